@@ -24,11 +24,7 @@ from src.inventory.transfer.infra.models import (  # noqa: F401
 )
 from src.inventory.warehouse.infra.models import WarehouseModel  # noqa: F401
 from src.pos.cash.infra.models import CashMovementModel  # noqa: F401
-from src.pos.refund.infra.models import (  # noqa: F401
-    RefundItemModel,
-    RefundModel,
-    RefundPaymentModel,
-)
+from src.pos.refund.infra.models import RefundItemModel, RefundModel, RefundPaymentModel  # noqa: F401
 from src.pos.shift.infra.models import ShiftModel  # noqa: F401
 from src.purchasing.infra.models import (  # noqa: F401
     PurchaseOrderItemModel,
@@ -36,8 +32,10 @@ from src.purchasing.infra.models import (  # noqa: F401
     PurchaseReceiptItemModel,
     PurchaseReceiptModel,
 )
+from src.reports.jobs.infra.models import ReportJobModel  # noqa: F401
 from src.sales.infra.models import PaymentModel, SaleItemModel, SaleModel  # noqa: F401
 from src.shared.infra.database import Base
+from src.shared.infra.models import DocumentSequenceModel, OutboxMessageModel  # noqa: F401
 from src.suppliers.infra.models import (  # noqa: F401
     SupplierContactModel,
     SupplierModel,
@@ -0,0 +1,133 @@
+"""partition movements by month
+
+Revision ID: b7d1f4a9c3e2
+Revises: a8c3e6f1b2d4
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d1f4a9c3e2"
+down_revision: str | None = "a8c3e6f1b2d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+MONTHS_AHEAD = 3
+
+_INDEXES = {
+    "ix_movements_product_id_date": ["product_id", "date"],
+    "ix_movements_date_id": ["date", "id"],
+    "ix_movements_location_id": ["location_id"],
+    "ix_movements_reference": ["reference_type", "reference_id"],
+}
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_constraints_and_indexes() -> None:
+    op.create_foreign_key(
+        "movements_product_id_fkey", "movements", "products", ["product_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "movements_location_id_fkey", "movements", "locations", ["location_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "movements_source_location_id_fkey",
+        "movements",
+        "locations",
+        ["source_location_id"],
+        ["id"],
+    )
+    for name, columns in _INDEXES.items():
+        op.create_index(name, "movements", columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # date becomes the partition key, part of the primary key
+    op.execute(
+        "UPDATE movements SET date = COALESCE(created_at, CURRENT_TIMESTAMP) "
+        "WHERE date IS NULL"
+    )
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        with op.batch_alter_table("movements") as batch_op:
+            batch_op.alter_column("date", existing_type=sa.DateTime(), nullable=False)
+        return
+
+    # A foreign key to a partitioned table must cover the partition key
+    op.drop_constraint(
+        "movement_lot_items_movement_id_fkey", "movement_lot_items", type_="foreignkey"
+    )
+    op.execute("ALTER TABLE movements RENAME TO movements_unpartitioned")
+    op.execute(
+        "ALTER TABLE movements_unpartitioned "
+        "RENAME CONSTRAINT movements_pkey TO movements_unpartitioned_pkey"
+    )
+    for name in _INDEXES:
+        op.drop_index(name, table_name="movements_unpartitioned")
+
+    op.execute(
+        "CREATE TABLE movements (LIKE movements_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (date)"
+    )
+    op.execute("ALTER TABLE movements ALTER COLUMN date SET NOT NULL")
+    op.execute("ALTER SEQUENCE movements_id_seq OWNED BY movements.id")
+    op.create_primary_key("movements_pkey", "movements", ["id", "date"])
+    _create_constraints_and_indexes()
+
+    first = bind.execute(
+        sa.text("SELECT min(date) FROM movements_unpartitioned")
+    ).scalar()
+    today = date.today().replace(day=1)
+    month = first.date().replace(day=1) if first is not None else today
+    last = _add_months(today, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE movements_p{month:%Y_%m} PARTITION OF movements "
+            f"FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    op.execute("CREATE TABLE movements_default PARTITION OF movements DEFAULT")
+
+    op.execute("INSERT INTO movements SELECT * FROM movements_unpartitioned")
+    op.execute("DROP TABLE movements_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        with op.batch_alter_table("movements") as batch_op:
+            batch_op.alter_column("date", existing_type=sa.DateTime(), nullable=True)
+        return
+
+    op.execute(
+        "CREATE TABLE movements_unpartitioned (LIKE movements INCLUDING DEFAULTS)"
+    )
+    op.execute("INSERT INTO movements_unpartitioned SELECT * FROM movements")
+    op.execute("ALTER SEQUENCE movements_id_seq OWNED BY movements_unpartitioned.id")
+    op.execute("DROP TABLE movements")
+    op.execute("ALTER TABLE movements_unpartitioned RENAME TO movements")
+    op.execute("ALTER TABLE movements ALTER COLUMN date DROP NOT NULL")
+    op.create_primary_key("movements_pkey", "movements", ["id"])
+    _create_constraints_and_indexes()
+    op.create_foreign_key(
+        "movement_lot_items_movement_id_fkey",
+        "movement_lot_items",
+        "movements",
+        ["movement_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,84 @@
+"""add secondary indexes for hot filter and join columns
+
+Revision ID: c4d2e8f1a9b3
+Revises: a355b8c15a63
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d2e8f1a9b3"
+down_revision: str | None = "a355b8c15a63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Movement history, rotation and valuation reports
+    op.create_index("ix_movements_product_id_date", "movements", ["product_id", "date"])
+    op.create_index("ix_movements_date_id", "movements", ["date", "id"])
+    op.create_index("ix_movements_location_id", "movements", ["location_id"])
+    op.create_index(
+        "ix_movements_reference", "movements", ["reference_type", "reference_id"]
+    )
+    # POS X/Z reports, daily summary and cash summary
+    op.create_index("ix_sales_shift_id_status", "sales", ["shift_id", "status"])
+    op.create_index("ix_sales_status_sale_date", "sales", ["status", "sale_date"])
+    op.create_index("ix_sale_items_sale_id", "sale_items", ["sale_id"])
+    op.create_index("ix_payments_sale_id", "payments", ["sale_id"])
+    op.create_index(
+        "ix_pos_refunds_original_sale_id", "pos_refunds", ["original_sale_id"]
+    )
+    op.create_index(
+        "ix_pos_refunds_shift_id_status", "pos_refunds", ["shift_id", "status"]
+    )
+    op.create_index(
+        "ix_pos_refund_payments_refund_id", "pos_refund_payments", ["refund_id"]
+    )
+    op.create_index(
+        "ix_pos_cash_movements_shift_id_type",
+        "pos_cash_movements",
+        ["shift_id", "type"],
+    )
+    # Stock alerts and warehouse summaries
+    op.create_index("ix_stocks_location_id", "stocks", ["location_id"])
+    op.create_index(
+        "ix_lots_expiration_date_in_stock",
+        "lots",
+        ["expiration_date"],
+        postgresql_where=sa.text("current_quantity > 0"),
+        sqlite_where=sa.text("current_quantity > 0"),
+    )
+    op.create_index(
+        "ix_serial_numbers_product_id_status",
+        "serial_numbers",
+        ["product_id", "status"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_serial_numbers_product_id_status", table_name="serial_numbers")
+    op.drop_index("ix_lots_expiration_date_in_stock", table_name="lots")
+    op.drop_index("ix_stocks_location_id", table_name="stocks")
+    op.drop_index(
+        "ix_pos_cash_movements_shift_id_type", table_name="pos_cash_movements"
+    )
+    op.drop_index("ix_pos_refund_payments_refund_id", table_name="pos_refund_payments")
+    op.drop_index("ix_pos_refunds_shift_id_status", table_name="pos_refunds")
+    op.drop_index("ix_pos_refunds_original_sale_id", table_name="pos_refunds")
+    op.drop_index("ix_payments_sale_id", table_name="payments")
+    op.drop_index("ix_sale_items_sale_id", table_name="sale_items")
+    op.drop_index("ix_sales_status_sale_date", table_name="sales")
+    op.drop_index("ix_sales_shift_id_status", table_name="sales")
+    op.drop_index("ix_movements_reference", table_name="movements")
+    op.drop_index("ix_movements_location_id", table_name="movements")
+    op.drop_index("ix_movements_date_id", table_name="movements")
+    op.drop_index("ix_movements_product_id_date", table_name="movements")
@@ -0,0 +1,57 @@
+"""create movement daily aggregates table
+
+Revision ID: c9e2a5b8d1f3
+Revises: b7d1f4a9c3e2
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e2a5b8d1f3"
+down_revision: str | None = "b7d1f4a9c3e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "movement_daily_aggregates",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("warehouse_id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("qty_in", sa.Integer(), nullable=False),
+        sa.Column("qty_out", sa.Integer(), nullable=False),
+        sa.Column("movement_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "day",
+            "warehouse_id",
+            "product_id",
+            name="uq_movement_aggregate_day_warehouse_product",
+        ),
+    )
+    # History; warehouse_id 0 stands for movements without a location
+    op.execute(
+        "INSERT INTO movement_daily_aggregates "
+        "(day, warehouse_id, product_id, qty_in, qty_out, movement_count) "
+        "SELECT date(m.date), COALESCE(l.warehouse_id, 0), m.product_id, "
+        "SUM(CASE WHEN m.quantity > 0 THEN m.quantity ELSE 0 END), "
+        "SUM(CASE WHEN m.quantity < 0 THEN -m.quantity ELSE 0 END), "
+        "COUNT(*) "
+        "FROM movements m LEFT OUTER JOIN locations l ON l.id = m.location_id "
+        "GROUP BY date(m.date), COALESCE(l.warehouse_id, 0), m.product_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("movement_daily_aggregates")
@@ -0,0 +1,55 @@
+"""create document_sequences table
+
+Revision ID: d7a3b5c9e2f4
+Revises: c4d2e8f1a9b3
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+import re
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a3b5c9e2f4"
+down_revision: str | None = "c4d2e8f1a9b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ORDER_NUMBER = re.compile(r"^PO-(\d{4})-(\d+)$")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    document_sequences = op.create_table(
+        "document_sequences",
+        sa.Column("name", sa.String(length=32), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("last_value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name", "year"),
+    )
+
+    # Continue the numbering of existing purchase orders
+    last_values: dict[int, int] = {}
+    rows = op.get_bind().execute(sa.text("SELECT order_number FROM purchase_orders"))
+    for (order_number,) in rows:
+        match = ORDER_NUMBER.match(order_number or "")
+        if match:
+            year, number = int(match.group(1)), int(match.group(2))
+            last_values[year] = max(last_values.get(year, 0), number)
+    if last_values:
+        op.bulk_insert(
+            document_sequences,
+            [
+                {"name": "PO", "year": year, "last_value": value}
+                for year, value in last_values.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("document_sequences")
@@ -0,0 +1,49 @@
+"""add outbox dead letter and retention
+
+Revision ID: e8b3f6a2c7d9
+Revises: d4f7b2c8e6a1
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b3f6a2c7d9"
+down_revision: str | None = "d4f7b2c8e6a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PENDING = "published_at IS NULL AND dead_lettered_at IS NULL"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("outbox", sa.Column("dead_lettered_at", sa.DateTime(), nullable=True))
+    op.drop_index("ix_outbox_pending", table_name="outbox")
+    op.create_index(
+        "ix_outbox_pending",
+        "outbox",
+        ["id"],
+        postgresql_where=sa.text(PENDING),
+        sqlite_where=sa.text(PENDING),
+    )
+    op.create_index("ix_outbox_published_at", "outbox", ["published_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_outbox_published_at", table_name="outbox")
+    op.drop_index("ix_outbox_pending", table_name="outbox")
+    op.create_index(
+        "ix_outbox_pending",
+        "outbox",
+        ["id"],
+        postgresql_where=sa.text("published_at IS NULL"),
+        sqlite_where=sa.text("published_at IS NULL"),
+    )
+    op.drop_column("outbox", "dead_lettered_at")
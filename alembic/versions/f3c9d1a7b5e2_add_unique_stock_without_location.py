@@ -0,0 +1,60 @@
+"""add unique stock without location
+
+Revision ID: f3c9d1a7b5e2
+Revises: e8b3f6a2c7d9
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c9d1a7b5e2"
+down_revision: str | None = "e8b3f6a2c7d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+WITHOUT_LOCATION = "location_id IS NULL"
+# Rows of the same product without a location, seen from the outer stocks row
+SAME_KEY = "s.product_id = stocks.product_id AND s.location_id IS NULL"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent first movements may already have inserted duplicates: fold
+    # them into the oldest row before the index forbids them
+    op.execute(
+        f"""
+        UPDATE stocks SET
+            quantity = (SELECT SUM(s.quantity) FROM stocks s WHERE {SAME_KEY}),
+            reserved_quantity = (
+                SELECT SUM(s.reserved_quantity) FROM stocks s WHERE {SAME_KEY}
+            )
+        WHERE {WITHOUT_LOCATION}
+          AND id = (SELECT MIN(s.id) FROM stocks s WHERE {SAME_KEY})
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM stocks
+        WHERE {WITHOUT_LOCATION}
+          AND id > (SELECT MIN(s.id) FROM stocks s WHERE {SAME_KEY})
+        """
+    )
+    op.create_index(
+        "uq_stock_product_without_location",
+        "stocks",
+        ["product_id"],
+        unique=True,
+        postgresql_where=sa.text(WITHOUT_LOCATION),
+        sqlite_where=sa.text(WITHOUT_LOCATION),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_stock_product_without_location", table_name="stocks")
@@ -14,6 +14,15 @@ class OpenTelemetryConfig:
     sampling_rate: float = 1.0
 
 
+@dataclass
+class DatabasePoolConfig:
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+
 @dataclass
 class DocsConfig:
     title: str
@@ -37,6 +46,19 @@ class BaseConfig:
     # Database config
     #
     DB_CONNECTION_STRING = env("DATABASE_URL", "sqlite:///./warehouse.db")
+    # Read-only (GET) requests are spread round-robin over these replicas
+    DB_REPLICA_URLS = env.list("DB_REPLICA_URLS", [])
+    # After a write, the client's reads stay on the primary for this long
+    DB_READ_YOUR_WRITES_SECONDS = env.int("DB_READ_YOUR_WRITES_SECONDS", 5)
+    DB_POOL_SIZE = env.int("DB_POOL_SIZE", 10)
+    DB_MAX_OVERFLOW = env.int("DB_MAX_OVERFLOW", 20)
+    DB_POOL_TIMEOUT = env.float("DB_POOL_TIMEOUT", 30.0)
+    DB_POOL_RECYCLE = env.int("DB_POOL_RECYCLE", 1800)
+    DB_POOL_PRE_PING = env.bool("DB_POOL_PRE_PING", True)
+    # Per-surface statement timeouts in milliseconds (PostgreSQL only, 0 = none)
+    DB_STATEMENT_TIMEOUT_ADMIN_MS = env.int("DB_STATEMENT_TIMEOUT_ADMIN_MS", 30000)
+    DB_STATEMENT_TIMEOUT_POS_MS = env.int("DB_STATEMENT_TIMEOUT_POS_MS", 5000)
+    DB_STATEMENT_TIMEOUT_REPORTS_MS = env.int("DB_STATEMENT_TIMEOUT_REPORTS_MS", 120000)
 
     #
     # OpenTelemetry config
@@ -47,11 +69,79 @@ class BaseConfig:
     OTEL_ENABLED = env.bool("OTEL_ENABLED", True)
     OTEL_SAMPLING_RATE = env.float("OTEL_SAMPLING_RATE", 1.0)
 
+    #
+    # Movements partitions (PostgreSQL)
+    #
+    # Monthly partitions kept created ahead of the current month
+    MOVEMENT_PARTITION_MONTHS_AHEAD = env.int("MOVEMENT_PARTITION_MONTHS_AHEAD", 3)
+    # Where archived months are written as gzipped JSONL files
+    MOVEMENT_ARCHIVE_DIR = env("MOVEMENT_ARCHIVE_DIR", "./archive/movements")
+
+    #
+    # Domain events
+    #
+    # Spans per EventBus.publish: "publish" (one) or "handler" (one per handler)
+    EVENT_SPAN_GRANULARITY = env("EVENT_SPAN_GRANULARITY", "publish")
+    # Threads running after-commit handlers; 0 runs them inline after commit
+    EVENT_AFTER_COMMIT_WORKERS = env.int("EVENT_AFTER_COMMIT_WORKERS", 0)
+
+    #
+    # Report cache
+    #
+    # Valuation, rotation, summary and alert results, invalidated by stock,
+    # movement and product events
+    REPORT_CACHE_ENABLED = env.bool("REPORT_CACHE_ENABLED", True)
+    REPORT_CACHE_MAXSIZE = env.int("REPORT_CACHE_MAXSIZE", 256)
+    # Bounds staleness for writes that publish no event (e.g. other processes)
+    REPORT_CACHE_TTL_SECONDS = env.float("REPORT_CACHE_TTL_SECONDS", 60.0)
+    # Store shared by processes: "" (none) or "memory" (local stand-in)
+    REPORT_CACHE_SHARED_BACKEND = env("REPORT_CACHE_SHARED_BACKEND", "")
+
+    #
+    # Report jobs
+    #
+    # Run a report job worker inside the API process; disable it when the
+    # workers run on their own (python -m src.reports.jobs.infra.worker)
+    REPORT_JOB_WORKER_IN_PROCESS = env.bool("REPORT_JOB_WORKER_IN_PROCESS", True)
+    # Pool the jobs run on: "thread" or "process"
+    REPORT_JOB_EXECUTOR = env("REPORT_JOB_EXECUTOR", "thread")
+    REPORT_JOB_WORKERS = env.int("REPORT_JOB_WORKERS", 2)
+    # Jobs running at once per report type, e.g. "valuation=1,rotation=2"
+    REPORT_JOB_CONCURRENCY = env.dict("REPORT_JOB_CONCURRENCY", {}, subcast_values=int)
+    REPORT_JOB_POLL_INTERVAL = env.float("REPORT_JOB_POLL_INTERVAL", 1.0)
+    REPORT_JOB_RESULT_DIR = env("REPORT_JOB_RESULT_DIR", "./report-jobs")
+    REPORT_JOB_RESULT_TTL_HOURS = env.float("REPORT_JOB_RESULT_TTL_HOURS", 24.0)
+    # Running jobs older than this are failed (their worker is gone)
+    REPORT_JOB_TIMEOUT_MINUTES = env.float("REPORT_JOB_TIMEOUT_MINUTES", 60.0)
+    # Longest date range the synchronous rotation endpoint accepts; longer
+    # ranges go through a report job
+    REPORT_SYNC_MAX_DAYS = env.int("REPORT_SYNC_MAX_DAYS", 92)
+
     #
     # Kafka config
     #
     KAFKA_BOOTSTRAP_SERVERS = env("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
     KAFKA_ENABLED = env.bool("KAFKA_ENABLED", False)
+    KAFKA_LINGER_MS = env.int("KAFKA_LINGER_MS", 5)
+    KAFKA_MAX_BATCH_SIZE = env.int("KAFKA_MAX_BATCH_SIZE", 16384)
+    KAFKA_COMPRESSION_TYPE = env("KAFKA_COMPRESSION_TYPE", "gzip")
+    KAFKA_QUEUE_SIZE = env.int("KAFKA_QUEUE_SIZE", 10000)
+    # What sends do when the queue is full: block, drop_oldest or spill
+    KAFKA_BACKPRESSURE = env("KAFKA_BACKPRESSURE", "block")
+    KAFKA_SPOOL_PATH = env("KAFKA_SPOOL_PATH", "./kafka-spool.jsonl")
+    KAFKA_SPOOL_FSYNC_INTERVAL = env.float("KAFKA_SPOOL_FSYNC_INTERVAL", 1.0)
+    # Circuit breaker: consecutive failures that open it, seconds until a probe
+    KAFKA_BREAKER_FAILURE_THRESHOLD = env.int("KAFKA_BREAKER_FAILURE_THRESHOLD", 5)
+    KAFKA_BREAKER_RESET_SECONDS = env.float("KAFKA_BREAKER_RESET_SECONDS", 30.0)
+    # Run the outbox relay inside the API process; disable it when the relay
+    # runs on its own (python -m src.shared.infra.outbox)
+    OUTBOX_RELAY_IN_PROCESS = env.bool("OUTBOX_RELAY_IN_PROCESS", True)
+    OUTBOX_BATCH_SIZE = env.int("OUTBOX_BATCH_SIZE", 100)
+    OUTBOX_POLL_INTERVAL = env.float("OUTBOX_POLL_INTERVAL", 1.0)
+    # Failed sends (broker up) before a message is dead-lettered
+    OUTBOX_MAX_ATTEMPTS = env.int("OUTBOX_MAX_ATTEMPTS", 10)
+    # Published messages are deleted after this many hours
+    OUTBOX_RETENTION_HOURS = env.float("OUTBOX_RETENTION_HOURS", 72.0)
 
     #
     # Docs config
@@ -102,7 +192,8 @@ Paginated lists include additional pagination metadata:
   "meta": {
     "requestId": "...",
     "timestamp": "...",
-    "pagination": { "total": 142, "limit": 100, "offset": 0 }
+    "pagination": { "total": 142, "totalMode": "exact", "limit": 100, "offset": 0 },
+    "nextCursor": "WzEwMF0"
   }
 }
 ```
@@ -145,6 +236,8 @@ All errors follow a consistent structure with one or more error entries:
 
 - **Field naming**: All JSON fields use **camelCase** (e.g. `customerId`, `unitPrice`).
 - **Pagination**: List endpoints accept `limit` (1-1000, default 100) and `offset` (default 0) query parameters.
+  Pass `meta.nextCursor` back as `cursor` to fetch the next page without an offset scan.
+  `includeTotal` (`exact`, `estimated`, `none`) controls how `pagination.total` is computed.
 - **IDs**: All resource IDs are positive integers.
 - **Decimals**: Monetary and percentage values are returned as floating-point numbers.
 - **Timestamps**: All timestamps are in ISO 8601 format with UTC timezone.
@@ -272,6 +365,13 @@ All errors follow a consistent structure with one or more error entries:
                 "movement history, and warehouse stock summaries."
             ),
         },
+        {
+            "name": "Report Jobs",
+            "description": (
+                "Heavy reports computed in the background: submit, poll the "
+                "status, then fetch or download the result before it expires."
+            ),
+        },
         # POS
         {
             "name": "Product Search",
@@ -374,7 +474,7 @@ All errors follow a consistent structure with one or more error entries:
         },
         {
             "name": "Reports",
-            "tags": ["Inventory Reports"],
+            "tags": ["Inventory Reports", "Report Jobs"],
         },
         {
             "name": "POS",
@@ -399,6 +499,23 @@ All errors follow a consistent structure with one or more error entries:
             sampling_rate=self.OTEL_SAMPLING_RATE,
         )
 
+    def get_db_pool_config(self) -> DatabasePoolConfig:
+        return DatabasePoolConfig(
+            pool_size=self.DB_POOL_SIZE,
+            max_overflow=self.DB_MAX_OVERFLOW,
+            pool_timeout=self.DB_POOL_TIMEOUT,
+            pool_recycle=self.DB_POOL_RECYCLE,
+            pool_pre_ping=self.DB_POOL_PRE_PING,
+        )
+
+    def get_statement_timeouts(self) -> dict[str, int]:
+        """Statement timeout per API path prefix; the longest matching prefix wins."""
+        return {
+            "/api/admin": self.DB_STATEMENT_TIMEOUT_ADMIN_MS,
+            "/api/admin/reports": self.DB_STATEMENT_TIMEOUT_REPORTS_MS,
+            "/api/pos": self.DB_STATEMENT_TIMEOUT_POS_MS,
+        }
+
     def get_docs_config(self) -> DocsConfig:
         return DocsConfig(
             title=self.API_TITLE,
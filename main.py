@@ -1,5 +1,7 @@
+import asyncio
 import copy
 import json
+from datetime import timedelta
 
 import structlog
 from fastapi import APIRouter, FastAPI
@@ -31,10 +33,15 @@ from src.pos.sales.infra.routes import POSSaleRouter
 from src.pos.shift.infra.routes import POSShiftRouter
 from src.purchasing.infra.routes import POItemRouter, PurchaseOrderRouter
 from src.reports.inventory.infra.routes import ReportRouter
+from src.reports.jobs.infra.routes import ReportJobRouter
 from src.sales.infra.routes import SaleRouter
 from src.shared.infra.adapters import OpenTelemetry
 from src.shared.infra.logging import configure_logging
-from src.shared.infra.middlewares import ErrorHandlingMiddleware
+from src.shared.infra.middlewares import (
+    ErrorHandlingMiddleware,
+    ReadOnlySessionMiddleware,
+    StatementTimeoutMiddleware,
+)
 from src.suppliers.infra.routes import (
     SupplierContactRouter,
     SupplierProductRouter,
@@ -248,6 +255,9 @@ admin_router.include_router(
     prefix="/reports/inventory",
     tags=["Inventory Reports"],
 )
+admin_router.include_router(
+    ReportJobRouter().router, prefix="/reports/jobs", tags=["Report Jobs"]
+)
 
 # POS API
 pos_router = APIRouter(prefix="/api/pos")
@@ -271,6 +281,11 @@ pos_router.include_router(
 # Middleware
 # ---------------------------------------------------------------------------
 
+app.add_middleware(
+    ReadOnlySessionMiddleware,
+    pin_primary_seconds=config.DB_READ_YOUR_WRITES_SECONDS,
+)
+app.add_middleware(StatementTimeoutMiddleware, timeouts=config.get_statement_timeouts())
 app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -323,10 +338,53 @@ async def root():
     return RedirectResponse("/docs")
 
 
+_outbox_stop = asyncio.Event()
+_outbox_task: asyncio.Task | None = None
+_report_jobs_stop = asyncio.Event()
+_report_jobs_task: asyncio.Task | None = None
+
+
+@app.on_event("startup")
+async def startup_event():
+    global _outbox_task, _report_jobs_task
+    if config.REPORT_JOB_WORKER_IN_PROCESS:
+        from src.reports.jobs.infra.worker import create_report_job_worker
+
+        worker = create_report_job_worker()
+        _report_jobs_task = asyncio.create_task(worker.run(_report_jobs_stop))
+
+    if not (config.KAFKA_ENABLED and config.OUTBOX_RELAY_IN_PROCESS):
+        return
+
+    from src.shared.infra.kafka.event_handlers import _get_producer
+    from src.shared.infra.outbox import OutboxRelay
+
+    producer = await asyncio.to_thread(_get_producer)
+    relay = OutboxRelay(
+        producer,
+        batch_size=config.OUTBOX_BATCH_SIZE,
+        poll_interval=config.OUTBOX_POLL_INTERVAL,
+        max_attempts=config.OUTBOX_MAX_ATTEMPTS,
+        retention=timedelta(hours=config.OUTBOX_RETENTION_HOURS),
+    )
+    _outbox_task = asyncio.create_task(relay.run(_outbox_stop))
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
+    from src.shared.infra.events.after_commit import shutdown_after_commit_workers
     from src.shared.infra.kafka.event_handlers import _get_producer
 
+    if _outbox_task is not None:
+        _outbox_stop.set()
+        await _outbox_task
+
+    if _report_jobs_task is not None:
+        _report_jobs_stop.set()
+        await _report_jobs_task
+
+    shutdown_after_commit_workers()
+
     producer = _get_producer()
     if producer:
         producer.close()
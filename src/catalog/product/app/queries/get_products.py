@@ -7,6 +7,7 @@ from src.catalog.product.domain.specifications import (
     ProductBySearchTerm,
     ProductInCategory,
 )
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -16,6 +17,8 @@ class GetAllProductsQuery(Query):
     category_id: int | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -27,9 +30,18 @@ class GetAllProductsQueryHandler(QueryHandler[GetAllProductsQuery, dict]):
         if query.category_id is not None:
             spec = ProductInCategory(query.category_id)
             return self.repo.paginate_by_spec(
-                spec, limit=query.limit, offset=query.offset
+                spec,
+                limit=query.limit,
+                offset=query.offset,
+                cursor=query.cursor,
+                include_total=query.include_total,
             )
-        return self.repo.paginate(limit=query.limit, offset=query.offset)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+        )
 
 
 @dataclass
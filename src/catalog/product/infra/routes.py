@@ -139,6 +139,8 @@ class CategoryRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
@@ -233,6 +235,8 @@ class ProductRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.catalog.uom.app.repositories import UnitOfMeasureRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -12,6 +13,8 @@ class GetAllUnitsOfMeasureQuery(Query):
     is_active: bool | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -24,16 +27,13 @@ class GetAllUnitsOfMeasureQueryHandler(QueryHandler[GetAllUnitsOfMeasureQuery, d
         if query.is_active is not None:
             filter_kwargs["is_active"] = query.is_active
 
-        uoms = self.repo.filter_by(
-            limit=query.limit, offset=query.offset, **filter_kwargs
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filter_kwargs,
         )
-        total = self.repo.count_by(**filter_kwargs)
-        return {
-            "total": total,
-            "limit": query.limit,
-            "offset": query.offset,
-            "items": [u.dict() for u in uoms],
-        }
 
 
 @dataclass
@@ -121,6 +121,8 @@ class UnitOfMeasureRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
@@ -29,21 +29,28 @@ def create_wireup_container():
     from src.pos.shift.infra.container import INJECTABLES as POS_SHIFT_INJECTABLES
     from src.purchasing.infra.container import INJECTABLES as PURCHASING_INJECTABLES
     from src.reports.inventory.infra.container import REPORT_INJECTABLES
+    from src.reports.jobs.infra.container import REPORT_JOB_INJECTABLES
     from src.sales.infra.container import INJECTABLES as SALES_INJECTABLES
     from src.shared.infra.database import create_session_factory
     from src.shared.infra.events.event_bus_publisher import EventBusPublisher
+    from src.shared.infra.sequences import SqlAlchemyDocumentSequence
     from src.suppliers.infra.container import INJECTABLES as SUPPLIER_INJECTABLES
 
     db_connection_string = config.DB_CONNECTION_STRING
     if not db_connection_string:
         raise ValueError("Database connection string not found in environment")
 
-    get_db_session = create_session_factory(db_connection_string)
+    get_db_session = create_session_factory(
+        db_connection_string,
+        replica_urls=config.DB_REPLICA_URLS,
+        pool=config.get_db_pool_config(),
+    )
 
     container = create_async_container(
         injectables=[
             get_db_session,
             EventBusPublisher,
+            SqlAlchemyDocumentSequence,
             *CATALOG_INJECTABLES,
             *UOM_INJECTABLES,
             *WAREHOUSE_INJECTABLES,
@@ -59,6 +66,7 @@ def create_wireup_container():
             *SUPPLIER_INJECTABLES,
             *PURCHASING_INJECTABLES,
             *REPORT_INJECTABLES,
+            *REPORT_JOB_INJECTABLES,
             *SALES_INJECTABLES,
             *POS_SALES_INJECTABLES,
             *POS_SHIFT_INJECTABLES,
@@ -73,6 +81,23 @@ def create_wireup_container():
     import src.inventory.serial.infra.event_handlers  # noqa: F401
     import src.inventory.stock.infra.event_handlers  # noqa: F401
     import src.purchasing.infra.event_handlers  # noqa: F401
+    import src.reports.inventory.infra.event_handlers  # noqa: F401
     import src.shared.infra.kafka.event_handlers  # noqa: F401
+    from src.shared.infra.events.after_commit import configure_after_commit_workers
+    from src.shared.infra.events.event_bus import EventBus, SpanGranularity
+
+    EventBus.freeze(SpanGranularity(config.EVENT_SPAN_GRANULARITY))
+    configure_after_commit_workers(config.EVENT_AFTER_COMMIT_WORKERS)
+
+    from src.shared.infra.report_cache import configure_report_cache
+
+    configure_report_cache(
+        enabled=config.REPORT_CACHE_ENABLED,
+        maxsize=config.REPORT_CACHE_MAXSIZE,
+        ttl=config.REPORT_CACHE_TTL_SECONDS,
+        shared_backend=config.REPORT_CACHE_SHARED_BACKEND,
+        # Reports read replicas, assumed caught up within the read-your-writes pin
+        replica_lag=config.DB_READ_YOUR_WRITES_SECONDS if config.DB_REPLICA_URLS else 0,
+    )
 
     return container
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.customers.app.repositories import CustomerRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -11,6 +12,8 @@ from src.shared.domain.exceptions import NotFoundError
 class GetAllCustomersQuery(Query):
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -19,7 +22,12 @@ class GetAllCustomersQueryHandler(QueryHandler[GetAllCustomersQuery, dict]):
         self.repo = repo
 
     def _handle(self, query: GetAllCustomersQuery) -> dict:
-        return self.repo.paginate(limit=query.limit, offset=query.offset)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+        )
 
 
 @dataclass
@@ -169,6 +169,8 @@ class CustomerRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
@@ -15,7 +15,8 @@ from src.inventory.adjustment.domain.entities import (
 from src.inventory.adjustment.domain.events import AdjustmentConfirmed
 from src.inventory.movement.app.commands.movement import (
     CreateMovementCommand,
-    CreateMovementCommandHandler,
+    CreateMovementsBatchCommand,
+    CreateMovementsBatchCommandHandler,
 )
 from src.inventory.movement.domain.constants import MovementType
 from src.inventory.stock.app.repositories import StockRepository
@@ -149,7 +150,7 @@ class ConfirmAdjustmentCommandHandler(CommandHandler[ConfirmAdjustmentCommand, d
         self,
         repo: InventoryAdjustmentRepository,
         item_repo: AdjustmentItemRepository,
-        movement_handler: CreateMovementCommandHandler,
+        movement_handler: CreateMovementsBatchCommandHandler,
         event_publisher: EventPublisher,
     ):
         self.repo = repo
@@ -165,25 +166,30 @@ class ConfirmAdjustmentCommandHandler(CommandHandler[ConfirmAdjustmentCommand, d
         confirmed = adjustment.confirm()
 
         items = self.item_repo.filter_by(adjustment_id=adjustment.id)
-        adjusted_count = 0
-
-        for item in items:
-            diff = item.difference
-            if diff == 0:
-                continue
-            movement_type = MovementType.IN if diff > 0 else MovementType.OUT
+        movements = [
+            CreateMovementCommand(
+                product_id=item.product_id,
+                quantity=item.difference,
+                type=(
+                    MovementType.IN if item.difference > 0 else MovementType.OUT
+                ).value,
+                location_id=item.location_id,
+                reference_type="adjustment",
+                reference_id=adjustment.id,
+                reason=f"Ajuste de inventario: {adjustment.reason.value}",
+            )
+            for item in items
+            if item.difference != 0
+        ]
+        if movements:
             self.movement_handler.handle(
-                CreateMovementCommand(
-                    product_id=item.product_id,
-                    quantity=diff,
-                    type=movement_type.value,
-                    location_id=item.location_id,
+                CreateMovementsBatchCommand(
+                    movements=movements,
                     reference_type="adjustment",
                     reference_id=adjustment.id,
-                    reason=f"Ajuste de inventario: {adjustment.reason.value}",
                 )
             )
-            adjusted_count += 1
+        adjusted_count = len(movements)
 
         confirmed = self.repo.update(confirmed)
         self.event_publisher.publish(
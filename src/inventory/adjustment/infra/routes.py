@@ -126,6 +126,8 @@ class AdjustmentRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
@@ -17,8 +17,18 @@ from src.inventory.alert.infra.validators import (
     StockAlertResponse,
 )
 from src.shared.infra.dependencies import get_meta
+from src.shared.infra.report_cache import ReportData, report_cache
 from src.shared.infra.validators import RESPONSES_LIST, ListResponse, Meta
 
+# Data each cached alert list is computed from (see report_cache)
+STOCK_ALERT_DATA = (ReportData.STOCK, ReportData.PRODUCTS, ReportData.LOCATIONS)
+LOT_ALERT_DATA = (
+    ReportData.STOCK,
+    ReportData.MOVEMENTS,
+    ReportData.PRODUCTS,
+    ReportData.LOTS,
+)
+
 
 class AlertRouter:
     def __init__(self):
@@ -58,10 +68,12 @@ class AlertRouter:
         meta: Meta = Depends(get_meta),
     ) -> ListResponse[StockAlertResponse]:
         """Get alerts for products whose stock is at or below the minimum stock level."""
-        result = handler.handle(
+        result = report_cache.fetch(
+            handler,
             GetLowStockAlertsQuery(
                 **query_params.model_dump(exclude_none=True, by_alias=False)
-            )
+            ),
+            STOCK_ALERT_DATA,
         )
         return ListResponse(
             data=[StockAlertResponse.model_validate(a) for a in result], meta=meta
@@ -74,10 +86,12 @@ class AlertRouter:
         meta: Meta = Depends(get_meta),
     ) -> ListResponse[StockAlertResponse]:
         """Get alerts for products with zero stock."""
-        result = handler.handle(
+        result = report_cache.fetch(
+            handler,
             GetOutOfStockAlertsQuery(
                 **query_params.model_dump(exclude_none=True, by_alias=False)
-            )
+            ),
+            STOCK_ALERT_DATA,
         )
         return ListResponse(
             data=[StockAlertResponse.model_validate(a) for a in result], meta=meta
@@ -90,10 +104,12 @@ class AlertRouter:
         meta: Meta = Depends(get_meta),
     ) -> ListResponse[StockAlertResponse]:
         """Get alerts for products whose stock is at or below the reorder point."""
-        result = handler.handle(
+        result = report_cache.fetch(
+            handler,
             GetReorderPointAlertsQuery(
                 **query_params.model_dump(exclude_none=True, by_alias=False)
-            )
+            ),
+            STOCK_ALERT_DATA,
         )
         return ListResponse(
             data=[StockAlertResponse.model_validate(a) for a in result], meta=meta
@@ -106,8 +122,10 @@ class AlertRouter:
         meta: Meta = Depends(get_meta),
     ) -> ListResponse[StockAlertResponse]:
         """Get alerts for lots expiring within the specified number of days."""
-        result = handler.handle(
-            GetExpiringLotsAlertsQuery(**query_params.model_dump(by_alias=False))
+        result = report_cache.fetch(
+            handler,
+            GetExpiringLotsAlertsQuery(**query_params.model_dump(by_alias=False)),
+            LOT_ALERT_DATA,
         )
         return ListResponse(
             data=[StockAlertResponse.model_validate(a) for a in result], meta=meta
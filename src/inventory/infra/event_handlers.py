@@ -9,7 +9,8 @@ import structlog
 
 from src.inventory.movement.app.commands import (
     CreateMovementCommand,
-    CreateMovementCommandHandler,
+    CreateMovementsBatchCommand,
+    CreateMovementsBatchCommandHandler,
 )
 from src.inventory.movement.domain.constants import MovementType
 from src.sales.domain.events import SaleCancelled, SaleConfirmed
@@ -37,23 +38,27 @@ def handle_sale_confirmed(event: SaleConfirmed, session: Any = None) -> None:
 
     with create_sync_scope(session) as scope:
         try:
-            for item in event.items:
-                handler = scope.get(CreateMovementCommandHandler)
-
-                command = CreateMovementCommand(
-                    product_id=item["product_id"],
-                    quantity=-abs(item["quantity"]),
-                    type=MovementType.OUT.value,
-                    reason=f"Sale #{event.sale_id} confirmed",
-                )
-
-                handler.handle(command)
-                logger.info(
-                    "out_movement_created",
-                    sale_id=event.sale_id,
-                    product_id=item["product_id"],
-                    quantity=item["quantity"],
+            handler = scope.get(CreateMovementsBatchCommandHandler)
+            handler.handle(
+                CreateMovementsBatchCommand(
+                    movements=[
+                        CreateMovementCommand(
+                            product_id=item["product_id"],
+                            quantity=-abs(item["quantity"]),
+                            type=MovementType.OUT.value,
+                            reason=f"Sale #{event.sale_id} confirmed",
+                        )
+                        for item in event.items
+                    ],
+                    reference_type="sale",
+                    reference_id=event.sale_id,
                 )
+            )
+            logger.info(
+                "out_movements_created",
+                sale_id=event.sale_id,
+                item_count=len(event.items),
+            )
 
         except Exception as e:
             logger.error(
@@ -94,23 +99,27 @@ def handle_sale_cancelled(event: SaleCancelled, session: Any = None) -> None:
 
     with create_sync_scope(session) as scope:
         try:
-            for item in event.items:
-                handler = scope.get(CreateMovementCommandHandler)
-
-                command = CreateMovementCommand(
-                    product_id=item["product_id"],
-                    quantity=abs(item["quantity"]),
-                    type=MovementType.IN.value,
-                    reason=f"Sale #{event.sale_id} cancelled - reversal",
-                )
-
-                handler.handle(command)
-                logger.info(
-                    "in_reversal_movement_created",
-                    sale_id=event.sale_id,
-                    product_id=item["product_id"],
-                    quantity=item["quantity"],
+            handler = scope.get(CreateMovementsBatchCommandHandler)
+            handler.handle(
+                CreateMovementsBatchCommand(
+                    movements=[
+                        CreateMovementCommand(
+                            product_id=item["product_id"],
+                            quantity=abs(item["quantity"]),
+                            type=MovementType.IN.value,
+                            reason=f"Sale #{event.sale_id} cancelled - reversal",
+                        )
+                        for item in event.items
+                    ],
+                    reference_type="sale",
+                    reference_id=event.sale_id,
                 )
+            )
+            logger.info(
+                "in_reversal_movements_created",
+                sale_id=event.sale_id,
+                item_count=len(event.items),
+            )
 
         except Exception as e:
             logger.error(
@@ -4,7 +4,9 @@ from wireup import injectable
 
 from src.inventory.location.app.repositories import LocationRepository
 from src.inventory.location.domain.entities import Location, LocationType
+from src.inventory.location.domain.events import LocationCreated
 from src.shared.app.commands import Command, CommandHandler
+from src.shared.app.events import EventPublisher
 
 
 @dataclass
@@ -19,8 +21,9 @@ class CreateLocationCommand(Command):
 
 @injectable(lifetime="scoped")
 class CreateLocationCommandHandler(CommandHandler[CreateLocationCommand, dict]):
-    def __init__(self, repo: LocationRepository):
+    def __init__(self, repo: LocationRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: CreateLocationCommand) -> dict:
         location = Location(
@@ -32,4 +35,12 @@ class CreateLocationCommandHandler(CommandHandler[CreateLocationCommand, dict]):
             capacity=command.capacity,
         )
         location = self.repo.create(location)
+
+        self.event_publisher.publish(
+            LocationCreated(
+                aggregate_id=location.id,
+                location_id=location.id,
+                warehouse_id=location.warehouse_id,
+            )
+        )
         return location.dict()
@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.inventory.location.app.repositories import LocationRepository
+from src.inventory.location.domain.events import LocationDeleted
 from src.shared.app.commands import Command, CommandHandler
+from src.shared.app.events import EventPublisher
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -14,11 +16,19 @@ class DeleteLocationCommand(Command):
 
 @injectable(lifetime="scoped")
 class DeleteLocationCommandHandler(CommandHandler[DeleteLocationCommand, None]):
-    def __init__(self, repo: LocationRepository):
+    def __init__(self, repo: LocationRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: DeleteLocationCommand) -> None:
         location = self.repo.get_by_id(command.location_id)
         if location is None:
             raise NotFoundError(f"Location {command.location_id} not found")
         self.repo.delete(command.location_id)
+
+        self.event_publisher.publish(
+            LocationDeleted(
+                aggregate_id=command.location_id,
+                location_id=command.location_id,
+            )
+        )
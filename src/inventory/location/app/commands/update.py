@@ -4,7 +4,9 @@ from wireup import injectable
 
 from src.inventory.location.app.repositories import LocationRepository
 from src.inventory.location.domain.entities import Location, LocationType
+from src.inventory.location.domain.events import LocationUpdated
 from src.shared.app.commands import Command, CommandHandler
+from src.shared.app.events import EventPublisher
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -21,13 +23,15 @@ class UpdateLocationCommand(Command):
 
 @injectable(lifetime="scoped")
 class UpdateLocationCommandHandler(CommandHandler[UpdateLocationCommand, dict]):
-    def __init__(self, repo: LocationRepository):
+    def __init__(self, repo: LocationRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: UpdateLocationCommand) -> dict:
         location = self.repo.get_by_id(command.location_id)
         if location is None:
             raise NotFoundError(f"Location {command.location_id} not found")
+        previous_warehouse_id = location.warehouse_id
         location = Location(
             id=command.location_id,
             warehouse_id=command.warehouse_id,
@@ -38,4 +42,13 @@ class UpdateLocationCommandHandler(CommandHandler[UpdateLocationCommand, dict]):
             capacity=command.capacity,
         )
         location = self.repo.update(location)
+
+        self.event_publisher.publish(
+            LocationUpdated(
+                aggregate_id=location.id,
+                location_id=location.id,
+                warehouse_id=location.warehouse_id,
+                previous_warehouse_id=previous_warehouse_id,
+            )
+        )
         return location.dict()
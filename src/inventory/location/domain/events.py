@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+from src.shared.domain.events import DomainEvent
+
+
+@dataclass
+class LocationCreated(DomainEvent):
+    location_id: int = 0
+    warehouse_id: int = 0
+
+    def _payload(self) -> dict:
+        return {"location_id": self.location_id, "warehouse_id": self.warehouse_id}
+
+
+@dataclass
+class LocationUpdated(DomainEvent):
+    location_id: int = 0
+    warehouse_id: int = 0
+    previous_warehouse_id: int = 0
+
+    def _payload(self) -> dict:
+        return {
+            "location_id": self.location_id,
+            "warehouse_id": self.warehouse_id,
+            "previous_warehouse_id": self.previous_warehouse_id,
+        }
+
+
+@dataclass
+class LocationDeleted(DomainEvent):
+    location_id: int = 0
+
+    def _payload(self) -> dict:
+        return {"location_id": self.location_id}
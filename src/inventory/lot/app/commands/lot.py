@@ -5,7 +5,9 @@ from wireup import injectable
 
 from src.inventory.lot.app.repositories import LotRepository
 from src.inventory.lot.domain.entities import Lot
+from src.inventory.lot.domain.events import LotCreated, LotUpdated
 from src.shared.app.commands import Command, CommandHandler
+from src.shared.app.events import EventPublisher
 from src.shared.domain.exceptions import DomainError, NotFoundError
 
 
@@ -30,8 +32,9 @@ class UpdateLotCommand(Command):
 
 @injectable(lifetime="scoped")
 class CreateLotCommandHandler(CommandHandler[CreateLotCommand, dict]):
-    def __init__(self, repo: LotRepository):
+    def __init__(self, repo: LotRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: CreateLotCommand) -> dict:
         existing = self.repo.first(
@@ -52,13 +55,23 @@ class CreateLotCommandHandler(CommandHandler[CreateLotCommand, dict]):
             notes=command.notes,
         )
         lot = self.repo.create(lot)
+
+        self.event_publisher.publish(
+            LotCreated(
+                aggregate_id=lot.id,
+                lot_id=lot.id,
+                product_id=lot.product_id,
+                lot_number=lot.lot_number,
+            )
+        )
         return lot.dict()
 
 
 @injectable(lifetime="scoped")
 class UpdateLotCommandHandler(CommandHandler[UpdateLotCommand, dict]):
-    def __init__(self, repo: LotRepository):
+    def __init__(self, repo: LotRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: UpdateLotCommand) -> dict:
         lot = self.repo.get_by_id(command.id)
@@ -83,4 +96,13 @@ class UpdateLotCommandHandler(CommandHandler[UpdateLotCommand, dict]):
 
         lot = dc_replace(lot, **updates)
         lot = self.repo.update(lot)
+
+        self.event_publisher.publish(
+            LotUpdated(
+                aggregate_id=lot.id,
+                lot_id=lot.id,
+                product_id=lot.product_id,
+                changed_fields=list(updates),
+            )
+        )
         return lot.dict()
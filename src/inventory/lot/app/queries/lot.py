@@ -4,6 +4,7 @@ from wireup import injectable
 
 from src.inventory.lot.app.repositories import LotRepository
 from src.inventory.lot.domain.specifications import ExpiringLots, LotsByProduct
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -14,6 +15,8 @@ class GetAllLotsQuery(Query):
     expiring_in_days: int | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @dataclass
@@ -36,9 +39,18 @@ class GetAllLotsQueryHandler(QueryHandler[GetAllLotsQuery, dict]):
 
         if spec is not None:
             return self.repo.paginate_by_spec(
-                spec, limit=query.limit, offset=query.offset
+                spec,
+                limit=query.limit,
+                offset=query.offset,
+                cursor=query.cursor,
+                include_total=query.include_total,
             )
-        return self.repo.paginate(limit=query.limit, offset=query.offset)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+        )
 
 
 @injectable(lifetime="scoped")
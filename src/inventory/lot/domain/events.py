@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+
+from src.shared.domain.events import DomainEvent
+
+
+@dataclass
+class LotCreated(DomainEvent):
+    lot_id: int = 0
+    product_id: int = 0
+    lot_number: str = ""
+
+    def _payload(self) -> dict:
+        return {
+            "lot_id": self.lot_id,
+            "product_id": self.product_id,
+            "lot_number": self.lot_number,
+        }
+
+
+@dataclass
+class LotUpdated(DomainEvent):
+    lot_id: int = 0
+    product_id: int = 0
+    changed_fields: list[str] = field(default_factory=list)
+
+    def _payload(self) -> dict:
+        return {
+            "lot_id": self.lot_id,
+            "product_id": self.product_id,
+            "changed_fields": self.changed_fields,
+        }
@@ -3,6 +3,7 @@ Event handlers for Lot that react to purchasing domain events.
 Creates or updates lots when purchase orders are received.
 """
 
+from datetime import timedelta
 from typing import Any
 
 import structlog
@@ -42,11 +43,24 @@ def handle_purchase_order_received_lots(
             )
             from src.inventory.lot.domain.entities import Lot, MovementLotItem
             from src.inventory.movement.app.repositories import MovementRepository
+            from src.inventory.movement.domain.specifications import (
+                MovementsByReference,
+                MovementsDatedFrom,
+            )
 
             lot_repo = scope.get(LotRepository)
             movement_lot_item_repo = scope.get(MovementLotItemRepository)
             movement_repo = scope.get(MovementRepository)
 
+            # The receipt's movements are created while this event is handled,
+            # so the date bound only reads the newest movements partition
+            received_from = event.occurred_at.astimezone().replace(
+                tzinfo=None
+            ) - timedelta(days=1)
+            movements = movement_repo.filter_by_spec(
+                MovementsByReference("purchase_order", event.purchase_order_id)
+                & MovementsDatedFrom(received_from)
+            )
             used_movement_ids: set[int] = set()
 
             for item in items_with_lots:
@@ -90,14 +104,14 @@ def handle_purchase_order_received_lots(
                     )
 
                 # Find the movement created for this item and link it
-                movements = movement_repo.filter_by(
-                    reference_type="purchase_order",
-                    reference_id=event.purchase_order_id,
-                    product_id=product_id,
-                    quantity=quantity,
-                )
                 movement = next(
-                    (m for m in movements if m.id not in used_movement_ids),
+                    (
+                        m
+                        for m in movements
+                        if m.product_id == product_id
+                        and m.quantity == quantity
+                        and m.id not in used_movement_ids
+                    ),
                     None,
                 )
                 if movement is not None:
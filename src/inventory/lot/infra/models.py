@@ -4,10 +4,12 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,6 +20,13 @@ class LotModel(Base):
     __tablename__ = "lots"
     __table_args__ = (
         UniqueConstraint("product_id", "lot_number", name="uq_lot_product_lot_number"),
+        # Expiring-lot alerts only look at lots that still hold stock
+        Index(
+            "ix_lots_expiration_date_in_stock",
+            "expiration_date",
+            postgresql_where=text("current_quantity > 0"),
+            sqlite_where=text("current_quantity > 0"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
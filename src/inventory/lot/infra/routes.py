@@ -100,6 +100,8 @@ class LotRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
@@ -1,3 +1,13 @@
-from .movement import CreateMovementCommand, CreateMovementCommandHandler
+from .movement import (
+    CreateMovementCommand,
+    CreateMovementCommandHandler,
+    CreateMovementsBatchCommand,
+    CreateMovementsBatchCommandHandler,
+)
 
-__all__ = ["CreateMovementCommand", "CreateMovementCommandHandler"]
+__all__ = [
+    "CreateMovementCommand",
+    "CreateMovementCommandHandler",
+    "CreateMovementsBatchCommand",
+    "CreateMovementsBatchCommandHandler",
+]
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from sqlalchemy.orm import Session
@@ -7,7 +7,7 @@ from wireup import injectable
 from src.inventory.movement.app.repositories import MovementRepository
 from src.inventory.movement.domain.constants import MovementType
 from src.inventory.movement.domain.entities import Movement
-from src.inventory.movement.domain.events import MovementCreated
+from src.inventory.movement.domain.events import MovementCreated, MovementsCreated
 from src.shared.app.commands import Command, CommandHandler
 from src.shared.app.events import EventPublisher
 
@@ -25,6 +25,27 @@ class CreateMovementCommand(Command):
     date: datetime | None = None
 
 
+@dataclass
+class CreateMovementsBatchCommand(Command):
+    movements: list[CreateMovementCommand] = field(default_factory=list)
+    reference_type: str | None = None
+    reference_id: int | None = None
+
+
+def _build_movement(command: CreateMovementCommand) -> Movement:
+    return Movement(
+        product_id=command.product_id,
+        quantity=command.quantity,
+        type=MovementType(command.type),
+        location_id=command.location_id,
+        source_location_id=command.source_location_id,
+        reference_type=command.reference_type,
+        reference_id=command.reference_id,
+        reason=command.reason,
+        date=command.date,
+    )
+
+
 @injectable(lifetime="scoped")
 class CreateMovementCommandHandler(CommandHandler[CreateMovementCommand, dict]):
     """
@@ -43,21 +64,7 @@ class CreateMovementCommandHandler(CommandHandler[CreateMovementCommand, dict]):
         self.session = session
 
     def _handle(self, command: CreateMovementCommand) -> dict:
-        movement_type = MovementType(command.type)
-
-        movement = Movement(
-            product_id=command.product_id,
-            quantity=command.quantity,
-            type=movement_type,
-            location_id=command.location_id,
-            source_location_id=command.source_location_id,
-            reference_type=command.reference_type,
-            reference_id=command.reference_id,
-            reason=command.reason,
-            date=command.date,
-        )
-
-        movement = self.repo.create(movement)
+        movement = self.repo.create(_build_movement(command))
 
         self.event_publisher.publish(
             MovementCreated(
@@ -73,3 +80,55 @@ class CreateMovementCommandHandler(CommandHandler[CreateMovementCommand, dict]):
         )
 
         return movement.dict()
+
+
+@injectable(lifetime="scoped")
+class CreateMovementsBatchCommandHandler(
+    CommandHandler[CreateMovementsBatchCommand, list[dict]]
+):
+    """
+    Crea los movimientos de un documento con un solo INSERT multi-fila y
+    publica un unico MovementsCreated; el Stock event handler aplica los
+    deltas agregados por (producto, ubicacion) en un solo UPDATE.
+    """
+
+    def __init__(
+        self,
+        repo: MovementRepository,
+        event_publisher: EventPublisher,
+        session: Session,
+    ):
+        self.repo = repo
+        self.event_publisher = event_publisher
+        self.session = session
+
+    def _handle(self, command: CreateMovementsBatchCommand) -> list[dict]:
+        if not command.movements:
+            return []
+
+        movements = self.repo.create_many(
+            [_build_movement(movement) for movement in command.movements]
+        )
+
+        self.event_publisher.publish(
+            MovementsCreated(
+                aggregate_id=movements[0].id,
+                movements=[
+                    {
+                        "movement_id": movement.id,
+                        "product_id": movement.product_id,
+                        "quantity": movement.quantity,
+                        "type": movement.type.value,
+                        "location_id": movement.location_id,
+                        "reason": movement.reason,
+                        "date": movement.date.isoformat() if movement.date else None,
+                    }
+                    for movement in movements
+                ],
+                reference_type=command.reference_type,
+                reference_id=command.reference_id,
+            ),
+            session=self.session,
+        )
+
+        return [movement.dict() for movement in movements]
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.inventory.movement.app.repositories import MovementRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -17,6 +18,8 @@ class GetAllMovementsQuery(Query):
     to_date: str | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -31,7 +34,13 @@ class GetAllMovementsQueryHandler(QueryHandler[GetAllMovementsQuery, dict]):
         if query.type is not None:
             filters["type"] = query.type
         # TODO: Implementar filtros por from_date y to_date cuando sea necesario
-        return self.repo.paginate(limit=query.limit, offset=query.offset, **filters)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filters,
+        )
 
 
 @dataclass
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -30,3 +30,24 @@ class MovementCreated(DomainEvent):
             "reason": self.reason,
             "date": self.date.isoformat() if self.date else None,
         }
+
+
+@dataclass
+class MovementsCreated(DomainEvent):
+    """
+    Evento emitido cuando se crean en lote los movimientos de un documento
+    (venta, recepcion, ajuste, transferencia). El stock se actualiza con un
+    solo UPDATE para todo el lote.
+    """
+
+    aggregate_id: int = 0  # id del primer movimiento del lote
+    movements: list[dict[str, Any]] = field(default_factory=list)
+    reference_type: str | None = None
+    reference_id: int | None = None
+
+    def _payload(self) -> dict[str, Any]:
+        return {
+            "movements": self.movements,
+            "reference_type": self.reference_type,
+            "reference_id": self.reference_id,
+        }
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Any
+
+from src.inventory.movement.domain.entities import Movement
+from src.shared.domain.specifications import Specification
+
+
+class MovementsByReference(Specification):
+    def __init__(self, reference_type: str, reference_id: int):
+        self.reference_type = reference_type
+        self.reference_id = reference_id
+
+    def is_satisfied_by(self, candidate: Movement) -> bool:
+        return (
+            candidate.reference_type == self.reference_type
+            and candidate.reference_id == self.reference_id
+        )
+
+    def to_query_criteria(self) -> list[Any]:
+        from src.inventory.movement.infra.models import MovementModel
+
+        return [
+            MovementModel.reference_type == self.reference_type,
+            MovementModel.reference_id == self.reference_id,
+        ]
+
+
+class MovementsDatedFrom(Specification):
+    """Lower bound on the date, which lets PostgreSQL skip older partitions."""
+
+    def __init__(self, since: datetime):
+        self.since = since
+
+    def is_satisfied_by(self, candidate: Movement) -> bool:
+        return candidate.date is not None and candidate.date >= self.since
+
+    def to_query_criteria(self) -> list[Any]:
+        from src.inventory.movement.infra.models import MovementModel
+
+        return [MovementModel.date >= self.since]
@@ -0,0 +1,203 @@
+"""
+Daily IN/OUT totals per product and warehouse, so period reports read one
+row per product and day instead of every movement.
+
+The movement repository upserts them in the transaction that inserts the
+movements. The rebuild recomputes a range of days from the movements, one
+committed month at a time (history, or after movements were edited):
+
+    python -m src.inventory.movement.infra.aggregates [--from DAY] [--to DAY]
+"""
+
+import argparse
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+import structlog
+from sqlalchemy import case, create_engine, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.inventory.location.infra.models import LocationModel
+from src.inventory.movement.domain.entities import Movement
+from src.inventory.movement.infra.models import (
+    NO_WAREHOUSE,
+    MovementDailyAggregateModel,
+    MovementModel,
+)
+
+logger = structlog.get_logger(__name__)
+
+_KEY = ["day", "warehouse_id", "product_id"]
+
+
+def _warehouses(session: Session, location_ids: set[int]) -> dict[int, int]:
+    if not location_ids:
+        return {}
+    rows = session.execute(
+        select(LocationModel.id, LocationModel.warehouse_id).where(
+            LocationModel.id.in_(location_ids)
+        )
+    )
+    return dict(rows.all())
+
+
+def record_daily_aggregates(session: Session, movements: list[Movement]) -> None:
+    """
+    Adds the movements to their daily totals with one INSERT ... ON CONFLICT
+    DO UPDATE, in key order so concurrent writers lock rows alike.
+    """
+    if not movements:
+        return
+
+    warehouses = _warehouses(
+        session, {m.location_id for m in movements if m.location_id is not None}
+    )
+    totals: dict[tuple[date, int, int], list[int]] = defaultdict(lambda: [0, 0, 0])
+    for movement in movements:
+        warehouse_id = warehouses.get(movement.location_id, NO_WAREHOUSE)
+        day = (movement.date or datetime.now()).date()
+        total = totals[(day, warehouse_id, movement.product_id)]
+        if movement.quantity > 0:
+            total[0] += movement.quantity
+        else:
+            total[1] -= movement.quantity
+        total[2] += 1
+
+    dialect = session.get_bind().dialect.name
+    upsert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = upsert(MovementDailyAggregateModel)
+    table = MovementDailyAggregateModel.__table__
+    stmt = stmt.on_conflict_do_update(
+        index_elements=_KEY,
+        set_={
+            column: table.c[column] + stmt.excluded[column]
+            for column in ("qty_in", "qty_out", "movement_count")
+        },
+    )
+    session.execute(
+        stmt,
+        [
+            {
+                "day": day,
+                "warehouse_id": warehouse_id,
+                "product_id": product_id,
+                "qty_in": qty_in,
+                "qty_out": qty_out,
+                "movement_count": count,
+            }
+            for (day, warehouse_id, product_id), (qty_in, qty_out, count) in sorted(
+                totals.items()
+            )
+        ],
+    )
+
+
+def rebuild_daily_aggregates(session: Session, first: date, last: date) -> int:
+    """
+    Replaces the totals of first..last with a single INSERT ... SELECT over
+    the movements of those days.
+    Returns:
+        Number of rows written
+    """
+    session.execute(
+        delete(MovementDailyAggregateModel).where(
+            MovementDailyAggregateModel.day.between(first, last)
+        )
+    )
+    day = func.date(MovementModel.date)
+    warehouse_id = func.coalesce(LocationModel.warehouse_id, NO_WAREHOUSE)
+    quantity = MovementModel.quantity
+    totals = (
+        select(
+            day,
+            warehouse_id,
+            MovementModel.product_id,
+            func.sum(case((quantity > 0, quantity), else_=0)),
+            func.sum(case((quantity < 0, -quantity), else_=0)),
+            func.count(),
+        )
+        .outerjoin(LocationModel, LocationModel.id == MovementModel.location_id)
+        .where(
+            MovementModel.date >= datetime.combine(first, datetime.min.time()),
+            MovementModel.date
+            < datetime.combine(last + timedelta(days=1), datetime.min.time()),
+        )
+        .group_by(day, warehouse_id, MovementModel.product_id)
+    )
+    result = session.execute(
+        insert(MovementDailyAggregateModel).from_select(
+            [*_KEY, "qty_in", "qty_out", "movement_count"], totals
+        )
+    )
+    return result.rowcount
+
+
+def _movement_days(session: Session) -> tuple[date, date] | None:
+    first, last = session.execute(
+        select(func.min(MovementModel.date), func.max(MovementModel.date))
+    ).one()
+    return (first.date(), last.date()) if first is not None else None
+
+
+def rebuild_by_month(session: Session, first: date, last: date) -> int:
+    """Rebuilds first..last a month at a time, committing each one."""
+    start = time.perf_counter()
+    rows = 0
+    chunk_first = first
+    while chunk_first <= last:
+        next_month = (chunk_first.replace(day=1) + timedelta(days=32)).replace(day=1)
+        chunk_last = min(next_month - timedelta(days=1), last)
+        rows += rebuild_daily_aggregates(session, chunk_first, chunk_last)
+        session.commit()
+        chunk_first = next_month
+
+    logger.info(
+        "movement_aggregates_rebuilt",
+        first=first.isoformat(),
+        last=last.isoformat(),
+        rows=rows,
+        elapsed_seconds=round(time.perf_counter() - start, 3),
+    )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    import src
+    from config import config
+    from src.container import create_wireup_container
+
+    # Wires every module, so all the mapped models are configured
+    src.wireup_container = create_wireup_container()
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild the daily movement totals from the movements."
+    )
+    parser.add_argument("--from", dest="first", type=date.fromisoformat)
+    parser.add_argument("--to", dest="last", type=date.fromisoformat)
+    parser.add_argument("--database-url", default=config.DB_CONNECTION_STRING)
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as session:
+            days = _movement_days(session)
+            if days is not None:
+                rebuild_by_month(session, args.first or days[0], args.last or days[1])
+        return 0
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    from config import config
+    from src.shared.infra.logging import configure_logging
+
+    configure_logging(
+        log_level=config.LOG_LEVEL,
+        json_output=config.ENVIRONMENT != "local",
+    )
+    sys.exit(main())
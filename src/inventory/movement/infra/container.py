@@ -1,4 +1,7 @@
-from src.inventory.movement.app.commands.movement import CreateMovementCommandHandler
+from src.inventory.movement.app.commands.movement import (
+    CreateMovementCommandHandler,
+    CreateMovementsBatchCommandHandler,
+)
 from src.inventory.movement.app.queries.movement import (
     GetAllMovementsQueryHandler,
     GetMovementByIdQueryHandler,
@@ -10,6 +13,7 @@ INJECTABLES = [
     MovementMapper,
     SqlAlchemyMovementRepository,
     CreateMovementCommandHandler,
+    CreateMovementsBatchCommandHandler,
     GetAllMovementsQueryHandler,
     GetMovementByIdQueryHandler,
 ]
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.inventory.movement.domain.constants import MovementType
@@ -8,7 +8,16 @@ from src.shared.infra.database import Base
 
 
 class MovementModel(Base):
+    # On PostgreSQL the table is range partitioned by month on date, with
+    # primary key (id, date) and no foreign key from movement_lot_items (see
+    # the partition_movements_by_month migration and infra/partitions.py)
     __tablename__ = "movements"
+    __table_args__ = (
+        Index("ix_movements_product_id_date", "product_id", "date"),
+        Index("ix_movements_date_id", "date", "id"),
+        Index("ix_movements_location_id", "location_id"),
+        Index("ix_movements_reference", "reference_type", "reference_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     product_id: Mapped[int] = mapped_column(ForeignKey("products.id"))
@@ -19,8 +28,35 @@ class MovementModel(Base):
     reference_type: Mapped[str | None] = mapped_column(String(64))
     reference_id: Mapped[int | None]
     reason: Mapped[str | None] = mapped_column(String(128))
-    date: Mapped[datetime | None] = mapped_column(default=datetime.now)
+    date: Mapped[datetime] = mapped_column(default=datetime.now)
     created_at: Mapped[datetime | None] = mapped_column(default=datetime.now)
     product: Mapped["ProductModel"] = relationship(  # NOQA: F821
         back_populates="movements"
     )
+
+
+# warehouse_id of the movements without a location: a real value instead of
+# NULL, so the upsert can conflict on it
+NO_WAREHOUSE = 0
+
+
+class MovementDailyAggregateModel(Base):
+    """IN/OUT totals of a product in a warehouse for one day, for period reports."""
+
+    __tablename__ = "movement_daily_aggregates"
+    __table_args__ = (
+        UniqueConstraint(
+            "day",
+            "warehouse_id",
+            "product_id",
+            name="uq_movement_aggregate_day_warehouse_product",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(nullable=False)
+    warehouse_id: Mapped[int] = mapped_column(nullable=False)
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False)
+    qty_in: Mapped[int] = mapped_column(nullable=False, default=0)
+    qty_out: Mapped[int] = mapped_column(nullable=False, default=0)  # Positive
+    movement_count: Mapped[int] = mapped_column(nullable=False, default=0)
@@ -0,0 +1,333 @@
+"""
+Monthly partitions of the movements table and the archival of old months.
+
+On PostgreSQL movements is range partitioned by date, one partition per month
+plus a default partition that catches dates nobody created a partition for.
+A daily cron job keeps the coming months created; archiving exports every
+month before the cutoff to a gzipped JSONL file and drops its partition
+(rows of older months caught by the default partition are exported and
+deleted from it):
+
+    python -m src.inventory.movement.infra.partitions ensure [--months-ahead N]
+    python -m src.inventory.movement.infra.partitions archive --before DAY [--directory DIR]
+
+On SQLite (development) there are no partitions: ensure does nothing and
+archive exports and deletes the rows month by month.
+
+The stock snapshot of the day before the cutoff is (re)built first: it is the
+opening balance that as-of queries and reconciliation start from once the
+older movements are gone.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+
+import structlog
+from sqlalchemy import create_engine, delete, func, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.stock.infra.snapshots import build_snapshot
+
+logger = structlog.get_logger(__name__)
+
+PARTITION_PREFIX = "movements_p"
+DEFAULT_PARTITION = "movements_default"
+_YIELD_PER = 5000
+
+
+@dataclass
+class ArchivedMonth:
+    month: date
+    rows: int
+    path: str
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y_%m}"
+
+
+def _partition_month(name: str) -> date:
+    return datetime.strptime(name[len(PARTITION_PREFIX) :], "%Y_%m").date()
+
+
+def is_partitioned(session: Session) -> bool:
+    """Whether movements is a partitioned table (PostgreSQL after the migration)."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(
+        session.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('movements')"
+            )
+        ).scalar()
+    )
+
+
+def monthly_partitions(session: Session) -> dict[date, str]:
+    """Month -> name of the monthly partitions attached to movements."""
+    names = session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass('movements')"
+        )
+    ).scalars()
+    return {
+        _partition_month(name): name
+        for name in names
+        if name.startswith(PARTITION_PREFIX)
+    }
+
+
+def create_partition(session: Session, month: date) -> str:
+    """
+    Creates the partition of month. Rows of that month already caught by the
+    default partition are moved into it, since PostgreSQL refuses to create
+    a partition whose range overlaps rows of the default one.
+    """
+    name = partition_name(month)
+    low, high = month.isoformat(), add_months(month, 1).isoformat()
+    bounds = f"FOR VALUES FROM ('{low}') TO ('{high}')"
+    in_range = f"date >= '{low}' AND date < '{high}'"
+
+    stray = session.execute(
+        text(f"SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range} LIMIT 1")
+    ).scalar()
+    if not stray:
+        session.execute(text(f"CREATE TABLE {name} PARTITION OF movements {bounds}"))
+        return name
+
+    session.execute(text(f"ALTER TABLE movements DETACH PARTITION {DEFAULT_PARTITION}"))
+    session.execute(text(f"CREATE TABLE {name} PARTITION OF movements {bounds}"))
+    session.execute(
+        text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}")
+    )
+    session.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+    session.execute(
+        text(f"ALTER TABLE movements ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
+    return name
+
+
+def ensure_movement_partitions(
+    session: Session, months_ahead: int, today: date | None = None
+) -> list[str]:
+    """
+    Creates the partitions missing from the current month to months_ahead
+    months later. A no-op when movements is not partitioned.
+    Returns:
+        Names of the partitions created
+    """
+    if not is_partitioned(session):
+        return []
+
+    current = month_start(today or date.today())
+    existing = monthly_partitions(session)
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            created.append(create_partition(session, month))
+    session.commit()
+    if created:
+        logger.info("movement_partitions_created", partitions=created)
+    return created
+
+
+def _months_before(session: Session, cutoff: date, partitioned: bool) -> list[date]:
+    if partitioned:
+        months = {m for m in monthly_partitions(session) if m < cutoff}
+        # Months nobody created a partition for live in the default partition
+        stray = session.execute(
+            text(
+                "SELECT DISTINCT date_trunc('month', date)::date "
+                f"FROM {DEFAULT_PARTITION} WHERE date < :cutoff"
+            ),
+            {"cutoff": cutoff},
+        ).scalars()
+        return sorted(months.union(stray))
+
+    first = session.execute(select(func.min(MovementModel.date))).scalar()
+    if first is None:
+        return []
+    months = []
+    month = month_start(first.date())
+    while month < cutoff:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def _json_default(value):
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def archive_month(
+    session: Session, month: date, directory: Path, partitioned: bool
+) -> ArchivedMonth:
+    """
+    Exports the movements of month to directory/<partition>.jsonl.gz, then
+    drops its partition (or deletes its rows, also when they sit in the
+    default partition) and commits. The file is complete before anything is
+    removed, so an interrupted run is retried from scratch.
+    """
+    name = partition_name(month)
+    start, end = (
+        datetime.combine(month, datetime.min.time()),
+        datetime.combine(add_months(month, 1), datetime.min.time()),
+    )
+    own_partition = partitioned and month in monthly_partitions(session)
+    if partitioned:
+        # Backdated writes into the month wait until its rows are gone
+        locked = name if own_partition else DEFAULT_PARTITION
+        session.execute(text(f"LOCK TABLE {locked} IN SHARE MODE"))
+
+    rows = session.execute(
+        select(MovementModel.__table__)
+        .where(MovementModel.date >= start, MovementModel.date < end)
+        .order_by(MovementModel.id)
+        .execution_options(yield_per=_YIELD_PER)
+    ).mappings()
+
+    path = directory / f"{name}.jsonl.gz"
+    partial = path.with_suffix(".gz.partial")
+    count = 0
+    with gzip.open(partial, "wt", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(dict(row), default=_json_default) + "\n")
+            count += 1
+    os.replace(partial, path)
+
+    if own_partition:
+        session.execute(text(f"ALTER TABLE movements DETACH PARTITION {name}"))
+        session.execute(text(f"DROP TABLE {name}"))
+    else:
+        session.execute(
+            delete(MovementModel).where(
+                MovementModel.date >= start, MovementModel.date < end
+            )
+        )
+    session.commit()
+    logger.info("movements_month_archived", month=month.isoformat(), rows=count)
+    return ArchivedMonth(month=month, rows=count, path=str(path))
+
+
+def archive_movements(
+    session: Session, before: date, directory: Path
+) -> list[ArchivedMonth]:
+    """
+    Archives every whole month before the month of before.
+    Returns:
+        The months archived, oldest first
+    """
+    start = time.perf_counter()
+    cutoff = month_start(before)
+    partitioned = is_partitioned(session)
+    months = _months_before(session, cutoff, partitioned)
+    if not months:
+        return []
+
+    build_snapshot(session, cutoff - timedelta(days=1))
+    session.commit()
+
+    directory.mkdir(parents=True, exist_ok=True)
+    archived = [
+        archive_month(session, month, directory, partitioned) for month in months
+    ]
+    logger.info(
+        "movements_archived",
+        before=cutoff.isoformat(),
+        months=len(archived),
+        rows=sum(month.rows for month in archived),
+        elapsed_seconds=round(time.perf_counter() - start, 3),
+    )
+    return archived
+
+
+def main(argv: list[str] | None = None) -> int:
+    import src
+    from config import config
+    from src.container import create_wireup_container
+
+    # Wires every module, so all the mapped models are configured
+    src.wireup_container = create_wireup_container()
+
+    parser = argparse.ArgumentParser(
+        description="Maintain the monthly partitions of movements."
+    )
+    parser.add_argument("--database-url", default=config.DB_CONNECTION_STRING)
+    commands = parser.add_subparsers(dest="command", required=True)
+    ensure = commands.add_parser("ensure", help="create the coming months")
+    ensure.add_argument(
+        "--months-ahead", type=int, default=config.MOVEMENT_PARTITION_MONTHS_AHEAD
+    )
+    archive = commands.add_parser("archive", help="export and drop old months")
+    archive.add_argument(
+        "--before",
+        type=date.fromisoformat,
+        required=True,
+        help="archive the whole months before this day's month",
+    )
+    archive.add_argument(
+        "--directory", type=Path, default=Path(config.MOVEMENT_ARCHIVE_DIR)
+    )
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as session:
+            if args.command == "ensure":
+                created = ensure_movement_partitions(session, args.months_ahead)
+                print(json.dumps({"created": created}))
+            else:
+                archived = archive_movements(session, args.before, args.directory)
+                print(
+                    json.dumps(
+                        [
+                            {**vars(month), "month": month.month.isoformat()}
+                            for month in archived
+                        ],
+                        indent=2,
+                    )
+                )
+        return 0
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    from config import config
+    from src.shared.infra.logging import configure_logging
+
+    configure_logging(
+        log_level=config.LOG_LEVEL,
+        json_output=config.ENVIRONMENT != "local",
+    )
+    sys.exit(main())
@@ -3,14 +3,30 @@ from wireup import injectable
 
 from src.inventory.movement.app.repositories import MovementRepository
 from src.inventory.movement.domain.entities import Movement
+from src.inventory.movement.infra.aggregates import record_daily_aggregates
 from src.inventory.movement.infra.mappers import MovementMapper
 from src.inventory.movement.infra.models import MovementModel
+from src.inventory.stock.infra.snapshots import record_backdated_movements
 from src.shared.infra.repositories import SqlAlchemyRepository
 
 
 @injectable(lifetime="scoped", as_type=MovementRepository)
 class SqlAlchemyMovementRepository(SqlAlchemyRepository[Movement], MovementRepository):
+    """Keeps the daily movement totals and stock snapshots in step with every insert."""
+
     __model__ = MovementModel
 
     def __init__(self, session: Session, mapper: MovementMapper):
         super().__init__(session, mapper)
+
+    def create(self, entity: Movement) -> Movement:
+        movement = super().create(entity)
+        record_daily_aggregates(self.session, [movement])
+        record_backdated_movements(self.session, [movement])
+        return movement
+
+    def create_many(self, entities: list[Movement]) -> list[Movement]:
+        movements = super().create_many(entities)
+        record_daily_aggregates(self.session, movements)
+        record_backdated_movements(self.session, movements)
+        return movements
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.inventory.serial.app.repositories import SerialNumberRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -13,6 +14,8 @@ class GetSerialsQuery(Query):
     status: str | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @dataclass
@@ -36,7 +39,13 @@ class GetSerialsQueryHandler(QueryHandler[GetSerialsQuery, dict]):
             kwargs["product_id"] = query.product_id
         if query.status is not None:
             kwargs["status"] = query.status
-        return self.repo.paginate(limit=query.limit, offset=query.offset, **kwargs)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **kwargs,
+        )
 
 
 @injectable(lifetime="scoped")
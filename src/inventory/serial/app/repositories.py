@@ -1,6 +1,10 @@
+from abc import abstractmethod
+
 from src.inventory.serial.domain.entities import SerialNumber
 from src.shared.app.repositories import Repository
 
 
 class SerialNumberRepository(Repository[SerialNumber]):
-    pass
+    @abstractmethod
+    def find_by_serials(self, serial_numbers: list[str]) -> list[SerialNumber]:
+        raise NotImplementedError
@@ -41,6 +41,18 @@ def handle_purchase_order_received_serials(
             serial_repo = scope.get(SerialNumberRepository)
             lot_repo = scope.get(LotRepository)
 
+            existing_by_serial = {
+                serial.serial_number: serial
+                for serial in serial_repo.find_by_serials(
+                    [
+                        sn
+                        for item in items_with_serials
+                        for sn in item.get("serial_numbers", [])
+                    ]
+                )
+            }
+
+            new_serials = []
             for item in items_with_serials:
                 product_id = item["product_id"]
                 serial_numbers = item.get("serial_numbers", [])
@@ -58,7 +70,7 @@ def handle_purchase_order_received_serials(
                         lot_id = lot.id
 
                 for sn in serial_numbers:
-                    existing = serial_repo.first(serial_number=sn)
+                    existing = existing_by_serial.get(sn)
                     if existing is not None:
                         if existing.product_id != product_id:
                             logger.error(
@@ -83,14 +95,17 @@ def handle_purchase_order_received_serials(
                         location_id=location_id,
                         purchase_order_id=purchase_order_id,
                     )
-                    serial = serial_repo.create(serial)
-                    logger.info(
-                        "serial_number_created",
-                        serial_id=serial.id,
-                        serial_number=sn,
-                        product_id=product_id,
-                        lot_id=lot_id,
-                    )
+                    existing_by_serial[sn] = serial
+                    new_serials.append(serial)
+
+            for serial in serial_repo.create_many(new_serials):
+                logger.info(
+                    "serial_number_created",
+                    serial_id=serial.id,
+                    serial_number=serial.serial_number,
+                    product_id=serial.product_id,
+                    lot_id=serial.lot_id,
+                )
 
         except Exception as e:
             logger.error(
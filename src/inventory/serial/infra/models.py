@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.shared.infra.database import Base
@@ -8,6 +8,9 @@ from src.shared.infra.database import Base
 
 class SerialNumberModel(Base):
     __tablename__ = "serial_numbers"
+    __table_args__ = (
+        Index("ix_serial_numbers_product_id_status", "product_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     product_id: Mapped[int] = mapped_column(
@@ -19,3 +19,10 @@ class SqlAlchemySerialNumberRepository(
 
     def find_by_serial(self, serial_number: str) -> SerialNumber | None:
         return self.first(serial_number=serial_number)
+
+    def find_by_serials(self, serial_numbers: list[str]) -> list[SerialNumber]:
+        if not serial_numbers:
+            return []
+        return self.filter(
+            [SerialNumberModel.serial_number.in_(serial_numbers)],
+        )
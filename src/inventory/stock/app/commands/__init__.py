@@ -0,0 +1,3 @@
+from .reconcile import ReconcileStockCommand, ReconcileStockCommandHandler
+
+__all__ = ["ReconcileStockCommand", "ReconcileStockCommandHandler"]
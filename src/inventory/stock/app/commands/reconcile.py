@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from wireup import injectable
+
+from src.inventory.stock.app.reconciliation import StockLedger
+from src.shared.app.commands import Command, CommandHandler
+
+
+@dataclass
+class ReconcileStockCommand(Command):
+    """Comando para comparar (y opcionalmente reparar) stocks contra movements"""
+
+    repair: bool = False
+    product_id_from: int | None = None
+    product_id_to: int | None = None
+
+
+@injectable(lifetime="scoped")
+class ReconcileStockCommandHandler(CommandHandler[ReconcileStockCommand, dict]):
+    def __init__(self, ledger: StockLedger):
+        self.ledger = ledger
+
+    def _handle(self, command: ReconcileStockCommand) -> dict:
+        report = self.ledger.reconcile(
+            product_id_from=command.product_id_from,
+            product_id_to=command.product_id_to,
+            repair=command.repair,
+        )
+        return report.dict()
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.inventory.stock.app.repositories import StockRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -15,6 +16,8 @@ class GetAllStocksQuery(Query):
     location_id: int | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -29,7 +32,11 @@ class GetAllStocksQueryHandler(QueryHandler[GetAllStocksQuery, dict]):
         if query.location_id is not None:
             filter_kwargs["location_id"] = query.location_id
         return self.repo.paginate(
-            limit=query.limit, offset=query.offset, **filter_kwargs
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filter_kwargs,
         )
 
 
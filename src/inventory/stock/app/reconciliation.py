@@ -0,0 +1,71 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+
+MAX_REPORTED_DRIFTS = 1000
+
+
+@dataclass
+class StockDrift:
+    product_id: int
+    location_id: int | None
+    expected: int  # Sum of the movements
+    actual: int | None  # Quantity in stocks; None when the row is missing
+
+
+@dataclass
+class ReconciliationReport:
+    movements_scanned: int = 0
+    keys_checked: int = 0
+    drift_count: int = 0
+    repaired: int = 0
+    elapsed_seconds: float = 0.0
+    # Only the first MAX_REPORTED_DRIFTS; drift_count has the total
+    drifts: list[StockDrift] = field(default_factory=list)
+
+    @property
+    def movements_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.movements_scanned / self.elapsed_seconds
+
+    def add_drift(self, drift: StockDrift) -> None:
+        self.drift_count += 1
+        if len(self.drifts) < MAX_REPORTED_DRIFTS:
+            self.drifts.append(drift)
+
+    def merge(self, other: "ReconciliationReport") -> None:
+        """Adds the counters and drifts of a report over another product range."""
+        self.movements_scanned += other.movements_scanned
+        self.keys_checked += other.keys_checked
+        self.repaired += other.repaired
+        self.drift_count += other.drift_count
+        room = MAX_REPORTED_DRIFTS - len(self.drifts)
+        self.drifts.extend(other.drifts[:room])
+
+    def dict(self) -> dict:
+        return {
+            **asdict(self),
+            "movements_per_second": round(self.movements_per_second, 2),
+        }
+
+
+class StockLedger(ABC):
+    """The movements table seen as the ledger that stocks must add up to."""
+
+    @abstractmethod
+    def reconcile(
+        self,
+        product_id_from: int | None = None,
+        product_id_to: int | None = None,
+        repair: bool = False,
+    ) -> ReconciliationReport:
+        """
+        Compares every stock quantity with the sum of its movements.
+        Args:
+            product_id_from: First product ID to check (default: lowest)
+            product_id_to: Last product ID to check (default: highest)
+            repair: Whether to rewrite drifted quantities from the movements
+        Returns:
+            Counters, throughput and the drifts found
+        """
+        raise NotImplementedError
@@ -1,6 +1,40 @@
+from abc import abstractmethod
+
 from src.inventory.stock.domain.entities import Stock
 from src.shared.app.repositories import Repository
 
 
 class StockRepository(Repository[Stock]):
-    pass
+    @abstractmethod
+    def apply_delta(
+        self, product_id: int, location_id: int | None, delta: int
+    ) -> tuple[Stock, bool]:
+        """
+        Atomically adds delta to the stock of (product_id, location_id).
+        Args:
+            product_id: Product whose stock changes
+            location_id: Location of the stock row (None for unassigned stock)
+            delta: Signed quantity to add
+        Returns:
+            The resulting stock and whether the row was created
+        Raises:
+            InsufficientStockError: If the delta would make the quantity negative
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply_deltas(
+        self, deltas: dict[tuple[int, int | None], int]
+    ) -> list[tuple[Stock, bool]]:
+        """
+        Atomically adds several deltas with a single UPDATE, creating the
+        missing stock rows with one INSERT.
+        Args:
+            deltas: Signed quantity per (product_id, location_id)
+        Returns:
+            The resulting stock and whether the row was created, in the
+            order of deltas
+        Raises:
+            InsufficientStockError: If any delta would make a quantity negative
+        """
+        raise NotImplementedError
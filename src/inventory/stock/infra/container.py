@@ -1,9 +1,11 @@
+from src.inventory.stock.app.commands import ReconcileStockCommandHandler
 from src.inventory.stock.app.queries.stock import (
     GetAllStocksQueryHandler,
     GetStockByIdQueryHandler,
     GetStockByProductQueryHandler,
 )
 from src.inventory.stock.infra.mappers import StockMapper
+from src.inventory.stock.infra.reconciliation import SqlAlchemyStockLedger
 from src.inventory.stock.infra.repositories import SqlAlchemyStockRepository
 
 INJECTABLES = [
@@ -12,4 +14,6 @@ INJECTABLES = [
     GetAllStocksQueryHandler,
     GetStockByIdQueryHandler,
     GetStockByProductQueryHandler,
+    SqlAlchemyStockLedger,
+    ReconcileStockCommandHandler,
 ]
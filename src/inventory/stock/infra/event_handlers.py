@@ -3,11 +3,12 @@ Event handlers para Stock que reaccionan a eventos de otros módulos.
 Este handler desacopla Movement de Stock mediante eventos.
 """
 
+from collections import defaultdict
 from typing import Any
 
 import structlog
 
-from src.inventory.movement.domain.events import MovementCreated
+from src.inventory.movement.domain.events import MovementCreated, MovementsCreated
 from src.inventory.stock.app.repositories import StockRepository
 from src.inventory.stock.domain.entities import Stock
 from src.inventory.stock.domain.events import StockCreated, StockUpdated
@@ -23,7 +24,8 @@ def handle_movement_created(event: MovementCreated, session: Any = None) -> None
     """
     Cuando se crea un movimiento, actualizar o crear el stock correspondiente.
     El stock se maneja por (product_id, location_id). Si location_id es None,
-    se actualiza el stock sin ubicación asignada.
+    se actualiza el stock sin ubicación asignada. El delta se aplica con un
+    único UPDATE condicional en la base de datos (sin leer-modificar-escribir).
     """
     logger.info(
         "handling_movement_created",
@@ -36,80 +38,92 @@ def handle_movement_created(event: MovementCreated, session: Any = None) -> None
     with create_sync_scope(session) as scope:
         try:
             stock_repo = scope.get(StockRepository)
+            stock, created = stock_repo.apply_delta(
+                event.product_id, event.location_id, event.quantity
+            )
+            _publish_stock_change(stock, created, event.quantity, session)
 
-            # Find stock by (product_id, location_id)
-            if event.location_id is not None:
-                stock = stock_repo.first(
-                    product_id=event.product_id, location_id=event.location_id
-                )
-            else:
-                stock = stock_repo.first(product_id=event.product_id, location_id=None)
+        except Exception as e:
+            logger.error(
+                "movement_created_handler_error",
+                movement_id=event.aggregate_id,
+                product_id=event.product_id,
+                error=str(e),
+            )
+            raise
 
-            if stock is None:
-                logger.info(
-                    "creating_new_stock",
-                    product_id=event.product_id,
-                    location_id=event.location_id,
-                )
-                stock = Stock(
-                    product_id=event.product_id,
-                    quantity=event.quantity,
-                    location_id=event.location_id,
-                )
-                stock = stock_repo.create(stock)
 
-                EventBus.publish(
-                    StockCreated(
-                        aggregate_id=stock.id,
-                        product_id=stock.product_id,
-                        quantity=stock.quantity,
-                        location_id=stock.location_id,
-                    ),
-                    session=session,
-                )
-                logger.info(
-                    "stock_created",
-                    stock_id=stock.id,
-                    product_id=stock.product_id,
-                    quantity=stock.quantity,
-                    location_id=stock.location_id,
-                )
-            else:
-                old_quantity = stock.quantity
-                logger.info(
-                    "updating_existing_stock",
-                    stock_id=stock.id,
-                    current_quantity=old_quantity,
-                    delta=event.quantity,
-                    location_id=stock.location_id,
-                )
+@event_handler(MovementsCreated)
+def handle_movements_created(event: MovementsCreated, session: Any = None) -> None:
+    """
+    Cuando se crean movimientos en lote, agrega los deltas por
+    (product_id, location_id) y los aplica con un solo UPDATE.
+    """
+    deltas: dict[tuple[int, int | None], int] = defaultdict(int)
+    for movement in event.movements:
+        deltas[(movement["product_id"], movement["location_id"])] += movement[
+            "quantity"
+        ]
 
-                stock = stock.update_quantity(event.quantity)
-                stock = stock_repo.update(stock)
+    logger.info(
+        "handling_movements_created",
+        reference_type=event.reference_type,
+        reference_id=event.reference_id,
+        movements=len(event.movements),
+        stocks=len(deltas),
+    )
 
-                EventBus.publish(
-                    StockUpdated(
-                        aggregate_id=stock.id,
-                        product_id=stock.product_id,
-                        old_quantity=old_quantity,
-                        new_quantity=stock.quantity,
-                        location_id=stock.location_id,
-                    ),
-                    session=session,
-                )
-                logger.info(
-                    "stock_updated",
-                    stock_id=stock.id,
-                    old_quantity=old_quantity,
-                    new_quantity=stock.quantity,
-                    location_id=stock.location_id,
-                )
+    with create_sync_scope(session) as scope:
+        try:
+            stock_repo = scope.get(StockRepository)
+            results = stock_repo.apply_deltas(dict(deltas))
+            for (stock, created), delta in zip(results, deltas.values(), strict=True):
+                _publish_stock_change(stock, created, delta, session)
 
         except Exception as e:
             logger.error(
-                "movement_created_handler_error",
-                movement_id=event.aggregate_id,
-                product_id=event.product_id,
+                "movements_created_handler_error",
+                reference_type=event.reference_type,
+                reference_id=event.reference_id,
                 error=str(e),
             )
             raise
+
+
+def _publish_stock_change(stock: Stock, created: bool, delta: int, session: Any):
+    if created:
+        EventBus.publish(
+            StockCreated(
+                aggregate_id=stock.id,
+                product_id=stock.product_id,
+                quantity=stock.quantity,
+                location_id=stock.location_id,
+            ),
+            session=session,
+        )
+        logger.info(
+            "stock_created",
+            stock_id=stock.id,
+            product_id=stock.product_id,
+            quantity=stock.quantity,
+            location_id=stock.location_id,
+        )
+    else:
+        old_quantity = stock.quantity - delta
+        EventBus.publish(
+            StockUpdated(
+                aggregate_id=stock.id,
+                product_id=stock.product_id,
+                old_quantity=old_quantity,
+                new_quantity=stock.quantity,
+                location_id=stock.location_id,
+            ),
+            session=session,
+        )
+        logger.info(
+            "stock_updated",
+            stock_id=stock.id,
+            old_quantity=old_quantity,
+            new_quantity=stock.quantity,
+            location_id=stock.location_id,
+        )
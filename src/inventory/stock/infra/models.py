@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey, UniqueConstraint
+from datetime import date
+
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infra.database import Base
@@ -8,6 +10,16 @@ class StockModel(Base):
     __tablename__ = "stocks"
     __table_args__ = (
         UniqueConstraint("product_id", "location_id", name="uq_stock_product_location"),
+        # NULLs are distinct in the constraint above: one row per product
+        # without a location needs its own index
+        Index(
+            "uq_stock_product_without_location",
+            "product_id",
+            unique=True,
+            postgresql_where=text("location_id IS NULL"),
+            sqlite_where=text("location_id IS NULL"),
+        ),
+        Index("ix_stocks_location_id", "location_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -19,3 +31,23 @@ class StockModel(Base):
     product: Mapped["ProductModel"] = relationship(  # NOQA: F821
         back_populates="stocks"
     )
+
+
+class StockDailySnapshotModel(Base):
+    """Quantity of each (product, location) at the end of a day; zero balances are omitted."""
+
+    __tablename__ = "stock_daily_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "day",
+            "product_id",
+            "location_id",
+            name="uq_stock_snapshot_day_product_location",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(nullable=False)
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False)
+    location_id: Mapped[int | None] = mapped_column(ForeignKey("locations.id"))
+    quantity: Mapped[int] = mapped_column(nullable=False)
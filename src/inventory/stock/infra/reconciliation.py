@@ -0,0 +1,348 @@
+"""
+Rebuilds stock quantities from the movements ledger.
+
+The admin endpoint checks (and repairs) inside its request transaction. For
+large tables run the tool, which splits the product IDs across processes
+and commits chunk by chunk:
+
+    python -m src.inventory.stock.infra.reconciliation [--repair] [--workers N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import structlog
+from sqlalchemy import create_engine, func, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+from wireup import injectable
+
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.stock.app.reconciliation import (
+    ReconciliationReport,
+    StockDrift,
+    StockLedger,
+)
+from src.inventory.stock.infra.models import StockDailySnapshotModel, StockModel
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000  # Product IDs per chunk
+_YIELD_PER = 5000
+_RANGES_PER_WORKER = 4
+
+
+def opening_snapshot_day(session: Session) -> date | None:
+    """
+    Day of the snapshot the remaining movements start from: the latest one
+    before the oldest movement, which only exists once older months were
+    archived. None while the ledger holds the whole history.
+    """
+    first = session.execute(select(func.min(MovementModel.date))).scalar()
+    latest = select(func.max(StockDailySnapshotModel.day))
+    if first is not None:
+        latest = latest.where(StockDailySnapshotModel.day < first.date())
+    return session.execute(latest).scalar()
+
+
+def product_id_bounds(
+    session: Session,
+    product_id_from: int | None = None,
+    product_id_to: int | None = None,
+    opening_day: date | None = None,
+) -> tuple[int, int] | None:
+    """
+    Lowest and highest product ID with movements, stock or an opening
+    balance, within the limits.
+    """
+    queries = [
+        select(func.min(model.product_id), func.max(model.product_id))
+        for model in (MovementModel, StockModel)
+    ]
+    if opening_day is not None:
+        queries.append(
+            select(
+                func.min(StockDailySnapshotModel.product_id),
+                func.max(StockDailySnapshotModel.product_id),
+            ).where(StockDailySnapshotModel.day == opening_day)
+        )
+    bounds = [session.execute(query).one() for query in queries]
+    lows = [low for low, _ in bounds if low is not None]
+    highs = [high for _, high in bounds if high is not None]
+    if not lows:
+        return None
+
+    first = max(min(lows), product_id_from or 0)
+    last = min(max(highs), product_id_to) if product_id_to else max(highs)
+    return (first, last) if first <= last else None
+
+
+def _chunks(first: int, last: int, size: int) -> Iterator[tuple[int, int]]:
+    for start in range(first, last + 1, size):
+        yield start, min(start + size - 1, last)
+
+
+def _key_order(key: tuple[int, int | None]) -> tuple[int, bool, int]:
+    product_id, location_id = key
+    return product_id, location_id is not None, location_id or 0
+
+
+def reconcile_chunk(
+    session: Session,
+    first: int,
+    last: int,
+    repair: bool = False,
+    opening_day: date | None = None,
+) -> ReconciliationReport:
+    """
+    Compares the stocks of products first..last with their movements, on
+    top of the snapshot of opening_day when older movements were archived.
+    """
+    stocks = select(
+        StockModel.id,
+        StockModel.product_id,
+        StockModel.location_id,
+        StockModel.quantity,
+    ).where(StockModel.product_id.between(first, last))
+    if repair:
+        # Locked before summing: a movement committed later adds its delta
+        # on top of the repaired quantity
+        stocks = stocks.with_for_update()
+    actual = {
+        (product_id, location_id): (id, quantity)
+        for id, product_id, location_id, quantity in session.execute(stocks)
+    }
+
+    ledger = (
+        select(
+            MovementModel.product_id,
+            MovementModel.location_id,
+            func.sum(MovementModel.quantity),
+            func.count(),
+        )
+        .where(MovementModel.product_id.between(first, last))
+        .group_by(MovementModel.product_id, MovementModel.location_id)
+        .execution_options(yield_per=_YIELD_PER)
+    )
+    report = ReconciliationReport()
+    expected: dict[tuple[int, int | None], int] = {}
+    if opening_day is not None:
+        opening = select(
+            StockDailySnapshotModel.product_id,
+            StockDailySnapshotModel.location_id,
+            StockDailySnapshotModel.quantity,
+        ).where(
+            StockDailySnapshotModel.day == opening_day,
+            StockDailySnapshotModel.product_id.between(first, last),
+        )
+        for product_id, location_id, quantity in session.execute(opening):
+            expected[(product_id, location_id)] = quantity
+    for product_id, location_id, total, count in session.execute(ledger):
+        key = (product_id, location_id)
+        expected[key] = expected.get(key, 0) + int(total)
+        report.movements_scanned += count
+
+    updates: list[dict] = []
+    inserts: list[dict] = []
+    keys = sorted(actual.keys() | expected.keys(), key=_key_order)
+    report.keys_checked = len(keys)
+    for key in keys:
+        quantity = expected.get(key, 0)
+        stock_id, current = actual.get(key, (None, None))
+        if current == quantity or (current is None and quantity == 0):
+            continue
+        report.add_drift(StockDrift(*key, expected=quantity, actual=current))
+        if stock_id is not None:
+            updates.append({"id": stock_id, "quantity": quantity})
+        else:
+            inserts.append(
+                {
+                    "product_id": key[0],
+                    "location_id": key[1],
+                    "quantity": quantity,
+                    "reserved_quantity": 0,
+                }
+            )
+
+    if repair:
+        if updates:
+            session.execute(update(StockModel), updates)
+        if inserts:
+            session.execute(insert(StockModel), inserts)
+        report.repaired = len(updates) + len(inserts)
+    return report
+
+
+def reconcile_range(
+    session: Session,
+    first: int,
+    last: int,
+    repair: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    commit: bool = False,
+) -> ReconciliationReport:
+    """Reconciles products first..last chunk by chunk, optionally committing each."""
+    start = time.perf_counter()
+    opening_day = opening_snapshot_day(session)
+    report = ReconciliationReport()
+    for chunk_first, chunk_last in _chunks(first, last, chunk_size):
+        report.merge(
+            reconcile_chunk(session, chunk_first, chunk_last, repair, opening_day)
+        )
+        if commit:
+            session.commit()
+    report.elapsed_seconds = time.perf_counter() - start
+    return report
+
+
+@injectable(lifetime="scoped", as_type=StockLedger)
+class SqlAlchemyStockLedger(StockLedger):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def reconcile(
+        self,
+        product_id_from: int | None = None,
+        product_id_to: int | None = None,
+        repair: bool = False,
+    ) -> ReconciliationReport:
+        bounds = product_id_bounds(
+            self.session,
+            product_id_from,
+            product_id_to,
+            opening_snapshot_day(self.session),
+        )
+        if bounds is None:
+            return ReconciliationReport()
+        report = reconcile_range(self.session, *bounds, repair=repair)
+        _log_report(report, repair)
+        return report
+
+
+def _reconcile_range_in_process(
+    database_url: str, first: int, last: int, repair: bool, chunk_size: int
+) -> ReconciliationReport:
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as session:
+            return reconcile_range(
+                session, first, last, repair, chunk_size, commit=True
+            )
+    finally:
+        engine.dispose()
+
+
+def reconcile_in_parallel(
+    database_url: str,
+    workers: int,
+    repair: bool = False,
+    product_id_from: int | None = None,
+    product_id_to: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ReconciliationReport:
+    """
+    Splits the product IDs in ranges reconciled by a pool of processes,
+    each with its own connection; a single worker runs in this process.
+    """
+    start = time.perf_counter()
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as session:
+            bounds = product_id_bounds(
+                session,
+                product_id_from,
+                product_id_to,
+                opening_snapshot_day(session),
+            )
+    finally:
+        engine.dispose()
+
+    report = ReconciliationReport()
+    if bounds is not None:
+        first, last = bounds
+        range_size = max(
+            chunk_size, -(-(last - first + 1) // (workers * _RANGES_PER_WORKER))
+        )
+        ranges = list(_chunks(first, last, range_size))
+        args = (
+            [database_url] * len(ranges),
+            [r[0] for r in ranges],
+            [r[1] for r in ranges],
+            [repair] * len(ranges),
+            [chunk_size] * len(ranges),
+        )
+        if workers > 1 and len(ranges) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_reconcile_range_in_process, *args))
+        else:
+            parts = list(map(_reconcile_range_in_process, *args))
+        for part in parts:
+            report.merge(part)
+
+    report.elapsed_seconds = time.perf_counter() - start
+    _log_report(report, repair)
+    return report
+
+
+def _log_report(report: ReconciliationReport, repair: bool) -> None:
+    logger.info(
+        "stock_reconciliation_finished",
+        repair=repair,
+        movements_scanned=report.movements_scanned,
+        keys_checked=report.keys_checked,
+        drift_count=report.drift_count,
+        repaired=report.repaired,
+        elapsed_seconds=round(report.elapsed_seconds, 3),
+        movements_per_second=round(report.movements_per_second, 2),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    import src
+    from config import config
+    from src.container import create_wireup_container
+
+    # Wires every module, so all the mapped models are configured
+    src.wireup_container = create_wireup_container()
+
+    parser = argparse.ArgumentParser(
+        description="Compare stocks with the sum of their movements."
+    )
+    parser.add_argument(
+        "--repair", action="store_true", help="rewrite drifted quantities"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--product-id-from", type=int)
+    parser.add_argument("--product-id-to", type=int)
+    parser.add_argument("--database-url", default=config.DB_CONNECTION_STRING)
+    args = parser.parse_args(argv)
+
+    report = reconcile_in_parallel(
+        args.database_url,
+        workers=args.workers,
+        repair=args.repair,
+        product_id_from=args.product_id_from,
+        product_id_to=args.product_id_to,
+        chunk_size=args.chunk_size,
+    )
+    print(json.dumps(report.dict(), indent=2))
+    # Non-zero exit when drift is left behind, for cron and CI checks
+    return 1 if report.drift_count and not args.repair else 0
+
+
+if __name__ == "__main__":
+    from config import config
+    from src.shared.infra.logging import configure_logging
+
+    configure_logging(
+        log_level=config.LOG_LEVEL,
+        json_output=config.ENVIRONMENT != "local",
+    )
+    sys.exit(main())
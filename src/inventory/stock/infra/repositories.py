@@ -1,12 +1,18 @@
+from sqlalchemy import Boolean, and_, case, literal_column, or_, true, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from wireup import injectable
 
 from src.inventory.stock.app.repositories import StockRepository
 from src.inventory.stock.domain.entities import Stock
+from src.inventory.stock.domain.exceptions import InsufficientStockError
 from src.inventory.stock.infra.mappers import StockMapper
 from src.inventory.stock.infra.models import StockModel
 from src.shared.infra.repositories import SqlAlchemyRepository
 
+# Keys per UPDATE in apply_deltas; each adds a CASE branch and a guard
+_DELTAS_PER_STATEMENT = 200
+
 
 @injectable(lifetime="scoped", as_type=StockRepository)
 class SqlAlchemyStockRepository(SqlAlchemyRepository[Stock], StockRepository):
@@ -14,3 +20,152 @@ class SqlAlchemyStockRepository(SqlAlchemyRepository[Stock], StockRepository):
 
     def __init__(self, session: Session, mapper: StockMapper):
         super().__init__(session, mapper)
+
+    def apply_delta(
+        self, product_id: int, location_id: int | None, delta: int
+    ) -> tuple[Stock, bool]:
+        stock = self._increment(product_id, location_id, delta)
+        if stock is not None:
+            return stock, False
+
+        # No row matched: either it does not exist yet or the guard rejected
+        # the delta. A non-negative delta can only miss because the row is new.
+        if delta < 0:
+            raise InsufficientStockError(product_id, delta)
+
+        return self._upsert([((product_id, location_id), delta)])[
+            (product_id, location_id)
+        ]
+
+    def apply_deltas(
+        self, deltas: dict[tuple[int, int | None], int]
+    ) -> list[tuple[Stock, bool]]:
+        # A stable key order makes concurrent batches lock rows in the same order
+        ordered = sorted(deltas.items(), key=lambda i: (i[0][0], i[0][1] or 0))
+        results: dict[tuple[int, int | None], tuple[Stock, bool]] = {}
+        for start in range(0, len(ordered), _DELTAS_PER_STATEMENT):
+            for stock in self._increment_many(
+                ordered[start : start + _DELTAS_PER_STATEMENT]
+            ):
+                results[(stock.product_id, stock.location_id)] = (stock, False)
+
+        # Keys without a matching row are new, unless the guard rejected them
+        missing = [(key, delta) for key, delta in ordered if key not in results]
+        for (product_id, _), delta in missing:
+            if delta < 0:
+                raise InsufficientStockError(product_id, delta)
+
+        if missing:
+            results.update(self._upsert(missing))
+
+        return [results[key] for key in deltas]
+
+    def _upsert(
+        self, deltas: list[tuple[tuple[int, int | None], int]]
+    ) -> dict[tuple[int, int | None], tuple[Stock, bool]]:
+        """
+        Inserts the rows of non-negative deltas with INSERT ... ON CONFLICT DO
+        UPDATE, adding the delta to any row a concurrent transaction inserted
+        first. Rows with and without a location conflict on different unique
+        indexes, so each kind is its own statement.
+        Returns:
+            (stock, created) per key
+        """
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            upsert = postgresql.insert
+            # xmax is 0 on the rows the statement inserted
+            created = literal_column("xmax = 0", Boolean)
+        else:
+            upsert = sqlite.insert
+            # SQLite holds the write lock since the guarded UPDATE found no
+            # row, so no other transaction can have inserted it
+            created = true()
+
+        results = {}
+        for without_location in (False, True):
+            rows = [
+                {
+                    "product_id": product_id,
+                    "location_id": location_id,
+                    "quantity": delta,
+                    "reserved_quantity": 0,
+                }
+                for (product_id, location_id), delta in deltas
+                if (location_id is None) == without_location
+            ]
+            if not rows:
+                continue
+            stmt = upsert(StockModel)
+            if without_location:
+                conflict = {
+                    "index_elements": ["product_id"],
+                    "index_where": StockModel.location_id.is_(None),
+                }
+            else:
+                conflict = {"index_elements": ["product_id", "location_id"]}
+            stmt = stmt.on_conflict_do_update(
+                **conflict,
+                set_={"quantity": StockModel.quantity + stmt.excluded.quantity},
+            )
+            returned = self.session.execute(
+                stmt.returning(StockModel, created).execution_options(
+                    populate_existing=True
+                ),
+                rows,
+            )
+            for model, was_created in returned:
+                key = (model.product_id, model.location_id)
+                results[key] = (self.mapper.to_entity(model), bool(was_created))
+        return results
+
+    def _increment_many(
+        self, deltas: list[tuple[tuple[int, int | None], int]]
+    ) -> list[Stock]:
+        def matches(product_id: int, location_id: int | None):
+            if location_id is None:
+                location_criteria = StockModel.location_id.is_(None)
+            else:
+                location_criteria = StockModel.location_id == location_id
+            return and_(StockModel.product_id == product_id, location_criteria)
+
+        stmt = (
+            update(StockModel)
+            .where(
+                or_(
+                    *(
+                        and_(matches(*key), StockModel.quantity + delta >= 0)
+                        for key, delta in deltas
+                    )
+                )
+            )
+            .values(
+                quantity=StockModel.quantity
+                + case(*((matches(*key), delta) for key, delta in deltas), else_=0)
+            )
+            .returning(StockModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return self.mapper.to_entities(self.session.execute(stmt).scalars())
+
+    def _increment(
+        self, product_id: int, location_id: int | None, delta: int
+    ) -> Stock | None:
+        if location_id is None:
+            location_criteria = StockModel.location_id.is_(None)
+        else:
+            location_criteria = StockModel.location_id == location_id
+
+        stmt = (
+            update(StockModel)
+            .where(
+                StockModel.product_id == product_id,
+                location_criteria,
+                StockModel.quantity + delta >= 0,
+            )
+            .values(quantity=StockModel.quantity + delta)
+            .returning(StockModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        model = self.session.execute(stmt).scalars().first()
+        return self.mapper.to_entity(model)
@@ -1,13 +1,28 @@
 from fastapi import APIRouter, Depends
 from wireup import Injected
 
+from src.inventory.stock.app.commands import (
+    ReconcileStockCommand,
+    ReconcileStockCommandHandler,
+)
 from src.inventory.stock.app.queries.stock import (
     GetAllStocksQuery,
     GetAllStocksQueryHandler,
 )
-from src.inventory.stock.infra.validators import StockQueryParams, StockResponse
+from src.inventory.stock.infra.validators import (
+    ReconcileStockRequest,
+    ReconciliationResponse,
+    StockQueryParams,
+    StockResponse,
+)
 from src.shared.infra.dependencies import get_meta
-from src.shared.infra.validators import RESPONSES_LIST, Meta, PaginatedDataResponse
+from src.shared.infra.validators import (
+    RESPONSES_COMMAND,
+    RESPONSES_LIST,
+    DataResponse,
+    Meta,
+    PaginatedDataResponse,
+)
 
 
 class StockRouter:
@@ -23,6 +38,12 @@ class StockRouter:
             summary="Get all stocks",
             responses=RESPONSES_LIST,
         )(self.get_all)
+        self.router.post(
+            "/reconcile",
+            response_model=DataResponse[ReconciliationResponse],
+            summary="Reconcile stock with movements",
+            responses=RESPONSES_COMMAND,
+        )(self.reconcile)
 
     def get_all(
         self,
@@ -40,5 +61,19 @@ class StockRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
+
+    def reconcile(
+        self,
+        request: ReconcileStockRequest,
+        handler: Injected[ReconcileStockCommandHandler],
+        meta: Meta = Depends(get_meta),
+    ) -> DataResponse[ReconciliationResponse]:
+        """Compare every stock quantity with the sum of its movements and, with repair, rewrite the drifted ones. For large catalogs use `python -m src.inventory.stock.infra.reconciliation`."""
+        result = handler.handle(ReconcileStockCommand(**request.model_dump()))
+        return DataResponse(
+            data=ReconciliationResponse.model_validate(result), meta=meta
+        )
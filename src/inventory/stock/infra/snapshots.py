@@ -0,0 +1,265 @@
+"""
+Daily stock snapshots, so as-of quantities read one day of balances plus the
+movements after it instead of the whole movements history.
+
+The nightly job appends every day missing up to yesterday; the movement
+repository adds backdated movements to the snapshots already built; the
+backfill rebuilds a range of days (e.g. after movements were edited), one
+committed day at a time:
+
+    python -m src.inventory.stock.infra.snapshots [--backfill] [--from DAY] [--to DAY]
+"""
+
+import argparse
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+import structlog
+from sqlalchemy import (
+    Date,
+    Subquery,
+    create_engine,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.pool import NullPool
+
+from src.inventory.movement.domain.entities import Movement
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.stock.infra.models import StockDailySnapshotModel
+
+logger = structlog.get_logger(__name__)
+
+
+def _start_of(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def stock_entries_as_of(session: Session, day: date) -> Subquery:
+    """
+    Signed quantities (product_id, location_id, quantity) whose sum per
+    product and location is the stock at the end of day: the nearest
+    snapshot on or before day plus the movements dated after it.
+    """
+    snapshot_day = session.execute(
+        select(func.max(StockDailySnapshotModel.day)).where(
+            StockDailySnapshotModel.day <= day
+        )
+    ).scalar()
+
+    movements = select(
+        MovementModel.product_id,
+        MovementModel.location_id,
+        MovementModel.quantity,
+    ).where(MovementModel.date < _start_of(day + timedelta(days=1)))
+    if snapshot_day is None:
+        return movements.subquery()
+
+    movements = movements.where(
+        MovementModel.date >= _start_of(snapshot_day + timedelta(days=1))
+    )
+    snapshot = select(
+        StockDailySnapshotModel.product_id,
+        StockDailySnapshotModel.location_id,
+        StockDailySnapshotModel.quantity,
+    ).where(StockDailySnapshotModel.day == snapshot_day)
+    return union_all(snapshot, movements).subquery()
+
+
+def build_snapshot(session: Session, day: date) -> int:
+    """
+    (Re)builds the snapshot of day from the previous one and the day's
+    movements with a single INSERT ... SELECT.
+    Returns:
+        Number of non-zero balances stored
+    """
+    session.execute(
+        delete(StockDailySnapshotModel).where(StockDailySnapshotModel.day == day)
+    )
+    entries = stock_entries_as_of(session, day)
+    quantity = func.sum(entries.c.quantity)
+    balances = (
+        select(
+            literal(day, Date),
+            entries.c.product_id,
+            entries.c.location_id,
+            quantity,
+        )
+        .group_by(entries.c.product_id, entries.c.location_id)
+        .having(quantity != 0)
+    )
+    result = session.execute(
+        insert(StockDailySnapshotModel).from_select(
+            ["day", "product_id", "location_id", "quantity"], balances
+        )
+    )
+    return result.rowcount
+
+
+def record_backdated_movements(session: Session, movements: list[Movement]) -> None:
+    """
+    Adds movements dated on or before the latest snapshot to every snapshot
+    from their day on, in the transaction that inserts them, so as-of
+    quantities of those days (and the days built from them) include them.
+    """
+    days = [(movement.date or datetime.now()).date() for movement in movements]
+    if not days:
+        return
+    latest = session.execute(select(func.max(StockDailySnapshotModel.day))).scalar()
+    if latest is None or min(days) > latest:
+        return
+
+    totals: dict[tuple[date, int, int | None], int] = defaultdict(int)
+    for day, movement in zip(days, movements, strict=True):
+        if day <= latest:
+            key = (day, movement.product_id, movement.location_id)
+            totals[key] += movement.quantity
+
+    snapshot = StockDailySnapshotModel
+    other = aliased(StockDailySnapshotModel)
+    # Key order, so concurrent writers lock rows alike
+    for (day, product_id, location_id), quantity in sorted(
+        totals.items(), key=lambda item: (item[0][0], item[0][1], item[0][2] or 0)
+    ):
+        if not quantity:
+            continue
+        same_key = (
+            snapshot.product_id == product_id,
+            snapshot.location_id.is_not_distinct_from(location_id),
+        )
+        session.execute(
+            update(snapshot)
+            .where(snapshot.day >= day, *same_key)
+            .values(quantity=snapshot.quantity + quantity)
+        )
+        # Snapshot days without a balance for the key get one
+        missing_days = (
+            select(
+                snapshot.day,
+                literal(product_id),
+                literal(location_id, snapshot.location_id.type),
+                literal(quantity),
+            )
+            .where(
+                snapshot.day >= day,
+                ~exists().where(
+                    other.day == snapshot.day,
+                    other.product_id == product_id,
+                    other.location_id.is_not_distinct_from(location_id),
+                ),
+            )
+            .distinct()
+        )
+        session.execute(
+            insert(snapshot).from_select(
+                ["day", "product_id", "location_id", "quantity"], missing_days
+            )
+        )
+
+    session.execute(
+        delete(snapshot).where(snapshot.day >= min(days), snapshot.quantity == 0)
+    )
+
+
+def build_snapshots(session: Session, first: date, last: date) -> int:
+    """
+    Builds the snapshots of first..last in order, committing each day so a
+    long backfill holds no locks and can resume where it stopped.
+    Returns:
+        Number of days built
+    """
+    start = time.perf_counter()
+    days = 0
+    day = first
+    while day <= last:
+        rows = build_snapshot(session, day)
+        session.commit()
+        days += 1
+        logger.debug("stock_snapshot_built", day=day.isoformat(), rows=rows)
+        day += timedelta(days=1)
+
+    logger.info(
+        "stock_snapshots_built",
+        first=first.isoformat(),
+        last=last.isoformat(),
+        days=days,
+        elapsed_seconds=round(time.perf_counter() - start, 3),
+    )
+    return days
+
+
+def _first_movement_day(session: Session) -> date | None:
+    first = session.execute(select(func.min(MovementModel.date))).scalar()
+    return first.date() if first is not None else None
+
+
+def append_snapshots(session: Session, today: date | None = None) -> int:
+    """
+    Nightly job: builds every day after the latest snapshot up to
+    yesterday, starting at the first movement when there is none yet.
+    Returns:
+        Number of days built
+    """
+    yesterday = (today or date.today()) - timedelta(days=1)
+    latest = session.execute(select(func.max(StockDailySnapshotModel.day))).scalar()
+    if latest is not None:
+        first = latest + timedelta(days=1)
+    else:
+        first = _first_movement_day(session)
+    if first is None or first > yesterday:
+        return 0
+    return build_snapshots(session, first, yesterday)
+
+
+def main(argv: list[str] | None = None) -> int:
+    import src
+    from config import config
+    from src.container import create_wireup_container
+
+    # Wires every module, so all the mapped models are configured
+    src.wireup_container = create_wireup_container()
+
+    parser = argparse.ArgumentParser(description="Build daily stock snapshots.")
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="rebuild --from..--to instead of appending the missing days",
+    )
+    parser.add_argument("--from", dest="first", type=date.fromisoformat)
+    parser.add_argument("--to", dest="last", type=date.fromisoformat)
+    parser.add_argument("--database-url", default=config.DB_CONNECTION_STRING)
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as session:
+            if not args.backfill:
+                append_snapshots(session)
+                return 0
+            first = args.first or _first_movement_day(session)
+            if first is not None:
+                last = args.last or date.today() - timedelta(days=1)
+                build_snapshots(session, first, last)
+            return 0
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    from config import config
+    from src.shared.infra.logging import configure_logging
+
+    configure_logging(
+        log_level=config.LOG_LEVEL,
+        json_output=config.ENVIRONMENT != "local",
+    )
+    sys.exit(main())
@@ -30,3 +30,47 @@ class StockResponse(BaseModel):
 class StockQueryParams(QueryParams):
     product_id: int | None = Field(None, ge=1, description="Filter by product ID")
     location_id: int | None = Field(None, ge=1, description="Filter by location ID")
+
+
+class ReconcileStockRequest(BaseModel):
+    repair: bool = Field(
+        False, description="Rewrite drifted quantities from the movements"
+    )
+    product_id_from: int | None = Field(
+        None,
+        ge=1,
+        description="First product ID to check",
+        validation_alias=AliasChoices("productIdFrom", "product_id_from"),
+    )
+    product_id_to: int | None = Field(
+        None,
+        ge=1,
+        description="Last product ID to check",
+        validation_alias=AliasChoices("productIdTo", "product_id_to"),
+    )
+
+
+class StockDriftResponse(BaseModel):
+    product_id: int = Field(description="Product ID", serialization_alias="productId")
+    location_id: int | None = Field(
+        None, description="Storage location ID", serialization_alias="locationId"
+    )
+    expected: int = Field(description="Sum of the product's movements")
+    actual: int | None = Field(
+        None, description="Quantity in stock, null when the row is missing"
+    )
+
+
+class ReconciliationResponse(BaseModel):
+    movements_scanned: int = Field(serialization_alias="movementsScanned")
+    keys_checked: int = Field(
+        description="Product/location pairs compared",
+        serialization_alias="keysChecked",
+    )
+    drift_count: int = Field(serialization_alias="driftCount")
+    repaired: int = Field(description="Stock rows rewritten or created")
+    elapsed_seconds: float = Field(serialization_alias="elapsedSeconds")
+    movements_per_second: float = Field(serialization_alias="movementsPerSecond")
+    drifts: list[StockDriftResponse] = Field(
+        description="First drifts found (up to 1000)"
+    )
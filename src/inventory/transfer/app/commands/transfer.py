@@ -4,7 +4,8 @@ from wireup import injectable
 
 from src.inventory.movement.app.commands.movement import (
     CreateMovementCommand,
-    CreateMovementCommandHandler,
+    CreateMovementsBatchCommand,
+    CreateMovementsBatchCommandHandler,
 )
 from src.inventory.movement.domain.constants import MovementType
 from src.inventory.stock.app.repositories import StockRepository
@@ -222,7 +223,7 @@ class ReceiveStockTransferCommandHandler(
         repo: StockTransferRepository,
         item_repo: StockTransferItemRepository,
         stock_repo: StockRepository,
-        movement_handler: CreateMovementCommandHandler,
+        movement_handler: CreateMovementsBatchCommandHandler,
         event_publisher: EventPublisher,
     ):
         self.repo = repo
@@ -239,6 +240,7 @@ class ReceiveStockTransferCommandHandler(
             raise DomainError("Solo transferencias CONFIRMED pueden recibirse")
 
         items = self.item_repo.filter_by(transfer_id=transfer.id)
+        movements = []
 
         for item in items:
             # Release reservation in source
@@ -254,7 +256,7 @@ class ReceiveStockTransferCommandHandler(
                 self.stock_repo.update(updated)
 
             # OUT movement from source
-            self.movement_handler.handle(
+            movements.append(
                 CreateMovementCommand(
                     product_id=item.product_id,
                     quantity=-abs(item.quantity),
@@ -268,7 +270,7 @@ class ReceiveStockTransferCommandHandler(
             )
 
             # IN movement to destination
-            self.movement_handler.handle(
+            movements.append(
                 CreateMovementCommand(
                     product_id=item.product_id,
                     quantity=item.quantity,
@@ -281,6 +283,14 @@ class ReceiveStockTransferCommandHandler(
                 )
             )
 
+        self.movement_handler.handle(
+            CreateMovementsBatchCommand(
+                movements=movements,
+                reference_type="transfer",
+                reference_id=transfer.id,
+            )
+        )
+
         received = transfer.receive()
         saved = self.repo.update(received)
         self.event_publisher.publish(
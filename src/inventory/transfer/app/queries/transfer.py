@@ -10,6 +10,7 @@ from src.inventory.transfer.domain.specifications import (
     TransfersBySourceLocation,
     TransfersByStatus,
 )
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -20,6 +21,8 @@ class GetAllTransfersQuery(Query):
     source_location_id: int | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -42,9 +45,18 @@ class GetAllTransfersQueryHandler(QueryHandler[GetAllTransfersQuery, dict]):
 
         if spec is not None:
             return self.repo.paginate_by_spec(
-                spec, limit=query.limit, offset=query.offset
+                spec,
+                limit=query.limit,
+                offset=query.offset,
+                cursor=query.cursor,
+                include_total=query.include_total,
             )
-        return self.repo.paginate(limit=query.limit, offset=query.offset)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+        )
 
 
 @dataclass
@@ -4,7 +4,9 @@ from wireup import injectable
 
 from src.inventory.warehouse.app.repositories import WarehouseRepository
 from src.inventory.warehouse.domain.entities import Warehouse
+from src.inventory.warehouse.domain.events import WarehouseCreated
 from src.shared.app.commands import Command, CommandHandler
+from src.shared.app.events import EventPublisher
 
 
 @dataclass
@@ -23,8 +25,9 @@ class CreateWarehouseCommand(Command):
 
 @injectable(lifetime="scoped")
 class CreateWarehouseCommandHandler(CommandHandler[CreateWarehouseCommand, dict]):
-    def __init__(self, repo: WarehouseRepository):
+    def __init__(self, repo: WarehouseRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: CreateWarehouseCommand) -> dict:
         warehouse = Warehouse(
@@ -40,4 +43,12 @@ class CreateWarehouseCommandHandler(CommandHandler[CreateWarehouseCommand, dict]
             email=command.email,
         )
         warehouse = self.repo.create(warehouse)
+
+        self.event_publisher.publish(
+            WarehouseCreated(
+                aggregate_id=warehouse.id,
+                warehouse_id=warehouse.id,
+                code=warehouse.code,
+            )
+        )
         return warehouse.dict()
@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.inventory.warehouse.app.repositories import WarehouseRepository
+from src.inventory.warehouse.domain.events import WarehouseDeleted
 from src.shared.app.commands import Command, CommandHandler
+from src.shared.app.events import EventPublisher
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -14,11 +16,19 @@ class DeleteWarehouseCommand(Command):
 
 @injectable(lifetime="scoped")
 class DeleteWarehouseCommandHandler(CommandHandler[DeleteWarehouseCommand, None]):
-    def __init__(self, repo: WarehouseRepository):
+    def __init__(self, repo: WarehouseRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: DeleteWarehouseCommand) -> None:
         warehouse = self.repo.get_by_id(command.warehouse_id)
         if warehouse is None:
             raise NotFoundError(f"Warehouse {command.warehouse_id} not found")
         self.repo.delete(command.warehouse_id)
+
+        self.event_publisher.publish(
+            WarehouseDeleted(
+                aggregate_id=command.warehouse_id,
+                warehouse_id=command.warehouse_id,
+            )
+        )
@@ -4,7 +4,9 @@ from wireup import injectable
 
 from src.inventory.warehouse.app.repositories import WarehouseRepository
 from src.inventory.warehouse.domain.entities import Warehouse
+from src.inventory.warehouse.domain.events import WarehouseUpdated
 from src.shared.app.commands import Command, CommandHandler
+from src.shared.app.events import EventPublisher
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -25,8 +27,9 @@ class UpdateWarehouseCommand(Command):
 
 @injectable(lifetime="scoped")
 class UpdateWarehouseCommandHandler(CommandHandler[UpdateWarehouseCommand, dict]):
-    def __init__(self, repo: WarehouseRepository):
+    def __init__(self, repo: WarehouseRepository, event_publisher: EventPublisher):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def _handle(self, command: UpdateWarehouseCommand) -> dict:
         warehouse = self.repo.get_by_id(command.warehouse_id)
@@ -46,4 +49,12 @@ class UpdateWarehouseCommandHandler(CommandHandler[UpdateWarehouseCommand, dict]
             email=command.email,
         )
         warehouse = self.repo.update(warehouse)
+
+        self.event_publisher.publish(
+            WarehouseUpdated(
+                aggregate_id=warehouse.id,
+                warehouse_id=warehouse.id,
+                code=warehouse.code,
+            )
+        )
         return warehouse.dict()
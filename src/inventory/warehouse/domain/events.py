@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from src.shared.domain.events import DomainEvent
+
+
+@dataclass
+class WarehouseCreated(DomainEvent):
+    warehouse_id: int = 0
+    code: str = ""
+
+    def _payload(self) -> dict:
+        return {"warehouse_id": self.warehouse_id, "code": self.code}
+
+
+@dataclass
+class WarehouseUpdated(DomainEvent):
+    warehouse_id: int = 0
+    code: str = ""
+
+    def _payload(self) -> dict:
+        return {"warehouse_id": self.warehouse_id, "code": self.code}
+
+
+@dataclass
+class WarehouseDeleted(DomainEvent):
+    warehouse_id: int = 0
+
+    def _payload(self) -> dict:
+        return {"warehouse_id": self.warehouse_id}
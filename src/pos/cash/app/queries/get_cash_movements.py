@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.pos.cash.app.repositories import CashMovementRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 
 
@@ -11,6 +12,8 @@ class GetCashMovementsQuery(Query):
     shift_id: int
     limit: int = 100
     offset: int = 0
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -22,5 +25,7 @@ class GetCashMovementsQueryHandler(QueryHandler[GetCashMovementsQuery, dict]):
         return self.repo.paginate(
             limit=query.limit,
             offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
             shift_id=query.shift_id,
         )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.shared.infra.database import Base
@@ -10,6 +10,7 @@ from src.shared.infra.precision import MoneyColumn
 
 class CashMovementModel(Base):
     __tablename__ = "pos_cash_movements"
+    __table_args__ = (Index("ix_pos_cash_movements_shift_id_type", "shift_id", "type"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     shift_id: Mapped[int] = mapped_column(
@@ -88,6 +88,8 @@ class POSCashRouter:
                 shift_id=shift_id,
                 limit=query_params.limit,
                 offset=query_params.offset,
+                cursor=query_params.cursor,
+                include_total=query_params.include_total,
             )
         )
         return PaginatedDataResponse(
@@ -96,6 +98,8 @@ class POSCashRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
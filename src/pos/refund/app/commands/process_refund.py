@@ -82,18 +82,19 @@ class ProcessRefundCommandHandler(CommandHandler[ProcessRefundCommand, dict]):
         self.refund_repo.update(refund)
 
         for item in items:
+            stock = self.stock_repo.first(product_id=item.product_id)
+            location_id = stock.location_id if stock else None
             movement = Movement(
                 product_id=item.product_id,
                 quantity=abs(item.quantity),
                 type=MovementType.IN,
+                location_id=location_id,
                 reason=f"Refund #{refund.id}",
             )
             self.movement_repo.create(movement)
-
-            stock = self.stock_repo.first(product_id=item.product_id)
-            if stock:
-                stock.update_quantity(abs(item.quantity))
-                self.stock_repo.update(stock)
+            self.stock_repo.apply_delta(
+                item.product_id, location_id, abs(item.quantity)
+            )
 
         items_data = [
             {
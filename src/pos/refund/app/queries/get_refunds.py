@@ -7,6 +7,7 @@ from src.pos.refund.app.repositories import (
     RefundPaymentRepository,
     RefundRepository,
 )
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -48,6 +49,8 @@ class GetRefundsQuery(Query):
     status: str | None = None
     limit: int | None = 100
     offset: int | None = 0
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -63,5 +66,9 @@ class GetRefundsQueryHandler(QueryHandler[GetRefundsQuery, dict]):
             filters["status"] = query.status
 
         return self.refund_repo.paginate(
-            limit=query.limit, offset=query.offset, **filters
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filters,
         )
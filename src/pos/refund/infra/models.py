@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infra.database import Base
@@ -10,6 +10,10 @@ from src.shared.infra.precision import MoneyColumn, PercentageColumn
 
 class RefundModel(Base):
     __tablename__ = "pos_refunds"
+    __table_args__ = (
+        Index("ix_pos_refunds_original_sale_id", "original_sale_id"),
+        Index("ix_pos_refunds_shift_id_status", "shift_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     original_sale_id: Mapped[int] = mapped_column(
@@ -73,6 +77,7 @@ class RefundItemModel(Base):
 
 class RefundPaymentModel(Base):
     __tablename__ = "pos_refund_payments"
+    __table_args__ = (Index("ix_pos_refund_payments_refund_id", "refund_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     refund_id: Mapped[int] = mapped_column(
@@ -149,13 +149,17 @@ class POSRefundRouter:
                 status=params.status,
                 limit=params.limit,
                 offset=params.offset,
+                cursor=params.cursor,
+                include_total=params.include_total,
             )
         )
         return PaginatedDataResponse(
             data=[RefundResponse.model_validate(r) for r in result["items"]],
             meta=meta.with_pagination(
                 total=result["total"],
-                limit=params.limit,
-                offset=params.offset,
+                limit=result["limit"],
+                offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
@@ -50,18 +50,19 @@ class POSCancelSaleCommandHandler(CommandHandler[POSCancelSaleCommand, dict]):
             self.sale_repo.update(sale)
 
             for item in items:
+                stock = self.stock_repo.first(product_id=item.product_id)
+                location_id = stock.location_id if stock else None
                 movement = Movement(
                     product_id=item.product_id,
                     quantity=abs(item.quantity),
                     type=MovementType.IN,
+                    location_id=location_id,
                     reason=f"Sale #{command.sale_id} cancelled - reversal",
                 )
                 self.movement_repo.create(movement)
-
-                stock = self.stock_repo.first(product_id=item.product_id)
-                if stock:
-                    stock.update_quantity(abs(item.quantity))
-                    self.stock_repo.update(stock)
+                self.stock_repo.apply_delta(
+                    item.product_id, location_id, abs(item.quantity)
+                )
 
             items_data = [
                 {"product_id": item.product_id, "quantity": item.quantity}
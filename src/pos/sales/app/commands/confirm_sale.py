@@ -61,27 +61,30 @@ class POSConfirmSaleCommandHandler(CommandHandler[POSConfirmSaleCommand, dict]):
         if not items:
             raise SaleHasNoItemsError(command.sale_id)
 
+        stocks = {}
         for item in items:
             stock = self.stock_repo.first(product_id=item.product_id)
             available = stock.quantity if stock else 0
             if available < item.quantity:
                 raise InsufficientStockError(item.product_id, item.quantity, available)
+            stocks[item.product_id] = stock
 
         sale.confirm()
         self.sale_repo.update(sale)
 
         for item in items:
+            location_id = stocks[item.product_id].location_id
             movement = Movement(
                 product_id=item.product_id,
                 quantity=-abs(item.quantity),
                 type=MovementType.OUT,
+                location_id=location_id,
                 reason=f"Sale #{command.sale_id} confirmed",
             )
             self.movement_repo.create(movement)
-
-            stock = self.stock_repo.first(product_id=item.product_id)
-            stock.update_quantity(-abs(item.quantity))
-            self.stock_repo.update(stock)
+            self.stock_repo.apply_delta(
+                item.product_id, location_id, -abs(item.quantity)
+            )
 
         items_data = [
             {
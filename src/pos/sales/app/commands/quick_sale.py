@@ -80,7 +80,7 @@ class QuickSaleCommandHandler(CommandHandler[QuickSaleCommand, dict]):
         sale = self.sale_repo.create(sale)
 
         # 4. Crear items
-        created_items = []
+        sale_items = []
         for item_data in command.items:
             product = self.product_repo.get_by_id(item_data["product_id"])
             if not product:
@@ -106,19 +106,20 @@ class QuickSaleCommandHandler(CommandHandler[QuickSaleCommand, dict]):
                 tax_rate=product.tax_rate,
                 tax_amount=tax_amount,
             )
-            sale_item = self.sale_item_repo.create(sale_item)
-            created_items.append(sale_item)
+            sale_items.append(sale_item)
+        created_items = self.sale_item_repo.create_many(sale_items)
 
         # 5. Recalcular totales
         recalculate_sale_totals(sale, created_items)
-        self.sale_repo.update(sale)
 
         # 6. Validar stock
+        stocks = {}
         for item in created_items:
             stock = self.stock_repo.first(product_id=item.product_id)
             available = stock.quantity if stock else 0
             if available < item.quantity:
                 raise InsufficientStockError(item.product_id, item.quantity, available)
+            stocks[item.product_id] = stock
 
         # 7. Validar pagos cubren el total
         total_payment = sum(Decimal(str(p["amount"])) for p in command.payments)
@@ -130,24 +131,26 @@ class QuickSaleCommandHandler(CommandHandler[QuickSaleCommand, dict]):
 
         # 8. Confirmar venta
         sale.confirm()
-        self.sale_repo.update(sale)
 
         # 9. Crear movimientos de inventario
-        for item in created_items:
-            movement = Movement(
+        movements = [
+            Movement(
                 product_id=item.product_id,
                 quantity=-abs(item.quantity),
                 type=MovementType.OUT,
+                location_id=stocks[item.product_id].location_id,
                 reason=f"Sale #{sale.id} confirmed",
             )
-            self.movement_repo.create(movement)
-
-            stock = self.stock_repo.first(product_id=item.product_id)
-            stock.update_quantity(-abs(item.quantity))
-            self.stock_repo.update(stock)
+            for item in created_items
+        ]
+        self.movement_repo.create_many(movements)
+        for movement in movements:
+            self.stock_repo.apply_delta(
+                movement.product_id, movement.location_id, movement.quantity
+            )
 
         # 10. Registrar pagos
-        created_payments = []
+        payments = []
         for payment_data in command.payments:
             try:
                 payment_method = PaymentMethod(payment_data["payment_method"])
@@ -157,17 +160,19 @@ class QuickSaleCommandHandler(CommandHandler[QuickSaleCommand, dict]):
                     detail=f"Valid methods: {[m.value for m in PaymentMethod]}",
                 ) from None
 
-            payment = Payment(
-                sale_id=sale.id,
-                amount=Decimal(str(payment_data["amount"])),
-                payment_method=payment_method,
-                reference=payment_data.get("reference"),
+            payments.append(
+                Payment(
+                    sale_id=sale.id,
+                    amount=Decimal(str(payment_data["amount"])),
+                    payment_method=payment_method,
+                    reference=payment_data.get("reference"),
+                )
             )
-            payment = self.payment_repo.create(payment)
-            created_payments.append(payment)
+        created_payments = self.payment_repo.create_many(payments)
 
         # 11. Actualizar estado de pago
         sale.update_payment_status(total_payment)
+        # Totals, status and payment status are written together
         self.sale_repo.update(sale)
 
         # 12. Publicar evento
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.pos.shift.app.repositories import ShiftRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -56,6 +57,8 @@ class GetAllShiftsQuery(Query):
     status: str | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -69,4 +72,10 @@ class GetAllShiftsQueryHandler(QueryHandler[GetAllShiftsQuery, dict]):
         filters = {}
         if query.status is not None:
             filters["status"] = query.status
-        return self.repo.paginate(limit=query.limit, offset=query.offset, **filters)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filters,
+        )
@@ -12,8 +12,11 @@ from src.purchasing.domain.events import (
 )
 from src.shared.app.commands import Command, CommandHandler
 from src.shared.app.events import EventPublisher
+from src.shared.app.sequences import DocumentSequence
 from src.shared.domain.exceptions import DomainError, NotFoundError
 
+ORDER_NUMBER_PREFIX = "PO"
+
 
 @dataclass
 class CreatePurchaseOrderCommand(Command):
@@ -30,14 +33,16 @@ class CreatePurchaseOrderCommandHandler(
         self,
         repo: PurchaseOrderRepository,
         event_publisher: EventPublisher,
+        sequence: DocumentSequence,
     ):
         self.repo = repo
         self.event_publisher = event_publisher
+        self.sequence = sequence
 
     def _handle(self, command: CreatePurchaseOrderCommand) -> dict:
         year = datetime.now().year
-        count = self.repo.count_by_year(year)
-        order_number = f"PO-{year}-{count + 1:04d}"
+        number = self.sequence.next_value(ORDER_NUMBER_PREFIX, year)
+        order_number = f"{ORDER_NUMBER_PREFIX}-{year}-{number:04d}"
 
         purchase_order = PurchaseOrder(
             supplier_id=command.supplier_id,
@@ -108,20 +108,23 @@ class CreatePurchaseReceiptCommandHandler(
         receipt = self.receipt_repo.create(receipt)
 
         # Create receipt items and update PO item quantities
+        receipt_items = []
         receipt_items_data = []
+        updated_item_ids: list[int] = []
         for receive_item in command.items:
             po_item = po_items_by_id[receive_item.purchase_order_item_id]
 
-            receipt_item = PurchaseReceiptItem(
-                purchase_receipt_id=receipt.id,
-                purchase_order_item_id=receive_item.purchase_order_item_id,
-                product_id=po_item.product_id,
-                quantity_received=receive_item.quantity_received,
-                location_id=receive_item.location_id,
-                lot_number=receive_item.lot_number,
-                serial_numbers=receive_item.serial_numbers,
+            receipt_items.append(
+                PurchaseReceiptItem(
+                    purchase_receipt_id=receipt.id,
+                    purchase_order_item_id=receive_item.purchase_order_item_id,
+                    product_id=po_item.product_id,
+                    quantity_received=receive_item.quantity_received,
+                    location_id=receive_item.location_id,
+                    lot_number=receive_item.lot_number,
+                    serial_numbers=receive_item.serial_numbers,
+                )
             )
-            receipt_item = self.receipt_item_repo.create(receipt_item)
             receipt_items_data.append(
                 {
                     "product_id": po_item.product_id,
@@ -138,8 +141,12 @@ class CreatePurchaseReceiptCommandHandler(
                 quantity_received=po_item.quantity_received
                 + receive_item.quantity_received,
             )
-            self.item_repo.update(updated_item)
             po_items_by_id[po_item.id] = updated_item
+            if po_item.id not in updated_item_ids:
+                updated_item_ids.append(po_item.id)
+
+        self.receipt_item_repo.create_many(receipt_items)
+        self.item_repo.update_many([po_items_by_id[id] for id in updated_item_ids])
 
         # Determine new PO status
         all_received = all(
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.purchasing.app.repositories import PurchaseOrderRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -13,6 +14,8 @@ class GetAllPurchaseOrdersQuery(Query):
     supplier_id: int | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -26,7 +29,13 @@ class GetAllPurchaseOrdersQueryHandler(QueryHandler[GetAllPurchaseOrdersQuery, d
             filters["status"] = query.status
         if query.supplier_id is not None:
             filters["supplier_id"] = query.supplier_id
-        return self.repo.paginate(limit=query.limit, offset=query.offset, **filters)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filters,
+        )
 
 
 @dataclass
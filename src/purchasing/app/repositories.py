@@ -1,5 +1,3 @@
-from abc import abstractmethod
-
 from src.purchasing.domain.entities import (
     PurchaseOrder,
     PurchaseOrderItem,
@@ -10,9 +8,7 @@ from src.shared.app.repositories import Repository
 
 
 class PurchaseOrderRepository(Repository[PurchaseOrder]):
-    @abstractmethod
-    def count_by_year(self, year: int) -> int:
-        raise NotImplementedError
+    pass
 
 
 class PurchaseOrderItemRepository(Repository[PurchaseOrderItem]):
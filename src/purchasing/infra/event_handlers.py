@@ -8,7 +8,8 @@ import structlog
 
 from src.inventory.movement.app.commands.movement import (
     CreateMovementCommand,
-    CreateMovementCommandHandler,
+    CreateMovementsBatchCommand,
+    CreateMovementsBatchCommandHandler,
 )
 from src.inventory.movement.domain.constants import MovementType
 from src.purchasing.domain.events import PurchaseOrderReceived
@@ -24,7 +25,7 @@ def handle_purchase_order_received(
 ) -> None:
     """
     When goods are received for a purchase order, create IN inventory movements.
-    Each receipt item becomes an individual IN movement.
+    Each receipt item becomes an IN movement; all of them are created in one batch.
     """
     logger.info(
         "handling_purchase_order_received",
@@ -36,26 +37,30 @@ def handle_purchase_order_received(
 
     with create_sync_scope(session) as scope:
         try:
-            for item in event.items:
-                handler = scope.get(CreateMovementCommandHandler)
-
-                command = CreateMovementCommand(
-                    product_id=item["product_id"],
-                    quantity=abs(item["quantity"]),
-                    type=MovementType.IN.value,
-                    location_id=item.get("location_id"),
+            handler = scope.get(CreateMovementsBatchCommandHandler)
+            handler.handle(
+                CreateMovementsBatchCommand(
+                    movements=[
+                        CreateMovementCommand(
+                            product_id=item["product_id"],
+                            quantity=abs(item["quantity"]),
+                            type=MovementType.IN.value,
+                            location_id=item.get("location_id"),
+                            reference_type="purchase_order",
+                            reference_id=event.purchase_order_id,
+                            reason=f"Purchase order {event.order_number} received",
+                        )
+                        for item in event.items
+                    ],
                     reference_type="purchase_order",
                     reference_id=event.purchase_order_id,
-                    reason=f"Purchase order {event.order_number} received",
-                )
-
-                handler.handle(command)
-                logger.info(
-                    "in_movement_created",
-                    purchase_order_id=event.purchase_order_id,
-                    product_id=item["product_id"],
-                    quantity=item["quantity"],
                 )
+            )
+            logger.info(
+                "in_movements_created",
+                purchase_order_id=event.purchase_order_id,
+                item_count=len(event.items),
+            )
 
         except Exception as e:
             logger.error(
@@ -1,4 +1,3 @@
-from sqlalchemy import extract, func
 from sqlalchemy.orm import Session
 from wireup import injectable
 
@@ -38,14 +37,6 @@ class SqlAlchemyPurchaseOrderRepository(
     def __init__(self, session: Session, mapper: PurchaseOrderMapper):
         super().__init__(session, mapper)
 
-    def count_by_year(self, year: int) -> int:
-        return (
-            self.session.query(func.count(self.__model__.id))
-            .filter(extract("year", self.__model__.created_at) == year)
-            .scalar()
-            or 0
-        )
-
 
 @injectable(lifetime="scoped", as_type=PurchaseOrderItemRepository)
 class SqlAlchemyPurchaseOrderItemRepository(
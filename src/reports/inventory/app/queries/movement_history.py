@@ -1,14 +1,20 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, datetime, time
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Query as OrmQuery, Session
 from wireup import injectable
 
 from src.catalog.product.infra.models import ProductModel
 from src.inventory.location.infra.models import LocationModel
 from src.inventory.movement.infra.models import MovementModel
+from src.shared.app.pagination import TotalMode, decode_cursor, encode_cursor
 from src.shared.app.queries import Query, QueryHandler
+from src.shared.domain.exceptions import ValidationError
+from src.shared.infra.counting import count_rows
+
+EXPORT_BATCH_SIZE = 1000
 
 
 @dataclass
@@ -20,6 +26,72 @@ class GetMovementHistoryReportQuery(Query):
     warehouse_id: int | None = None
     limit: int = 50
     offset: int = 0
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
+
+
+@dataclass
+class ExportMovementHistoryQuery(Query):
+    product_id: int | None = None
+    type: str | None = None
+    from_date: date | None = None
+    to_date: date | None = None
+    warehouse_id: int | None = None
+
+
+def _filtered_movements(
+    session: Session,
+    query: "GetMovementHistoryReportQuery | ExportMovementHistoryQuery",
+) -> OrmQuery:
+    """Movements joined with their product, narrowed by the report filters."""
+    q = session.query(
+        MovementModel.id,
+        MovementModel.product_id,
+        ProductModel.name.label("product_name"),
+        ProductModel.sku,
+        MovementModel.quantity,
+        MovementModel.type,
+        MovementModel.location_id,
+        MovementModel.source_location_id,
+        MovementModel.reference_type,
+        MovementModel.reference_id,
+        MovementModel.reason,
+        MovementModel.date,
+        MovementModel.created_at,
+    ).join(ProductModel, ProductModel.id == MovementModel.product_id)
+
+    if query.product_id is not None:
+        q = q.filter(MovementModel.product_id == query.product_id)
+    if query.type is not None:
+        q = q.filter(MovementModel.type == query.type)
+    if query.from_date is not None:
+        q = q.filter(MovementModel.date >= datetime.combine(query.from_date, time.min))
+    if query.to_date is not None:
+        q = q.filter(MovementModel.date <= datetime.combine(query.to_date, time.max))
+    if query.warehouse_id is not None:
+        location_subq = select(LocationModel.id).where(
+            LocationModel.warehouse_id == query.warehouse_id
+        )
+        q = q.filter(MovementModel.location_id.in_(location_subq))
+    return q
+
+
+def _item(row) -> dict:
+    return {
+        "id": row.id,
+        "product_id": row.product_id,
+        "product_name": row.product_name,
+        "sku": row.sku,
+        "quantity": row.quantity,
+        "type": row.type,
+        "location_id": row.location_id,
+        "source_location_id": row.source_location_id,
+        "reference_type": row.reference_type,
+        "reference_id": row.reference_id,
+        "reason": row.reason,
+        "date": row.date,
+        "created_at": row.created_at,
+    }
 
 
 @injectable(lifetime="scoped")
@@ -30,68 +102,67 @@ class GetMovementHistoryReportQueryHandler(
         self.session = session
 
     def _handle(self, query: GetMovementHistoryReportQuery) -> dict:
-        q = self.session.query(
-            MovementModel.id,
-            MovementModel.product_id,
-            ProductModel.name.label("product_name"),
-            ProductModel.sku,
-            MovementModel.quantity,
-            MovementModel.type,
-            MovementModel.location_id,
-            MovementModel.source_location_id,
-            MovementModel.reference_type,
-            MovementModel.reference_id,
-            MovementModel.reason,
-            MovementModel.date,
-            MovementModel.created_at,
-        ).join(ProductModel, ProductModel.id == MovementModel.product_id)
-
-        if query.product_id is not None:
-            q = q.filter(MovementModel.product_id == query.product_id)
-        if query.type is not None:
-            q = q.filter(MovementModel.type == query.type)
-        if query.from_date is not None:
-            q = q.filter(
-                MovementModel.date >= datetime.combine(query.from_date, time.min)
-            )
-        if query.to_date is not None:
+        q = _filtered_movements(self.session, query)
+
+        # Keyset on (date, id): the cursor holds the last row of the page
+        include_total = query.include_total
+        if query.cursor is None:
+            if include_total == TotalMode.EXACT:
+                total = q.count()
+            else:
+                total = count_rows(self.session, q.statement, include_total)
+            offset = query.offset
+        else:
+            last_date, last_id = decode_cursor(query.cursor, size=2)
+            try:
+                last_date = datetime.fromisoformat(last_date)
+            except (TypeError, ValueError):
+                raise ValidationError("Invalid pagination cursor") from None
             q = q.filter(
-                MovementModel.date <= datetime.combine(query.to_date, time.max)
+                tuple_(MovementModel.date, MovementModel.id) < (last_date, last_id),
+                # Implied by the tuple; spelled out so partitions get pruned
+                MovementModel.date <= last_date,
             )
-        if query.warehouse_id is not None:
-            location_subq = select(LocationModel.id).where(
-                LocationModel.warehouse_id == query.warehouse_id
-            )
-            q = q.filter(MovementModel.location_id.in_(location_subq))
-
-        total = q.count()
-        rows = (
-            q.order_by(MovementModel.date.desc())
-            .offset(query.offset)
-            .limit(query.limit)
-            .all()
-        )
+            include_total = TotalMode.NONE
+            total = None
+            offset = None
+
+        q = q.order_by(MovementModel.date.desc(), MovementModel.id.desc())
+        if offset:
+            q = q.offset(offset)
+        rows = q.limit(query.limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > query.limit:
+            rows = rows[: query.limit]
+            next_cursor = encode_cursor(rows[-1].date, rows[-1].id)
 
         return {
             "total": total,
+            "total_mode": include_total,
             "limit": query.limit,
-            "offset": query.offset,
-            "items": [
-                {
-                    "id": row.id,
-                    "product_id": row.product_id,
-                    "product_name": row.product_name,
-                    "sku": row.sku,
-                    "quantity": row.quantity,
-                    "type": row.type,
-                    "location_id": row.location_id,
-                    "source_location_id": row.source_location_id,
-                    "reference_type": row.reference_type,
-                    "reference_id": row.reference_id,
-                    "reason": row.reason,
-                    "date": row.date,
-                    "created_at": row.created_at,
-                }
-                for row in rows
-            ],
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "items": [_item(row) for row in rows],
         }
+
+
+@injectable(lifetime="scoped")
+class ExportMovementHistoryQueryHandler(
+    QueryHandler[ExportMovementHistoryQuery, Iterator[dict]]
+):
+    """
+    Every movement matching the report filters, oldest first, fetched in
+    batches of EXPORT_BATCH_SIZE through a server-side cursor. The rows are
+    read while the returned iterator is consumed, so the session must stay
+    open until then.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _handle(self, query: ExportMovementHistoryQuery) -> Iterator[dict]:
+        q = _filtered_movements(self.session, query).order_by(
+            MovementModel.date, MovementModel.id
+        )
+        return (_item(row) for row in q.yield_per(EXPORT_BATCH_SIZE))
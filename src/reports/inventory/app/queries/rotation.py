@@ -1,15 +1,14 @@
 from dataclasses import dataclass
-from datetime import date, datetime, time
+from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import case, func, select
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from wireup import injectable
 
 from src.catalog.product.infra.models import ProductModel
 from src.inventory.location.infra.models import LocationModel
-from src.inventory.movement.domain.constants import MovementType
-from src.inventory.movement.infra.models import MovementModel
+from src.inventory.movement.infra.models import MovementDailyAggregateModel
 from src.inventory.stock.infra.models import StockModel
 from src.shared.app.queries import Query, QueryHandler
 
@@ -27,12 +26,10 @@ class GetProductRotationQueryHandler(QueryHandler[GetProductRotationQuery, list[
         self.session = session
 
     def _handle(self, query: GetProductRotationQuery) -> list[dict]:
-        from_datetime = datetime.combine(query.from_date, time.min)
-        to_datetime = datetime.combine(query.to_date, time.max)
         days_in_period = max((query.to_date - query.from_date).days + 1, 1)
 
         movement_rows = self._fetch_movement_aggregates(
-            from_datetime, to_datetime, query.warehouse_id
+            query.from_date, query.to_date, query.warehouse_id
         )
         stock_by_product = self._fetch_current_stocks(query.warehouse_id)
 
@@ -69,43 +66,30 @@ class GetProductRotationQueryHandler(QueryHandler[GetProductRotationQuery, list[
 
     def _fetch_movement_aggregates(
         self,
-        from_datetime: datetime,
-        to_datetime: datetime,
+        from_date: date,
+        to_date: date,
         warehouse_id: int | None,
     ) -> list:
+        # One row per product, warehouse and day instead of every movement
         q = (
             self.session.query(
-                MovementModel.product_id,
+                MovementDailyAggregateModel.product_id,
                 ProductModel.name.label("product_name"),
                 ProductModel.sku,
-                func.sum(
-                    case(
-                        (MovementModel.type == MovementType.IN, MovementModel.quantity),
-                        else_=0,
-                    )
-                ).label("total_in"),
-                func.sum(
-                    case(
-                        (
-                            MovementModel.type == MovementType.OUT,
-                            MovementModel.quantity,
-                        ),
-                        else_=0,
-                    )
-                ).label("total_out"),
+                func.sum(MovementDailyAggregateModel.qty_in).label("total_in"),
+                func.sum(MovementDailyAggregateModel.qty_out).label("total_out"),
             )
-            .join(ProductModel, ProductModel.id == MovementModel.product_id)
-            .filter(MovementModel.date >= from_datetime)
-            .filter(MovementModel.date <= to_datetime)
+            .join(
+                ProductModel, ProductModel.id == MovementDailyAggregateModel.product_id
+            )
+            .filter(MovementDailyAggregateModel.day >= from_date)
+            .filter(MovementDailyAggregateModel.day <= to_date)
             .filter(ProductModel.is_service == False)  # noqa: E712
         )
         if warehouse_id is not None:
-            location_subq = select(LocationModel.id).where(
-                LocationModel.warehouse_id == warehouse_id
-            )
-            q = q.filter(MovementModel.location_id.in_(location_subq))
+            q = q.filter(MovementDailyAggregateModel.warehouse_id == warehouse_id)
         return q.group_by(
-            MovementModel.product_id, ProductModel.name, ProductModel.sku
+            MovementDailyAggregateModel.product_id, ProductModel.name, ProductModel.sku
         ).all()
 
     def _fetch_current_stocks(self, warehouse_id: int | None) -> dict[int, int]:
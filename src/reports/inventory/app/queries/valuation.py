@@ -1,16 +1,15 @@
 from dataclasses import dataclass
-from datetime import date, datetime, time
+from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import case, func
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from wireup import injectable
 
 from src.catalog.product.infra.models import ProductModel
 from src.inventory.location.infra.models import LocationModel
-from src.inventory.movement.domain.constants import MovementType
-from src.inventory.movement.infra.models import MovementModel
 from src.inventory.stock.infra.models import StockModel
+from src.inventory.stock.infra.snapshots import stock_entries_as_of
 from src.shared.app.queries import Query, QueryHandler
 
 
@@ -79,28 +78,20 @@ class GetInventoryValuationQueryHandler(QueryHandler[GetInventoryValuationQuery,
     def _valuation_at_date(
         self, as_of_date: date, warehouse_id: int | None
     ) -> list[dict]:
-        as_of_datetime = datetime.combine(as_of_date, time.max)
+        # Nearest daily snapshot plus the movements after it
+        entries = stock_entries_as_of(self.session, as_of_date)
         q = (
             self.session.query(
                 ProductModel.id,
                 ProductModel.name,
                 ProductModel.sku,
                 ProductModel.purchase_price,
-                func.sum(
-                    case(
-                        (
-                            MovementModel.type == MovementType.IN,
-                            MovementModel.quantity,
-                        ),
-                        else_=-MovementModel.quantity,
-                    )
-                ).label("quantity"),
+                func.sum(entries.c.quantity).label("quantity"),
             )
-            .join(MovementModel, MovementModel.product_id == ProductModel.id)
+            .join(entries, entries.c.product_id == ProductModel.id)
             .filter(ProductModel.is_service == False)  # noqa: E712
             .filter(ProductModel.purchase_price.isnot(None))
             .filter(ProductModel.purchase_price > 0)
-            .filter(MovementModel.date <= as_of_datetime)
         )
         if warehouse_id is not None:
             location_ids = [
@@ -109,7 +100,7 @@ class GetInventoryValuationQueryHandler(QueryHandler[GetInventoryValuationQuery,
                 .filter(LocationModel.warehouse_id == warehouse_id)
                 .all()
             ]
-            q = q.filter(MovementModel.location_id.in_(location_ids))
+            q = q.filter(entries.c.location_id.in_(location_ids))
         q = q.group_by(
             ProductModel.id,
             ProductModel.name,
@@ -1,4 +1,5 @@
 from src.reports.inventory.app.queries.movement_history import (
+    ExportMovementHistoryQueryHandler,
     GetMovementHistoryReportQueryHandler,
 )
 from src.reports.inventory.app.queries.rotation import GetProductRotationQueryHandler
@@ -13,5 +14,6 @@ REPORT_INJECTABLES = [
     GetInventoryValuationQueryHandler,
     GetProductRotationQueryHandler,
     GetMovementHistoryReportQueryHandler,
+    ExportMovementHistoryQueryHandler,
     GetWarehouseSummaryQueryHandler,
 ]
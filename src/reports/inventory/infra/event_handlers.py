@@ -0,0 +1,85 @@
+"""
+Invalidates cached reports once the transactions that change their data
+commit. Invalidating earlier would let a concurrent request cache results
+read before the commit.
+"""
+
+from src.catalog.product.domain.events import ProductDeleted, ProductUpdated
+from src.inventory.location.domain.events import (
+    LocationCreated,
+    LocationDeleted,
+    LocationUpdated,
+)
+from src.inventory.lot.domain.events import LotCreated, LotUpdated
+from src.inventory.movement.domain.events import MovementCreated, MovementsCreated
+from src.inventory.stock.domain.events import StockCreated, StockUpdated
+from src.inventory.transfer.domain.events import (
+    StockTransferCancelled,
+    StockTransferConfirmed,
+    StockTransferReceived,
+)
+from src.inventory.warehouse.domain.events import (
+    WarehouseCreated,
+    WarehouseDeleted,
+    WarehouseUpdated,
+)
+from src.pos.refund.domain.events import RefundCompleted
+from src.sales.domain.events import SaleCancelled, SaleConfirmed
+from src.shared.infra.events.decorators import event_handler
+from src.shared.infra.events.event_bus import EventPhase
+from src.shared.infra.report_cache import ReportData, report_cache
+
+PRICE_FIELDS = {"purchase_price", "sale_price"}
+
+
+@event_handler(MovementCreated, phase=EventPhase.AFTER_COMMIT)
+@event_handler(MovementsCreated, phase=EventPhase.AFTER_COMMIT)
+# POS sales and refunds write movements and stock without movement events
+@event_handler(SaleConfirmed, phase=EventPhase.AFTER_COMMIT)
+@event_handler(SaleCancelled, phase=EventPhase.AFTER_COMMIT)
+@event_handler(RefundCompleted, phase=EventPhase.AFTER_COMMIT)
+def invalidate_movement_reports(event) -> None:
+    report_cache.invalidate(ReportData.MOVEMENTS, ReportData.STOCK)
+
+
+@event_handler(StockCreated, phase=EventPhase.AFTER_COMMIT)
+@event_handler(StockUpdated, phase=EventPhase.AFTER_COMMIT)
+# Transfers reserve and release stock without stock events
+@event_handler(StockTransferConfirmed, phase=EventPhase.AFTER_COMMIT)
+@event_handler(StockTransferReceived, phase=EventPhase.AFTER_COMMIT)
+@event_handler(StockTransferCancelled, phase=EventPhase.AFTER_COMMIT)
+def invalidate_stock_reports(event) -> None:
+    report_cache.invalidate(ReportData.STOCK)
+
+
+@event_handler(ProductUpdated, phase=EventPhase.AFTER_COMMIT)
+def invalidate_product_reports(event: ProductUpdated) -> None:
+    changed = set(event.changes or ())
+    if changed & PRICE_FIELDS:
+        report_cache.invalidate(ReportData.PRICES)
+    # Names, SKUs and stock thresholds show up in every report
+    if changed - PRICE_FIELDS:
+        report_cache.invalidate(ReportData.PRODUCTS)
+
+
+@event_handler(ProductDeleted, phase=EventPhase.AFTER_COMMIT)
+def invalidate_deleted_product_reports(event: ProductDeleted) -> None:
+    report_cache.invalidate(ReportData.PRODUCTS)
+
+
+@event_handler(LotCreated, phase=EventPhase.AFTER_COMMIT)
+@event_handler(LotUpdated, phase=EventPhase.AFTER_COMMIT)
+def invalidate_lot_reports(event) -> None:
+    report_cache.invalidate(ReportData.LOTS)
+
+
+# Reports group and filter stock by warehouse through its location, so a
+# location moving to another warehouse changes them as well
+@event_handler(WarehouseCreated, phase=EventPhase.AFTER_COMMIT)
+@event_handler(WarehouseUpdated, phase=EventPhase.AFTER_COMMIT)
+@event_handler(WarehouseDeleted, phase=EventPhase.AFTER_COMMIT)
+@event_handler(LocationCreated, phase=EventPhase.AFTER_COMMIT)
+@event_handler(LocationUpdated, phase=EventPhase.AFTER_COMMIT)
+@event_handler(LocationDeleted, phase=EventPhase.AFTER_COMMIT)
+def invalidate_location_reports(event) -> None:
+    report_cache.invalidate(ReportData.LOCATIONS)
@@ -1,7 +1,14 @@
+from collections.abc import Iterator
+from itertools import chain
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from wireup import Injected
 
+from config import config
 from src.reports.inventory.app.queries.movement_history import (
+    ExportMovementHistoryQuery,
+    ExportMovementHistoryQueryHandler,
     GetMovementHistoryReportQuery,
     GetMovementHistoryReportQueryHandler,
 )
@@ -19,6 +26,7 @@ from src.reports.inventory.app.queries.warehouse_summary import (
 )
 from src.reports.inventory.infra.validators import (
     InventoryValuationResponse,
+    MovementExportQueryParams,
     MovementHistoryItemResponse,
     MovementHistoryQueryParams,
     ProductRotationResponse,
@@ -27,7 +35,11 @@ from src.reports.inventory.infra.validators import (
     ValuationQueryParams,
     WarehouseSummaryResponse,
 )
+from src.shared.domain.exceptions import ValidationError
 from src.shared.infra.dependencies import get_meta
+from src.shared.infra.events.scope import create_sync_scope
+from src.shared.infra.exports import MEDIA_TYPES, export_chunks
+from src.shared.infra.report_cache import ReportData, report_cache
 from src.shared.infra.validators import (
     RESPONSES_LIST,
     RESPONSES_QUERY,
@@ -37,6 +49,51 @@ from src.shared.infra.validators import (
     PaginatedDataResponse,
 )
 
+# Data each cached report is computed from (see report_cache); all of them
+# group or filter by warehouse through the locations
+VALUATION_DATA = (
+    ReportData.STOCK,
+    ReportData.MOVEMENTS,
+    ReportData.PRICES,
+    ReportData.PRODUCTS,
+    ReportData.LOCATIONS,
+)
+ROTATION_DATA = (
+    ReportData.STOCK,
+    ReportData.MOVEMENTS,
+    ReportData.PRODUCTS,
+    ReportData.LOCATIONS,
+)
+SUMMARY_DATA = (
+    ReportData.STOCK,
+    ReportData.PRICES,
+    ReportData.PRODUCTS,
+    ReportData.LOCATIONS,
+)
+
+EXPORT_COLUMNS = [
+    "id",
+    "date",
+    "product_id",
+    "product_name",
+    "sku",
+    "type",
+    "quantity",
+    "location_id",
+    "source_location_id",
+    "reference_type",
+    "reference_id",
+    "reason",
+    "created_at",
+]
+
+
+def _export_rows(query: ExportMovementHistoryQuery) -> Iterator[dict]:
+    # Own scope: the request scope (and its session) closes when the
+    # endpoint returns, before the response body is streamed
+    with create_sync_scope() as scope:
+        yield from scope.get(ExportMovementHistoryQueryHandler).handle(query)
+
 
 class ReportRouter:
     def __init__(self):
@@ -62,6 +119,20 @@ class ReportRouter:
             summary="Movement history report",
             responses=RESPONSES_LIST,
         )(self.movement_history)
+        self.router.get(
+            "/movements/export",
+            response_class=StreamingResponse,
+            summary="Export movement history",
+            responses={
+                200: {
+                    "content": {
+                        "text/csv": {},
+                        "application/x-ndjson": {},
+                        "application/gzip": {},
+                    }
+                }
+            },
+        )(self.export_movements)
         self.router.get(
             "/summary",
             response_model=ListResponse[WarehouseSummaryResponse],
@@ -80,11 +151,13 @@ class ReportRouter:
         Optionally filtered by warehouse and as-of date.
         If `asOfDate` is provided, stock is reconstructed from movement history up to that date.
         """
-        result = handler.handle(
+        result = report_cache.fetch(
+            handler,
             GetInventoryValuationQuery(
                 warehouse_id=query_params.warehouse_id,
                 as_of_date=query_params.as_of_date,
-            )
+            ),
+            VALUATION_DATA,
         )
         return DataResponse(
             data=InventoryValuationResponse.model_validate(result), meta=meta
@@ -99,13 +172,23 @@ class ReportRouter:
         """
         Returns product rotation metrics for a given date range:
         total IN/OUT movements, current stock, turnover rate, and days of stock.
+        Ranges longer than REPORT_SYNC_MAX_DAYS are rejected; submit them as a
+        report job instead.
         """
-        result = handler.handle(
+        days = (query_params.to_date - query_params.from_date).days
+        if days > config.REPORT_SYNC_MAX_DAYS:
+            raise ValidationError(
+                f"Rotation ranges longer than {config.REPORT_SYNC_MAX_DAYS} days"
+                " run as report jobs: POST /api/admin/reports/jobs"
+            )
+        result = report_cache.fetch(
+            handler,
             GetProductRotationQuery(
                 from_date=query_params.from_date,
                 to_date=query_params.to_date,
                 warehouse_id=query_params.warehouse_id,
-            )
+            ),
+            ROTATION_DATA,
         )
         return ListResponse(
             data=[ProductRotationResponse.model_validate(r) for r in result],
@@ -134,9 +217,43 @@ class ReportRouter:
                 total=result["total"],
                 limit=result["limit"],
                 offset=result["offset"],
+                next_cursor=result["next_cursor"],
+                total_mode=result["total_mode"],
             ),
         )
 
+    def export_movements(
+        self, query_params: MovementExportQueryParams = Depends()
+    ) -> StreamingResponse:
+        """
+        Streams every movement matching the movement history filters, oldest
+        first, as CSV or NDJSON (optionally gzipped). Rows are read through a
+        server-side cursor and written in small chunks, so memory stays flat
+        whatever the size of the export.
+        """
+        query = ExportMovementHistoryQuery(
+            **query_params.model_dump(exclude={"format", "gzip"}, exclude_none=True)
+        )
+        chunks = export_chunks(
+            _export_rows(query),
+            query_params.format,
+            EXPORT_COLUMNS,
+            compress=query_params.gzip,
+        )
+        # Runs the query now, so a failing one still gets an error response
+        first = next(chunks, b"")
+
+        filename = f"movements.{query_params.format}"
+        media_type = MEDIA_TYPES[query_params.format]
+        if query_params.gzip:
+            filename += ".gz"
+            media_type = "application/gzip"
+        return StreamingResponse(
+            chain([first], chunks),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
     def warehouse_summary(
         self,
         handler: Injected[GetWarehouseSummaryQueryHandler],
@@ -147,8 +264,10 @@ class ReportRouter:
         Returns aggregated stock summary per warehouse:
         total products, quantities, reserved stock, and total value.
         """
-        result = handler.handle(
-            GetWarehouseSummaryQuery(warehouse_id=query_params.warehouse_id)
+        result = report_cache.fetch(
+            handler,
+            GetWarehouseSummaryQuery(warehouse_id=query_params.warehouse_id),
+            SUMMARY_DATA,
         )
         return ListResponse(
             data=[WarehouseSummaryResponse.model_validate(r) for r in result],
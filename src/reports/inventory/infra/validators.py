@@ -3,6 +3,7 @@ from datetime import date, datetime
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
 
+from src.shared.infra.exports import ExportFormat
 from src.shared.infra.validators import DecimalNumber, QueryParams
 
 # ---------------------------------------------------------------------------
@@ -117,6 +118,20 @@ class MovementHistoryQueryParams(QueryParams):
     warehouse_id: int | None = Field(None, ge=1, description="Filter by warehouse ID")
 
 
+class MovementExportQueryParams(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    format: ExportFormat = Field(
+        ExportFormat.CSV, description="File format: csv or ndjson"
+    )
+    gzip: bool = Field(False, description="Compress the file with gzip")
+    product_id: int | None = Field(None, ge=1, description="Filter by product ID")
+    type: str | None = Field(None, description="Filter by movement type (IN or OUT)")
+    from_date: date | None = Field(None, description="Start date (inclusive)")
+    to_date: date | None = Field(None, description="End date (inclusive)")
+    warehouse_id: int | None = Field(None, ge=1, description="Filter by warehouse ID")
+
+
 # ---------------------------------------------------------------------------
 # Warehouse Summary
 # ---------------------------------------------------------------------------
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+
+from wireup import injectable
+
+from src.reports.jobs.app.repositories import ReportJobRepository
+from src.reports.jobs.domain.entities import ReportJob, ReportType
+from src.shared.app.commands import Command, CommandHandler
+
+
+@dataclass
+class SubmitReportJobCommand(Command):
+    report_type: ReportType
+    params: dict = field(default_factory=dict)  # JSON-serializable query fields
+
+
+@injectable(lifetime="scoped")
+class SubmitReportJobCommandHandler(CommandHandler[SubmitReportJobCommand, dict]):
+    """Queues a report for the job workers"""
+
+    def __init__(self, repo: ReportJobRepository):
+        self.repo = repo
+
+    def _handle(self, command: SubmitReportJobCommand) -> dict:
+        job = self.repo.create(
+            ReportJob(report_type=command.report_type, params=command.params)
+        )
+        return job.dict()
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+from wireup import injectable
+
+from src.reports.jobs.app.repositories import ReportJobRepository
+from src.reports.jobs.domain.entities import ReportJob
+from src.shared.app.queries import Query, QueryHandler
+from src.shared.domain.exceptions import NotFoundError
+
+
+def _get_job(repo: ReportJobRepository, job_id: int) -> ReportJob:
+    job = repo.get_by_id(job_id)
+    if job is None:
+        raise NotFoundError(f"Report job with id {job_id} not found")
+    return job
+
+
+@dataclass
+class GetReportJobByIdQuery(Query):
+    job_id: int
+
+
+@injectable(lifetime="scoped")
+class GetReportJobByIdQueryHandler(QueryHandler[GetReportJobByIdQuery, dict]):
+    def __init__(self, repo: ReportJobRepository):
+        self.repo = repo
+
+    def _handle(self, query: GetReportJobByIdQuery) -> dict:
+        return _get_job(self.repo, query.job_id).dict()
+
+
+@dataclass
+class GetReportJobResultQuery(Query):
+    job_id: int
+
+
+@injectable(lifetime="scoped")
+class GetReportJobResultQueryHandler(QueryHandler[GetReportJobResultQuery, str]):
+    """Returns the path of the result file of a finished, unexpired job"""
+
+    def __init__(self, repo: ReportJobRepository):
+        self.repo = repo
+
+    def _handle(self, query: GetReportJobResultQuery) -> str:
+        return _get_job(self.repo, query.job_id).ensure_result()
@@ -0,0 +1,6 @@
+from src.reports.jobs.domain.entities import ReportJob
+from src.shared.app.repositories import Repository
+
+
+class ReportJobRepository(Repository[ReportJob]):
+    pass
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+from src.reports.jobs.domain.exceptions import (
+    ReportJobExpiredError,
+    ReportJobFailedError,
+    ReportJobNotReadyError,
+)
+from src.shared.domain.entities import Entity
+
+
+class ReportType(StrEnum):
+    """Reports that can run as background jobs"""
+
+    VALUATION = "valuation"
+    ROTATION = "rotation"
+    WAREHOUSE_SUMMARY = "warehouse_summary"
+
+
+class ReportJobStatus(StrEnum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+    EXPIRED = "EXPIRED"  # Done, but its result file was purged
+
+
+@dataclass
+class ReportJob(Entity):
+    """A report computed by the job workers, whose result is kept as a file"""
+
+    report_type: ReportType
+    params: dict = field(default_factory=dict)
+    status: ReportJobStatus = ReportJobStatus.PENDING
+    result_path: str | None = None
+    result_size: int | None = None
+    error: str | None = None
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    expires_at: datetime | None = None
+    id: int | None = None
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
+    def complete(self, result_path: str, result_size: int, ttl: timedelta) -> None:
+        self.status = ReportJobStatus.DONE
+        self.finished_at = datetime.now()
+        self.result_path = result_path
+        self.result_size = result_size
+        self.expires_at = self.finished_at + ttl
+
+    def fail(self, error: str) -> None:
+        self.status = ReportJobStatus.FAILED
+        self.finished_at = datetime.now()
+        self.error = error
+
+    def ensure_result(self, now: datetime | None = None) -> str:
+        """Returns the path of the result file, if it can still be read."""
+        if self.status == ReportJobStatus.FAILED:
+            raise ReportJobFailedError(self.id, self.error)
+        if self.status == ReportJobStatus.EXPIRED or (
+            self.status == ReportJobStatus.DONE
+            and self.expires_at is not None
+            and self.expires_at <= (now or datetime.now())
+        ):
+            raise ReportJobExpiredError(self.id)
+        if self.status != ReportJobStatus.DONE:
+            raise ReportJobNotReadyError(self.id, self.status)
+        return self.result_path
@@ -0,0 +1,42 @@
+from src.shared.domain.exceptions import DomainError
+
+
+class ReportJobError(DomainError):
+    error_code = "REPORT_JOB_ERROR"
+
+
+class ReportJobNotReadyError(ReportJobError):
+    """Raised when the result of a job that has not finished is requested"""
+
+    error_code = "REPORT_JOB_NOT_READY"
+
+    def __init__(self, job_id: int, status: str):
+        self.job_id = job_id
+        super().__init__(
+            message=f"Report job {job_id} has no result yet",
+            detail=f"job_id={job_id}, status={status}",
+        )
+
+
+class ReportJobFailedError(ReportJobError):
+    error_code = "REPORT_JOB_FAILED"
+
+    def __init__(self, job_id: int, error: str | None):
+        self.job_id = job_id
+        super().__init__(
+            message=f"Report job {job_id} failed",
+            detail=error,
+        )
+
+
+class ReportJobExpiredError(ReportJobError):
+    """Raised when the result of a job was already purged"""
+
+    error_code = "REPORT_JOB_EXPIRED"
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        super().__init__(
+            message=f"The result of report job {job_id} has expired",
+            detail="Submit the report again",
+        )
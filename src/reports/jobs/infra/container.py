@@ -0,0 +1,17 @@
+from src.reports.jobs.app.commands.submit_report_job import (
+    SubmitReportJobCommandHandler,
+)
+from src.reports.jobs.app.queries.get_report_jobs import (
+    GetReportJobByIdQueryHandler,
+    GetReportJobResultQueryHandler,
+)
+from src.reports.jobs.infra.mappers import ReportJobMapper
+from src.reports.jobs.infra.repositories import SqlAlchemyReportJobRepository
+
+REPORT_JOB_INJECTABLES = [
+    ReportJobMapper,
+    SqlAlchemyReportJobRepository,
+    SubmitReportJobCommandHandler,
+    GetReportJobByIdQueryHandler,
+    GetReportJobResultQueryHandler,
+]
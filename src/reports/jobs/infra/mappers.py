@@ -0,0 +1,10 @@
+from wireup import injectable
+
+from src.reports.jobs.domain.entities import ReportJob
+from src.reports.jobs.infra.models import ReportJobModel
+from src.shared.infra.mappers import Mapper
+
+
+@injectable(lifetime="singleton")
+class ReportJobMapper(Mapper[ReportJob, ReportJobModel]):
+    __entity__ = ReportJob
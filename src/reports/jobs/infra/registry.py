@@ -0,0 +1,82 @@
+"""What each report type runs as a job, and how many may run at once."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from src.reports.inventory.app.queries.rotation import (
+    GetProductRotationQuery,
+    GetProductRotationQueryHandler,
+)
+from src.reports.inventory.app.queries.valuation import (
+    GetInventoryValuationQuery,
+    GetInventoryValuationQueryHandler,
+)
+from src.reports.inventory.app.queries.warehouse_summary import (
+    GetWarehouseSummaryQuery,
+    GetWarehouseSummaryQueryHandler,
+)
+from src.reports.inventory.infra.validators import (
+    InventoryValuationResponse,
+    ProductRotationResponse,
+    RotationQueryParams,
+    SummaryQueryParams,
+    ValuationQueryParams,
+    WarehouseSummaryResponse,
+)
+from src.reports.jobs.domain.entities import ReportType
+from src.shared.app.queries import Query, QueryHandler
+
+
+@dataclass(frozen=True)
+class ReportJobType:
+    handler: type[QueryHandler]
+    query: type[Query]
+    # Validates the submitted params, which are stored as JSON
+    params: type[BaseModel]
+    # Serializes the result exactly as the synchronous endpoint does
+    response: TypeAdapter[Any]
+    # Jobs of this type running at once across every worker
+    max_concurrency: int = 1
+
+    def build_query(self, params: dict) -> Query:
+        return self.query(**self.params.model_validate(params).model_dump())
+
+    def serialize(self, result: Any) -> bytes:
+        return self.response.dump_json(
+            self.response.validate_python(result), by_alias=True
+        )
+
+
+REPORT_JOB_TYPES: dict[ReportType, ReportJobType] = {
+    ReportType.VALUATION: ReportJobType(
+        handler=GetInventoryValuationQueryHandler,
+        query=GetInventoryValuationQuery,
+        params=ValuationQueryParams,
+        response=TypeAdapter(InventoryValuationResponse),
+    ),
+    ReportType.ROTATION: ReportJobType(
+        handler=GetProductRotationQueryHandler,
+        query=GetProductRotationQuery,
+        params=RotationQueryParams,
+        response=TypeAdapter(list[ProductRotationResponse]),
+    ),
+    ReportType.WAREHOUSE_SUMMARY: ReportJobType(
+        handler=GetWarehouseSummaryQueryHandler,
+        query=GetWarehouseSummaryQuery,
+        params=SummaryQueryParams,
+        response=TypeAdapter(list[WarehouseSummaryResponse]),
+        max_concurrency=2,
+    ),
+}
+
+
+def concurrency_limits(overrides: dict[str, int] | None = None) -> dict[str, int]:
+    """Per report type limits, with overrides (e.g. from config) applied."""
+    limits = {
+        str(t): job_type.max_concurrency for t, job_type in REPORT_JOB_TYPES.items()
+    }
+    for report_type, limit in (overrides or {}).items():
+        limits[str(ReportType(report_type))] = limit
+    return limits
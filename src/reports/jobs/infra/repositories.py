@@ -0,0 +1,18 @@
+from sqlalchemy.orm import Session
+from wireup import injectable
+
+from src.reports.jobs.app.repositories import ReportJobRepository
+from src.reports.jobs.domain.entities import ReportJob
+from src.reports.jobs.infra.mappers import ReportJobMapper
+from src.reports.jobs.infra.models import ReportJobModel
+from src.shared.infra.repositories import SqlAlchemyRepository
+
+
+@injectable(lifetime="scoped", as_type=ReportJobRepository)
+class SqlAlchemyReportJobRepository(
+    SqlAlchemyRepository[ReportJob], ReportJobRepository
+):
+    __model__ = ReportJobModel
+
+    def __init__(self, session: Session, mapper: ReportJobMapper):
+        super().__init__(session, mapper)
@@ -0,0 +1,35 @@
+"""Result files of report jobs: the JSON response, gzip-compressed."""
+
+import gzip
+import os
+from pathlib import Path
+
+
+def result_path(directory: Path, job_id: int) -> Path:
+    return directory / f"report-job-{job_id}.json.gz"
+
+
+def write_result(directory: Path, job_id: int, payload: bytes) -> tuple[Path, int]:
+    """
+    Writes the file under a temporary name and renames it, so a reader never
+    sees a partial result.
+    Returns:
+        Path of the file and its compressed size in bytes
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = result_path(directory, job_id)
+    partial = path.with_suffix(".gz.partial")
+    with gzip.open(partial, "wb") as file:
+        file.write(payload)
+    os.replace(partial, path)
+    return path, path.stat().st_size
+
+
+def read_result(path: str | Path) -> bytes:
+    with gzip.open(path, "rb") as file:
+        return file.read()
+
+
+def remove_result(path: str | Path | None) -> None:
+    if path is not None:
+        Path(path).unlink(missing_ok=True)
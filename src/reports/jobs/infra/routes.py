@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
+from wireup import Injected
+
+from src.reports.jobs.app.commands.submit_report_job import (
+    SubmitReportJobCommand,
+    SubmitReportJobCommandHandler,
+)
+from src.reports.jobs.app.queries.get_report_jobs import (
+    GetReportJobByIdQuery,
+    GetReportJobByIdQueryHandler,
+    GetReportJobResultQuery,
+    GetReportJobResultQueryHandler,
+)
+from src.reports.jobs.infra.registry import REPORT_JOB_TYPES
+from src.reports.jobs.infra.results import read_result
+from src.reports.jobs.infra.validators import ReportJobResponse, SubmitReportJobRequest
+from src.shared.infra.dependencies import get_meta
+from src.shared.infra.validators import (
+    RESPONSES_COMMAND,
+    RESPONSES_QUERY,
+    DataResponse,
+    Meta,
+)
+
+
+class ReportJobRouter:
+    def __init__(self):
+        self.router = APIRouter()
+        self._setup_routes()
+
+    def _setup_routes(self):
+        self.router.post(
+            "",
+            response_model=DataResponse[ReportJobResponse],
+            status_code=status.HTTP_202_ACCEPTED,
+            summary="Submit a report job",
+            responses=RESPONSES_COMMAND,
+        )(self.submit)
+        self.router.get(
+            "/{job_id}",
+            response_model=DataResponse[ReportJobResponse],
+            summary="Get report job status",
+            responses=RESPONSES_QUERY,
+        )(self.get_job)
+        self.router.get(
+            "/{job_id}/result",
+            response_model=DataResponse[Any],
+            summary="Get report job result",
+            responses=RESPONSES_QUERY,
+        )(self.get_result)
+        self.router.get(
+            "/{job_id}/download",
+            response_class=FileResponse,
+            summary="Download report job result",
+            responses={
+                **RESPONSES_QUERY,
+                200: {"content": {"application/gzip": {}}},
+            },
+        )(self.download)
+
+    def submit(
+        self,
+        handler: Injected[SubmitReportJobCommandHandler],
+        data: SubmitReportJobRequest,
+        meta: Meta = Depends(get_meta),
+    ) -> DataResponse[ReportJobResponse]:
+        """
+        Queues a report for the background workers and returns at once.
+        `params` takes the query parameters of the report's synchronous
+        endpoint; poll the job until its status is DONE.
+        """
+        job_type = REPORT_JOB_TYPES[data.report_type]
+        # Defaults such as "today" are fixed now, not when the job runs
+        params = job_type.params.model_validate(data.params).model_dump(
+            mode="json", by_alias=True
+        )
+        result = handler.handle(
+            SubmitReportJobCommand(report_type=data.report_type, params=params)
+        )
+        return DataResponse(data=ReportJobResponse.model_validate(result), meta=meta)
+
+    def get_job(
+        self,
+        job_id: int,
+        handler: Injected[GetReportJobByIdQueryHandler],
+        meta: Meta = Depends(get_meta),
+    ) -> DataResponse[ReportJobResponse]:
+        """Returns the status of a report job."""
+        result = handler.handle(GetReportJobByIdQuery(job_id=job_id))
+        return DataResponse(data=ReportJobResponse.model_validate(result), meta=meta)
+
+    def get_result(
+        self,
+        job_id: int,
+        handler: Injected[GetReportJobResultQueryHandler],
+        meta: Meta = Depends(get_meta),
+    ) -> DataResponse[Any]:
+        """
+        Returns the result of a finished job, shaped as the synchronous
+        endpoint's `data`.
+        """
+        path = handler.handle(GetReportJobResultQuery(job_id=job_id))
+        return DataResponse(data=json.loads(read_result(path)), meta=meta)
+
+    def download(
+        self,
+        job_id: int,
+        handler: Injected[GetReportJobResultQueryHandler],
+    ) -> FileResponse:
+        """Returns the result of a finished job as a gzipped JSON file."""
+        path = handler.handle(GetReportJobResultQuery(job_id=job_id))
+        return FileResponse(
+            path, media_type="application/gzip", filename=Path(path).name
+        )
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from src.reports.jobs.domain.entities import ReportJobStatus, ReportType
+
+
+class SubmitReportJobRequest(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    report_type: ReportType = Field(description="Report to compute")
+    params: dict = Field(
+        default_factory=dict,
+        description="Query parameters of the report's synchronous endpoint",
+    )
+
+
+class ReportJobResponse(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel, populate_by_name=True, from_attributes=True
+    )
+
+    id: int = Field(description="Job ID")
+    report_type: ReportType = Field(description="Report computed")
+    params: dict = Field(description="Validated report parameters")
+    status: ReportJobStatus = Field(
+        description="PENDING, RUNNING, DONE, FAILED or EXPIRED"
+    )
+    result_size: int | None = Field(
+        None, description="Size of the compressed result in bytes"
+    )
+    error: str | None = Field(None, description="Why the job failed")
+    created_at: datetime = Field(description="Submission time")
+    started_at: datetime | None = Field(None, description="Start time")
+    finished_at: datetime | None = Field(None, description="Completion time")
+    expires_at: datetime | None = Field(None, description="When the result is deleted")
@@ -0,0 +1,393 @@
+"""
+Runs report jobs in the background, on a pool of threads or processes.
+
+The API process runs a worker unless REPORT_JOB_WORKER_IN_PROCESS is off;
+more workers can run on their own:
+
+    python -m src.reports.jobs.infra.worker
+"""
+
+import asyncio
+import multiprocessing
+import signal
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import structlog
+from sqlalchemy import func, select, text, update
+from sqlalchemy.orm import Session
+
+from src.reports.jobs.app.repositories import ReportJobRepository
+from src.reports.jobs.domain.entities import ReportJob, ReportJobStatus
+from src.reports.jobs.infra.models import ReportJobModel
+from src.reports.jobs.infra.registry import REPORT_JOB_TYPES
+from src.reports.jobs.infra.results import remove_result, write_result
+from src.shared.infra.events.scope import create_sync_scope
+
+logger = structlog.get_logger(__name__)
+
+# Arbitrary key for pg_try_advisory_xact_lock: one worker claims at a time,
+# so the per type limits hold across worker processes
+CLAIM_LOCK_KEY = 0x0B7B0C6
+# Pending jobs looked at per claim, enough to skip the types at their limit
+CLAIM_SCAN_SIZE = 100
+PURGE_INTERVAL_SECONDS = 60.0
+
+
+def claim_jobs(session: Session, slots: int, limits: dict[str, int]) -> list[int]:
+    """
+    Marks up to slots pending jobs as running, oldest first, skipping the
+    report types that already run as many jobs as their limit allows.
+    Returns:
+        Ids of the claimed jobs
+    """
+    if slots <= 0 or not _acquire_claim_lock(session):
+        return []
+
+    running = dict(
+        session.execute(
+            select(ReportJobModel.report_type, func.count())
+            .where(ReportJobModel.status == ReportJobStatus.RUNNING)
+            .group_by(ReportJobModel.report_type)
+        ).all()
+    )
+    pending = session.execute(
+        select(ReportJobModel.id, ReportJobModel.report_type)
+        .where(ReportJobModel.status == ReportJobStatus.PENDING)
+        .order_by(ReportJobModel.id)
+        .limit(CLAIM_SCAN_SIZE)
+    ).all()
+
+    claimed: list[int] = []
+    for job_id, report_type in pending:
+        if len(claimed) == slots:
+            break
+        if running.get(report_type, 0) >= limits.get(report_type, 1):
+            continue
+        running[report_type] = running.get(report_type, 0) + 1
+        claimed.append(job_id)
+
+    if claimed:
+        session.execute(
+            update(ReportJobModel)
+            .where(ReportJobModel.id.in_(claimed))
+            .values(status=ReportJobStatus.RUNNING, started_at=datetime.now())
+        )
+    return claimed
+
+
+def release_jobs(session: Session, job_ids: list[int]) -> None:
+    """Puts claimed jobs that never started back in the queue."""
+    session.execute(
+        update(ReportJobModel)
+        .where(
+            ReportJobModel.id.in_(job_ids),
+            ReportJobModel.status == ReportJobStatus.RUNNING,
+        )
+        .values(status=ReportJobStatus.PENDING, started_at=None)
+    )
+
+
+def purge_jobs(
+    session: Session, timeout: timedelta, now: datetime | None = None
+) -> tuple[int, int]:
+    """
+    Deletes the result files past their expiry and fails the jobs running for
+    longer than timeout (their worker is gone, or the report never ends).
+    Returns:
+        Number of jobs expired and of jobs timed out
+    """
+    now = now or datetime.now()
+    expired = (
+        session.execute(
+            select(ReportJobModel).where(
+                ReportJobModel.status == ReportJobStatus.DONE,
+                ReportJobModel.expires_at <= now,
+            )
+        )
+        .scalars()
+        .all()
+    )
+    for job in expired:
+        remove_result(job.result_path)
+        job.status = ReportJobStatus.EXPIRED
+        job.result_path = None
+
+    timed_out = session.execute(
+        update(ReportJobModel)
+        .where(
+            ReportJobModel.status == ReportJobStatus.RUNNING,
+            ReportJobModel.started_at <= now - timeout,
+        )
+        .values(
+            status=ReportJobStatus.FAILED,
+            finished_at=now,
+            error="Timed out, or the worker running it stopped",
+        )
+    ).rowcount
+    return len(expired), timed_out
+
+
+def finish_job(session: Session, job: ReportJob) -> bool:
+    """
+    Stores the outcome of job unless it stopped running meanwhile (purge_jobs
+    timed it out), so a late finish never overwrites that failure.
+    Returns:
+        Whether the outcome was stored
+    """
+    return (
+        session.execute(
+            update(ReportJobModel)
+            .where(
+                ReportJobModel.id == job.id,
+                ReportJobModel.status == ReportJobStatus.RUNNING,
+            )
+            .values(
+                status=job.status,
+                finished_at=job.finished_at,
+                result_path=job.result_path,
+                result_size=job.result_size,
+                expires_at=job.expires_at,
+                error=job.error,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        == 1
+    )
+
+
+def run_report_job(job_id: int, result_dir: str, result_ttl: float) -> str:
+    """
+    Computes a claimed job and stores its result. Runs on a worker thread or
+    process, with its own session.
+    Returns:
+        Final status of the job
+    """
+    with create_sync_scope() as scope:
+        repo = scope.get(ReportJobRepository)
+        job = repo.get_by_id(job_id)
+        if job is None:
+            return ReportJobStatus.FAILED
+        job_type = REPORT_JOB_TYPES[job.report_type]
+        start = time.perf_counter()
+        try:
+            result = scope.get(job_type.handler).handle(
+                job_type.build_query(job.params)
+            )
+            path, size = write_result(
+                Path(result_dir),
+                job.id,
+                job_type.serialize(result),
+            )
+            job.complete(str(path), size, timedelta(seconds=result_ttl))
+        except Exception as exc:
+            scope.get(Session).rollback()
+            logger.error(
+                "report_job_failed",
+                job_id=job_id,
+                report_type=str(job.report_type),
+                exc_info=True,
+            )
+            job.fail(f"{type(exc).__name__}: {exc}")
+        session = scope.get(Session)
+        if not finish_job(session, job):
+            remove_result(job.result_path)
+            job.status = session.execute(
+                select(ReportJobModel.status).where(ReportJobModel.id == job_id)
+            ).scalar()
+            logger.warning(
+                "report_job_finished_too_late",
+                job_id=job_id,
+                status=str(job.status),
+            )
+
+    logger.info(
+        "report_job_finished",
+        job_id=job_id,
+        report_type=str(job.report_type),
+        status=str(job.status),
+        elapsed_seconds=round(time.perf_counter() - start, 3),
+    )
+    return job.status
+
+
+def _init_worker_process() -> None:
+    import src
+    from config import config
+    from src.container import create_wireup_container
+    from src.shared.infra.logging import configure_logging
+
+    configure_logging(
+        log_level=config.LOG_LEVEL,
+        json_output=config.ENVIRONMENT != "local",
+    )
+    # Its own container, so the process opens its own connections
+    src.wireup_container = create_wireup_container()
+
+
+def create_executor(kind: str, workers: int) -> Executor:
+    """Pool the jobs run on: "thread", or "process" for CPU-bound reports."""
+    if kind == "process":
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker_process,
+        )
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-job")
+    raise ValueError(f"Unknown report job executor: {kind}")
+
+
+def _log_crash(job_id: int, future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        # The job stays running until purge_jobs times it out
+        logger.error("report_job_crashed", job_id=job_id, exc_info=future.exception())
+
+
+class ReportJobWorker:
+    """
+    Claims pending jobs while its pool has free workers and runs them there.
+
+    Claims are serialized between worker processes and count the jobs
+    running anywhere, so each report type stays within its concurrency
+    limit however many workers there are.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        workers: int,
+        limits: dict[str, int],
+        result_dir: Path,
+        result_ttl: timedelta,
+        timeout: timedelta,
+        poll_interval: float = 1.0,
+    ):
+        self.executor = executor
+        self.workers = workers
+        self.limits = limits
+        self.result_dir = result_dir
+        self.result_ttl = result_ttl
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._in_flight: dict[Future, int] = {}
+
+    def dispatch_once(self) -> int:
+        """
+        Claims jobs for the free workers and hands them to the pool.
+        Returns:
+            Number of jobs started
+        """
+        self._in_flight = {f: i for f, i in self._in_flight.items() if not f.done()}
+        slots = self.workers - len(self._in_flight)
+        if slots <= 0:
+            return 0
+
+        # The claim commits when the scope closes, before a worker reads it
+        with create_sync_scope() as scope:
+            job_ids = claim_jobs(scope.get(Session), slots, self.limits)
+
+        for job_id in job_ids:
+            future = self.executor.submit(
+                run_report_job,
+                job_id,
+                str(self.result_dir),
+                self.result_ttl.total_seconds(),
+            )
+            future.add_done_callback(lambda f, job_id=job_id: _log_crash(job_id, f))
+            self._in_flight[future] = job_id
+        return len(job_ids)
+
+    def purge_once(self) -> None:
+        with create_sync_scope() as scope:
+            expired, timed_out = purge_jobs(scope.get(Session), self.timeout)
+        if expired or timed_out:
+            logger.info("report_jobs_purged", expired=expired, timed_out=timed_out)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Dispatches jobs until stop is set, polling when none are pending."""
+        logger.info("report_job_worker_started", workers=self.workers)
+        last_purge = float("-inf")
+        while not stop.is_set():
+            started = 0
+            try:
+                if time.monotonic() - last_purge >= PURGE_INTERVAL_SECONDS:
+                    await asyncio.to_thread(self.purge_once)
+                    last_purge = time.monotonic()
+                started = await asyncio.to_thread(self.dispatch_once)
+            except Exception:
+                logger.error("report_job_worker_error", exc_info=True)
+            if not started:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+        await asyncio.to_thread(self.shutdown)
+        logger.info("report_job_worker_stopped")
+
+    def shutdown(self) -> None:
+        """
+        Stops the pool and requeues the claimed jobs not started. Returns
+        without waiting for running jobs, but does not stop them: at
+        interpreter exit concurrent.futures joins the pool's threads (the
+        process pool's manager thread waits for its running jobs too), so
+        the process only exits once the running reports end. A job that never
+        stores its outcome is failed by purge_jobs after the timeout.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        cancelled = [i for f, i in self._in_flight.items() if f.cancelled()]
+        if cancelled:
+            with create_sync_scope() as scope:
+                release_jobs(scope.get(Session), cancelled)
+            logger.info("report_jobs_released", job_ids=cancelled)
+
+
+def create_report_job_worker() -> ReportJobWorker:
+    from config import config
+    from src.reports.jobs.infra.registry import concurrency_limits
+
+    return ReportJobWorker(
+        create_executor(config.REPORT_JOB_EXECUTOR, config.REPORT_JOB_WORKERS),
+        workers=config.REPORT_JOB_WORKERS,
+        limits=concurrency_limits(config.REPORT_JOB_CONCURRENCY),
+        result_dir=Path(config.REPORT_JOB_RESULT_DIR),
+        result_ttl=timedelta(hours=config.REPORT_JOB_RESULT_TTL_HOURS),
+        timeout=timedelta(minutes=config.REPORT_JOB_TIMEOUT_MINUTES),
+        poll_interval=config.REPORT_JOB_POLL_INTERVAL,
+    )
+
+
+def _acquire_claim_lock(session: Session) -> bool:
+    if session.get_bind().dialect.name != "postgresql":
+        return True
+    return bool(
+        session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": CLAIM_LOCK_KEY}
+        ).scalar()
+    )
+
+
+async def main() -> None:
+    import src
+    from src.container import create_wireup_container
+
+    src.wireup_container = create_wireup_container()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await create_report_job_worker().run(stop)
+
+
+if __name__ == "__main__":
+    from config import config
+    from src.shared.infra.logging import configure_logging
+
+    configure_logging(
+        log_level=config.LOG_LEVEL,
+        json_output=config.ENVIRONMENT != "local",
+    )
+    asyncio.run(main())
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from wireup import injectable
 
 from src.sales.app.repositories import SaleRepository
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 
@@ -15,6 +16,8 @@ class GetAllSalesQuery(Query):
     status: str | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -31,7 +34,13 @@ class GetAllSalesQueryHandler(QueryHandler[GetAllSalesQuery, dict]):
             filters["customer_id"] = query.customer_id
         if query.status is not None:
             filters["status"] = query.status
-        return self.repo.paginate(limit=query.limit, offset=query.offset, **filters)
+        return self.repo.paginate(
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filters,
+        )
 
 
 @dataclass
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infra.database import Base
@@ -12,6 +12,10 @@ class SaleModel(Base):
     """Modelo SQLAlchemy para Sales"""
 
     __tablename__ = "sales"
+    __table_args__ = (
+        Index("ix_sales_shift_id_status", "shift_id", "status"),
+        Index("ix_sales_status_sale_date", "status", "sale_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     customer_id: Mapped[int | None] = mapped_column(
@@ -66,6 +70,7 @@ class SaleItemModel(Base):
     """Modelo SQLAlchemy para Sale Items"""
 
     __tablename__ = "sale_items"
+    __table_args__ = (Index("ix_sale_items_sale_id", "sale_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     sale_id: Mapped[int] = mapped_column(
@@ -96,6 +101,7 @@ class PaymentModel(Base):
     """Modelo SQLAlchemy para Payments"""
 
     __tablename__ = "payments"
+    __table_args__ = (Index("ix_payments_sale_id", "sale_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     sale_id: Mapped[int] = mapped_column(
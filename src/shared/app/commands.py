@@ -11,6 +11,7 @@ from src.shared.infra.telemetry_instruments import (
     handler_errors,
     handler_invocations,
 )
+from src.shared.infra.unit_of_work import unit_of_work
 
 logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -46,7 +47,9 @@ class CommandHandler(Generic[TCommand, TResult], ABC):
             handler_invocations.add(1, attributes)
             start = time.perf_counter()
             try:
-                result = self._handle(command)
+                # Writes are flushed once, when the command succeeds
+                with unit_of_work():
+                    result = self._handle(command)
                 elapsed = time.perf_counter() - start
                 elapsed_ms = round(elapsed * 1000, 2)
                 logger.info(
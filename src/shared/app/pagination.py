@@ -0,0 +1,61 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from enum import StrEnum
+from typing import Any
+
+from src.shared.domain.exceptions import ValidationError
+
+
+class TotalMode(StrEnum):
+    """How the total of a paginated response is computed."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encodes the sort key of the last row of a page as an opaque cursor.
+    Args:
+        *values: Sort key values, ending with the row id
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps(list(values), default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decodes a cursor produced by encode_cursor.
+    Args:
+        cursor: Cursor received from the client
+        size: Number of values the sort key must have
+    Returns:
+        Sort key values, in the order they were encoded
+    Raises:
+        ValidationError: If the cursor is malformed or its last value is not
+            an integer id
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Invalid pagination cursor") from None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError("Invalid pagination cursor")
+    # The id is compared in SQL as is; bool is an int subclass
+    last_id = values[-1]
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValidationError("Invalid pagination cursor")
+    return values
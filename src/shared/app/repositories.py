@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.specifications import Specification
 
 T = TypeVar("T")
@@ -15,6 +16,18 @@ class Repository(Generic[T], ABC):
     def update(self, entity: T) -> T:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_many(self, entities: list[T]) -> list[T]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, entities: list[T]) -> list[T]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_many(self, entities: list[T], conflict_fields: list[str]) -> list[T]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, id: int) -> None:
         raise NotImplementedError
@@ -27,6 +40,10 @@ class Repository(Generic[T], ABC):
     def get_by_id(self, id: int) -> T | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_many(self, ids: list[int]) -> list[T]:
+        raise NotImplementedError
+
     @abstractmethod
     def first(self, **kwargs) -> T | None:
         raise NotImplementedError
@@ -54,12 +71,22 @@ class Repository(Generic[T], ABC):
 
     @abstractmethod
     def paginate(
-        self, limit: int | None = None, offset: int | None = None, **kwargs
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        include_total: TotalMode = TotalMode.EXACT,
+        **kwargs,
     ) -> dict:
         raise NotImplementedError
 
     @abstractmethod
     def paginate_by_spec(
-        self, spec: Specification, limit: int | None = None, offset: int | None = None
+        self,
+        spec: Specification,
+        limit: int | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        include_total: TotalMode = TotalMode.EXACT,
     ) -> dict:
         raise NotImplementedError
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class DocumentSequence(ABC):
+    """Gap-tolerant, per-year counters for numbered documents (PO-2026-0001...)."""
+
+    @abstractmethod
+    def next_value(self, name: str, year: int) -> int:
+        """
+        Allocates the next number of a document sequence.
+        Args:
+            name: Sequence name, usually the document prefix (e.g. "PO")
+            year: Year the numbering restarts on
+        Returns:
+            The allocated number, starting at 1 for each (name, year)
+        """
+        raise NotImplementedError
@@ -0,0 +1,87 @@
+import structlog
+from sqlalchemy import Select, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.shared.app.pagination import TotalMode
+from src.shared.infra.cache import LRUCache
+
+logger = structlog.get_logger(__name__)
+
+ESTIMATED_COUNT_TTL_SECONDS = 30.0
+COUNT_CACHE_MAXSIZE = 1024
+
+
+# Bounded: the keys are the compiled filters, which vary with every request
+count_cache: LRUCache[str, int] = LRUCache(
+    maxsize=COUNT_CACHE_MAXSIZE, ttl=ESTIMATED_COUNT_TTL_SECONDS
+)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN of a SELECT, compiled with the SELECT's bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, stmt: Select):
+        self.statement = stmt
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def count_rows(session: Session, stmt: Select, mode: TotalMode) -> int | None:
+    """
+    Counts the rows a SELECT would return using the requested mode.
+    Args:
+        session: Session to run the count with
+        stmt: Page query without ORDER BY, LIMIT or OFFSET
+        mode: exact runs COUNT(*), estimated asks the planner (PostgreSQL)
+            or reuses a short-lived cached count, none skips counting
+    Returns:
+        Row count, or None when mode is none
+    """
+    if mode == TotalMode.NONE:
+        return None
+    if mode == TotalMode.ESTIMATED:
+        return estimate_rows(session, stmt)
+    return _exact_count(session, stmt)
+
+
+def estimate_rows(session: Session, stmt: Select) -> int:
+    if session.get_bind().dialect.name == "postgresql":
+        estimate = _planner_estimate(session, stmt)
+        if estimate is not None:
+            return estimate
+
+    key = _cache_key(session, stmt)
+    total = count_cache.get(key)
+    if total is None:
+        total = _exact_count(session, stmt)
+        count_cache.set(key, total)
+    return total
+
+
+def _exact_count(session: Session, stmt: Select) -> int:
+    return session.scalar(select(func.count()).select_from(stmt.subquery()))
+
+
+def _cache_key(session: Session, stmt: Select) -> str:
+    compiled = stmt.compile(dialect=session.get_bind().dialect)
+    params = sorted((key, repr(value)) for key, value in compiled.params.items())
+    return f"{compiled}|{params}"
+
+
+def _planner_estimate(session: Session, stmt: Select) -> int | None:
+    try:
+        # A failed EXPLAIN must not abort the caller's transaction
+        with session.begin_nested():
+            plan = session.execute(_Explain(stmt)).scalar()
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (SQLAlchemyError, LookupError, TypeError, ValueError) as exc:
+        logger.warning("row_estimate_failed", error=str(exc))
+        return None
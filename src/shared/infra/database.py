@@ -1,31 +1,247 @@
+import threading
+import time
 from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+import structlog
+from sqlalchemy import Connection, Engine, QueuePool, create_engine, event, make_url
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction, sessionmaker
 from wireup import injectable
 
+from config.base import DatabasePoolConfig
+from src.shared.infra.events.after_commit import after_commit_scope
+from src.shared.infra.telemetry_instruments import (
+    db_pool_checkout_wait,
+    db_pool_connections_in_use,
+    db_pool_timeouts,
+    observe_pool_overflow,
+)
+
+logger = structlog.get_logger(__name__)
+
+REPLICA_COOLDOWN_SECONDS = 30.0
+
 
 class Base(DeclarativeBase):
     pass
 
 
-def create_session_factory(connection_string: str):
+_read_only: ContextVar[bool] = ContextVar("db_session_read_only", default=False)
+_use_primary: ContextVar[bool] = ContextVar("db_session_use_primary", default=False)
+_statement_timeout_ms: ContextVar[int | None] = ContextVar(
+    "db_statement_timeout_ms", default=None
+)
+
+
+@contextmanager
+def read_only_session_scope(use_primary: bool = False) -> Iterator[None]:
+    """
+    Makes sessions created inside the block read-only (no flush, no commit).
+    Read-only sessions go to a replica when any is configured, unless
+    use_primary pins them to the primary (read-your-writes).
+    """
+    read_only_token = _read_only.set(True)
+    primary_token = _use_primary.set(use_primary)
+    try:
+        yield
+    finally:
+        _use_primary.reset(primary_token)
+        _read_only.reset(read_only_token)
+
+
+@contextmanager
+def statement_timeout_scope(timeout_ms: int | None) -> Iterator[None]:
+    """Caps every statement of sessions created inside the block (PostgreSQL)."""
+    token = _statement_timeout_ms.set(timeout_ms)
+    try:
+        yield
+    finally:
+        _statement_timeout_ms.reset(token)
+
+
+def _set_statement_timeout(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    timeout_ms = _statement_timeout_ms.get()
+    if timeout_ms and connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def _set_transaction_read_only(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+def _safe_url(engine: Engine) -> str:
+    return engine.url.render_as_string(hide_password=True)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports checkout wait time and checkout timeouts."""
+
+    role = "primary"
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            db_pool_timeouts.add(1, {"db.pool": self.role})
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            db_pool_checkout_wait.record(elapsed_ms, {"db.pool": self.role})
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.role = self.role
+        return pool
+
+
+def _engine_options(url: str, pool: DatabasePoolConfig) -> dict:
+    options = {"pool_pre_ping": pool.pool_pre_ping, "pool_recycle": pool.pool_recycle}
+    sa_url = make_url(url)
+    # In-memory SQLite uses a singleton pool that takes no sizing options
+    if issubclass(sa_url.get_dialect().get_pool_class(sa_url), QueuePool):
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool.pool_size,
+            max_overflow=pool.max_overflow,
+            pool_timeout=pool.pool_timeout,
+        )
+    return options
+
+
+def _create_engine(url: str, pool: DatabasePoolConfig, role: str) -> Engine:
+    engine = create_engine(url, **_engine_options(url, pool))
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.role = role
+        observe_pool_overflow(engine)
+
+    attributes = {"db.pool": role}
+    event.listen(
+        engine,
+        "checkout",
+        lambda *args: db_pool_connections_in_use.add(1, attributes),
+    )
+    event.listen(
+        engine,
+        "checkin",
+        lambda *args: db_pool_connections_in_use.add(-1, attributes),
+    )
+    return engine
+
+
+class ReplicaPool:
+    """Round-robin over replica engines, skipping replicas that recently failed."""
+
+    def __init__(
+        self, engines: list[Engine], cooldown: float = REPLICA_COOLDOWN_SECONDS
+    ):
+        self.engines = engines
+        self.cooldown = cooldown
+        self._down_until: dict[Engine, float] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+        for engine in engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def connect(self) -> Connection | None:
+        """
+        Opens a connection on the next healthy replica.
+        Returns:
+            The connection, or None when every replica is down
+        """
+        for engine in self._candidates():
+            try:
+                return engine.connect()
+            except DBAPIError as exc:
+                self.mark_down(engine, str(exc))
+        return None
+
+    def mark_down(self, engine: Engine, reason: str) -> None:
+        with self._lock:
+            self._down_until[engine] = time.monotonic() + self.cooldown
+        logger.warning("db_replica_unavailable", url=_safe_url(engine), error=reason)
+
+    def _candidates(self) -> list[Engine]:
+        now = time.monotonic()
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.engines)
+            ordered = self.engines[start:] + self.engines[:start]
+            return [e for e in ordered if self._down_until.get(e, 0.0) <= now]
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.is_disconnect and context.engine is not None:
+            self.mark_down(context.engine, str(context.original_exception))
+
+
+def create_session_factory(
+    connection_string: str,
+    replica_urls: list[str] | None = None,
+    pool: DatabasePoolConfig | None = None,
+):
     if not connection_string:
         raise ValueError("Database connection string cannot be empty")
 
-    engine = create_engine(connection_string)
+    pool = pool or DatabasePoolConfig()
+    engine = _create_engine(connection_string, pool, "primary")
+    replicas = (
+        ReplicaPool(
+            [
+                _create_engine(url, pool, f"replica-{index}")
+                for index, url in enumerate(replica_urls)
+            ]
+        )
+        if replica_urls
+        else None
+    )
     _factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    _read_only_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    event.listen(_factory, "after_begin", _set_statement_timeout)
+    event.listen(_read_only_factory, "after_begin", _set_statement_timeout)
+    event.listen(_read_only_factory, "after_begin", _set_transaction_read_only)
 
     @injectable(lifetime="scoped")
     def get_db_session() -> Iterator[Session]:
+        if _read_only.get():
+            # Falls back to the primary when no replica is reachable
+            connection = None
+            if replicas is not None and not _use_primary.get():
+                connection = replicas.connect()
+            if connection is not None:
+                session = _read_only_factory(bind=connection)
+            else:
+                session = _read_only_factory()
+
+            # Queries never write: end with a rollback instead of a commit
+            try:
+                yield session
+            finally:
+                session.rollback()
+                session.close()
+                if connection is not None:
+                    connection.close()
+            return
+
         session = _factory()
-        try:
-            yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
+        with after_commit_scope() as after_commit:
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                after_commit.discard()
+                raise
+            finally:
+                session.close()
+        # Side-effect handlers run outside the transaction and its locks
+        after_commit.drain()
 
     return get_db_session
@@ -1,4 +1,4 @@
 from src.shared.infra.events.decorators import event_handler
-from src.shared.infra.events.event_bus import EventBus
+from src.shared.infra.events.event_bus import EventBus, EventPhase, SpanGranularity
 
-__all__ = ["EventBus", "event_handler"]
+__all__ = ["EventBus", "EventPhase", "SpanGranularity", "event_handler"]
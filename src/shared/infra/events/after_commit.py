@@ -0,0 +1,86 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current: ContextVar["AfterCommitQueue | None"] = ContextVar(
+    "after_commit_queue", default=None
+)
+_executor: ThreadPoolExecutor | None = None
+
+
+class AfterCommitQueue:
+    """
+    Handler calls deferred until the transaction that published their events
+    commits. A rollback discards them, so a failed sale never triggers its
+    side effects, and a failing side effect cannot roll back the sale.
+    """
+
+    def __init__(self):
+        self._pending: list[Callable[[], None]] = []
+
+    def defer(self, call: Callable[[], None]) -> None:
+        self._pending.append(call)
+
+    def discard(self) -> None:
+        self._pending.clear()
+
+    def drain(self) -> None:
+        """Runs the deferred calls in order, on the worker pool when configured."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if _executor is not None:
+            _executor.submit(_run, pending)
+        else:
+            _run(pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+def _run(pending: list[Callable[[], None]]) -> None:
+    for call in pending:
+        try:
+            call()
+        except Exception:
+            # Already logged and counted by the bus; the commit stands
+            continue
+
+
+def current_after_commit_queue() -> AfterCommitQueue | None:
+    return _current.get()
+
+
+@contextmanager
+def after_commit_scope() -> Iterator[AfterCommitQueue]:
+    """
+    Collects the after-commit handlers of events published inside the block.
+    The caller drains the queue once its transaction commits.
+    """
+    previous = _current.get()
+    queue = AfterCommitQueue()
+    _current.set(queue)
+    try:
+        yield queue
+    finally:
+        # set() instead of reset(): a session generator may be finalized in
+        # another context than the one it started in
+        _current.set(previous)
+
+
+def configure_after_commit_workers(workers: int) -> None:
+    """Drains after-commit queues on a pool of worker threads; 0 drains inline."""
+    global _executor
+    shutdown_after_commit_workers()
+    if workers > 0:
+        _executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="after-commit"
+        )
+
+
+def shutdown_after_commit_workers() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
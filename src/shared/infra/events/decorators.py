@@ -1,18 +1,15 @@
 from collections.abc import Callable
-from typing import Any
 
 from src.shared.domain.events import DomainEvent
-from src.shared.infra.events.event_bus import EventBus
+from src.shared.infra.events.event_bus import EventBus, EventPhase
 
 
-def event_handler(event_type: type[DomainEvent]) -> Callable:
+def event_handler(
+    event_type: type[DomainEvent], phase: EventPhase = EventPhase.IN_TRANSACTION
+) -> Callable:
     def decorator(func: Callable) -> Callable:
-        def wrapper(event: DomainEvent, session: Any = None) -> None:
-            func(event, session=session)
-
-        wrapper.__name__ = func.__name__
-        wrapper.__qualname__ = func.__qualname__
-        EventBus.subscribe(event_type, wrapper)
+        # EventBus detects whether func takes a session when it freezes
+        EventBus.subscribe(event_type, func, phase)
         return func
 
     return decorator
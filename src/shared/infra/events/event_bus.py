@@ -1,13 +1,21 @@
 import inspect
+import time
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
 import structlog
 from opentelemetry import trace
+from opentelemetry.trace import Span
 
 from src.shared.domain.events import DomainEvent
+from src.shared.infra.events.after_commit import current_after_commit_queue
 from src.shared.infra.telemetry_instruments import (
+    event_handler_duration,
     event_handler_errors,
     events_published,
 )
@@ -16,73 +24,201 @@ logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
 
 
+class SpanGranularity(StrEnum):
+    """Spans opened by EventBus.publish."""
+
+    PUBLISH = "publish"  # One span per publish
+    HANDLER = "handler"  # Plus a child span per handler
+
+
+class EventPhase(StrEnum):
+    """When a subscriber runs relative to the publishing transaction."""
+
+    IN_TRANSACTION = "in_transaction"  # Inline, inside the transaction
+    AFTER_COMMIT = "after_commit"  # Once the transaction commits, without session
+
+
+@dataclass(frozen=True, slots=True)
+class _Route:
+    """A handler bound to one event type, with everything publish needs."""
+
+    handler: Callable
+    name: str
+    accepts_session: bool
+    phase: EventPhase
+    attributes: dict[str, str]
+
+
+def _accepts_session(handler: Callable) -> bool:
+    try:
+        parameters = inspect.signature(handler).parameters
+    except (ValueError, TypeError):
+        return False
+    return "session" in parameters or any(
+        p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+
+
+def _event_types() -> set[type[DomainEvent]]:
+    found: set[type[DomainEvent]] = set()
+    pending = [DomainEvent]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass not in found:
+                found.add(subclass)
+                pending.append(subclass)
+    return found
+
+
 class EventBus:
-    _subscribers: dict[type[DomainEvent], list[Callable]] = defaultdict(list)
-    _accepts_session: dict[int, bool] = {}
+    """
+    In-process synchronous event bus.
+
+    Handlers subscribe while the application is being wired. freeze() then
+    resolves, for every known event type, the handlers subscribed to it or
+    to any of its base events, and stores them with their calling
+    convention in an immutable dispatch table. After that a publish is a
+    single dict lookup. Before freeze() (tests, scripts) handlers are
+    resolved on each publish.
+
+    After-commit handlers are queued on the transaction's after-commit
+    queue and run once it commits; with no queue active (scripts, tests,
+    the outbox relay) they run inline like the others.
+    """
+
+    _subscribers: dict[type[DomainEvent], list[tuple[Callable, EventPhase]]] = (
+        defaultdict(list)
+    )
+    _dispatch: Mapping[type[DomainEvent], tuple[_Route, ...]] | None = None
+    _span_granularity: SpanGranularity = SpanGranularity.PUBLISH
 
     @classmethod
-    def subscribe(cls, event_type: type[DomainEvent], handler: Callable) -> None:
-        cls._subscribers[event_type].append(handler)
-        try:
-            sig = inspect.signature(handler)
-            cls._accepts_session[id(handler)] = "session" in sig.parameters
-        except (ValueError, TypeError):
-            cls._accepts_session[id(handler)] = False
+    def subscribe(
+        cls,
+        event_type: type[DomainEvent],
+        handler: Callable,
+        phase: EventPhase = EventPhase.IN_TRANSACTION,
+    ) -> None:
+        if cls._dispatch is not None:
+            raise RuntimeError(
+                f"Cannot subscribe {handler.__name__}: the EventBus is frozen"
+            )
+        cls._subscribers[event_type].append((handler, EventPhase(phase)))
+
+    @classmethod
+    def freeze(
+        cls, span_granularity: SpanGranularity = SpanGranularity.PUBLISH
+    ) -> None:
+        """Builds the dispatch table; later subscriptions are rejected."""
+        event_types = _event_types() | set(cls._subscribers)
+        cls._dispatch = MappingProxyType(
+            {event_type: cls._resolve(event_type) for event_type in event_types}
+        )
+        cls._span_granularity = SpanGranularity(span_granularity)
+        logger.info(
+            "event_bus_frozen",
+            event_types=len(event_types),
+            span_granularity=str(cls._span_granularity),
+        )
+
+    @classmethod
+    def _resolve(cls, event_type: type[DomainEvent]) -> tuple[_Route, ...]:
+        routes: list[_Route] = []
+        seen: set[int] = set()
+        for klass in event_type.__mro__:
+            for handler, phase in cls._subscribers.get(klass, ()):
+                if id(handler) in seen:
+                    continue
+                seen.add(id(handler))
+                routes.append(
+                    _Route(
+                        handler=handler,
+                        name=handler.__name__,
+                        accepts_session=_accepts_session(handler),
+                        phase=phase,
+                        attributes={
+                            "event.type": event_type.__name__,
+                            "event.handler": handler.__name__,
+                        },
+                    )
+                )
+        return tuple(routes)
+
+    @classmethod
+    def _routes(cls, event_type: type[DomainEvent]) -> tuple[_Route, ...]:
+        if cls._dispatch is not None:
+            routes = cls._dispatch.get(event_type)
+            if routes is not None:
+                return routes
+        # Not frozen yet, or an event class defined after freeze()
+        return cls._resolve(event_type)
 
     @classmethod
     def publish(cls, event: DomainEvent, session: Any = None) -> None:
-        event_type = type(event)
-        event_type_name = event_type.__name__
-        handlers = cls._subscribers.get(event_type, [])
+        event_type_name = type(event).__name__
+        routes = cls._routes(type(event))
 
         with tracer.start_as_current_span(
             f"event.publish.{event_type_name}",
             attributes={
                 "event.type": event_type_name,
-                "event.handler_count": len(handlers),
+                "event.handler_count": len(routes),
             },
-        ):
-            logger.info(
+        ) as span:
+            logger.debug(
                 "event_published",
                 event_type=event_type_name,
-                handler_count=len(handlers),
+                handler_count=len(routes),
             )
             events_published.add(1, {"event.type": event_type_name})
 
-            for handler in handlers:
-                handler_name = handler.__name__
-                with tracer.start_as_current_span(
-                    f"event.handle.{handler_name}",
-                    attributes={
-                        "event.type": event_type_name,
-                        "event.handler": handler_name,
-                    },
-                ) as span:
-                    try:
-                        if cls._accepts_session.get(id(handler), False):
-                            handler(event, session=session)
-                        else:
-                            handler(event)
-                        span.set_status(trace.StatusCode.OK)
-                    except Exception as e:
-                        logger.error(
-                            "event_handler_error",
-                            handler=handler_name,
-                            event_type=event_type_name,
-                            error=str(e),
-                        )
-                        event_handler_errors.add(
-                            1,
-                            {
-                                "event.type": event_type_name,
-                                "event.handler": handler_name,
-                            },
-                        )
-                        span.set_status(trace.StatusCode.ERROR, str(e))
-                        span.record_exception(e)
-                        raise
+            per_handler = cls._span_granularity == SpanGranularity.HANDLER
+            after_commit = current_after_commit_queue()
+            for route in routes:
+                if route.phase == EventPhase.AFTER_COMMIT and after_commit is not None:
+                    after_commit.defer(partial(cls._call_after_commit, route, event))
+                elif per_handler:
+                    with tracer.start_as_current_span(
+                        f"event.handle.{route.name}", attributes=route.attributes
+                    ) as handler_span:
+                        cls._call(route, event, session, handler_span)
+                else:
+                    cls._call(route, event, session, span)
+
+    @classmethod
+    def _call_after_commit(cls, route: _Route, event: DomainEvent) -> None:
+        with tracer.start_as_current_span(
+            f"event.after_commit.{route.name}", attributes=route.attributes
+        ) as span:
+            cls._call(route, event, None, span)
+
+    @staticmethod
+    def _call(route: _Route, event: DomainEvent, session: Any, span: Span) -> None:
+        start = time.perf_counter()
+        try:
+            if route.accepts_session:
+                route.handler(event, session=session)
+            else:
+                route.handler(event)
+        except Exception as e:
+            logger.error(
+                "event_handler_error",
+                handler=route.name,
+                event_type=route.attributes["event.type"],
+                error=str(e),
+            )
+            event_handler_errors.add(1, route.attributes)
+            span.set_attribute("event.failed_handler", route.name)
+            span.set_status(trace.StatusCode.ERROR, str(e))
+            span.record_exception(e)
+            raise
+        finally:
+            event_handler_duration.record(
+                (time.perf_counter() - start) * 1000, route.attributes
+            )
 
     @classmethod
     def clear(cls) -> None:
         cls._subscribers.clear()
-        cls._accepts_session.clear()
+        cls._dispatch = None
+        cls._span_granularity = SpanGranularity.PUBLISH
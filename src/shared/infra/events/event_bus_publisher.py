@@ -5,9 +5,14 @@ from wireup import injectable
 from src.shared.app.events import EventPublisher
 from src.shared.domain.events import DomainEvent
 from src.shared.infra.events.event_bus import EventBus
+from src.shared.infra.unit_of_work import current_unit_of_work
 
 
 @injectable(lifetime="singleton", as_type=EventPublisher)
 class EventBusPublisher(EventPublisher):
     def publish(self, event: DomainEvent, session: Any = None) -> None:
+        # Handlers must see the writes the command has deferred so far
+        uow = current_unit_of_work()
+        if uow is not None:
+            uow.flush()
         EventBus.publish(event, session=session)
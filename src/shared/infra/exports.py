@@ -0,0 +1,94 @@
+"""
+Turns row iterators into byte chunks for streamed downloads. Rows are
+buffered only up to CHUNK_SIZE bytes, so memory stays flat however many
+rows the export has.
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum, StrEnum
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def _plain(value):
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _json_default(value):
+    plain = _plain(value)
+    if plain is value:
+        raise TypeError(f"Cannot serialize {type(value).__name__}")
+    return plain
+
+
+def csv_chunks(rows: Iterable[dict], columns: list[str]) -> Iterator[bytes]:
+    """CSV with a header row; None is written as an empty field."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_plain(row[column]) for column in columns])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def ndjson_chunks(rows: Iterable[dict]) -> Iterator[bytes]:
+    """One JSON object per line."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(json.dumps(row, default=_json_default))
+        buffer.write("\n")
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compresses a chunk stream into a single gzip member, as it goes."""
+    compressor = zlib.compressobj(wbits=31)  # 31: gzip header and trailer
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_chunks(
+    rows: Iterable[dict],
+    format: ExportFormat,
+    columns: list[str],
+    compress: bool = False,
+) -> Iterator[bytes]:
+    if format == ExportFormat.CSV:
+        chunks = csv_chunks(rows, columns)
+    else:
+        chunks = ndjson_chunks(rows)
+    return gzip_chunks(chunks) if compress else chunks
@@ -1,3 +1,14 @@
-from src.shared.infra.kafka.producer import KafkaEventProducer
+from src.shared.infra.kafka.breaker import CircuitBreaker, CircuitState
+from src.shared.infra.kafka.producer import (
+    Backpressure,
+    KafkaEventProducer,
+    OutgoingMessage,
+)
 
-__all__ = ["KafkaEventProducer"]
+__all__ = [
+    "Backpressure",
+    "CircuitBreaker",
+    "CircuitState",
+    "KafkaEventProducer",
+    "OutgoingMessage",
+]
@@ -0,0 +1,80 @@
+import threading
+import time
+from enum import StrEnum
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Opens after failure_threshold failures in a row. Once reset_timeout has
+    elapsed, allow_request() lets a single probe through (half-open): its
+    success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def is_closed(self) -> bool:
+        return self._state == CircuitState.CLOSED
+
+    def allow_request(self) -> bool:
+        """Whether a request may go to the broker; may start a half-open probe."""
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            if (
+                self._state == CircuitState.OPEN
+                and time.monotonic() >= self._opened_at + self.reset_timeout
+            ):
+                self._state = CircuitState.HALF_OPEN
+                return True
+            # Open, or half-open with the probe still in flight
+            return False
+
+    def record_success(self) -> bool:
+        """
+        Returns:
+            Whether this success closed a circuit that was not closed
+        """
+        with self._lock:
+            self._failures = 0
+            if self._state == CircuitState.CLOSED:
+                return False
+            self._state = CircuitState.CLOSED
+        logger.info("kafka_circuit_closed")
+        return True
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitState.OPEN:
+                return
+            if (
+                self._state == CircuitState.CLOSED
+                and self._failures < self.failure_threshold
+            ):
+                return
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+        logger.warning("kafka_circuit_opened", failures=self._failures)
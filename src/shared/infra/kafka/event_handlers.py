@@ -1,16 +1,28 @@
+import time
 from typing import Any
 
-import structlog
+from opentelemetry import trace
+from sqlalchemy.orm import Session
 
+from src.catalog.product.domain.events import ProductDeleted, ProductUpdated
 from src.sales.domain.events import SaleConfirmed
+from src.shared.infra.cache import LRUCache
 from src.shared.infra.events.decorators import event_handler
+from src.shared.infra.events.event_bus import EventPhase
 from src.shared.infra.events.scope import create_sync_scope
-from src.shared.infra.kafka.producer import KafkaEventProducer
+from src.shared.infra.kafka.breaker import CircuitBreaker
+from src.shared.infra.kafka.producer import Backpressure, KafkaEventProducer
+from src.shared.infra.outbox import enqueue_message, register_enricher
+from src.shared.infra.telemetry_instruments import kafka_enrichment_duration
 
-logger = structlog.get_logger(__name__)
+tracer = trace.get_tracer(__name__)
 
 _producer: KafkaEventProducer | None = None
 
+# (sku, name) of products referenced by sales. Product events invalidate
+# entries; the TTL bounds staleness when the relay runs in its own process.
+_product_projections: LRUCache[int, tuple[str, str]] = LRUCache(maxsize=2048, ttl=300.0)
+
 
 def _get_producer() -> KafkaEventProducer | None:
     global _producer
@@ -20,47 +32,101 @@ def _get_producer() -> KafkaEventProducer | None:
         if not config.KAFKA_ENABLED:
             return None
 
-        _producer = KafkaEventProducer(config.KAFKA_BOOTSTRAP_SERVERS)
+        _producer = KafkaEventProducer(
+            config.KAFKA_BOOTSTRAP_SERVERS,
+            linger_ms=config.KAFKA_LINGER_MS,
+            max_batch_size=config.KAFKA_MAX_BATCH_SIZE,
+            compression_type=config.KAFKA_COMPRESSION_TYPE or None,
+            queue_size=config.KAFKA_QUEUE_SIZE,
+            backpressure=Backpressure(config.KAFKA_BACKPRESSURE),
+            spool_path=config.KAFKA_SPOOL_PATH,
+            spool_fsync_interval=config.KAFKA_SPOOL_FSYNC_INTERVAL,
+            breaker=CircuitBreaker(
+                failure_threshold=config.KAFKA_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=config.KAFKA_BREAKER_RESET_SECONDS,
+            ),
+        )
         _producer.start()
 
     return _producer
 
 
-def _build_enriched_payload(event: SaleConfirmed, session: Any = None) -> dict:
+def _customer_data(customer) -> dict:
+    return {
+        "id": customer.id,
+        "name": customer.name,
+        "tax_id": customer.tax_id,
+        "tax_type": customer.tax_type.name,
+        "email": customer.email,
+        "phone": customer.phone,
+        "address": customer.address,
+    }
+
+
+def _load_product_projections(
+    product_ids: set[int], scope
+) -> dict[int, tuple[str, str]]:
+    """Returns (sku, name) per product, fetching cache misses in one query."""
     from src.catalog.product.app.repositories import ProductRepository
+
+    projections = _product_projections.get_many(product_ids)
+    missing = product_ids - projections.keys()
+    if missing:
+        for product in scope.get(ProductRepository).get_many(list(missing)):
+            projections[product.id] = (product.sku, product.name)
+            _product_projections.set(product.id, projections[product.id])
+    return projections
+
+
+def _build_enriched_payloads(messages: list[dict], session: Session) -> list[dict]:
+    """Adds customer and product details to a batch of stored SaleConfirmed events."""
     from src.customers.app.repositories import CustomerRepository
 
-    customer_data = None
+    start = time.perf_counter()
+    payloads = [message["payload"] for message in messages]
+    product_ids = {item["product_id"] for p in payloads for item in p["items"]}
+    customer_ids = {p["customer_id"] for p in payloads if p.get("customer_id")}
+
+    with tracer.start_as_current_span(
+        "kafka.enrich.SaleConfirmed",
+        attributes={
+            "enrichment.events": len(messages),
+            "enrichment.products": len(product_ids),
+            "enrichment.customers": len(customer_ids),
+        },
+    ):
+        with create_sync_scope(session) as scope:
+            products = _load_product_projections(product_ids, scope)
+            customers = {
+                customer.id: _customer_data(customer)
+                for customer in scope.get(CustomerRepository).get_many(
+                    list(customer_ids)
+                )
+            }
+        enriched = [
+            _enriched_message(message, products, customers) for message in messages
+        ]
+
+    kafka_enrichment_duration.record(
+        (time.perf_counter() - start) * 1000, {"event.type": "SaleConfirmed"}
+    )
+    return enriched
+
+
+def _enriched_message(
+    message: dict,
+    products: dict[int, tuple[str, str]],
+    customers: dict[int, dict],
+) -> dict:
+    payload = message["payload"]
     enriched_items = []
-
-    with create_sync_scope(session) as scope:
-        if event.customer_id:
-            customer_repo = scope.get(CustomerRepository)
-            customer = customer_repo.get_by_id(event.customer_id)
-            if customer:
-                customer_data = {
-                    "id": customer.id,
-                    "name": customer.name,
-                    "tax_id": customer.tax_id,
-                    "tax_type": customer.tax_type.name,
-                    "email": customer.email,
-                    "phone": customer.phone,
-                    "address": customer.address,
-                }
-
-        product_repo = scope.get(ProductRepository)
-        product_ids = {item["product_id"] for item in event.items}
-        products = {
-            p.id: p for p in (product_repo.get_by_id(pid) for pid in product_ids) if p
-        }
-
-    for item in event.items:
-        product = products.get(item["product_id"])
+    for item in payload["items"]:
+        sku, name = products.get(item["product_id"], (None, None))
         enriched_items.append(
             {
                 "product_id": item["product_id"],
-                "sku": product.sku if product else None,
-                "product_name": product.name if product else None,
+                "sku": sku,
+                "product_name": name,
                 "quantity": item["quantity"],
                 "unit_price": item["unit_price"],
                 "discount": item.get("discount", 0),
@@ -71,36 +137,44 @@ def _build_enriched_payload(event: SaleConfirmed, session: Any = None) -> dict:
         )
 
     return {
-        "event_id": event.event_id,
+        "event_id": message["event_id"],
         "event_type": "SaleConfirmed",
-        "aggregate_id": event.aggregate_id,
-        "occurred_at": event.occurred_at.isoformat().replace("+00:00", "Z"),
+        "aggregate_id": message["aggregate_id"],
+        "occurred_at": message["occurred_at"].replace("+00:00", "Z"),
         "payload": {
-            "sale_id": event.sale_id,
-            "source": event.source,
-            "subtotal": event.subtotal,
-            "total_discount": event.total_discount,
-            "total": event.total,
-            "customer": customer_data,
+            "sale_id": payload["sale_id"],
+            "source": payload["source"],
+            "subtotal": payload["subtotal"],
+            "total_discount": payload["total_discount"],
+            "total": payload["total"],
+            "customer": customers.get(payload.get("customer_id")),
             "items": enriched_items,
-            "payments": event.payments,
+            "payments": payload["payments"],
         },
     }
 
 
+register_enricher("SaleConfirmed", _build_enriched_payloads)
+
+
+# Invalidating before the commit would let a concurrent read cache the old row
+@event_handler(ProductUpdated, phase=EventPhase.AFTER_COMMIT)
+def invalidate_product_projection(event: ProductUpdated, session: Any = None) -> None:
+    _product_projections.invalidate(event.product_id)
+
+
+@event_handler(ProductDeleted, phase=EventPhase.AFTER_COMMIT)
+def drop_product_projection(event: ProductDeleted, session: Any = None) -> None:
+    _product_projections.invalidate(event.product_id)
+
+
 @event_handler(SaleConfirmed)
 def publish_sale_confirmed_to_kafka(event: SaleConfirmed, session: Any = None) -> None:
-    producer = _get_producer()
-    if producer is None:
+    """Stores the event in the outbox; OutboxRelay enriches and publishes it."""
+    from config import config
+
+    if not config.KAFKA_ENABLED:
         return
 
-    try:
-        enriched = _build_enriched_payload(event, session=session)
-        producer.send_raw("sales.confirmed", enriched, event_type="SaleConfirmed")
-    except Exception:
-        logger.error(
-            "kafka_enrichment_error",
-            sale_id=event.sale_id,
-            exc_info=True,
-        )
-        producer.send("sales.confirmed", event)
+    with create_sync_scope(session) as scope:
+        enqueue_message(scope.get(Session), "sales.confirmed", event)
@@ -1,23 +1,55 @@
 import asyncio
 import json
 import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from enum import StrEnum
+from typing import Any
 
 import structlog
 from aiokafka import AIOKafkaProducer
+from aiokafka.errors import (
+    InvalidTopicError,
+    MessageSizeTooLargeError,
+    RecordListTooLargeError,
+)
 from opentelemetry import trace
 from opentelemetry.propagate import inject
 
 from src.shared.domain.events import DomainEvent
+from src.shared.infra.kafka.breaker import CircuitBreaker, CircuitState
+from src.shared.infra.kafka.spool import DiskSpool
 from src.shared.infra.telemetry_instruments import (
+    kafka_messages_dropped,
     kafka_messages_sent,
+    kafka_queue_depth,
     kafka_send_errors,
 )
 
 logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Messages handed to aiokafka per wake-up of the loop thread
+_DRAIN_CHUNK = 500
+# Longest the loop thread sleeps without a wake-up (spool sync, probes)
+_IDLE_TICK = 0.5
+# Delivery attempts of a fire-and-forget message before it is given up
+_MAX_DELIVERY_ATTEMPTS = 5
+# Errors caused by the message itself; they say nothing about the broker,
+# so they do not count towards opening the circuit
+_MESSAGE_ERRORS = (
+    InvalidTopicError,
+    MessageSizeTooLargeError,
+    RecordListTooLargeError,
+    TypeError,
+    ValueError,
+)
+
 
 class _KafkaHeaderSetter:
     def set(self, carrier: list, key: str, value: str) -> None:
@@ -33,6 +65,10 @@ def _inject_trace_context() -> list[tuple[str, bytes]]:
     return headers
 
 
+def _remaining(deadline: float) -> float:
+    return max(deadline - time.monotonic(), 0.0)
+
+
 def _json_serializer(obj):
     if isinstance(obj, Decimal):
         return str(obj)
@@ -41,15 +77,110 @@ def _json_serializer(obj):
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+class Backpressure(StrEnum):
+    """What a send does when the in-memory queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    SPILL = "spill"
+
+
+@dataclass
+class OutgoingMessage:
+    topic: str
+    value: dict[str, Any]
+    event_type: str = "unknown"
+    key: str | None = None
+    headers: list[tuple[str, bytes]] = field(default_factory=list)
+    attempts: int = 0
+    # Set when the caller waits for the delivery result
+    result: Future | None = field(default=None, repr=False)
+    # Set when read back from the spool, which keeps it until it is settled
+    spool_offset: int | None = field(default=None, repr=False)
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "topic": self.topic,
+            "value": self.value,
+            "event_type": self.event_type,
+            "key": self.key,
+            "headers": [[k, v.decode("utf-8")] for k, v in self.headers],
+            "attempts": self.attempts,
+        }
+
+    @classmethod
+    def from_record(
+        cls, record: dict[str, Any], spool_offset: int | None = None
+    ) -> "OutgoingMessage":
+        return cls(
+            topic=record["topic"],
+            value=record["value"],
+            event_type=record["event_type"],
+            key=record["key"],
+            headers=[(k, v.encode("utf-8")) for k, v in record["headers"]],
+            attempts=record.get("attempts", 0),
+            spool_offset=spool_offset,
+        )
+
+
 class KafkaEventProducer:
-    def __init__(self, bootstrap_servers: str) -> None:
+    """
+    Thread-safe front end for AIOKafkaProducer.
+
+    Sends go through a bounded in-memory queue that the producer's loop
+    thread drains into aiokafka, which batches them (linger_ms,
+    max_batch_size) and compresses each batch. publish() returns as soon as
+    the message is queued; send()/send_raw()/send_many() wait for the broker
+    acknowledgement. When the queue is full the backpressure policy decides
+    whether the caller blocks, the oldest message is dropped, or the message
+    spills to a JSONL file that is replayed once the queue drains.
+
+    A circuit breaker guards the broker. While it is open, sends that wait
+    for an acknowledgement fail at once and fire-and-forget messages go to
+    the spool; it is replayed in order once a half-open probe succeeds.
+    Fire-and-forget messages that fail in flight are spooled again at the
+    tail, so they may land after messages published later.
+    """
+
+    def __init__(
+        self,
+        bootstrap_servers: str,
+        linger_ms: int = 5,
+        max_batch_size: int = 16384,
+        compression_type: str | None = "gzip",
+        queue_size: int = 10000,
+        backpressure: Backpressure = Backpressure.BLOCK,
+        spool_path: str | None = None,
+        spool_fsync_interval: float = 1.0,
+        send_timeout: float = 5.0,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        if backpressure == Backpressure.SPILL and not spool_path:
+            raise ValueError("The spill backpressure policy requires a spool_path")
+
         self._bootstrap_servers = bootstrap_servers
+        self._linger_ms = linger_ms
+        self._max_batch_size = max_batch_size
+        self._compression_type = compression_type
+        self._queue_size = queue_size
+        self._backpressure = Backpressure(backpressure)
+        self._spool = (
+            DiskSpool(spool_path, spool_fsync_interval) if spool_path else None
+        )
+        self._send_timeout = send_timeout
+        self._breaker = breaker or CircuitBreaker()
+
         self._producer: AIOKafkaProducer | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
-        self._started = threading.Event()
+        self._queue: deque[OutgoingMessage] = deque()
+        self._not_full = threading.Condition()
+        # Records waiting in the spool, including leftovers of a previous run
+        self._spooled = len(self._spool) if self._spool is not None else 0
+        self._wakeup: asyncio.Event | None = None
 
     def start(self) -> None:
+        """Starts the loop thread. Does not wait for the broker connection."""
         if self._thread is not None:
             return
 
@@ -58,103 +189,338 @@ class KafkaEventProducer:
             target=self._run_loop, daemon=True, name="kafka-producer"
         )
         self._thread.start()
-        self._started.wait(timeout=10)
 
     def _run_loop(self) -> None:
         asyncio.set_event_loop(self._loop)
-        self._loop.run_until_complete(self._start_producer())
-        self._started.set()
+        self._wakeup = asyncio.Event()
+        try:
+            self._loop.run_until_complete(self._start_producer())
+        except Exception as e:
+            self._producer = None
+            logger.error("kafka_producer_start_error", error=str(e))
+        drain = self._loop.create_task(self._drain())
         self._loop.run_forever()
+        drain.cancel()
+        self._loop.run_until_complete(asyncio.gather(drain, return_exceptions=True))
+        self._loop.close()
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        return self._breaker.state
 
     async def _start_producer(self) -> None:
-        self._producer = AIOKafkaProducer(
+        producer = AIOKafkaProducer(
             bootstrap_servers=self._bootstrap_servers,
             value_serializer=lambda v: json.dumps(v, default=_json_serializer).encode(
                 "utf-8"
             ),
+            linger_ms=self._linger_ms,
+            max_batch_size=self._max_batch_size,
+            compression_type=self._compression_type,
         )
-        await self._producer.start()
+        try:
+            await producer.start()
+        except Exception:
+            await producer.stop()
+            raise
+        self._producer = producer
         logger.info(
             "kafka_producer_started",
             bootstrap_servers=self._bootstrap_servers,
         )
 
-    def send(self, topic: str, event: DomainEvent) -> None:
-        if self._loop is None or self._producer is None:
+    # -- Sending ----------------------------------------------------------
+
+    def publish(
+        self,
+        topic: str,
+        data: dict,
+        event_type: str = "unknown",
+        key: str | None = None,
+    ) -> bool:
+        """
+        Queues a message without waiting for delivery (fire-and-forget).
+        Delivery results are reported through kafka.messages_sent/send_errors.
+        Returns:
+            Whether the message was accepted by the queue or the spool
+        """
+        if self._thread is None:
             logger.warning("kafka_producer_not_started")
-            return
+            return False
+
+        message = OutgoingMessage(
+            topic, data, event_type, key, headers=_inject_trace_context()
+        )
+        return self._enqueue(message)
+
+    def send(self, topic: str, event: DomainEvent) -> bool:
+        return self.send_raw(
+            topic,
+            event.to_dict(),
+            event_type=type(event).__name__,
+            key=str(event.aggregate_id),
+        )
+
+    def send_raw(
+        self,
+        topic: str,
+        data: dict,
+        event_type: str = "unknown",
+        key: str | None = None,
+    ) -> bool:
+        """
+        Sends a pre-built message and waits for the broker acknowledgement.
+        Args:
+            topic: Destination topic
+            data: JSON-serializable message body
+            event_type: Event type, used for tracing and logs
+            key: Partition key; messages sharing a key keep their order
+        Returns:
+            Whether the broker acknowledged the message
+        """
+        return self.send_many([OutgoingMessage(topic, data, event_type, key)])[0]
+
+    def send_many(self, messages: list[OutgoingMessage]) -> list[bool]:
+        """
+        Queues several messages at once, so they share producer batches, and
+        waits for all acknowledgements. The whole call, queueing included,
+        waits at most send_timeout; messages not acknowledged by then fail.
+        Returns:
+            Delivery result of each message, in order
+        """
+        if not messages:
+            return []
+        if self._thread is None:
+            logger.warning("kafka_producer_not_started")
+            return [False] * len(messages)
 
         with tracer.start_as_current_span(
-            f"kafka.send.{topic}",
-            attributes={"kafka.topic": topic, "event.type": type(event).__name__},
+            f"kafka.send.{messages[0].topic}",
+            attributes={
+                "kafka.topic": messages[0].topic,
+                "kafka.message_count": len(messages),
+            },
         ):
+            deadline = time.monotonic() + self._send_timeout
             headers = _inject_trace_context()
-            future = asyncio.run_coroutine_threadsafe(
-                self._producer.send_and_wait(topic, event.to_dict(), headers=headers),
-                self._loop,
+            for message in messages:
+                message.headers = message.headers or headers
+                message.result = Future()
+                # A rejected message has its result resolved by _drop
+                self._enqueue(message, spill=False, timeout=_remaining(deadline))
+
+            results = []
+            for message in messages:
+                try:
+                    results.append(message.result.result(timeout=_remaining(deadline)))
+                except FutureTimeoutError:
+                    self._breaker.record_failure()
+                    kafka_send_errors.add(1, {"kafka.topic": message.topic})
+                    logger.error(
+                        "kafka_send_error",
+                        topic=message.topic,
+                        event_type=message.event_type,
+                        error="delivery timed out",
+                    )
+                    results.append(False)
+            return results
+
+    def _enqueue(
+        self,
+        message: OutgoingMessage,
+        spill: bool = True,
+        timeout: float | None = None,
+    ) -> bool:
+        with self._not_full:
+            can_spool = spill and self._spool is not None
+            if can_spool and (self._spooled or not self._breaker.is_closed):
+                # Broker down, or older messages still on disk: keep the order
+                self._spool_messages([message])
+                return True
+            if not self._breaker.is_closed and not self._breaker.allow_request():
+                self._drop(message, "circuit_open")
+                return False
+            if len(self._queue) >= self._queue_size:
+                if self._backpressure == Backpressure.SPILL and can_spool:
+                    self._spool_messages([message])
+                    return True
+                if self._backpressure == Backpressure.DROP_OLDEST:
+                    self._drop(self._queue.popleft(), "queue_full")
+                    kafka_queue_depth.add(-1)
+                elif not self._not_full.wait_for(
+                    lambda: len(self._queue) < self._queue_size,
+                    timeout=self._send_timeout if timeout is None else timeout,
+                ):
+                    self._drop(message, "queue_full")
+                    return False
+            self._queue.append(message)
+            kafka_queue_depth.add(1)
+        self._notify()
+        return True
+
+    def _spool_messages(self, messages: list[OutgoingMessage]) -> None:
+        with self._not_full:
+            self._spool.append([message.to_record() for message in messages])
+            self._spooled += len(messages)
+
+    def _drop(self, message: OutgoingMessage, reason: str) -> None:
+        kafka_messages_dropped.add(
+            1, {"kafka.topic": message.topic, "kafka.drop_reason": reason}
+        )
+        logger.warning(
+            "kafka_message_dropped",
+            topic=message.topic,
+            event_type=message.event_type,
+            reason=reason,
+        )
+        if message.result is not None and not message.result.done():
+            message.result.set_result(False)
+        self._settle(message)
+
+    def _settle(self, message: OutgoingMessage) -> None:
+        """Lets the spool move past a replayed message (sent, spooled or dropped)."""
+        if message.spool_offset is not None and self._spool is not None:
+            self._spool.commit(message.spool_offset)
+            message.spool_offset = None
+
+    def _notify(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # -- Loop thread ------------------------------------------------------
+
+    def _take(self, limit: int) -> list[OutgoingMessage]:
+        with self._not_full:
+            batch = [self._queue.popleft() for _ in range(min(limit, len(self._queue)))]
+            if batch:
+                kafka_queue_depth.add(-len(batch))
+                self._not_full.notify_all()
+            return batch
+
+    def _refill_from_spool(self) -> None:
+        if self._spool is None or not self._spooled or self._queue:
+            return
+        if not self._breaker.allow_request():
+            return
+        # A half-open probe replays a single message
+        limit = self._queue_size if self._breaker.is_closed else 1
+        with self._not_full:
+            records = self._spool.read(limit)
+            self._spooled = max(self._spooled - len(records), 0) if records else 0
+            self._queue.extend(
+                OutgoingMessage.from_record(record, spool_offset=end)
+                for end, record in records
             )
+            kafka_queue_depth.add(len(records))
+
+    async def _drain(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=_IDLE_TICK)
+            self._wakeup.clear()
+            if self._spool is not None:
+                self._spool.sync()
+            self._refill_from_spool()
+            batch = self._take(_DRAIN_CHUNK)
+            for message in batch:
+                if self._breaker.state == CircuitState.OPEN:
+                    # Queued before the circuit opened: do not wait on the broker
+                    self._divert(message)
+                else:
+                    await self._dispatch(message)
+            if batch:
+                # More may be queued (or spooled); yield and go again
+                self._wakeup.set()
+
+    def _divert(self, message: OutgoingMessage) -> None:
+        if message.result is None and self._spool is not None:
+            self._spool_messages([message])
+            self._settle(message)
+        else:
+            self._drop(message, "circuit_open")
+
+    async def _dispatch(self, message: OutgoingMessage) -> None:
+        if self._producer is None:
+            # Startup failed (broker down at boot); retry on each probe
             try:
-                future.result(timeout=5)
-                kafka_messages_sent.add(1, {"kafka.topic": topic})
-                logger.info(
-                    "kafka_message_sent",
-                    topic=topic,
-                    event_type=type(event).__name__,
-                    event_id=event.event_id,
-                )
+                await self._start_producer()
             except Exception as e:
-                kafka_send_errors.add(1, {"kafka.topic": topic})
-                logger.error(
-                    "kafka_send_error",
-                    topic=topic,
-                    event_type=type(event).__name__,
-                    error=str(e),
-                )
-
-    def send_raw(self, topic: str, data: dict, event_type: str = "unknown") -> None:
-        if self._loop is None or self._producer is None:
-            logger.warning("kafka_producer_not_started")
+                self._on_delivery(message, e)
+                return
+        try:
+            delivery = await self._producer.send(
+                message.topic,
+                message.value,
+                key=message.key.encode("utf-8") if message.key is not None else None,
+                headers=message.headers,
+            )
+        except Exception as e:
+            self._on_delivery(message, e)
             return
+        delivery.add_done_callback(
+            lambda done: self._on_delivery(
+                message, None if done.cancelled() else done.exception()
+            )
+        )
 
-        with tracer.start_as_current_span(
-            f"kafka.send.{topic}",
-            attributes={"kafka.topic": topic, "event.type": event_type},
-        ):
-            headers = _inject_trace_context()
-            future = asyncio.run_coroutine_threadsafe(
-                self._producer.send_and_wait(topic, data, headers=headers),
-                self._loop,
+    def _on_delivery(self, message: OutgoingMessage, error: BaseException | None):
+        if error is None:
+            if self._breaker.record_success():
+                # Circuit closed again: replay what was spooled meanwhile
+                self._notify()
+            kafka_messages_sent.add(1, {"kafka.topic": message.topic})
+            logger.debug(
+                "kafka_message_sent",
+                topic=message.topic,
+                event_type=message.event_type,
+                event_id=message.value.get("event_id"),
             )
-            try:
-                future.result(timeout=5)
-                kafka_messages_sent.add(1, {"kafka.topic": topic})
-                logger.info(
-                    "kafka_message_sent",
-                    topic=topic,
-                    event_type=event_type,
-                    event_id=data.get("event_id"),
-                )
-            except Exception as e:
-                kafka_send_errors.add(1, {"kafka.topic": topic})
-                logger.error(
-                    "kafka_send_error",
-                    topic=topic,
-                    event_type=event_type,
-                    error=str(e),
-                )
+        else:
+            if not isinstance(error, _MESSAGE_ERRORS):
+                self._breaker.record_failure()
+            kafka_send_errors.add(1, {"kafka.topic": message.topic})
+            logger.error(
+                "kafka_send_error",
+                topic=message.topic,
+                event_type=message.event_type,
+                error=str(error),
+            )
+            message.attempts += 1
+            if (
+                message.result is None
+                and self._spool is not None
+                and message.attempts < _MAX_DELIVERY_ATTEMPTS
+            ):
+                self._spool_messages([message])
+        self._settle(message)
+        if message.result is not None and not message.result.done():
+            message.result.set_result(error is None)
 
     def close(self) -> None:
-        if self._loop is None or self._producer is None:
+        if self._loop is None:
             return
 
-        future = asyncio.run_coroutine_threadsafe(self._producer.stop(), self._loop)
-        try:
-            future.result(timeout=5)
-        except Exception as e:
-            logger.error("kafka_producer_close_error", error=str(e))
+        if self._producer is not None:
+            # stop() flushes whatever aiokafka still holds in its batches
+            future = asyncio.run_coroutine_threadsafe(self._producer.stop(), self._loop)
+            try:
+                future.result(timeout=self._send_timeout)
+            except Exception as e:
+                logger.error("kafka_producer_close_error", error=str(e))
+
+        pending = self._take(len(self._queue))
+        if pending and self._spool is not None:
+            # Replayed messages are still in the spool, past its committed offset
+            fresh = [message for message in pending if message.spool_offset is None]
+            if fresh:
+                self._spool_messages(fresh)
+        elif pending:
+            logger.warning("kafka_messages_lost_on_close", count=len(pending))
 
         self._loop.call_soon_threadsafe(self._loop.stop)
         if self._thread is not None:
             self._thread.join(timeout=5)
+        if self._spool is not None:
+            self._spool.sync()
 
         logger.info("kafka_producer_stopped")
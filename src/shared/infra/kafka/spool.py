@@ -0,0 +1,138 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class DiskSpool:
+    """
+    Append-only JSONL file holding Kafka messages that could not be sent
+    right away. Records are read back in the order they were written.
+
+    Reading does not remove anything: the spool keeps a committed offset,
+    stored next to the file, that only moves past a record once commit()
+    reports it settled (delivered, spooled again or given up). Records read
+    but not settled when the process dies are read again on the next start.
+    The file is deleted once every record in it is settled.
+
+    Appends are flushed to the OS at once but fsync'ed at most once per
+    fsync_interval, so a burst of appends shares a single disk sync; sync()
+    forces the pending one and stores the committed offset.
+    """
+
+    def __init__(self, path: str, fsync_interval: float = 1.0):
+        self.path = path
+        self.offset_path = f"{path}.offset"
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._synced_at = 0.0
+        self._committed = self._load_offset()
+        self._stored_offset = self._committed
+        self._read_offset = self._committed
+        # End offset of each record read and not yet committed -> settled
+        self._in_flight: OrderedDict[int, bool] = OrderedDict()
+
+    def append(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+        lines = "".join(json.dumps(record) + "\n" for record in records)
+        with self._lock, open(self.path, "a", encoding="utf-8") as spool:
+            spool.write(lines)
+            spool.flush()
+            now = time.monotonic()
+            if now - self._synced_at >= self.fsync_interval:
+                os.fsync(spool.fileno())
+                self._synced_at = now
+                self._dirty = False
+            else:
+                self._dirty = True
+
+    def sync(self) -> None:
+        """Fsyncs appends still waiting for the batched sync, then the offset."""
+        with self._lock:
+            if self._dirty and os.path.exists(self.path):
+                with open(self.path, "a", encoding="utf-8") as spool:
+                    os.fsync(spool.fileno())
+                self._synced_at = time.monotonic()
+                self._dirty = False
+            if self._committed != self._stored_offset:
+                self._store_offset()
+
+    def read(self, limit: int) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Reads up to limit records after the last one read, without removing
+        them; each must be passed to commit() once settled.
+        Returns:
+            (end offset, record) pairs, in write order
+        """
+        with self._lock:
+            if limit <= 0 or not os.path.exists(self.path):
+                return []
+            records = []
+            with open(self.path, "rb") as spool:
+                spool.seek(self._read_offset)
+                while len(records) < limit:
+                    line = spool.readline()
+                    if not line.endswith(b"\n"):
+                        break  # End of file, or an append still being written
+                    self._read_offset += len(line)
+                    if not line.strip():
+                        continue
+                    self._in_flight[self._read_offset] = False
+                    records.append((self._read_offset, json.loads(line)))
+            return records
+
+    def commit(self, end: int) -> None:
+        """Marks the record ending at end as settled."""
+        with self._lock:
+            if end not in self._in_flight:
+                return
+            self._in_flight[end] = True
+            while self._in_flight:
+                first, settled = next(iter(self._in_flight.items()))
+                if not settled:
+                    break
+                self._in_flight.popitem(last=False)
+                self._committed = first
+            if self._committed == self._read_offset and not self._in_flight:
+                self._truncate_if_drained()
+
+    def __len__(self) -> int:
+        """Records not read yet."""
+        with self._lock:
+            if not os.path.exists(self.path):
+                return 0
+            with open(self.path, "rb") as spool:
+                spool.seek(self._read_offset)
+                return sum(1 for line in spool if line.strip())
+
+    def _truncate_if_drained(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        if os.path.getsize(self.path) != self._committed:
+            return
+        os.remove(self.path)
+        if os.path.exists(self.offset_path):
+            os.remove(self.offset_path)
+        self._committed = self._stored_offset = self._read_offset = 0
+        self._dirty = False
+
+    def _load_offset(self) -> int:
+        try:
+            with open(self.offset_path, encoding="utf-8") as offset_file:
+                offset = int(offset_file.read())
+        except (FileNotFoundError, ValueError):
+            return 0
+        # An offset past the end belongs to a spool file that was replaced
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return offset if 0 <= offset <= size else 0
+
+    def _store_offset(self) -> None:
+        tmp_path = f"{self.offset_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as offset_file:
+            offset_file.write(str(self._committed))
+        os.replace(tmp_path, self.offset_path)
+        self._stored_offset = self._committed
@@ -1,4 +1,5 @@
 import dataclasses
+from collections.abc import Callable, Iterable
 from enum import Enum
 from typing import Any, ClassVar, Generic, TypeVar, get_args, get_type_hints
 
@@ -16,17 +17,66 @@ def _extract_enum_type(hint) -> type[Enum] | None:
     return None
 
 
+def _compile(name: str, source: str, namespace: dict[str, Any]) -> Callable:
+    exec(compile(source, f"<mapper {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _build_to_entity(
+    entity: type, field_names: tuple[str, ...], enum_fields: dict[str, type[Enum]]
+) -> Callable[[Any], Any]:
+    """Generates `model -> entity` with one attribute read per field."""
+    namespace: dict[str, Any] = {"_entity": entity}
+    lines = ["def to_entity(model):"]
+    args = []
+    for index, name in enumerate(field_names):
+        if name in enum_fields:
+            namespace[f"_enum_{index}"] = enum_fields[name]
+            lines.append(f"    v{index} = model.{name}")
+            lines.append(f"    if v{index} is not None:")
+            lines.append(f"        v{index} = _enum_{index}(v{index})")
+            args.append(f"{name}=v{index}")
+        else:
+            args.append(f"{name}=model.{name}")
+    lines.append(f"    return _entity({', '.join(args)})")
+    return _compile("to_entity", "\n".join(lines), namespace)
+
+
+def _build_to_dict(field_names: tuple[str, ...]) -> Callable[[Any], dict[str, Any]]:
+    """Generates `entity -> dict` that unwraps enums and drops a missing id."""
+    namespace: dict[str, Any] = {"_Enum": Enum}
+    lines = ["def to_dict(entity):"]
+    items = []
+    for index, name in enumerate(field_names):
+        lines.append(f"    v{index} = entity.{name}")
+        lines.append(f"    if isinstance(v{index}, _Enum):")
+        lines.append(f"        v{index} = v{index}.value")
+        items.append(f"{name!r}: v{index}")
+    lines.append(f"    result = {{{', '.join(items)}}}")
+    if "id" in field_names:
+        lines.append("    if result['id'] is None:")
+        lines.append("        del result['id']")
+    lines.append("    return result")
+    return _compile("to_dict", "\n".join(lines), namespace)
+
+
 class Mapper(Generic[E, M]):
     """Convention-based mapper: auto-maps fields by name between Entity and Model.
 
     Subclasses only need to declare:
       - __entity__: the dataclass type to construct
       - __exclude_fields__: fields to omit from to_dict (e.g. auto-generated timestamps)
+
+    The field plan (names, enum coercers, excluded fields) is resolved once per
+    subclass and compiled into plain functions, so converting a row costs no
+    dataclass introspection.
     """
 
     __entity__: ClassVar[type]
     __exclude_fields__: ClassVar[frozenset[str]] = frozenset()
     _enum_fields: ClassVar[dict[str, type[Enum]]]
+    _to_entity: ClassVar[Callable[[Any], Any]]
+    _to_dict: ClassVar[Callable[[Any], dict[str, Any]]]
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -37,27 +87,24 @@ class Mapper(Generic[E, M]):
                 for name, hint in hints.items()
                 if (enum_type := _extract_enum_type(hint)) is not None
             }
+            field_names = tuple(f.name for f in dataclasses.fields(cls.__entity__))
+            cls._to_entity = staticmethod(
+                _build_to_entity(cls.__entity__, field_names, cls._enum_fields)
+            )
+            cls._to_dict = staticmethod(
+                _build_to_dict(
+                    tuple(n for n in field_names if n not in cls.__exclude_fields__)
+                )
+            )
 
     def to_entity(self, model: M | None) -> E | None:
         if model is None:
             return None
-        kwargs = {}
-        for field in dataclasses.fields(self.__entity__):
-            value = getattr(model, field.name)
-            if value is not None and field.name in self._enum_fields:
-                value = self._enum_fields[field.name](value)
-            kwargs[field.name] = value
-        return self.__entity__(**kwargs)
+        return self._to_entity(model)
+
+    def to_entities(self, models: Iterable[M]) -> list[E]:
+        to_entity = self._to_entity
+        return [to_entity(model) for model in models]
 
     def to_dict(self, entity: E) -> dict[str, Any]:
-        result = {}
-        for field in dataclasses.fields(entity):
-            if field.name in self.__exclude_fields__:
-                continue
-            value = getattr(entity, field.name)
-            if field.name == "id" and value is None:
-                continue
-            if isinstance(value, Enum):
-                value = value.value
-            result[field.name] = value
-        return result
+        return self._to_dict(entity)
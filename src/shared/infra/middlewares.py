@@ -11,6 +11,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.shared.domain.exceptions import ApplicationError, BaseError, DomainError
+from src.shared.infra.database import read_only_session_scope, statement_timeout_scope
 
 logger = structlog.get_logger(__name__)
 
@@ -20,6 +21,10 @@ ERROR_CODE_TO_STATUS = {
     "REQUEST_VALIDATION_ERROR": 422,
 }
 
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+READ_PRIMARY_COOKIE = "db_read_primary"
+READ_PRIMARY_HEADER = "x-read-primary"
+
 LAYER_TO_STATUS = {
     DomainError: 400,
     ApplicationError: 400,
@@ -153,3 +158,56 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             structlog.contextvars.unbind_contextvars(
                 "request_id", "trace_id", "span_id"
             )
+
+
+class ReadOnlySessionMiddleware(BaseHTTPMiddleware):
+    """
+    Serves GET/HEAD requests (query handlers) with a read-only DB session,
+    routed to a replica when one is configured.
+
+    Read-your-writes: a successful write sets a short-lived cookie that pins
+    the client's following reads to the primary. Clients can also send the
+    X-Read-Primary header to pin a single request.
+    """
+
+    def __init__(self, app, pin_primary_seconds: int = 5):
+        super().__init__(app)
+        self.pin_primary_seconds = pin_primary_seconds
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method not in READ_ONLY_METHODS:
+            response = await call_next(request)
+            if self.pin_primary_seconds > 0 and response.status_code < 400:
+                response.set_cookie(
+                    READ_PRIMARY_COOKIE,
+                    "1",
+                    max_age=self.pin_primary_seconds,
+                    httponly=True,
+                    samesite="lax",
+                )
+            return response
+
+        use_primary = READ_PRIMARY_COOKIE in request.cookies or request.headers.get(
+            READ_PRIMARY_HEADER, ""
+        ).lower() in ("1", "true")
+        with read_only_session_scope(use_primary=use_primary):
+            return await call_next(request)
+
+
+class StatementTimeoutMiddleware(BaseHTTPMiddleware):
+    """
+    Applies the statement timeout of the API surface (admin, POS, reports)
+    matching the request path; the longest matching prefix wins.
+    """
+
+    def __init__(self, app, timeouts: dict[str, int]):
+        super().__init__(app)
+        self.timeouts = sorted(timeouts.items(), key=lambda item: -len(item[0]))
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        timeout_ms = next(
+            (ms for prefix, ms in self.timeouts if path.startswith(prefix)), None
+        )
+        with statement_timeout_scope(timeout_ms):
+            return await call_next(request)
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.shared.infra.database import Base
+
+
+class DocumentSequenceModel(Base):
+    __tablename__ = "document_sequences"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class OutboxMessageModel(Base):
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # The relay only ever scans messages that are still pending
+        Index(
+            "ix_outbox_pending",
+            "id",
+            postgresql_where=text("published_at IS NULL AND dead_lettered_at IS NULL"),
+            sqlite_where=text("published_at IS NULL AND dead_lettered_at IS NULL"),
+        ),
+        # Retention purge of published messages
+        Index("ix_outbox_published_at", "published_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    topic: Mapped[str] = mapped_column(String(128), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    aggregate_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    trace_context: Mapped[dict | None] = mapped_column(JSON)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now
+    )
+    published_at: Mapped[datetime | None] = mapped_column(DateTime)
+    # Set once attempts reaches the relay's limit; the relay skips the message
+    dead_lettered_at: Mapped[datetime | None] = mapped_column(DateTime)
@@ -0,0 +1,4 @@
+from src.shared.infra.outbox.relay import OutboxRelay, register_enricher
+from src.shared.infra.outbox.writer import enqueue_message
+
+__all__ = ["OutboxRelay", "enqueue_message", "register_enricher"]
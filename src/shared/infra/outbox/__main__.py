@@ -0,0 +1,49 @@
+"""Runs the outbox relay as a standalone process: python -m src.shared.infra.outbox"""
+
+import asyncio
+import signal
+from datetime import timedelta
+
+import structlog
+
+import src
+from config import config
+from src.container import create_wireup_container
+from src.shared.infra.kafka.event_handlers import _get_producer
+from src.shared.infra.logging import configure_logging
+from src.shared.infra.outbox.relay import OutboxRelay
+
+logger = structlog.get_logger(__name__)
+
+
+async def main() -> None:
+    src.wireup_container = create_wireup_container()
+    producer = _get_producer()
+    if producer is None:
+        logger.warning("outbox_relay_kafka_disabled")
+        return
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    relay = OutboxRelay(
+        producer,
+        batch_size=config.OUTBOX_BATCH_SIZE,
+        poll_interval=config.OUTBOX_POLL_INTERVAL,
+        max_attempts=config.OUTBOX_MAX_ATTEMPTS,
+        retention=timedelta(hours=config.OUTBOX_RETENTION_HOURS),
+    )
+    try:
+        await relay.run(stop)
+    finally:
+        producer.close()
+
+
+if __name__ == "__main__":
+    configure_logging(
+        log_level=config.LOG_LEVEL,
+        json_output=config.ENVIRONMENT != "local",
+    )
+    asyncio.run(main())
@@ -0,0 +1,251 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import datetime, timedelta
+from typing import Any
+
+import structlog
+from opentelemetry import trace
+from sqlalchemy import delete, select, text
+from sqlalchemy.orm import Session
+
+from src.shared.infra.events.scope import create_sync_scope
+from src.shared.infra.kafka.breaker import CircuitState
+from src.shared.infra.kafka.producer import KafkaEventProducer, OutgoingMessage
+from src.shared.infra.models import OutboxMessageModel
+
+logger = structlog.get_logger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Arbitrary key for pg_try_advisory_xact_lock: a single relay drains at a time
+RELAY_LOCK_KEY = 0x0B7B0C5
+PURGE_INTERVAL_SECONDS = 300.0
+# Published messages deleted per transaction by the retention purge
+PURGE_CHUNK_SIZE = 5000
+
+Enricher = Callable[[list[dict[str, Any]], Session], list[dict[str, Any]]]
+
+_enrichers: dict[str, Enricher] = {}
+
+
+def register_enricher(event_type: str, enricher: Enricher) -> None:
+    """
+    Registers a function that turns the stored events of one type in a relay
+    batch into the messages sent to Kafka, one per event and in order. It
+    runs in the relay, so its reads stay off the request path, and it sees
+    the whole batch, so it can load related rows with one query.
+    """
+    _enrichers[event_type] = enricher
+
+
+class OutboxRelay:
+    """
+    Drains the outbox into Kafka with at-least-once delivery.
+
+    A batch is sent in waves keyed by aggregate: each wave carries the next
+    message of every aggregate, so events of one aggregate keep their order
+    and share producer batches with the other aggregates. When a send fails,
+    the later messages of its aggregate are not sent; they stay pending and
+    go after it on a later poll (consumers deduplicate by event_id).
+
+    A message that keeps failing while the broker is up is dead-lettered
+    after max_attempts sends and no longer holds back its aggregate.
+    Published messages are deleted once older than retention.
+    """
+
+    def __init__(
+        self,
+        producer: KafkaEventProducer,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        retention: timedelta = timedelta(hours=72),
+    ):
+        self.producer = producer
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retention = retention
+
+    def drain_once(self) -> int:
+        """
+        Publishes one batch of pending messages.
+        Returns:
+            Number of messages published
+        """
+        with create_sync_scope() as scope:
+            session = scope.get(Session)
+            if not self._acquire_lock(session):
+                return 0
+
+            messages = (
+                session.execute(
+                    select(OutboxMessageModel)
+                    .where(
+                        OutboxMessageModel.published_at.is_(None),
+                        OutboxMessageModel.dead_lettered_at.is_(None),
+                    )
+                    .order_by(OutboxMessageModel.id)
+                    .limit(self.batch_size)
+                )
+                .scalars()
+                .all()
+            )
+
+            with tracer.start_as_current_span(
+                "outbox.relay", attributes={"outbox.batch_size": len(messages)}
+            ):
+                values = self._enrich(messages, session)
+                published = self._send_in_waves(messages, values)
+
+            if messages:
+                logger.info(
+                    "outbox_batch_relayed",
+                    pending=len(messages),
+                    published=published,
+                )
+            return published
+
+    def purge_once(self) -> int:
+        """
+        Deletes the messages published longer than retention ago, in chunks
+        so no single transaction grows with the backlog.
+        Returns:
+            Number of messages deleted
+        """
+        cutoff = datetime.now() - self.retention
+        deleted = 0
+        while True:
+            with create_sync_scope() as scope:
+                session = scope.get(Session)
+                ids = (
+                    select(OutboxMessageModel.id)
+                    .where(OutboxMessageModel.published_at < cutoff)
+                    .limit(PURGE_CHUNK_SIZE)
+                    .scalar_subquery()
+                )
+                count = session.execute(
+                    delete(OutboxMessageModel).where(OutboxMessageModel.id.in_(ids))
+                ).rowcount
+            deleted += count
+            if count < PURGE_CHUNK_SIZE:
+                break
+        if deleted:
+            logger.info("outbox_purged", deleted=deleted)
+        return deleted
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Drains the outbox until stop is set, polling when it is empty."""
+        logger.info("outbox_relay_started", batch_size=self.batch_size)
+        last_purge = float("-inf")
+        while not stop.is_set():
+            try:
+                if time.monotonic() - last_purge >= PURGE_INTERVAL_SECONDS:
+                    await asyncio.to_thread(self.purge_once)
+                    last_purge = time.monotonic()
+                published = await asyncio.to_thread(self.drain_once)
+            except Exception:
+                logger.error("outbox_relay_error", exc_info=True)
+                published = 0
+            if published < self.batch_size:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+        logger.info("outbox_relay_stopped")
+
+    def _send_in_waves(
+        self, messages: list[OutboxMessageModel], values: list[dict]
+    ) -> int:
+        queues: dict[tuple[str, int], deque] = {}
+        for message, value in zip(messages, values, strict=True):
+            aggregate = (message.topic, message.aggregate_id)
+            queues.setdefault(aggregate, deque()).append((message, value))
+
+        published = 0
+        now = datetime.now()
+        while queues:
+            wave = [queue.popleft() for queue in queues.values()]
+            # Failures while the circuit is open are the broker's, not the message's
+            broker_up = self.producer.circuit_state == CircuitState.CLOSED
+            results = self.producer.send_many(
+                [self._outgoing(message, value) for message, value in wave]
+            )
+            for (message, _), delivered in zip(wave, results, strict=True):
+                if delivered:
+                    message.published_at = now
+                    published += 1
+                    continue
+                # Later messages of the aggregate are held back until it goes
+                del queues[(message.topic, message.aggregate_id)]
+                if broker_up:
+                    self._record_failure(message, now)
+            queues = {aggregate: queue for aggregate, queue in queues.items() if queue}
+        return published
+
+    def _record_failure(self, message: OutboxMessageModel, now: datetime) -> None:
+        message.attempts += 1
+        if message.attempts < self.max_attempts:
+            return
+        message.dead_lettered_at = now
+        logger.error(
+            "outbox_message_dead_lettered",
+            outbox_id=message.id,
+            topic=message.topic,
+            event_type=message.event_type,
+            aggregate_id=message.aggregate_id,
+            attempts=message.attempts,
+        )
+
+    @staticmethod
+    def _outgoing(message: OutboxMessageModel, value: dict) -> OutgoingMessage:
+        # Headers carry the trace context of the request that stored the event
+        headers = [
+            (name, value.encode("utf-8"))
+            for name, value in (message.trace_context or {}).items()
+        ]
+        return OutgoingMessage(
+            topic=message.topic,
+            value=value,
+            event_type=message.event_type,
+            key=str(message.aggregate_id),
+            headers=headers,
+        )
+
+    def _enrich(
+        self, messages: list[OutboxMessageModel], session: Session
+    ) -> list[dict]:
+        values = [message.payload for message in messages]
+        by_type: dict[str, list[int]] = {}
+        for index, message in enumerate(messages):
+            if message.event_type in _enrichers:
+                by_type.setdefault(message.event_type, []).append(index)
+
+        for event_type, indexes in by_type.items():
+            try:
+                enriched = _enrichers[event_type](
+                    [values[index] for index in indexes], session
+                )
+            except Exception:
+                # The stored events are sent as they are
+                logger.error(
+                    "outbox_enrichment_error",
+                    event_type=event_type,
+                    outbox_ids=[messages[index].id for index in indexes],
+                    exc_info=True,
+                )
+                continue
+            for index, value in zip(indexes, enriched, strict=True):
+                values[index] = value
+        return values
+
+    @staticmethod
+    def _acquire_lock(session: Session) -> bool:
+        if session.get_bind().dialect.name != "postgresql":
+            return True
+        return bool(
+            session.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": RELAY_LOCK_KEY},
+            ).scalar()
+        )
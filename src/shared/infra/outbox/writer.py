@@ -0,0 +1,37 @@
+import json
+from typing import Any
+
+from opentelemetry.propagate import inject
+from sqlalchemy.orm import Session
+
+from src.shared.domain.events import DomainEvent
+from src.shared.infra.kafka.producer import _json_serializer
+from src.shared.infra.models import OutboxMessageModel
+
+
+def _to_json(data: dict[str, Any]) -> dict[str, Any]:
+    # Decimals and datetimes are stored the same way the producer serializes them
+    return json.loads(json.dumps(data, default=_json_serializer))
+
+
+def enqueue_message(session: Session, topic: str, event: DomainEvent) -> None:
+    """
+    Stores an event in the outbox, in the caller's transaction. The row is
+    inserted with the rest of the unit of work and picked up by OutboxRelay
+    once committed.
+    Args:
+        session: Session of the transaction that produced the event
+        topic: Kafka topic the event is published to
+        event: Event to publish
+    """
+    trace_context: dict[str, str] = {}
+    inject(trace_context)
+    session.add(
+        OutboxMessageModel(
+            topic=topic,
+            event_type=type(event).__name__,
+            aggregate_id=event.aggregate_id,
+            payload=_to_json(event.to_dict()),
+            trace_context=trace_context or None,
+        )
+    )
@@ -0,0 +1,263 @@
+"""
+Caches report results keyed on the query handler and the query's fields.
+
+Every entry records the generation of each kind of data it was computed
+from. Event handlers bump a generation once the writing transaction
+commits, which makes the entries built on that data stale and leaves the
+others alone. Generations are read before the report is computed, so a
+result computed while a write commits is stored already stale.
+
+Reports are computed on read replicas, which may not have the commit yet
+when the invalidation runs. Results computed within replica_lag seconds of
+an invalidation of their data are returned but not stored, so a lagging
+replica's result is not served from the cache afterwards; replicas lagging
+further than that still serve stale results until the TTL.
+
+Entries live in a bounded in-process LRU with a TTL and, when a shared
+backend is configured, also there; generations then live in the shared
+backend too, so an invalidation in one process reaches all of them.
+"""
+
+import dataclasses
+import hashlib
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, TypeVar
+
+from src.shared.app.queries import Query, QueryHandler
+from src.shared.infra.cache import LRUCache
+from src.shared.infra.telemetry_instruments import (
+    report_cache_hit_age,
+    report_cache_hits,
+    report_cache_misses,
+    report_cache_stale,
+)
+
+TQuery = TypeVar("TQuery", bound=Query)
+TResult = TypeVar("TResult")
+
+
+class ReportData(StrEnum):
+    """Data a cached report is computed from; each has its own generation."""
+
+    STOCK = "stock"
+    MOVEMENTS = "movements"
+    PRICES = "prices"
+    PRODUCTS = "products"
+    LOTS = "lots"
+    LOCATIONS = "locations"
+
+
+class ReportCacheBackend(ABC):
+    """Store shared between processes, holding pickled results and generations."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def generations(self, names: list[str]) -> list[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bump(self, names: list[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bumped_at(self, names: list[str]) -> float:
+        """Time of the latest bump of any of names, 0 if never bumped."""
+        raise NotImplementedError
+
+
+class InMemoryReportCacheBackend(ReportCacheBackend):
+    """Local stand-in for a shared store such as Redis."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self._values: LRUCache[str, bytes] = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._generations: dict[str, int] = defaultdict(int)
+        self._bumped_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        return self._values.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self._values.set(key, value)
+
+    def generations(self, names: list[str]) -> list[int]:
+        with self._lock:
+            return [self._generations[name] for name in names]
+
+    def bump(self, names: list[str]) -> None:
+        now = time.time()
+        with self._lock:
+            for name in names:
+                self._generations[name] += 1
+                self._bumped_at[name] = now
+
+    def bumped_at(self, names: list[str]) -> float:
+        with self._lock:
+            return max((self._bumped_at.get(name, 0.0) for name in names), default=0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    value: Any
+    generations: tuple[int, ...]
+    stored_at: float
+
+
+class ReportCache:
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float | None = 60.0,
+        shared: ReportCacheBackend | None = None,
+        enabled: bool = True,
+        replica_lag: float = 0.0,
+    ):
+        self._generations: dict[ReportData, int] = defaultdict(int)
+        self._invalidated_at: dict[ReportData, float] = {}
+        self._lock = threading.Lock()
+        self.configure(maxsize, ttl, shared, enabled, replica_lag)
+
+    def configure(
+        self,
+        maxsize: int,
+        ttl: float | None,
+        shared: ReportCacheBackend | None,
+        enabled: bool,
+        replica_lag: float = 0.0,
+    ) -> None:
+        """Replaces the settings in place, dropping the cached entries."""
+        self.enabled = enabled
+        self.shared = shared
+        self.replica_lag = replica_lag
+        self._local: LRUCache[tuple, _Entry] = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def fetch(
+        self,
+        handler: QueryHandler[TQuery, TResult],
+        query: TQuery,
+        depends_on: Iterable[ReportData],
+    ) -> TResult:
+        """
+        Returns the cached result of handler for query, computing and storing
+        it when missing or stale.
+        Args:
+            handler: Query handler that computes the report
+            query: Query whose fields, with the handler name, make the key
+            depends_on: Data whose changes invalidate the result
+        """
+        if not self.enabled:
+            return handler.handle(query)
+
+        report = type(handler).__name__
+        attributes = {"report": report}
+        data = sorted(set(depends_on))
+        key = (report, *sorted(dataclasses.asdict(query).items()))
+        generations = self._current_generations(data)
+
+        entry = self._local.get(key)
+        if entry is not None:
+            if entry.generations == generations:
+                return self._hit(entry, attributes, "local")
+            report_cache_stale.add(1, attributes)
+
+        shared_key = None
+        if self.shared is not None:
+            shared_key = _shared_key(key, generations)
+            blob = self.shared.get(shared_key)
+            if blob is not None:
+                stored_at, value = pickle.loads(blob)
+                entry = _Entry(value, generations, stored_at)
+                self._local.set(key, entry)
+                return self._hit(entry, attributes, "shared")
+
+        report_cache_misses.add(1, attributes)
+        started_at = time.time()
+        value = handler.handle(query)
+        if started_at - self._invalidated_since(data) < self.replica_lag:
+            # Read from a replica that may not have the invalidating commit yet
+            return value
+        stored_at = time.time()
+        self._local.set(key, _Entry(value, generations, stored_at))
+        if shared_key is not None:
+            self.shared.set(shared_key, pickle.dumps((stored_at, value)))
+        return value
+
+    def invalidate(self, *data: ReportData) -> None:
+        """Makes every entry computed from any of data stale."""
+        if self.shared is not None:
+            self.shared.bump([str(d) for d in data])
+            return
+        now = time.time()
+        with self._lock:
+            for d in data:
+                self._generations[d] += 1
+                self._invalidated_at[d] = now
+
+    def clear(self) -> None:
+        self._local.clear()
+
+    def _current_generations(self, data: list[ReportData]) -> tuple[int, ...]:
+        if self.shared is not None:
+            return tuple(self.shared.generations([str(d) for d in data]))
+        with self._lock:
+            return tuple(self._generations[d] for d in data)
+
+    def _invalidated_since(self, data: list[ReportData]) -> float:
+        if not self.replica_lag:
+            return 0.0
+        if self.shared is not None:
+            return self.shared.bumped_at([str(d) for d in data])
+        with self._lock:
+            return max((self._invalidated_at.get(d, 0.0) for d in data), default=0.0)
+
+    @staticmethod
+    def _hit(entry: _Entry, attributes: dict, source: str) -> Any:
+        report_cache_hits.add(1, {**attributes, "source": source})
+        report_cache_hit_age.record(time.time() - entry.stored_at, attributes)
+        return entry.value
+
+
+def _shared_key(key: tuple, generations: tuple[int, ...]) -> str:
+    digest = hashlib.sha1(repr((key, generations)).encode()).hexdigest()
+    return f"report:{key[0]}:{digest}"
+
+
+# Disabled until configure_report_cache() runs at startup (API process)
+report_cache = ReportCache(enabled=False)
+
+
+def configure_report_cache(
+    enabled: bool,
+    maxsize: int,
+    ttl: float,
+    shared_backend: str = "",
+    replica_lag: float = 0.0,
+) -> None:
+    """
+    Sets up the process-wide report cache.
+    Args:
+        shared_backend: "" keeps entries in-process only, "memory" adds the
+            local stand-in for a shared store
+        replica_lag: Seconds after an invalidation during which results are
+            not stored (0 when reports read the primary)
+    """
+    shared = None
+    if shared_backend == "memory":
+        shared = InMemoryReportCacheBackend(maxsize=maxsize * 4, ttl=ttl)
+    elif shared_backend:
+        raise ValueError(f"Unknown report cache backend: {shared_backend}")
+    report_cache.configure(maxsize, ttl, shared, enabled, replica_lag)
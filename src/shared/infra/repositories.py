@@ -1,14 +1,19 @@
+from dataclasses import replace
 from typing import Any, ClassVar, Generic, TypeVar
 
-from sqlalchemy import asc, desc, func
+from sqlalchemy import asc, desc, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 
+from src.shared.app.pagination import TotalMode, decode_cursor, encode_cursor
 from src.shared.app.repositories import Repository
 from src.shared.domain.entities import Entity
 from src.shared.domain.exceptions import NotFoundError
 from src.shared.domain.specifications import Specification
+from src.shared.infra.counting import count_rows
 from src.shared.infra.mappers import Mapper
+from src.shared.infra.unit_of_work import current_unit_of_work
 
 from .database import Base
 
@@ -26,7 +31,16 @@ class SqlAlchemyRepository(Repository[E], Generic[E]):
         self.session = session
         self.mapper = mapper
 
-    def _save(self) -> None:
+    def _save(self, need_ids: bool = False) -> None:
+        """
+        Flushes the session, or leaves the flush to the active unit of work
+        unless new rows need their database-generated ids right away.
+        """
+        uow = current_unit_of_work()
+        if uow is not None:
+            uow.register(self.session)
+            if not need_ids:
+                return
         self.session.flush()
 
     def create(self, entity: E) -> E:
@@ -39,7 +53,7 @@ class SqlAlchemyRepository(Repository[E], Generic[E]):
         """
         model = self.__model__(**self.mapper.to_dict(entity))
         self.session.add(model)
-        self._save()
+        self._save(need_ids=True)
         return self.mapper.to_entity(model)
 
     def update(self, entity: E) -> E:
@@ -58,9 +72,114 @@ class SqlAlchemyRepository(Repository[E], Generic[E]):
 
         for key, value in self.mapper.to_dict(entity).items():
             setattr(model, key, value)
-        self._save()
+        # Columns set on UPDATE (updated_at) only get their value on flush
+        needs_flush = self._has_onupdate_columns() and self.session.is_modified(model)
+        self._save(need_ids=needs_flush)
         return self.mapper.to_entity(model)
 
+    @classmethod
+    def _has_onupdate_columns(cls) -> bool:
+        if "_onupdate_columns" not in cls.__dict__:
+            cls._onupdate_columns = any(
+                column.onupdate is not None or column.server_onupdate is not None
+                for column in cls.__model__.__table__.columns
+            )
+        return cls._onupdate_columns
+
+    def create_many(self, entities: list[E]) -> list[E]:
+        """
+        Creates several entities with a single multi-row INSERT ... RETURNING.
+        Args:
+            entities: Entities to create
+        Returns:
+            Created entities, in the same order as given
+        """
+        if not entities:
+            return []
+
+        rows = [self.mapper.to_dict(entity) for entity in entities]
+        stmt = insert(self.__model__).returning(
+            self.__model__, sort_by_parameter_order=True
+        )
+        models = self.session.scalars(stmt, rows).all()
+        return self.mapper.to_entities(models)
+
+    def update_many(self, entities: list[E]) -> list[E]:
+        """
+        Updates several entities with one executemany UPDATE by primary key.
+        Args:
+            entities: Entities to update
+        Returns:
+            Updated entities, in the same order as given
+        Raises:
+            NotFoundError: If any entity ID does not exist
+        """
+        if not entities:
+            return []
+
+        ids = [entity.id for entity in entities]
+        models = self._get_many(ids)
+        missing = [id for id in ids if id not in models]
+        if missing:
+            raise NotFoundError(f"Entities with ids {missing} not found")
+
+        rows = [self.mapper.to_dict(entity) for entity in entities]
+        self.session.execute(update(self.__model__), rows)
+        models = self._get_many(ids)
+        return self.mapper.to_entities(models[id] for id in ids)
+
+    def upsert_many(self, entities: list[E], conflict_fields: list[str]) -> list[E]:
+        """
+        Inserts several entities, updating the existing rows that collide on
+        conflict_fields, with a single INSERT ... ON CONFLICT ... RETURNING.
+        Args:
+            entities: Entities to insert or update
+            conflict_fields: Columns of the unique constraint to match on
+        Returns:
+            Resulting entities, in the same order as given
+        """
+        if not entities:
+            return []
+
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(self.__model__)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(self.__model__)
+        else:
+            return [self._upsert(entity, conflict_fields) for entity in entities]
+
+        rows = [self.mapper.to_dict(entity) for entity in entities]
+        update_fields = {key for row in rows for key in row} - {
+            "id",
+            *conflict_fields,
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_fields,
+            set_={field: stmt.excluded[field] for field in update_fields},
+        )
+        stmt = stmt.returning(
+            self.__model__, sort_by_parameter_order=True
+        ).execution_options(populate_existing=True)
+        models = self.session.scalars(stmt, rows).all()
+        return self.mapper.to_entities(models)
+
+    def _upsert(self, entity: E, conflict_fields: list[str]) -> E:
+        existing = self.first(
+            **{field: getattr(entity, field) for field in conflict_fields}
+        )
+        if existing is None:
+            return self.create(entity)
+        return self.update(replace(entity, id=existing.id))
+
+    def _get_many(self, ids: list[int]) -> dict[int, M]:
+        stmt = (
+            select(self.__model__)
+            .where(self.__model__.id.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+        return {model.id: model for model in self.session.scalars(stmt)}
+
     def delete(self, id: int) -> None:
         """
         Deletes an entity.
@@ -87,6 +206,18 @@ class SqlAlchemyRepository(Repository[E], Generic[E]):
         model = self.session.query(self.__model__).get(id)
         return self.mapper.to_entity(model)
 
+    def get_many(self, ids: list[int]) -> list[E]:
+        """
+        Retrieves the entities with the given IDs in a single query.
+        Args:
+            ids: IDs of the entities to retrieve
+        Returns:
+            Entities found, in no particular order; unknown IDs are skipped
+        """
+        if not ids:
+            return []
+        return self.mapper.to_entities(self._get_many(list(set(ids))).values())
+
     def get_all(self) -> list[E]:
         """
         Retrieves all entities.
@@ -94,7 +225,7 @@ class SqlAlchemyRepository(Repository[E], Generic[E]):
             List of all entities
         """
         models = self.session.query(self.__model__).all()
-        return [self.mapper.to_entity(model) for model in models]
+        return self.mapper.to_entities(models)
 
     def first(self, **kwargs) -> E | None:
         """
@@ -149,7 +280,7 @@ class SqlAlchemyRepository(Repository[E], Generic[E]):
             query = query.offset(offset)
 
         models = query.all()
-        return [self.mapper.to_entity(model) for model in models]
+        return self.mapper.to_entities(models)
 
     def count_by(self, **kwargs) -> int:
         """
@@ -202,22 +333,87 @@ class SqlAlchemyRepository(Repository[E], Generic[E]):
             self.session.query(func.count(self.__model__.id)).filter(*criteria).scalar()
         )
 
-    def paginate(self, limit=None, offset=None, **kwargs) -> dict:
-        items = self.filter_by(limit=limit, offset=offset, **kwargs)
-        total = self.count_by(**kwargs)
-        return {
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "items": [item.dict() for item in items],
-        }
+    def paginate(
+        self,
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        **kwargs,
+    ) -> dict:
+        criteria = [
+            getattr(self.__model__, key) == value for key, value in kwargs.items()
+        ]
+        return self._paginate(criteria, limit, offset, cursor, include_total)
+
+    def paginate_by_spec(
+        self,
+        spec,
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+    ) -> dict:
+        criteria = spec.to_query_criteria()
+        return self._paginate(criteria, limit, offset, cursor, include_total)
+
+    def _paginate(
+        self,
+        criteria: Criteria,
+        limit: int | None,
+        offset: int | None,
+        cursor: str | None,
+        include_total: TotalMode,
+    ) -> dict:
+        """
+        Fetches a page ordered by id, either by offset or by keyset cursor.
+        In cursor mode the page starts right after the id encoded in the
+        cursor and no total is computed, so total and offset are None.
+        Args:
+            criteria: List of conditions to filter by
+            limit: Maximum number of results to return
+            offset: Number of results to skip (ignored when cursor is given)
+            cursor: Cursor returned as next_cursor by the previous page
+            include_total: How to compute the total (ignored when cursor is given)
+        Returns:
+            Dict with total, total_mode, limit, offset, next_cursor and items
+        """
+        query = (
+            self.session.query(self.__model__)
+            .filter(*criteria)
+            .order_by(self.__model__.id)
+        )
+
+        if cursor is None:
+            total = count_rows(
+                self.session,
+                select(self.__model__.id).where(*criteria),
+                include_total,
+            )
+            if offset:
+                query = query.offset(offset)
+        else:
+            (last_id,) = decode_cursor(cursor, size=1)
+            query = query.filter(self.__model__.id > last_id)
+            include_total = TotalMode.NONE
+            total = None
+            offset = None
+
+        # Fetch one extra row to know whether there is a next page
+        if limit is not None:
+            query = query.limit(limit + 1)
+        models = query.all()
+
+        next_cursor = None
+        if limit is not None and len(models) > limit:
+            models = models[:limit]
+            next_cursor = encode_cursor(models[-1].id)
 
-    def paginate_by_spec(self, spec, limit=None, offset=None) -> dict:
-        items = self.filter_by_spec(spec, limit=limit, offset=offset)
-        total = self.count_by_spec(spec)
         return {
             "total": total,
+            "total_mode": include_total,
             "limit": limit,
             "offset": offset,
-            "items": [item.dict() for item in items],
+            "next_cursor": next_cursor,
+            "items": [entity.dict() for entity in self.mapper.to_entities(models)],
         }
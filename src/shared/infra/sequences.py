@@ -0,0 +1,50 @@
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from wireup import injectable
+
+from src.shared.app.sequences import DocumentSequence
+from src.shared.infra.models import DocumentSequenceModel
+
+
+@injectable(lifetime="scoped", as_type=DocumentSequence)
+class SqlAlchemyDocumentSequence(DocumentSequence):
+    """
+    Counter-table sequence: one row per (name, year), bumped with a single
+    UPDATE ... RETURNING. The row lock is held until the caller's transaction
+    ends, so concurrent allocations queue instead of reading the same value.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def next_value(self, name: str, year: int) -> int:
+        value = self._increment(name, year)
+        if value is not None:
+            return value
+
+        try:
+            with self.session.begin_nested():
+                self.session.add(
+                    DocumentSequenceModel(name=name, year=year, last_value=1)
+                )
+            return 1
+        except IntegrityError:
+            # A concurrent transaction opened the year first
+            value = self._increment(name, year)
+            if value is None:
+                raise
+            return value
+
+    def _increment(self, name: str, year: int) -> int | None:
+        stmt = (
+            update(DocumentSequenceModel)
+            .where(
+                DocumentSequenceModel.name == name,
+                DocumentSequenceModel.year == year,
+            )
+            .values(last_value=DocumentSequenceModel.last_value + 1)
+            .returning(DocumentSequenceModel.last_value)
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
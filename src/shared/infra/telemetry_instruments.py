@@ -1,4 +1,7 @@
+import weakref
+
 from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
 
 _meter = metrics.get_meter("faclab-core", "1.0.0")
 
@@ -23,6 +26,12 @@ events_published = _meter.create_counter(
     description="Number of domain events published",
 )
 
+event_handler_duration = _meter.create_histogram(
+    "events.handler.duration",
+    unit="ms",
+    description="Duration of each domain event handler call in milliseconds",
+)
+
 event_handler_errors = _meter.create_counter(
     "events.handler_errors",
     description="Number of event handler errors",
@@ -37,3 +46,77 @@ kafka_send_errors = _meter.create_counter(
     "kafka.send_errors",
     description="Number of Kafka send failures",
 )
+
+kafka_messages_dropped = _meter.create_counter(
+    "kafka.messages_dropped",
+    description="Number of Kafka messages dropped (full queue or open circuit)",
+)
+
+kafka_queue_depth = _meter.create_up_down_counter(
+    "kafka.queue_depth",
+    description="Number of messages waiting in the Kafka producer queue",
+)
+
+kafka_enrichment_duration = _meter.create_histogram(
+    "kafka.enrichment.duration",
+    unit="ms",
+    description="Time spent enriching a batch of outbox messages for Kafka",
+)
+
+db_pool_checkout_wait = _meter.create_histogram(
+    "db.pool.checkout_wait",
+    unit="ms",
+    description="Time spent waiting for a pooled database connection",
+)
+
+db_pool_connections_in_use = _meter.create_up_down_counter(
+    "db.pool.connections_in_use",
+    description="Number of database connections checked out of the pool",
+)
+
+db_pool_timeouts = _meter.create_counter(
+    "db.pool.timeouts",
+    description="Number of connection checkouts that timed out waiting for the pool",
+)
+
+report_cache_hits = _meter.create_counter(
+    "report_cache.hits",
+    description="Report results served from the cache",
+)
+
+report_cache_misses = _meter.create_counter(
+    "report_cache.misses",
+    description="Report results computed because they were not cached",
+)
+
+report_cache_stale = _meter.create_counter(
+    "report_cache.stale",
+    description="Cached report results found invalidated by a data change",
+)
+
+report_cache_hit_age = _meter.create_histogram(
+    "report_cache.hit_age",
+    unit="s",
+    description="Age of the cached report results served",
+)
+
+_observed_engines: weakref.WeakSet = weakref.WeakSet()
+
+
+def _observe_pool_overflow(options: CallbackOptions):
+    for engine in list(_observed_engines):
+        pool = engine.pool
+        if hasattr(pool, "overflow"):
+            yield Observation(max(pool.overflow(), 0), {"db.pool": pool.role})
+
+
+db_pool_overflow = _meter.create_observable_gauge(
+    "db.pool.overflow",
+    callbacks=[_observe_pool_overflow],
+    description="Number of connections open beyond the configured pool size",
+)
+
+
+def observe_pool_overflow(engine) -> None:
+    """Reports the overflow of the engine's pool through db.pool.overflow."""
+    _observed_engines.add(engine)
@@ -0,0 +1,65 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy.orm import Session
+
+_current: ContextVar["UnitOfWork | None"] = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWork:
+    """
+    Defers the flushes of the repositories used while handling a command.
+
+    Repositories register their session instead of flushing after every
+    update or delete, so repeated writes to the same rows reach the database
+    once. A registered session autoflushes, which keeps queries and bulk
+    statements issued later in the command consistent with the pending
+    changes; whatever is still pending is flushed before events are
+    published and when the command ends.
+    """
+
+    def __init__(self):
+        self._sessions: list[tuple[Session, bool]] = []
+
+    def register(self, session: Session) -> None:
+        if any(registered is session for registered, _ in self._sessions):
+            return
+        self._sessions.append((session, session.autoflush))
+        session.autoflush = True
+
+    def flush(self) -> None:
+        """Flushes the pending changes of every registered session."""
+        for session, _ in self._sessions:
+            session.flush()
+
+    def _release(self) -> None:
+        for session, autoflush in self._sessions:
+            session.autoflush = autoflush
+        self._sessions.clear()
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    return _current.get()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """
+    Opens a unit of work for the block, flushed when the block succeeds.
+    Nested blocks (a command dispatched while handling another one, or from
+    one of its event handlers) join the outer unit of work.
+    """
+    current = _current.get()
+    if current is not None:
+        yield current
+        return
+
+    uow = UnitOfWork()
+    token = _current.set(uow)
+    try:
+        yield uow
+        uow.flush()
+    finally:
+        _current.reset(token)
+        uow._release()
@@ -4,6 +4,8 @@ from typing import Annotated, Generic, TypeVar
 from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
 from pydantic.alias_generators import to_camel
 
+from src.shared.app.pagination import TotalMode
+
 DecimalNumber = Annotated[
     Decimal,
     PlainSerializer(lambda v: float(v), return_type=float),
@@ -23,6 +25,18 @@ class QueryParams(BaseModel):
     offset: int | None = Field(
         0, ge=0, description="Number of records to skip for pagination"
     )
+    cursor: str | None = Field(
+        None,
+        description="Opaque cursor from `meta.nextCursor` of the previous page. "
+        "When given, the page starts after that record, `offset` is ignored and "
+        "the total count is not computed.",
+    )
+    include_total: TotalMode = Field(
+        TotalMode.EXACT,
+        description="How to compute `pagination.total`: `exact` runs a full count, "
+        "`estimated` uses the database planner estimate or a short-lived cached "
+        "count, `none` skips it (use `nextCursor` to detect further pages).",
+    )
 
 
 class Meta(BaseModel):
@@ -32,26 +46,49 @@ class Meta(BaseModel):
     request_id: str = Field(description="Unique identifier for this request (UUID v4)")
     timestamp: str = Field(description="ISO 8601 timestamp of the response")
 
-    def with_pagination(self, total: int, limit: int, offset: int) -> "PaginatedMeta":
+    def with_pagination(
+        self,
+        total: int | None,
+        limit: int,
+        offset: int | None,
+        next_cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> "PaginatedMeta":
         return PaginatedMeta(
             request_id=self.request_id,
             timestamp=self.timestamp,
-            pagination=PaginationMeta(total=total, limit=limit, offset=offset),
+            pagination=PaginationMeta(
+                total=total, total_mode=total_mode, limit=limit, offset=offset
+            ),
+            next_cursor=next_cursor,
         )
 
 
 class PaginationMeta(BaseModel):
     """Pagination details returned in paginated list responses."""
 
-    total: int = Field(description="Total number of records matching the query")
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+    total: int | None = Field(
+        description="Total number of records matching the query "
+        "(null in cursor mode or when includeTotal is none)"
+    )
+    total_mode: TotalMode = Field(
+        TotalMode.EXACT, description="How `total` was computed"
+    )
     limit: int = Field(description="Maximum records per page (as requested)")
-    offset: int = Field(description="Number of records skipped (as requested)")
+    offset: int | None = Field(
+        description="Number of records skipped (as requested, null in cursor mode)"
+    )
 
 
 class PaginatedMeta(Meta):
     """Response metadata with pagination information."""
 
     pagination: PaginationMeta = Field(description="Pagination details")
+    next_cursor: str | None = Field(
+        None,
+        description="Cursor to request the next page with, null on the last page",
+    )
 
 
 class DataResponse(BaseModel, Generic[T]):
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from wireup import injectable
 
+from src.shared.app.pagination import TotalMode
 from src.shared.app.queries import Query, QueryHandler
 from src.shared.domain.exceptions import NotFoundError
 from src.suppliers.app.repositories import SupplierRepository
@@ -12,6 +13,8 @@ class GetAllSuppliersQuery(Query):
     is_active: bool | None = None
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    include_total: TotalMode = TotalMode.EXACT
 
 
 @injectable(lifetime="scoped")
@@ -24,7 +27,11 @@ class GetAllSuppliersQueryHandler(QueryHandler[GetAllSuppliersQuery, dict]):
         if query.is_active is not None:
             filter_kwargs["is_active"] = query.is_active
         return self.repo.paginate(
-            limit=query.limit, offset=query.offset, **filter_kwargs
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            include_total=query.include_total,
+            **filter_kwargs,
         )
 
 
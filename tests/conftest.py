@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+
+def _import_models() -> None:
+    import src.catalog.product.infra.models  # noqa: F401
+    import src.catalog.uom.infra.models  # noqa: F401
+    import src.customers.infra.models  # noqa: F401
+    import src.inventory.adjustment.infra.models  # noqa: F401
+    import src.inventory.location.infra.models  # noqa: F401
+    import src.inventory.lot.infra.models  # noqa: F401
+    import src.inventory.movement.infra.models  # noqa: F401
+    import src.inventory.serial.infra.models  # noqa: F401
+    import src.inventory.stock.infra.models  # noqa: F401
+    import src.inventory.transfer.infra.models  # noqa: F401
+    import src.inventory.warehouse.infra.models  # noqa: F401
+    import src.pos.cash.infra.models  # noqa: F401
+    import src.pos.refund.infra.models  # noqa: F401
+    import src.pos.shift.infra.models  # noqa: F401
+    import src.purchasing.infra.models  # noqa: F401
+    import src.reports.jobs.infra.models  # noqa: F401
+    import src.sales.infra.models  # noqa: F401
+    import src.shared.infra.models  # noqa: F401
+    import src.suppliers.infra.models  # noqa: F401
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with the full schema, for repository tests."""
+    from src.shared.infra.database import Base
+
+    _import_models()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
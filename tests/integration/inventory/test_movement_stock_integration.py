@@ -7,13 +7,17 @@ import pytest
 from src.inventory.movement.app.commands import (
     CreateMovementCommand,
     CreateMovementCommandHandler,
+    CreateMovementsBatchCommandHandler,
 )
 from src.inventory.movement.domain.constants import MovementType
 from src.inventory.movement.domain.entities import Movement
-from src.inventory.movement.domain.events import MovementCreated
+from src.inventory.movement.domain.events import MovementCreated, MovementsCreated
 from src.inventory.stock.domain.entities import Stock
 from src.inventory.stock.domain.events import StockCreated, StockUpdated
-from src.inventory.stock.infra.event_handlers import handle_movement_created
+from src.inventory.stock.infra.event_handlers import (
+    handle_movement_created,
+    handle_movements_created,
+)
 from src.sales.domain.events import SaleCancelled, SaleConfirmed
 from src.shared.infra.events.event_bus import EventBus
 from src.shared.infra.events.event_bus_publisher import EventBusPublisher
@@ -27,6 +31,7 @@ def clear_event_bus():
 
     # Register the stock event handler manually
     EventBus.subscribe(MovementCreated, handle_movement_created)
+    EventBus.subscribe(MovementsCreated, handle_movements_created)
 
     # Reload event handlers module to register SaleConfirmed/SaleCancelled handlers
     # This ensures @event_handler decorators run and register the handlers
@@ -50,11 +55,9 @@ def test_create_movement_triggers_stock_update_via_event(mock_stock_scope):
     mock_movement_repo = Mock()
     mock_stock_repo = Mock()
 
-    # Setup: No existing stock
-    mock_stock_repo.first.return_value = None
-
+    # Setup: No existing stock, the delta inserts a new row
     new_stock = Stock(id=1, product_id=10, quantity=10)
-    mock_stock_repo.create.return_value = new_stock
+    mock_stock_repo.apply_delta.return_value = (new_stock, True)
 
     # Mock the scope context manager
     mock_scope = Mock()
@@ -100,10 +103,7 @@ def test_create_movement_triggers_stock_update_via_event(mock_stock_scope):
     mock_movement_repo.create.assert_called_once()
 
     # 2. Stock was created via event handler
-    mock_stock_repo.create.assert_called_once()
-    created_stock = mock_stock_repo.create.call_args[0][0]
-    assert created_stock.product_id == 10
-    assert created_stock.quantity == 10
+    mock_stock_repo.apply_delta.assert_called_once_with(10, None, 10)
 
     # 3. StockCreated event was published
     assert len(stock_events) == 1
@@ -122,12 +122,9 @@ def test_sale_confirmed_creates_movement_and_updates_stock(
     mock_movement_repo = Mock()
     mock_stock_repo = Mock()
 
-    # Existing stock
-    existing_stock = Stock(id=1, product_id=10, quantity=100)
-    mock_stock_repo.first.return_value = existing_stock
-
+    # Existing stock (100) after applying the delta
     updated_stock = Stock(id=1, product_id=10, quantity=95)
-    mock_stock_repo.update.return_value = updated_stock
+    mock_stock_repo.apply_deltas.return_value = [(updated_stock, False)]
 
     # Movement created by sale confirmation
     created_movement = Movement(
@@ -142,12 +139,17 @@ def test_sale_confirmed_creates_movement_and_updates_stock(
     # Mock command handler that publishes MovementCreated event like the real one
     def mock_handle(command):
         EventBus.publish(
-            MovementCreated(
+            MovementsCreated(
                 aggregate_id=created_movement.id,
-                product_id=created_movement.product_id,
-                quantity=created_movement.quantity,
-                type=created_movement.type.value,
-                reason=created_movement.reason,
+                movements=[
+                    {
+                        "movement_id": created_movement.id,
+                        "product_id": created_movement.product_id,
+                        "quantity": created_movement.quantity,
+                        "type": created_movement.type.value,
+                        "location_id": None,
+                    }
+                ],
             )
         )
         return created_movement.dict()
@@ -157,7 +159,7 @@ def test_sale_confirmed_creates_movement_and_updates_stock(
 
     # Mock the inventory scope (for SaleConfirmed handler)
     def inv_scope_get(type_class):
-        if type_class == CreateMovementCommandHandler:
+        if type_class == CreateMovementsBatchCommandHandler:
             return mock_command_handler
         raise ValueError(f"Unexpected resolve: {type_class}")
 
@@ -193,13 +195,13 @@ def test_sale_confirmed_creates_movement_and_updates_stock(
     # Assert
     # 1. Movement command handler was called
     mock_command_handler.handle.assert_called_once()
-    call_args = mock_command_handler.handle.call_args[0][0]
+    [call_args] = mock_command_handler.handle.call_args[0][0].movements
     assert call_args.product_id == 10
     assert call_args.quantity == -5
     assert call_args.type == MovementType.OUT.value
 
     # 2. Stock was updated
-    mock_stock_repo.update.assert_called_once()
+    mock_stock_repo.apply_deltas.assert_called_once_with({(10, None): -5})
 
     # 3. StockUpdated event was published
     assert len(stock_events) == 1
@@ -218,13 +220,9 @@ def test_sale_cancelled_reverts_stock_via_event(mock_inv_scope, mock_stock_scope
     mock_movement_repo = Mock()
     mock_stock_repo = Mock()
 
-    # Stock after sale was confirmed (reduced by 5)
-    existing_stock = Stock(id=1, product_id=10, quantity=95)
-    mock_stock_repo.first.return_value = existing_stock
-
-    # Stock after reversal
+    # Stock after reversal (was 95 after the sale)
     restored_stock = Stock(id=1, product_id=10, quantity=100)
-    mock_stock_repo.update.return_value = restored_stock
+    mock_stock_repo.apply_deltas.return_value = [(restored_stock, False)]
 
     # Reversal movement
     reversal_movement = Movement(
@@ -238,12 +236,17 @@ def test_sale_cancelled_reverts_stock_via_event(mock_inv_scope, mock_stock_scope
 
     def mock_handle(command):
         EventBus.publish(
-            MovementCreated(
+            MovementsCreated(
                 aggregate_id=reversal_movement.id,
-                product_id=reversal_movement.product_id,
-                quantity=reversal_movement.quantity,
-                type=reversal_movement.type.value,
-                reason=reversal_movement.reason,
+                movements=[
+                    {
+                        "movement_id": reversal_movement.id,
+                        "product_id": reversal_movement.product_id,
+                        "quantity": reversal_movement.quantity,
+                        "type": reversal_movement.type.value,
+                        "location_id": None,
+                    }
+                ],
             )
         )
         return reversal_movement.dict()
@@ -253,7 +256,7 @@ def test_sale_cancelled_reverts_stock_via_event(mock_inv_scope, mock_stock_scope
 
     # Mock the inventory scope
     def inv_scope_get(type_class):
-        if type_class == CreateMovementCommandHandler:
+        if type_class == CreateMovementsBatchCommandHandler:
             return mock_command_handler
         raise ValueError(f"Unexpected resolve: {type_class}")
 
@@ -290,13 +293,13 @@ def test_sale_cancelled_reverts_stock_via_event(mock_inv_scope, mock_stock_scope
     # Assert
     # 1. Movement command handler was called
     mock_command_handler.handle.assert_called_once()
-    call_args = mock_command_handler.handle.call_args[0][0]
+    [call_args] = mock_command_handler.handle.call_args[0][0].movements
     assert call_args.product_id == 10
     assert call_args.quantity == 5
     assert call_args.type == MovementType.IN.value
 
     # 2. Stock was restored
-    mock_stock_repo.update.assert_called_once()
+    mock_stock_repo.apply_deltas.assert_called_once_with({(10, None): 5})
 
     # 3. StockUpdated event was published
     assert len(stock_events) == 1
@@ -340,23 +343,11 @@ def test_multiple_movements_accumulate_stock(mock_stock_scope):
     mock_movement_repo = Mock()
     mock_stock_repo = Mock()
 
-    # Start with no stock
-    call_count = [0]
-
-    def mock_first(**kwargs):
-        call_count[0] += 1
-        if call_count[0] == 1:
-            return None  # First call: no stock
-        elif call_count[0] == 2:
-            return Stock(id=1, product_id=10, quantity=10)  # After first movement
-        elif call_count[0] == 3:
-            return Stock(id=1, product_id=10, quantity=20)  # After second movement
-
-    mock_stock_repo.first.side_effect = mock_first
-    mock_stock_repo.create.return_value = Stock(id=1, product_id=10, quantity=10)
-    mock_stock_repo.update.side_effect = [
-        Stock(id=1, product_id=10, quantity=20),
-        Stock(id=1, product_id=10, quantity=15),
+    # Start with no stock: first delta inserts, the rest update in place
+    mock_stock_repo.apply_delta.side_effect = [
+        (Stock(id=1, product_id=10, quantity=10), True),
+        (Stock(id=1, product_id=10, quantity=20), False),
+        (Stock(id=1, product_id=10, quantity=15), False),
     ]
 
     # Mock the scope context manager
@@ -396,6 +387,7 @@ def test_multiple_movements_accumulate_stock(mock_stock_scope):
     handler.handle(command3)
 
     # Assert
-    # 1 create + 2 updates
-    assert mock_stock_repo.create.call_count == 1
-    assert mock_stock_repo.update.call_count == 2
+    # 3 atomic deltas, no read-modify-write
+    assert mock_stock_repo.apply_delta.call_count == 3
+    mock_stock_repo.first.assert_not_called()
+    mock_stock_repo.update.assert_not_called()
@@ -0,0 +1,292 @@
+"""
+EXPLAIN-based regression tests for the secondary indexes.
+
+Each test runs a real query shape (report handlers, POS reports, cash summary,
+alert specifications and repository lookups) against a seeded SQLite database and asserts that the
+planner picks the index added for it.
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from src.catalog.product.infra.models import ProductModel
+from src.inventory.location.infra.models import LocationModel
+from src.inventory.lot.domain.specifications import ExpiringLots
+from src.inventory.lot.infra.models import LotModel
+from src.inventory.movement.domain.constants import MovementType
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.serial.infra.models import SerialNumberModel
+from src.inventory.stock.app.queries.stock import (
+    GetAllStocksQuery,
+    GetAllStocksQueryHandler,
+)
+from src.inventory.stock.infra.mappers import StockMapper
+from src.inventory.stock.infra.models import StockModel
+from src.inventory.stock.infra.repositories import SqlAlchemyStockRepository
+from src.inventory.warehouse.infra.models import WarehouseModel
+from src.pos.cash.app.queries.get_cash_summary import compute_cash_summary
+from src.pos.cash.infra.models import CashMovementModel
+from src.pos.refund.infra.models import RefundModel, RefundPaymentModel
+from src.pos.reports.app.queries.daily_summary import (
+    GetDailySummaryQuery,
+    GetDailySummaryQueryHandler,
+)
+from src.pos.reports.app.queries.x_report import GetXReportQuery, GetXReportQueryHandler
+from src.pos.shift.infra.models import ShiftModel
+from src.reports.inventory.app.queries.movement_history import (
+    GetMovementHistoryReportQuery,
+    GetMovementHistoryReportQueryHandler,
+)
+from src.sales.infra.models import PaymentModel, SaleItemModel, SaleModel
+
+PRODUCTS = 50
+LOCATIONS = 20
+SHIFTS = 40
+SALES = 4000
+MOVEMENTS = 8000
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def seeded_session(db_session):
+    rows = db_session.execute
+    rows(
+        insert(WarehouseModel),
+        [{"id": i, "name": f"W{i}", "code": f"W{i}"} for i in (1, 2)],
+    )
+    rows(
+        insert(LocationModel),
+        [
+            {"id": i, "warehouse_id": i % 2 + 1, "name": f"L{i}", "code": f"L{i}"}
+            for i in range(1, LOCATIONS + 1)
+        ],
+    )
+    rows(
+        insert(ProductModel),
+        [{"id": i, "name": f"P{i}", "sku": f"SKU{i}"} for i in range(1, PRODUCTS + 1)],
+    )
+    rows(
+        insert(ShiftModel),
+        [{"id": i, "cashier_name": "cashier"} for i in range(1, SHIFTS + 1)],
+    )
+    rows(
+        insert(SaleModel),
+        [
+            {
+                "id": i,
+                "shift_id": i % SHIFTS + 1,
+                "status": ("CONFIRMED", "DRAFT", "CANCELLED")[i % 3],
+                "sale_date": START + timedelta(hours=i),
+            }
+            for i in range(1, SALES + 1)
+        ],
+    )
+    rows(
+        insert(SaleItemModel),
+        [
+            {
+                "sale_id": i,
+                "product_id": i % PRODUCTS + 1,
+                "quantity": 1,
+                "unit_price": 10,
+            }
+            for i in range(1, SALES + 1)
+        ],
+    )
+    rows(
+        insert(PaymentModel),
+        [
+            {"sale_id": i, "amount": 10, "payment_method": ("CASH", "CARD")[i % 2]}
+            for i in range(1, SALES + 1)
+        ],
+    )
+    rows(
+        insert(RefundModel),
+        [
+            {
+                "id": i,
+                "original_sale_id": i * 10,
+                "shift_id": i % SHIFTS + 1,
+                "status": ("COMPLETED", "PENDING")[i % 2],
+            }
+            for i in range(1, SALES // 10 + 1)
+        ],
+    )
+    rows(
+        insert(RefundPaymentModel),
+        [
+            {"refund_id": i, "amount": 10, "payment_method": "CASH"}
+            for i in range(1, SALES // 10 + 1)
+        ],
+    )
+    rows(
+        insert(CashMovementModel),
+        [
+            {"shift_id": i % SHIFTS + 1, "type": ("IN", "OUT")[i % 2], "amount": 5}
+            for i in range(1, SALES // 5 + 1)
+        ],
+    )
+    rows(
+        insert(MovementModel),
+        [
+            {
+                "product_id": i % PRODUCTS + 1,
+                "quantity": 1,
+                "type": MovementType.IN,
+                "location_id": i % LOCATIONS + 1,
+                "reference_type": "sale",
+                "reference_id": i,
+                "date": START + timedelta(minutes=i),
+            }
+            for i in range(1, MOVEMENTS + 1)
+        ],
+    )
+    rows(
+        insert(StockModel),
+        [
+            {"product_id": p, "location_id": loc, "quantity": p % 7}
+            for p in range(1, PRODUCTS + 1)
+            for loc in range(1, LOCATIONS + 1)
+        ],
+    )
+    rows(
+        insert(LotModel),
+        [
+            {
+                "product_id": i % PRODUCTS + 1,
+                "lot_number": f"LOT{i}",
+                "expiration_date": date.today() + timedelta(days=i),
+                "current_quantity": i % 3,
+            }
+            for i in range(1, 2001)
+        ],
+    )
+    rows(
+        insert(SerialNumberModel),
+        [
+            {
+                "product_id": i % PRODUCTS + 1,
+                "serial_number": f"SN{i}",
+                "status": ("available", "sold")[i % 2],
+            }
+            for i in range(1, 4001)
+        ],
+    )
+    db_session.execute(text("ANALYZE"))
+    db_session.flush()
+    return db_session
+
+
+@contextmanager
+def _capture_plans(session):
+    """Yields the EXPLAIN QUERY PLAN of every statement run inside the block."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    plans: list[str] = []
+    try:
+        yield plans
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    for statement, parameters in statements:
+        rows = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        plans.append("\n".join(row[-1] for row in rows))
+
+
+def _uses(plans: list[str], index: str) -> bool:
+    return any(index in plan for plan in plans)
+
+
+def test_cash_summary_uses_shift_indexes(seeded_session):
+    with _capture_plans(seeded_session) as plans:
+        compute_cash_summary(seeded_session, shift_id=3)
+
+    assert _uses(plans, "ix_sales_shift_id_status")
+    assert _uses(plans, "ix_payments_sale_id")
+    assert _uses(plans, "ix_pos_refunds_shift_id_status")
+    assert _uses(plans, "ix_pos_refund_payments_refund_id")
+    assert _uses(plans, "ix_pos_cash_movements_shift_id_type")
+
+
+def test_x_report_uses_shift_and_sale_indexes(seeded_session):
+    handler = GetXReportQueryHandler(seeded_session)
+    with _capture_plans(seeded_session) as plans:
+        handler.handle(GetXReportQuery(shift_id=3))
+
+    assert _uses(plans, "ix_sales_shift_id_status")
+    assert _uses(plans, "ix_sale_items_sale_id")
+
+
+def test_daily_summary_uses_status_date_index(seeded_session):
+    handler = GetDailySummaryQueryHandler(seeded_session)
+    with _capture_plans(seeded_session) as plans:
+        handler.handle(GetDailySummaryQuery(date=date(2026, 2, 1)))
+
+    assert _uses(plans, "ix_sales_status_sale_date")
+
+
+def test_movement_history_uses_movement_indexes(seeded_session):
+    handler = GetMovementHistoryReportQueryHandler(seeded_session)
+
+    with _capture_plans(seeded_session) as plans:
+        handler.handle(GetMovementHistoryReportQuery(product_id=7))
+    assert _uses(plans, "ix_movements_product_id_date")
+
+    with _capture_plans(seeded_session) as plans:
+        handler.handle(GetMovementHistoryReportQuery(limit=20))
+    assert _uses(plans, "ix_movements_date_id")
+
+
+def test_movement_lookups_use_indexes(seeded_session):
+    with _capture_plans(seeded_session) as plans:
+        seeded_session.query(MovementModel).filter(
+            MovementModel.reference_type == "sale", MovementModel.reference_id == 42
+        ).all()
+        seeded_session.query(MovementModel).filter_by(location_id=3).all()
+
+    assert _uses(plans, "ix_movements_reference")
+    assert _uses(plans, "ix_movements_location_id")
+
+
+def test_stock_list_by_location_uses_index(seeded_session):
+    handler = GetAllStocksQueryHandler(
+        SqlAlchemyStockRepository(seeded_session, StockMapper())
+    )
+    with _capture_plans(seeded_session) as plans:
+        handler.handle(GetAllStocksQuery(location_id=4, limit=20))
+
+    assert _uses(plans, "ix_stocks_location_id")
+
+
+def test_expiring_lots_use_partial_index(seeded_session):
+    with _capture_plans(seeded_session) as plans:
+        seeded_session.query(LotModel).filter(
+            *ExpiringLots(days=10).to_query_criteria()
+        ).all()
+
+    assert _uses(plans, "ix_lots_expiration_date_in_stock")
+
+
+def test_serials_by_product_and_status_use_index(seeded_session):
+    with _capture_plans(seeded_session) as plans:
+        seeded_session.query(SerialNumberModel).filter_by(
+            product_id=3, status="available"
+        ).all()
+
+    assert _uses(plans, "ix_serial_numbers_product_id_status")
+
+
+def test_refunds_by_sale_use_index(seeded_session):
+    with _capture_plans(seeded_session) as plans:
+        seeded_session.query(RefundModel).filter_by(original_sale_id=50).all()
+
+    assert _uses(plans, "ix_pos_refunds_original_sale_id")
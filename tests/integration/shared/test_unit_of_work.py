@@ -0,0 +1,190 @@
+"""
+Flush counts of the write-heavy command paths under the unit of work.
+
+Each test runs a real handler against SQLite and counts the session flushes
+that actually reach the database (before_flush only fires for a non-empty
+flush).
+"""
+
+from contextlib import contextmanager
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event, insert
+
+from src.catalog.product.infra.mappers import ProductMapper
+from src.catalog.product.infra.models import ProductModel
+from src.catalog.product.infra.repositories import SqlAlchemyProductRepository
+from src.inventory.movement.infra.mappers import MovementMapper
+from src.inventory.movement.infra.repositories import SqlAlchemyMovementRepository
+from src.inventory.stock.infra.mappers import StockMapper
+from src.inventory.stock.infra.models import StockModel
+from src.inventory.stock.infra.repositories import SqlAlchemyStockRepository
+from src.pos.sales.app.commands.quick_sale import (
+    QuickSaleCommand,
+    QuickSaleCommandHandler,
+)
+from src.pos.shift.infra.mappers import ShiftMapper
+from src.pos.shift.infra.models import ShiftModel
+from src.pos.shift.infra.repositories import SqlAlchemyShiftRepository
+from src.purchasing.app.commands.purchase_receipt import (
+    CreatePurchaseReceiptCommand,
+    CreatePurchaseReceiptCommandHandler,
+    ReceiveItemInput,
+)
+from src.purchasing.infra.mappers import (
+    PurchaseOrderItemMapper,
+    PurchaseOrderMapper,
+    PurchaseReceiptItemMapper,
+    PurchaseReceiptMapper,
+)
+from src.purchasing.infra.models import PurchaseOrderItemModel, PurchaseOrderModel
+from src.purchasing.infra.repositories import (
+    SqlAlchemyPurchaseOrderItemRepository,
+    SqlAlchemyPurchaseOrderRepository,
+    SqlAlchemyPurchaseReceiptItemRepository,
+    SqlAlchemyPurchaseReceiptRepository,
+)
+from src.sales.infra.mappers import PaymentMapper, SaleItemMapper, SaleMapper
+from src.sales.infra.models import SaleModel
+from src.sales.infra.repositories import (
+    SqlAlchemyPaymentRepository,
+    SqlAlchemySaleItemRepository,
+    SqlAlchemySaleRepository,
+)
+from src.shared.infra.unit_of_work import unit_of_work
+from src.suppliers.infra.models import SupplierModel
+
+ITEMS = 10
+
+
+@contextmanager
+def count_flushes(session):
+    flushes = []
+
+    def before_flush(session, flush_context, instances):
+        flushes.append(1)
+
+    event.listen(session, "before_flush", before_flush)
+    try:
+        yield flushes
+    finally:
+        event.remove(session, "before_flush", before_flush)
+
+
+@pytest.fixture
+def products(db_session):
+    db_session.execute(
+        insert(ProductModel),
+        [
+            {
+                "id": i,
+                "name": f"P{i}",
+                "sku": f"SKU-{i}",
+                "sale_price": Decimal("10.00"),
+                "tax_rate": Decimal("12.00"),
+            }
+            for i in range(1, ITEMS + 1)
+        ],
+    )
+    db_session.execute(
+        insert(StockModel),
+        [
+            {"product_id": i, "quantity": 100, "reserved_quantity": 0}
+            for i in range(1, ITEMS + 1)
+        ],
+    )
+    return list(range(1, ITEMS + 1))
+
+
+def test_quick_sale_flushes_twice(db_session, products):
+    db_session.add(ShiftModel(cashier_name="Ana", status="OPEN"))
+    db_session.flush()
+    handler = QuickSaleCommandHandler(
+        sale_repo=SqlAlchemySaleRepository(db_session, SaleMapper()),
+        sale_item_repo=SqlAlchemySaleItemRepository(db_session, SaleItemMapper()),
+        product_repo=SqlAlchemyProductRepository(db_session, ProductMapper()),
+        movement_repo=SqlAlchemyMovementRepository(db_session, MovementMapper()),
+        stock_repo=SqlAlchemyStockRepository(db_session, StockMapper()),
+        payment_repo=SqlAlchemyPaymentRepository(db_session, PaymentMapper()),
+        shift_repo=SqlAlchemyShiftRepository(db_session, ShiftMapper()),
+        event_publisher=Mock(),
+    )
+    command = QuickSaleCommand(
+        items=[{"product_id": id, "quantity": 1} for id in products],
+        payments=[{"payment_method": "CASH", "amount": "200.00"}],
+    )
+
+    with count_flushes(db_session) as flushes:
+        result = handler.handle(command)
+
+    # The sale INSERT (its id is needed) and one UPDATE with the final state
+    assert len(flushes) == 2
+    sale = db_session.get(SaleModel, result["id"])
+    assert sale.status == "CONFIRMED"
+    assert sale.total == Decimal("112.00")
+
+
+def test_purchase_receipt_flushes_twice(db_session, products):
+    db_session.add(SupplierModel(id=1, name="Acme", tax_id="0990000000001"))
+    db_session.add(
+        PurchaseOrderModel(id=1, supplier_id=1, order_number="PO-1", status="sent")
+    )
+    db_session.flush()
+    db_session.execute(
+        insert(PurchaseOrderItemModel),
+        [
+            {
+                "purchase_order_id": 1,
+                "product_id": id,
+                "quantity_ordered": 5,
+                "unit_cost": Decimal("4.00"),
+            }
+            for id in products
+        ],
+    )
+    handler = CreatePurchaseReceiptCommandHandler(
+        po_repo=SqlAlchemyPurchaseOrderRepository(db_session, PurchaseOrderMapper()),
+        item_repo=SqlAlchemyPurchaseOrderItemRepository(
+            db_session, PurchaseOrderItemMapper()
+        ),
+        receipt_repo=SqlAlchemyPurchaseReceiptRepository(
+            db_session, PurchaseReceiptMapper()
+        ),
+        receipt_item_repo=SqlAlchemyPurchaseReceiptItemRepository(
+            db_session, PurchaseReceiptItemMapper()
+        ),
+        event_publisher=Mock(),
+        session=db_session,
+    )
+    command = CreatePurchaseReceiptCommand(
+        purchase_order_id=1,
+        items=[
+            ReceiveItemInput(purchase_order_item_id=id, quantity_received=5)
+            for id in products
+        ],
+    )
+
+    with count_flushes(db_session) as flushes:
+        handler.handle(command)
+
+    # The receipt INSERT (its id is needed) and the order status UPDATE
+    assert len(flushes) == 2
+    assert db_session.get(PurchaseOrderModel, 1).status == "received"
+
+
+def test_update_returns_the_updated_at_it_writes(db_session):
+    db_session.add(SupplierModel(id=1, name="Acme", tax_id="0990000000001"))
+    db_session.add(PurchaseOrderModel(id=1, supplier_id=1, order_number="PO-1"))
+    db_session.flush()
+    repo = SqlAlchemyPurchaseOrderRepository(db_session, PurchaseOrderMapper())
+    before = repo.get_by_id(1).updated_at
+
+    with unit_of_work():
+        updated = repo.update(replace(repo.get_by_id(1), notes="Rush"))
+
+    db_session.expire_all()
+    assert updated.updated_at > before
+    assert updated.updated_at == db_session.get(PurchaseOrderModel, 1).updated_at
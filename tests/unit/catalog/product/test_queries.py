@@ -17,6 +17,7 @@ from src.catalog.product.app.queries import (
     SearchProductsQueryHandler,
 )
 from src.catalog.product.domain.entities import Category, Product
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -44,7 +45,9 @@ def test_get_all_products_query_handler():
     assert result["items"][0]["id"] == 1
     assert result["items"][1]["id"] == 2
     assert result["total"] == 2
-    mock_repo.paginate.assert_called_once_with(limit=None, offset=None)
+    mock_repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_all_products_with_category_filter():
@@ -139,7 +142,9 @@ def test_get_all_categories_query_handler():
     assert result["items"][0]["id"] == 1
     assert result["items"][1]["id"] == 2
     assert result["total"] == 2
-    mock_repo.paginate.assert_called_once_with(limit=None, offset=None)
+    mock_repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_category_by_id_handler():
@@ -11,6 +11,7 @@ from src.catalog.uom.app.queries.get_uom import (
     GetUnitOfMeasureByIdQueryHandler,
 )
 from src.catalog.uom.domain.entities import UnitOfMeasure
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 # --- Helpers ---
@@ -31,11 +32,20 @@ def _make_uom(**overrides) -> UnitOfMeasure:
 # --- GetAll ---
 
 
+def _page(items, total=None) -> dict:
+    return {
+        "total": len(items) if total is None else total,
+        "limit": None,
+        "offset": None,
+        "next_cursor": None,
+        "items": [item.dict() for item in items],
+    }
+
+
 def test_get_all_uom_returns_all():
     uoms = [_make_uom(id=1), _make_uom(id=2, name="Liter", symbol="L")]
     repo = Mock()
-    repo.filter_by.return_value = uoms
-    repo.count_by.return_value = 2
+    repo.paginate.return_value = _page(uoms)
     handler = GetAllUnitsOfMeasureQueryHandler(repo)
 
     result = handler.handle(GetAllUnitsOfMeasureQuery())
@@ -44,13 +54,12 @@ def test_get_all_uom_returns_all():
     assert result["items"][0]["id"] == 1
     assert result["items"][1]["id"] == 2
     assert result["total"] == 2
-    repo.filter_by.assert_called_once()
+    repo.paginate.assert_called_once()
 
 
 def test_get_all_uom_empty_list():
     repo = Mock()
-    repo.filter_by.return_value = []
-    repo.count_by.return_value = 0
+    repo.paginate.return_value = _page([])
     handler = GetAllUnitsOfMeasureQueryHandler(repo)
 
     result = handler.handle(GetAllUnitsOfMeasureQuery())
@@ -62,8 +71,7 @@ def test_get_all_uom_empty_list():
 def test_get_all_uom_filters_by_is_active_true():
     active_uoms = [_make_uom(is_active=True)]
     repo = Mock()
-    repo.filter_by.return_value = active_uoms
-    repo.count_by.return_value = 1
+    repo.paginate.return_value = _page(active_uoms)
     handler = GetAllUnitsOfMeasureQueryHandler(repo)
 
     result = handler.handle(GetAllUnitsOfMeasureQuery(is_active=True))
@@ -71,15 +79,19 @@ def test_get_all_uom_filters_by_is_active_true():
     assert len(result["items"]) == 1
     assert result["items"][0]["is_active"] is True
     assert result["total"] == 1
-    repo.filter_by.assert_called_once_with(is_active=True, limit=None, offset=None)
-    repo.count_by.assert_called_once_with(is_active=True)
+    repo.paginate.assert_called_once_with(
+        is_active=True,
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+    )
 
 
 def test_get_all_uom_filters_by_is_active_false():
     inactive_uoms = [_make_uom(is_active=False, name="Archived", symbol="ar")]
     repo = Mock()
-    repo.filter_by.return_value = inactive_uoms
-    repo.count_by.return_value = 1
+    repo.paginate.return_value = _page(inactive_uoms)
     handler = GetAllUnitsOfMeasureQueryHandler(repo)
 
     result = handler.handle(GetAllUnitsOfMeasureQuery(is_active=False))
@@ -87,32 +99,53 @@ def test_get_all_uom_filters_by_is_active_false():
     assert len(result["items"]) == 1
     assert result["items"][0]["is_active"] is False
     assert result["total"] == 1
-    repo.filter_by.assert_called_once_with(is_active=False, limit=None, offset=None)
-    repo.count_by.assert_called_once_with(is_active=False)
+    repo.paginate.assert_called_once_with(
+        is_active=False,
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+    )
 
 
 def test_get_all_uom_without_filter_does_not_pass_is_active():
     repo = Mock()
-    repo.filter_by.return_value = []
-    repo.count_by.return_value = 0
+    repo.paginate.return_value = _page([])
     handler = GetAllUnitsOfMeasureQueryHandler(repo)
 
     handler.handle(GetAllUnitsOfMeasureQuery())
 
-    # When is_active is None, should NOT pass it to filter_by
-    call_kwargs = repo.filter_by.call_args
+    # When is_active is None, should NOT pass it to paginate
+    call_kwargs = repo.paginate.call_args
     assert "is_active" not in (call_kwargs.kwargs if call_kwargs.kwargs else {})
 
 
 def test_get_all_uom_with_pagination():
     repo = Mock()
-    repo.filter_by.return_value = [_make_uom()]
-    repo.count_by.return_value = 1
+    repo.paginate.return_value = _page([_make_uom()])
     handler = GetAllUnitsOfMeasureQueryHandler(repo)
 
     handler.handle(GetAllUnitsOfMeasureQuery(limit=10, offset=20))
 
-    repo.filter_by.assert_called_once_with(limit=10, offset=20)
+    repo.paginate.assert_called_once_with(
+        limit=10, offset=20, cursor=None, include_total=TotalMode.EXACT
+    )
+
+
+def test_get_all_uom_with_cursor():
+    repo = Mock()
+    repo.paginate.return_value = _page([_make_uom()])
+    handler = GetAllUnitsOfMeasureQueryHandler(repo)
+
+    handler.handle(
+        GetAllUnitsOfMeasureQuery(
+            limit=10, cursor="WzVd", include_total=TotalMode.EXACT
+        )
+    )
+
+    repo.paginate.assert_called_once_with(
+        limit=10, offset=None, cursor="WzVd", include_total=TotalMode.EXACT
+    )
 
 
 # --- GetById ---
@@ -161,7 +161,7 @@ def test_confirm_adjustment_creates_in_movement_for_positive_diff():
     result = handler.handle(ConfirmAdjustmentCommand(id=1))
 
     movement_handler.handle.assert_called_once()
-    call_args = movement_handler.handle.call_args[0][0]
+    [call_args] = movement_handler.handle.call_args[0][0].movements
     assert call_args.quantity == 10
     assert call_args.type == "IN"
     assert result["status"] == AdjustmentStatus.CONFIRMED
@@ -187,7 +187,7 @@ def test_confirm_adjustment_creates_out_movement_for_negative_diff():
     )
     handler.handle(ConfirmAdjustmentCommand(id=1))
 
-    call_args = movement_handler.handle.call_args[0][0]
+    [call_args] = movement_handler.handle.call_args[0][0].movements
     assert call_args.quantity == -15
     assert call_args.type == "OUT"
 
@@ -17,6 +17,11 @@ from src.inventory.location.app.commands.update import (
     UpdateLocationCommandHandler,
 )
 from src.inventory.location.domain.entities import Location, LocationType
+from src.inventory.location.domain.events import (
+    LocationCreated,
+    LocationDeleted,
+    LocationUpdated,
+)
 from src.shared.domain.exceptions import NotFoundError
 
 # --- Helpers ---
@@ -51,7 +56,7 @@ def _mock_repo(location=None):
 def test_create_location_returns_dict_with_correct_fields():
     location = _make_location()
     repo = _mock_repo(location=location)
-    handler = CreateLocationCommandHandler(repo)
+    handler = CreateLocationCommandHandler(repo, Mock())
 
     result = handler.handle(
         CreateLocationCommand(
@@ -72,7 +77,7 @@ def test_create_location_returns_dict_with_correct_fields():
 
 def test_create_location_calls_repo_create():
     repo = _mock_repo(location=_make_location())
-    handler = CreateLocationCommandHandler(repo)
+    handler = CreateLocationCommandHandler(repo, Mock())
 
     handler.handle(
         CreateLocationCommand(warehouse_id=10, name="Receiving Area", code="REC-01")
@@ -85,10 +90,25 @@ def test_create_location_calls_repo_create():
     assert created.warehouse_id == 10
 
 
+def test_create_location_publishes_location_created():
+    repo = _mock_repo(location=_make_location())
+    event_publisher = Mock()
+    handler = CreateLocationCommandHandler(repo, event_publisher)
+
+    handler.handle(
+        CreateLocationCommand(warehouse_id=10, name="Receiving Area", code="REC-01")
+    )
+
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, LocationCreated)
+    assert event.location_id == 1
+    assert event.warehouse_id == 10
+
+
 def test_create_location_default_type_is_storage():
     location = _make_location(type=LocationType.STORAGE)
     repo = _mock_repo(location=location)
-    handler = CreateLocationCommandHandler(repo)
+    handler = CreateLocationCommandHandler(repo, Mock())
 
     handler.handle(
         CreateLocationCommand(warehouse_id=10, name="Default Zone", code="DZ-01")
@@ -101,7 +121,7 @@ def test_create_location_default_type_is_storage():
 def test_create_location_receiving_type():
     location = _make_location(type=LocationType.RECEIVING, code="REC-01")
     repo = _mock_repo(location=location)
-    handler = CreateLocationCommandHandler(repo)
+    handler = CreateLocationCommandHandler(repo, Mock())
 
     result = handler.handle(
         CreateLocationCommand(
@@ -119,7 +139,7 @@ def test_create_location_each_type_is_valid():
     for loc_type in LocationType:
         location = _make_location(type=loc_type)
         repo = _mock_repo(location=location)
-        handler = CreateLocationCommandHandler(repo)
+        handler = CreateLocationCommandHandler(repo, Mock())
 
         result = handler.handle(
             CreateLocationCommand(
@@ -136,7 +156,7 @@ def test_create_location_each_type_is_valid():
 def test_create_location_without_capacity():
     location = _make_location(capacity=None)
     repo = _mock_repo(location=location)
-    handler = CreateLocationCommandHandler(repo)
+    handler = CreateLocationCommandHandler(repo, Mock())
 
     result = handler.handle(
         CreateLocationCommand(warehouse_id=10, name="Open Zone", code="OZ-01")
@@ -148,7 +168,7 @@ def test_create_location_without_capacity():
 def test_create_location_inactive():
     location = _make_location(is_active=False)
     repo = _mock_repo(location=location)
-    handler = CreateLocationCommandHandler(repo)
+    handler = CreateLocationCommandHandler(repo, Mock())
 
     result = handler.handle(
         CreateLocationCommand(
@@ -168,7 +188,7 @@ def test_update_location_returns_updated_dict():
     repo = Mock()
     repo.get_by_id.return_value = existing
     repo.update.return_value = updated
-    handler = UpdateLocationCommandHandler(repo)
+    handler = UpdateLocationCommandHandler(repo, Mock())
 
     result = handler.handle(
         UpdateLocationCommand(
@@ -187,7 +207,7 @@ def test_update_location_returns_updated_dict():
 def test_update_location_not_found_raises():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = UpdateLocationCommandHandler(repo)
+    handler = UpdateLocationCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(
@@ -200,7 +220,7 @@ def test_update_location_not_found_raises():
 def test_update_location_not_found_does_not_call_update():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = UpdateLocationCommandHandler(repo)
+    handler = UpdateLocationCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(
@@ -218,7 +238,7 @@ def test_update_location_change_type():
     repo = Mock()
     repo.get_by_id.return_value = existing
     repo.update.return_value = updated
-    handler = UpdateLocationCommandHandler(repo)
+    handler = UpdateLocationCommandHandler(repo, Mock())
 
     result = handler.handle(
         UpdateLocationCommand(
@@ -241,7 +261,7 @@ def test_update_location_deactivate():
     repo = Mock()
     repo.get_by_id.return_value = existing
     repo.update.return_value = deactivated
-    handler = UpdateLocationCommandHandler(repo)
+    handler = UpdateLocationCommandHandler(repo, Mock())
 
     result = handler.handle(
         UpdateLocationCommand(
@@ -252,12 +272,32 @@ def test_update_location_deactivate():
     assert result["is_active"] is False
 
 
+def test_update_location_publishes_previous_warehouse():
+    repo = Mock()
+    repo.get_by_id.return_value = _make_location(warehouse_id=10)
+    repo.update.return_value = _make_location(warehouse_id=20)
+    event_publisher = Mock()
+    handler = UpdateLocationCommandHandler(repo, event_publisher)
+
+    handler.handle(
+        UpdateLocationCommand(
+            location_id=1, warehouse_id=20, name="Zone A", code="ZA-01"
+        )
+    )
+
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, LocationUpdated)
+    assert event.location_id == 1
+    assert event.warehouse_id == 20
+    assert event.previous_warehouse_id == 10
+
+
 # --- Delete ---
 
 
 def test_delete_location_calls_repo_delete():
     repo = _mock_repo(location=_make_location())
-    handler = DeleteLocationCommandHandler(repo)
+    handler = DeleteLocationCommandHandler(repo, Mock())
 
     result = handler.handle(DeleteLocationCommand(location_id=1))
 
@@ -265,10 +305,22 @@ def test_delete_location_calls_repo_delete():
     repo.delete.assert_called_once_with(1)
 
 
+def test_delete_location_publishes_location_deleted():
+    repo = _mock_repo(location=_make_location())
+    event_publisher = Mock()
+    handler = DeleteLocationCommandHandler(repo, event_publisher)
+
+    handler.handle(DeleteLocationCommand(location_id=1))
+
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, LocationDeleted)
+    assert event.location_id == 1
+
+
 def test_delete_location_not_found_raises():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = DeleteLocationCommandHandler(repo)
+    handler = DeleteLocationCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(DeleteLocationCommand(location_id=999))
@@ -277,7 +329,7 @@ def test_delete_location_not_found_raises():
 def test_delete_location_not_found_does_not_delete():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = DeleteLocationCommandHandler(repo)
+    handler = DeleteLocationCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(DeleteLocationCommand(location_id=999))
@@ -9,6 +9,7 @@ from src.inventory.lot.app.commands.lot import (
     UpdateLotCommandHandler,
 )
 from src.inventory.lot.domain.entities import Lot
+from src.inventory.lot.domain.events import LotCreated, LotUpdated
 from src.shared.domain.exceptions import DomainError, NotFoundError
 
 
@@ -34,7 +35,7 @@ def test_create_lot_success():
     repo = MagicMock()
     repo.first.return_value = None
     repo.create.return_value = lot
-    handler = CreateLotCommandHandler(repo)
+    handler = CreateLotCommandHandler(repo, MagicMock())
 
     result = handler.handle(
         CreateLotCommand(product_id=5, lot_number="LOT-001", initial_quantity=100)
@@ -49,7 +50,7 @@ def test_create_lot_duplicate_raises():
     existing_lot = _make_lot()
     repo = MagicMock()
     repo.first.return_value = existing_lot
-    handler = CreateLotCommandHandler(repo)
+    handler = CreateLotCommandHandler(repo, MagicMock())
 
     with pytest.raises(DomainError, match="already exists"):
         handler.handle(
@@ -64,7 +65,7 @@ def test_create_lot_sets_current_quantity_from_initial():
     repo = MagicMock()
     repo.first.return_value = None
     repo.create.return_value = lot
-    handler = CreateLotCommandHandler(repo)
+    handler = CreateLotCommandHandler(repo, MagicMock())
 
     handler.handle(
         CreateLotCommand(product_id=5, lot_number="LOT-001", initial_quantity=50)
@@ -75,6 +76,24 @@ def test_create_lot_sets_current_quantity_from_initial():
     assert created_lot.current_quantity == 50
 
 
+def test_create_lot_publishes_lot_created():
+    repo = MagicMock()
+    repo.first.return_value = None
+    repo.create.return_value = _make_lot()
+    event_publisher = MagicMock()
+    handler = CreateLotCommandHandler(repo, event_publisher)
+
+    handler.handle(
+        CreateLotCommand(product_id=5, lot_number="LOT-001", initial_quantity=100)
+    )
+
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, LotCreated)
+    assert event.lot_id == 1
+    assert event.product_id == 5
+    assert event.lot_number == "LOT-001"
+
+
 # ---------------------------------------------------------------------------
 # UpdateLotCommandHandler
 # ---------------------------------------------------------------------------
@@ -86,7 +105,7 @@ def test_update_lot_quantity():
     repo = MagicMock()
     repo.get_by_id.return_value = lot
     repo.update.return_value = updated_lot
-    handler = UpdateLotCommandHandler(repo)
+    handler = UpdateLotCommandHandler(repo, MagicMock())
 
     result = handler.handle(UpdateLotCommand(id=1, current_quantity=75))
 
@@ -100,7 +119,7 @@ def test_update_lot_notes():
     repo = MagicMock()
     repo.get_by_id.return_value = lot
     repo.update.return_value = updated_lot
-    handler = UpdateLotCommandHandler(repo)
+    handler = UpdateLotCommandHandler(repo, MagicMock())
 
     result = handler.handle(UpdateLotCommand(id=1, notes="Updated notes"))
 
@@ -111,7 +130,7 @@ def test_update_lot_notes():
 def test_update_lot_not_found_raises():
     repo = MagicMock()
     repo.get_by_id.return_value = None
-    handler = UpdateLotCommandHandler(repo)
+    handler = UpdateLotCommandHandler(repo, MagicMock())
 
     with pytest.raises(NotFoundError):
         handler.handle(UpdateLotCommand(id=99, current_quantity=50))
@@ -121,9 +140,36 @@ def test_update_lot_negative_quantity_raises():
     lot = _make_lot()
     repo = MagicMock()
     repo.get_by_id.return_value = lot
-    handler = UpdateLotCommandHandler(repo)
+    handler = UpdateLotCommandHandler(repo, MagicMock())
 
     with pytest.raises(DomainError, match="cannot be negative"):
         handler.handle(UpdateLotCommand(id=1, current_quantity=-5))
 
     repo.update.assert_not_called()
+
+
+def test_update_lot_publishes_changed_fields():
+    repo = MagicMock()
+    repo.get_by_id.return_value = _make_lot()
+    repo.update.return_value = _make_lot(current_quantity=75)
+    event_publisher = MagicMock()
+    handler = UpdateLotCommandHandler(repo, event_publisher)
+
+    handler.handle(UpdateLotCommand(id=1, current_quantity=75, notes="Recount"))
+
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, LotUpdated)
+    assert event.lot_id == 1
+    assert event.changed_fields == ["current_quantity", "notes"]
+
+
+def test_update_lot_rejected_publishes_nothing():
+    repo = MagicMock()
+    repo.get_by_id.return_value = _make_lot()
+    event_publisher = MagicMock()
+    handler = UpdateLotCommandHandler(repo, event_publisher)
+
+    with pytest.raises(DomainError):
+        handler.handle(UpdateLotCommand(id=1, current_quantity=-5))
+
+    event_publisher.publish.assert_not_called()
@@ -1,3 +1,5 @@
+from dataclasses import replace
+from datetime import datetime
 from unittest.mock import MagicMock, Mock, patch
 
 from src.inventory.lot.domain.entities import Lot, MovementLotItem
@@ -101,7 +103,7 @@ def test_creates_new_lot_when_not_exists(mock_create_scope):
 
     movement_lot_item_repo = MagicMock()
     movement_repo = MagicMock()
-    movement_repo.filter_by.return_value = []
+    movement_repo.filter_by_spec.return_value = []
 
     mock_scope = _make_scope(lot_repo, movement_lot_item_repo, movement_repo)
     mock_create_scope.return_value.__enter__.return_value = mock_scope
@@ -144,7 +146,7 @@ def test_updates_existing_lot_quantity(mock_create_scope):
 
     movement_lot_item_repo = MagicMock()
     movement_repo = MagicMock()
-    movement_repo.filter_by.return_value = []
+    movement_repo.filter_by_spec.return_value = []
 
     mock_scope = _make_scope(lot_repo, movement_lot_item_repo, movement_repo)
     mock_create_scope.return_value.__enter__.return_value = mock_scope
@@ -198,7 +200,7 @@ def test_creates_movement_lot_item_when_movement_exists(mock_create_scope):
     )
 
     movement_repo = MagicMock()
-    movement_repo.filter_by.return_value = [movement]
+    movement_repo.filter_by_spec.return_value = [movement]
 
     mock_scope = _make_scope(lot_repo, movement_lot_item_repo, movement_repo)
     mock_create_scope.return_value.__enter__.return_value = mock_scope
@@ -209,11 +211,12 @@ def test_creates_movement_lot_item_when_movement_exists(mock_create_scope):
 
     handle_purchase_order_received_lots(event)
 
-    movement_repo.filter_by.assert_called_once_with(
-        reference_type="purchase_order",
-        reference_id=1,
-        product_id=5,
-        quantity=10,
+    movement_repo.filter_by_spec.assert_called_once()
+    spec = movement_repo.filter_by_spec.call_args[0][0]
+    assert spec.is_satisfied_by(replace(movement, date=datetime.now()))
+    assert not spec.is_satisfied_by(replace(movement, date=datetime(2000, 1, 1)))
+    assert not spec.is_satisfied_by(
+        replace(movement, date=datetime.now(), reference_id=2)
     )
     movement_lot_item_repo.create.assert_called_once()
     created = movement_lot_item_repo.create.call_args[0][0]
@@ -275,7 +278,7 @@ def test_does_not_reuse_movement_for_duplicate_product_items(mock_create_scope):
     )
 
     movement_repo = MagicMock()
-    movement_repo.filter_by.return_value = [movement1, movement2]
+    movement_repo.filter_by_spec.return_value = [movement1, movement2]
 
     mock_scope = _make_scope(lot_repo, movement_lot_item_repo, movement_repo)
     mock_create_scope.return_value.__enter__.return_value = mock_scope
@@ -10,6 +10,7 @@ from src.inventory.lot.app.queries.lot import (
     GetLotByIdQueryHandler,
 )
 from src.inventory.lot.domain.entities import Lot
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -44,7 +45,9 @@ def test_get_all_lots():
 
     result = handler.handle(GetAllLotsQuery())
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None)
+    repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
     assert result["total"] == 2
     assert len(result["items"]) == 2
     assert result["items"][0]["lot_number"] == "LOT-001"
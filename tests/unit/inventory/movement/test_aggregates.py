@@ -0,0 +1,102 @@
+"""Unit tests for the daily movement aggregates"""
+
+from datetime import date, datetime
+
+from sqlalchemy import select
+
+from src.catalog.product.infra.models import ProductModel
+from src.inventory.location.infra.models import LocationModel
+from src.inventory.movement.domain.constants import MovementType
+from src.inventory.movement.domain.entities import Movement
+from src.inventory.movement.infra.aggregates import rebuild_by_month
+from src.inventory.movement.infra.mappers import MovementMapper
+from src.inventory.movement.infra.models import (
+    NO_WAREHOUSE,
+    MovementDailyAggregateModel,
+)
+from src.inventory.movement.infra.repositories import SqlAlchemyMovementRepository
+from src.reports.inventory.app.queries.rotation import (
+    GetProductRotationQuery,
+    GetProductRotationQueryHandler,
+)
+
+
+def _movement(product_id, quantity, when, location_id=None) -> Movement:
+    return Movement(
+        product_id=product_id,
+        quantity=quantity,
+        type=MovementType.IN if quantity > 0 else MovementType.OUT,
+        location_id=location_id,
+        date=when,
+    )
+
+
+def _seed(session) -> SqlAlchemyMovementRepository:
+    session.add_all(
+        [
+            ProductModel(id=1, name="Product A", sku="SKU-001"),
+            ProductModel(id=2, name="Product B", sku="SKU-002"),
+            LocationModel(id=10, warehouse_id=7, name="Main", code="A-1"),
+        ]
+    )
+    session.flush()
+    repo = SqlAlchemyMovementRepository(session, MovementMapper())
+    repo.create(_movement(1, 10, datetime(2026, 4, 1, 9), location_id=10))
+    repo.create_many(
+        [
+            _movement(1, -3, datetime(2026, 4, 1, 18), location_id=10),
+            _movement(1, -2, datetime(2026, 4, 1, 19), location_id=10),
+            _movement(1, 5, datetime(2026, 4, 2, 9)),
+            _movement(2, 8, datetime(2026, 5, 3, 9), location_id=10),
+        ]
+    )
+    return repo
+
+
+def _aggregates(session) -> dict:
+    rows = session.execute(
+        select(
+            MovementDailyAggregateModel.day,
+            MovementDailyAggregateModel.warehouse_id,
+            MovementDailyAggregateModel.product_id,
+            MovementDailyAggregateModel.qty_in,
+            MovementDailyAggregateModel.qty_out,
+            MovementDailyAggregateModel.movement_count,
+        )
+    )
+    return {(d, w, p): (i, o, c) for d, w, p, i, o, c in rows}
+
+
+def test_inserts_accumulate_per_day_warehouse_and_product(db_session):
+    _seed(db_session)
+
+    assert _aggregates(db_session) == {
+        (date(2026, 4, 1), 7, 1): (10, 5, 3),
+        (date(2026, 4, 2), NO_WAREHOUSE, 1): (5, 0, 1),
+        (date(2026, 5, 3), 7, 2): (8, 0, 1),
+    }
+
+
+def test_rebuild_matches_the_incremental_totals(db_session):
+    _seed(db_session)
+    incremental = _aggregates(db_session)
+    db_session.execute(MovementDailyAggregateModel.__table__.update().values(qty_in=0))
+
+    rebuild_by_month(db_session, date(2026, 4, 1), date(2026, 5, 31))
+
+    assert _aggregates(db_session) == incremental
+
+
+def test_rotation_reads_the_aggregates(db_session):
+    _seed(db_session)
+    handler = GetProductRotationQueryHandler(db_session)
+
+    result = handler.handle(
+        GetProductRotationQuery(
+            from_date=date(2026, 4, 1), to_date=date(2026, 4, 30), warehouse_id=7
+        )
+    )
+
+    assert [(r["product_id"], r["total_in"], r["total_out"]) for r in result] == [
+        (1, 10, 5)
+    ]
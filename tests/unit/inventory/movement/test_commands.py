@@ -8,10 +8,12 @@ import pytest
 from src.inventory.movement.app.commands import (
     CreateMovementCommand,
     CreateMovementCommandHandler,
+    CreateMovementsBatchCommand,
+    CreateMovementsBatchCommandHandler,
 )
 from src.inventory.movement.domain.constants import MovementType
 from src.inventory.movement.domain.entities import Movement
-from src.inventory.movement.domain.events import MovementCreated
+from src.inventory.movement.domain.events import MovementCreated, MovementsCreated
 from src.inventory.movement.domain.exceptions import InvalidMovementTypeError
 
 
@@ -199,3 +201,56 @@ def test_create_movement_with_date(mock_movement_repo, event_publisher):
 
     assert result["date"] == specific_date
     mock_movement_repo.create.assert_called_once()
+
+
+def test_create_movements_batch_inserts_once_and_publishes_one_event(
+    mock_movement_repo, event_publisher
+):
+    mock_movement_repo.create_many.side_effect = lambda movements: [
+        Movement(
+            id=index + 1,
+            product_id=m.product_id,
+            quantity=m.quantity,
+            type=m.type,
+            location_id=m.location_id,
+        )
+        for index, m in enumerate(movements)
+    ]
+    command = CreateMovementsBatchCommand(
+        movements=[
+            CreateMovementCommand(product_id=1, quantity=5, type=MovementType.IN.value),
+            CreateMovementCommand(
+                product_id=2, quantity=-3, type=MovementType.OUT.value, location_id=4
+            ),
+        ],
+        reference_type="purchase_order",
+        reference_id=7,
+    )
+
+    handler = CreateMovementsBatchCommandHandler(
+        mock_movement_repo, event_publisher, Mock()
+    )
+    result = handler.handle(command)
+
+    assert [m["id"] for m in result] == [1, 2]
+    mock_movement_repo.create_many.assert_called_once()
+    event_publisher.publish.assert_called_once()
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, MovementsCreated)
+    assert event.reference_id == 7
+    assert [
+        (m["product_id"], m["quantity"], m["location_id"]) for m in event.movements
+    ] == [
+        (1, 5, None),
+        (2, -3, 4),
+    ]
+
+
+def test_create_movements_batch_empty_does_nothing(mock_movement_repo, event_publisher):
+    handler = CreateMovementsBatchCommandHandler(
+        mock_movement_repo, event_publisher, Mock()
+    )
+
+    assert handler.handle(CreateMovementsBatchCommand()) == []
+    mock_movement_repo.create_many.assert_not_called()
+    event_publisher.publish.assert_not_called()
@@ -0,0 +1,143 @@
+"""Unit tests for the movements partitions maintenance and archival"""
+
+import gzip
+import json
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+from sqlalchemy import func, insert, select
+
+from src.inventory.movement.domain.constants import MovementType
+from src.inventory.movement.infra import partitions
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.movement.infra.partitions import (
+    add_months,
+    archive_movements,
+    ensure_movement_partitions,
+    partition_name,
+)
+from src.inventory.stock.infra.models import StockDailySnapshotModel, StockModel
+from src.inventory.stock.infra.reconciliation import SqlAlchemyStockLedger
+from src.inventory.stock.infra.snapshots import stock_entries_as_of
+
+
+def _movement(product_id: int, quantity: int, when: datetime) -> dict:
+    type = MovementType.IN if quantity > 0 else MovementType.OUT
+    return {
+        "product_id": product_id,
+        "location_id": None,
+        "quantity": quantity,
+        "type": type,
+        "date": when,
+    }
+
+
+def _seed(session) -> None:
+    session.execute(
+        insert(MovementModel),
+        [
+            _movement(1, 10, datetime(2026, 1, 5)),
+            _movement(1, -3, datetime(2026, 2, 10)),
+            _movement(2, 4, datetime(2026, 2, 28, 23, 59)),
+            _movement(1, 5, datetime(2026, 3, 1)),
+        ],
+    )
+    session.execute(
+        insert(StockModel),
+        [
+            {"product_id": 1, "location_id": None, "quantity": 12},
+            {"product_id": 2, "location_id": None, "quantity": 4},
+        ],
+    )
+
+
+def _as_of(session, day: date) -> dict:
+    entries = stock_entries_as_of(session, day)
+    rows = session.execute(
+        select(entries.c.product_id, func.sum(entries.c.quantity)).group_by(
+            entries.c.product_id
+        )
+    )
+    return dict(rows.all())
+
+
+def test_month_helpers():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2026, 2, 1)) == "movements_p2026_02"
+
+
+def test_ensure_is_a_no_op_without_partitions(db_session):
+    assert ensure_movement_partitions(db_session, months_ahead=3) == []
+
+
+def test_archive_exports_whole_months_before_the_cutoff(db_session, tmp_path):
+    _seed(db_session)
+
+    archived = archive_movements(db_session, date(2026, 3, 15), tmp_path)
+
+    assert [(a.month, a.rows) for a in archived] == [
+        (date(2026, 1, 1), 1),
+        (date(2026, 2, 1), 2),
+    ]
+    with gzip.open(tmp_path / "movements_p2026_02.jsonl.gz", "rt") as file:
+        rows = [json.loads(line) for line in file]
+    assert [row["quantity"] for row in rows] == [-3, 4]
+    assert rows[1]["date"] == "2026-02-28T23:59:00"
+    assert db_session.execute(select(func.count(MovementModel.id))).scalar() == 1
+
+
+def test_archive_keeps_balances_through_the_opening_snapshot(db_session, tmp_path):
+    _seed(db_session)
+    expected = _as_of(db_session, date(2026, 3, 1))
+
+    archive_movements(db_session, date(2026, 3, 1), tmp_path)
+
+    opening = db_session.execute(
+        select(
+            StockDailySnapshotModel.product_id, StockDailySnapshotModel.quantity
+        ).where(StockDailySnapshotModel.day == date(2026, 2, 28))
+    ).all()
+    assert dict(opening) == {1: 7, 2: 4}
+    assert _as_of(db_session, date(2026, 3, 1)) == expected
+    assert SqlAlchemyStockLedger(db_session).reconcile().drift_count == 0
+
+
+def test_archive_without_old_months_does_nothing(db_session, tmp_path):
+    _seed(db_session)
+
+    assert archive_movements(db_session, date(2026, 1, 20), tmp_path) == []
+    assert not list(tmp_path.iterdir())
+
+
+def test_partitioned_archive_includes_months_left_in_the_default_partition(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(partitions, "is_partitioned", lambda session: True)
+    monkeypatch.setattr(
+        partitions,
+        "monthly_partitions",
+        lambda session: {date(2026, 2, 1): "movements_p2026_02"},
+    )
+    monkeypatch.setattr(partitions, "build_snapshot", lambda session, day: 0)
+    statements = []
+
+    def execute(statement, *args):
+        statements.append(str(statement))
+        result = MagicMock()
+        # Month of the rows found in the default partition
+        result.scalars.return_value = [date(2025, 11, 1)]
+        result.mappings.return_value = []
+        return result
+
+    archived = archive_movements(
+        MagicMock(execute=execute), date(2026, 3, 15), tmp_path
+    )
+
+    assert [a.month for a in archived] == [date(2025, 11, 1), date(2026, 2, 1)]
+    assert (tmp_path / "movements_p2025_11.jsonl.gz").exists()
+    assert "LOCK TABLE movements_default IN SHARE MODE" in statements
+    assert "DROP TABLE movements_p2026_02" in statements
+    assert not any("movements_p2025_11" in sql for sql in statements)
+    deletes = [sql for sql in statements if sql.startswith("DELETE FROM movements")]
+    assert len(deletes) == 1
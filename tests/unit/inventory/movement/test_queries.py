@@ -13,6 +13,7 @@ from src.inventory.movement.app.queries import (
 )
 from src.inventory.movement.domain.constants import MovementType
 from src.inventory.movement.domain.entities import Movement
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -57,7 +58,9 @@ def test_get_all_movements_query_handler(mock_movement_repo):
     assert result["items"][0]["id"] == 1
     assert result["items"][1]["id"] == 2
     assert result["total"] == 2
-    mock_movement_repo.paginate.assert_called_once_with(limit=None, offset=None)
+    mock_movement_repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_all_movements_with_product_filter(mock_movement_repo):
@@ -86,7 +89,11 @@ def test_get_all_movements_with_product_filter(mock_movement_repo):
     assert result["items"][0]["product_id"] == 1
     assert result["total"] == 1
     mock_movement_repo.paginate.assert_called_once_with(
-        limit=None, offset=None, product_id=1
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        product_id=1,
     )
 
 
@@ -116,7 +123,11 @@ def test_get_all_movements_with_type_filter(mock_movement_repo):
     assert result["items"][0]["type"] == MovementType.IN
     assert result["total"] == 1
     mock_movement_repo.paginate.assert_called_once_with(
-        limit=None, offset=None, type=MovementType.IN.value
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        type=MovementType.IN.value,
     )
 
 
@@ -145,7 +156,12 @@ def test_get_all_movements_with_multiple_filters(mock_movement_repo):
     assert len(result["items"]) == 1
     assert result["total"] == 1
     mock_movement_repo.paginate.assert_called_once_with(
-        limit=None, offset=None, product_id=1, type=MovementType.IN.value
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        product_id=1,
+        type=MovementType.IN.value,
     )
 
 
@@ -165,7 +181,9 @@ def test_get_all_movements_empty(mock_movement_repo):
 
     assert len(result["items"]) == 0
     assert result["total"] == 0
-    mock_movement_repo.paginate.assert_called_once_with(limit=None, offset=None)
+    mock_movement_repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_all_movements_with_pagination(mock_movement_repo):
@@ -198,7 +216,9 @@ def test_get_all_movements_with_pagination(mock_movement_repo):
 
     assert len(result["items"]) == 2
     assert result["total"] == 2
-    mock_movement_repo.paginate.assert_called_once_with(limit=10, offset=5)
+    mock_movement_repo.paginate.assert_called_once_with(
+        limit=10, offset=5, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_movement_by_id_handler(mock_movement_repo):
@@ -87,8 +87,8 @@ def test_creates_serial_numbers_when_provided(mock_create_scope):
     )
 
     serial_repo = MagicMock()
-    serial_repo.first.return_value = None
-    serial_repo.create.return_value = serial
+    serial_repo.find_by_serials.return_value = []
+    serial_repo.create_many.return_value = [serial]
 
     lot_repo = MagicMock()
     lot_repo.first.return_value = None
@@ -102,9 +102,9 @@ def test_creates_serial_numbers_when_provided(mock_create_scope):
 
     handle_purchase_order_received_serials(event)
 
-    serial_repo.first.assert_called_once_with(serial_number="SN-001")
-    serial_repo.create.assert_called_once()
-    created = serial_repo.create.call_args[0][0]
+    serial_repo.find_by_serials.assert_called_once_with(["SN-001"])
+    serial_repo.create_many.assert_called_once()
+    (created,) = serial_repo.create_many.call_args[0][0]
     assert created.product_id == 5
     assert created.serial_number == "SN-001"
     assert created.status == SerialStatus.AVAILABLE
@@ -145,8 +145,8 @@ def test_associates_lot_id_when_lot_number_provided(mock_create_scope):
     )
 
     serial_repo = MagicMock()
-    serial_repo.first.return_value = None
-    serial_repo.create.return_value = serial
+    serial_repo.find_by_serials.return_value = []
+    serial_repo.create_many.return_value = [serial]
 
     lot_repo = MagicMock()
     lot_repo.first.return_value = lot
@@ -160,7 +160,7 @@ def test_associates_lot_id_when_lot_number_provided(mock_create_scope):
 
     handle_purchase_order_received_serials(event)
 
-    created = serial_repo.create.call_args[0][0]
+    (created,) = serial_repo.create_many.call_args[0][0]
     assert created.lot_id == 3
 
 
@@ -186,7 +186,8 @@ def test_skips_duplicate_serial_numbers(mock_create_scope):
     )
 
     serial_repo = MagicMock()
-    serial_repo.first.return_value = existing_serial
+    serial_repo.find_by_serials.return_value = [existing_serial]
+    serial_repo.create_many.return_value = []
 
     lot_repo = MagicMock()
     lot_repo.first.return_value = None
@@ -200,7 +201,7 @@ def test_skips_duplicate_serial_numbers(mock_create_scope):
 
     handle_purchase_order_received_serials(event)
 
-    serial_repo.create.assert_not_called()
+    serial_repo.create_many.assert_called_once_with([])
 
 
 @patch("src.inventory.serial.infra.event_handlers.create_sync_scope")
@@ -225,7 +226,8 @@ def test_logs_error_when_serial_exists_for_different_product(mock_create_scope):
     )
 
     serial_repo = MagicMock()
-    serial_repo.first.return_value = existing_serial
+    serial_repo.find_by_serials.return_value = [existing_serial]
+    serial_repo.create_many.return_value = []
 
     lot_repo = MagicMock()
     lot_repo.first.return_value = None
@@ -239,4 +241,53 @@ def test_logs_error_when_serial_exists_for_different_product(mock_create_scope):
 
     handle_purchase_order_received_serials(event)
 
-    serial_repo.create.assert_not_called()
+    serial_repo.create_many.assert_called_once_with([])
+
+
+@patch("src.inventory.serial.infra.event_handlers.create_sync_scope")
+def test_creates_all_serials_in_one_batch(mock_create_scope):
+    """Looks up and creates every serial of the event with a single call each."""
+    from src.inventory.serial.infra import event_handlers  # noqa: F401
+
+    event = _make_event(
+        items=[
+            {
+                "product_id": 5,
+                "quantity": 2,
+                "location_id": None,
+                "lot_number": None,
+                "serial_numbers": ["SN-001", "SN-002"],
+                "purchase_order_id": 1,
+            },
+            {
+                "product_id": 6,
+                "quantity": 2,
+                "location_id": None,
+                "lot_number": None,
+                "serial_numbers": ["SN-003", "SN-001"],
+                "purchase_order_id": 1,
+            },
+        ]
+    )
+
+    serial_repo = MagicMock()
+    serial_repo.find_by_serials.return_value = []
+    serial_repo.create_many.side_effect = lambda serials: serials
+
+    lot_repo = MagicMock()
+
+    mock_scope = _make_scope(serial_repo, lot_repo)
+    mock_create_scope.return_value.__enter__.return_value = mock_scope
+
+    from src.inventory.serial.infra.event_handlers import (
+        handle_purchase_order_received_serials,
+    )
+
+    handle_purchase_order_received_serials(event)
+
+    serial_repo.find_by_serials.assert_called_once_with(
+        ["SN-001", "SN-002", "SN-003", "SN-001"]
+    )
+    serial_repo.first.assert_not_called()
+    created = serial_repo.create_many.call_args[0][0]
+    assert [s.serial_number for s in created] == ["SN-001", "SN-002", "SN-003"]
@@ -11,6 +11,7 @@ from src.inventory.serial.app.queries.serial import (
     GetSerialsQueryHandler,
 )
 from src.inventory.serial.domain.entities import SerialNumber, SerialStatus
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -44,7 +45,13 @@ def test_get_serials_by_product():
 
     result = handler.handle(GetSerialsQuery(product_id=5))
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, product_id=5)
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        product_id=5,
+    )
     assert len(result["items"]) == 2
     assert result["total"] == 2
 
@@ -63,7 +70,12 @@ def test_get_serials_with_status_filter():
     result = handler.handle(GetSerialsQuery(product_id=5, status="available"))
 
     repo.paginate.assert_called_once_with(
-        limit=None, offset=None, product_id=5, status="available"
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        product_id=5,
+        status="available",
     )
     assert len(result["items"]) == 1
     assert result["total"] == 1
@@ -83,7 +95,9 @@ def test_get_serials_without_filters():
 
     result = handler.handle(GetSerialsQuery())
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None)
+    repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
     assert len(result["items"]) == 2
     assert result["total"] == 2
 
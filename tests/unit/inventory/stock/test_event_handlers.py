@@ -5,11 +5,14 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.inventory.movement.domain.constants import MovementType
-from src.inventory.movement.domain.events import MovementCreated
+from src.inventory.movement.domain.events import MovementCreated, MovementsCreated
 from src.inventory.stock.domain.entities import Stock
 from src.inventory.stock.domain.events import StockCreated, StockUpdated
 from src.inventory.stock.domain.exceptions import InsufficientStockError
-from src.inventory.stock.infra.event_handlers import handle_movement_created
+from src.inventory.stock.infra.event_handlers import (
+    handle_movement_created,
+    handle_movements_created,
+)
 from src.shared.infra.events.event_bus import EventBus
 
 
@@ -25,10 +28,8 @@ def clear_event_bus():
 def test_handle_movement_created_creates_new_stock(mock_create_scope):
     """Test that MovementCreated event creates new stock when none exists"""
     mock_repo = Mock()
-    mock_repo.first.return_value = None
-
     new_stock = Stock(id=1, product_id=10, quantity=5)
-    mock_repo.create.return_value = new_stock
+    mock_repo.apply_delta.return_value = (new_stock, True)
 
     mock_scope = Mock()
     mock_scope.get.return_value = mock_repo
@@ -51,12 +52,9 @@ def test_handle_movement_created_creates_new_stock(mock_create_scope):
 
     handle_movement_created(event)
 
-    mock_repo.first.assert_called_once_with(product_id=10, location_id=None)
-    mock_repo.create.assert_called_once()
-
-    created_stock = mock_repo.create.call_args[0][0]
-    assert created_stock.product_id == 10
-    assert created_stock.quantity == 5
+    mock_repo.apply_delta.assert_called_once_with(10, None, 5)
+    mock_repo.first.assert_not_called()
+    mock_repo.update.assert_not_called()
 
     assert len(events_received) == 1
     stock_event = events_received[0]
@@ -69,12 +67,9 @@ def test_handle_movement_created_creates_new_stock(mock_create_scope):
 @patch("src.inventory.stock.infra.event_handlers.create_sync_scope")
 def test_handle_movement_created_updates_existing_stock(mock_create_scope):
     """Test that MovementCreated event updates existing stock"""
-    existing_stock = Stock(id=1, product_id=10, quantity=100)
     mock_repo = Mock()
-    mock_repo.first.return_value = existing_stock
-
     updated_stock = Stock(id=1, product_id=10, quantity=105)
-    mock_repo.update.return_value = updated_stock
+    mock_repo.apply_delta.return_value = (updated_stock, False)
 
     mock_scope = Mock()
     mock_scope.get.return_value = mock_repo
@@ -96,11 +91,8 @@ def test_handle_movement_created_updates_existing_stock(mock_create_scope):
 
     handle_movement_created(event)
 
-    mock_repo.first.assert_called_once_with(product_id=10, location_id=None)
-    mock_repo.update.assert_called_once()
-
-    updated = mock_repo.update.call_args[0][0]
-    assert updated.quantity == 105
+    mock_repo.apply_delta.assert_called_once_with(10, None, 5)
+    mock_repo.update.assert_not_called()
 
     assert len(events_received) == 1
     stock_event = events_received[0]
@@ -114,12 +106,9 @@ def test_handle_movement_created_updates_existing_stock(mock_create_scope):
 @patch("src.inventory.stock.infra.event_handlers.create_sync_scope")
 def test_handle_movement_created_decreases_stock_on_out(mock_create_scope):
     """Test that OUT movement decreases stock"""
-    existing_stock = Stock(id=1, product_id=10, quantity=100)
     mock_repo = Mock()
-    mock_repo.first.return_value = existing_stock
-
     updated_stock = Stock(id=1, product_id=10, quantity=95)
-    mock_repo.update.return_value = updated_stock
+    mock_repo.apply_delta.return_value = (updated_stock, False)
 
     mock_scope = Mock()
     mock_scope.get.return_value = mock_repo
@@ -134,19 +123,14 @@ def test_handle_movement_created_decreases_stock_on_out(mock_create_scope):
 
     handle_movement_created(event)
 
-    mock_repo.first.assert_called_once_with(product_id=10, location_id=None)
-    mock_repo.update.assert_called_once()
-
-    updated = mock_repo.update.call_args[0][0]
-    assert updated.quantity == 95
+    mock_repo.apply_delta.assert_called_once_with(10, None, -5)
 
 
 @patch("src.inventory.stock.infra.event_handlers.create_sync_scope")
 def test_handle_movement_created_insufficient_stock_raises(mock_create_scope):
     """Test that insufficient stock raises exception"""
-    existing_stock = Stock(id=1, product_id=10, quantity=3)
     mock_repo = Mock()
-    mock_repo.first.return_value = existing_stock
+    mock_repo.apply_delta.side_effect = InsufficientStockError(10, -5)
 
     mock_scope = Mock()
     mock_scope.get.return_value = mock_repo
@@ -163,17 +147,14 @@ def test_handle_movement_created_insufficient_stock_raises(mock_create_scope):
         handle_movement_created(event)
 
     assert exc_info.value.data["product_id"] == 10
-    mock_repo.update.assert_not_called()
 
 
 @patch("src.inventory.stock.infra.event_handlers.create_sync_scope")
 def test_handle_movement_created_publishes_stock_created_event(mock_create_scope):
     """Test that StockCreated event is published when creating new stock"""
     mock_repo = Mock()
-    mock_repo.first.return_value = None
-
     new_stock = Stock(id=1, product_id=10, quantity=5)
-    mock_repo.create.return_value = new_stock
+    mock_repo.apply_delta.return_value = (new_stock, True)
 
     mock_scope = Mock()
     mock_scope.get.return_value = mock_repo
@@ -206,12 +187,9 @@ def test_handle_movement_created_publishes_stock_created_event(mock_create_scope
 @patch("src.inventory.stock.infra.event_handlers.create_sync_scope")
 def test_handle_movement_created_publishes_stock_updated_event(mock_create_scope):
     """Test that StockUpdated event is published when updating stock"""
-    existing_stock = Stock(id=1, product_id=10, quantity=100)
     mock_repo = Mock()
-    mock_repo.first.return_value = existing_stock
-
     updated_stock = Stock(id=1, product_id=10, quantity=105)
-    mock_repo.update.return_value = updated_stock
+    mock_repo.apply_delta.return_value = (updated_stock, False)
 
     mock_scope = Mock()
     mock_scope.get.return_value = mock_repo
@@ -245,10 +223,8 @@ def test_handle_movement_created_publishes_stock_updated_event(mock_create_scope
 def test_handle_movement_created_with_location(mock_create_scope):
     """Test creating stock with location_id"""
     mock_repo = Mock()
-    mock_repo.first.return_value = None
-
     new_stock = Stock(id=1, product_id=10, quantity=5, location_id=42)
-    mock_repo.create.return_value = new_stock
+    mock_repo.apply_delta.return_value = (new_stock, True)
 
     mock_scope = Mock()
     mock_scope.get.return_value = mock_repo
@@ -259,10 +235,42 @@ def test_handle_movement_created_with_location(mock_create_scope):
         product_id=10,
         quantity=5,
         type=MovementType.IN.value,
+        location_id=42,
     )
 
     handle_movement_created(event)
 
-    created_stock = mock_repo.create.call_args[0][0]
-    assert created_stock.product_id == 10
-    assert created_stock.quantity == 5
+    mock_repo.apply_delta.assert_called_once_with(10, 42, 5)
+
+
+@patch("src.inventory.stock.infra.event_handlers.create_sync_scope")
+def test_handle_movements_created_aggregates_deltas(mock_create_scope):
+    """Lines of the same (product, location) collapse into one delta"""
+    mock_repo = Mock()
+    mock_repo.apply_deltas.return_value = [
+        (Stock(id=1, product_id=10, quantity=2), False),
+        (Stock(id=2, product_id=11, quantity=4, location_id=3), True),
+    ]
+    mock_scope = Mock()
+    mock_scope.get.return_value = mock_repo
+    mock_create_scope.return_value.__enter__.return_value = mock_scope
+
+    events_received = []
+    EventBus.subscribe(StockUpdated, events_received.append)
+    EventBus.subscribe(StockCreated, events_received.append)
+
+    handle_movements_created(
+        MovementsCreated(
+            aggregate_id=1,
+            movements=[
+                {"product_id": 10, "quantity": -3, "location_id": None},
+                {"product_id": 11, "quantity": 4, "location_id": 3},
+                {"product_id": 10, "quantity": -5, "location_id": None},
+            ],
+        )
+    )
+
+    mock_repo.apply_deltas.assert_called_once_with({(10, None): -8, (11, 3): 4})
+    updated, created = events_received
+    assert (updated.old_quantity, updated.new_quantity) == (10, 2)
+    assert created.quantity == 4
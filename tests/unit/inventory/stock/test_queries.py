@@ -13,6 +13,7 @@ from src.inventory.stock.app.queries import (
     GetStockByProductQueryHandler,
 )
 from src.inventory.stock.domain.entities import Stock
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -47,7 +48,9 @@ def test_get_all_stocks_query_handler(mock_stock_repo):
     assert result["items"][1]["id"] == 2
     assert result["items"][1]["quantity"] == 50
     assert result["total"] == 2
-    mock_stock_repo.paginate.assert_called_once_with(limit=None, offset=None)
+    mock_stock_repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_all_stocks_with_product_filter(mock_stock_repo):
@@ -72,7 +75,11 @@ def test_get_all_stocks_with_product_filter(mock_stock_repo):
     assert result["items"][0]["quantity"] == 100
     assert result["total"] == 1
     mock_stock_repo.paginate.assert_called_once_with(
-        limit=None, offset=None, product_id=1
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        product_id=1,
     )
 
 
@@ -92,7 +99,9 @@ def test_get_all_stocks_empty(mock_stock_repo):
 
     assert len(result["items"]) == 0
     assert result["total"] == 0
-    mock_stock_repo.paginate.assert_called_once_with(limit=None, offset=None)
+    mock_stock_repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_all_stocks_with_pagination(mock_stock_repo):
@@ -115,7 +124,9 @@ def test_get_all_stocks_with_pagination(mock_stock_repo):
 
     assert len(result["items"]) == 2
     assert result["total"] == 2
-    mock_stock_repo.paginate.assert_called_once_with(limit=10, offset=5)
+    mock_stock_repo.paginate.assert_called_once_with(
+        limit=10, offset=5, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_stock_by_id_handler(mock_stock_repo):
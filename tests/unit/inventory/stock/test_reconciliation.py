@@ -0,0 +1,154 @@
+"""Unit tests for the stock reconciliation against the movements ledger"""
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from src.inventory.movement.domain.constants import MovementType
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.stock.app.commands import (
+    ReconcileStockCommand,
+    ReconcileStockCommandHandler,
+)
+from src.inventory.stock.app.reconciliation import StockDrift
+from src.inventory.stock.infra.models import StockModel
+from src.inventory.stock.infra.reconciliation import (
+    SqlAlchemyStockLedger,
+    reconcile_in_parallel,
+    reconcile_range,
+)
+from src.shared.infra.database import Base
+
+
+def _movement(product_id: int, location_id: int | None, quantity: int) -> dict:
+    type = MovementType.IN if quantity > 0 else MovementType.OUT
+    return {
+        "product_id": product_id,
+        "location_id": location_id,
+        "quantity": quantity,
+        "type": type,
+    }
+
+
+def _stock(product_id: int, location_id: int | None, quantity: int) -> dict:
+    return {
+        "product_id": product_id,
+        "location_id": location_id,
+        "quantity": quantity,
+        "reserved_quantity": 0,
+    }
+
+
+def _seed(session: Session) -> None:
+    session.execute(
+        insert(MovementModel),
+        [
+            _movement(1, 1, 10),
+            _movement(1, 1, -3),
+            _movement(2, None, 4),
+            _movement(3, 2, 6),
+        ],
+    )
+    session.execute(
+        insert(StockModel),
+        [
+            _stock(1, 1, 7),  # Matches its movements
+            _stock(2, None, 9),  # Drifted
+            _stock(4, 1, 2),  # No movements at all
+        ],
+    )
+    # Product 3 has movements but lost its stock row
+
+
+def _quantities(session: Session) -> dict:
+    rows = session.execute(
+        select(StockModel.product_id, StockModel.location_id, StockModel.quantity)
+    )
+    return {
+        (product_id, location_id): quantity
+        for product_id, location_id, quantity in rows
+    }
+
+
+def test_reports_drift_without_touching_stocks(db_session):
+    _seed(db_session)
+
+    report = SqlAlchemyStockLedger(db_session).reconcile()
+
+    assert report.movements_scanned == 4
+    assert report.keys_checked == 4
+    assert report.drifts == [
+        StockDrift(product_id=2, location_id=None, expected=4, actual=9),
+        StockDrift(product_id=3, location_id=2, expected=6, actual=None),
+        StockDrift(product_id=4, location_id=1, expected=0, actual=2),
+    ]
+    assert report.repaired == 0
+    assert _quantities(db_session)[(2, None)] == 9
+
+
+def test_repair_rewrites_stocks_from_movements(db_session):
+    _seed(db_session)
+
+    report = SqlAlchemyStockLedger(db_session).reconcile(repair=True)
+
+    assert report.repaired == 3
+    assert _quantities(db_session) == {(1, 1): 7, (2, None): 4, (3, 2): 6, (4, 1): 0}
+    assert SqlAlchemyStockLedger(db_session).reconcile().drift_count == 0
+
+
+def test_product_range_limits_the_check(db_session):
+    _seed(db_session)
+
+    report = SqlAlchemyStockLedger(db_session).reconcile(
+        product_id_from=3, product_id_to=3
+    )
+
+    assert [d.product_id for d in report.drifts] == [3]
+
+
+def test_chunks_cover_the_whole_range(db_session):
+    _seed(db_session)
+
+    report = reconcile_range(db_session, 1, 4, chunk_size=1)
+
+    assert report.movements_scanned == 4
+    assert report.drift_count == 3
+
+
+def test_command_returns_report_with_throughput(db_session):
+    _seed(db_session)
+    handler = ReconcileStockCommandHandler(SqlAlchemyStockLedger(db_session))
+
+    result = handler.handle(ReconcileStockCommand())
+
+    assert result["drift_count"] == 3
+    assert result["movements_per_second"] >= 0
+
+
+def test_parallel_reconciliation_repairs_every_range(db_session, tmp_path):
+    url = f"sqlite:///{tmp_path / 'ledger.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        _seed(session)
+        session.commit()
+
+    report = reconcile_in_parallel(url, workers=2, repair=True, chunk_size=1)
+
+    assert report.drift_count == 3
+    assert report.repaired == 3
+    with Session(engine) as session:
+        assert _quantities(session)[(3, 2)] == 6
+    engine.dispose()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_reconciliation_of_empty_tables(db_session, tmp_path, workers):
+    url = f"sqlite:///{tmp_path / 'empty.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    report = reconcile_in_parallel(url, workers=workers)
+
+    assert report.keys_checked == 0
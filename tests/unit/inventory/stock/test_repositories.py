@@ -0,0 +1,156 @@
+"""Unit tests for SqlAlchemyStockRepository.apply_delta(s) against in-memory SQLite"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.inventory.stock.domain.exceptions import InsufficientStockError
+from src.inventory.stock.infra.mappers import StockMapper
+from src.inventory.stock.infra.models import StockModel
+from src.inventory.stock.infra.repositories import SqlAlchemyStockRepository
+
+
+@pytest.fixture
+def session(db_session):
+    return db_session
+
+
+@pytest.fixture
+def repo(session):
+    return SqlAlchemyStockRepository(session, StockMapper())
+
+
+@pytest.fixture
+def sessions(db_session, tmp_path):
+    """Two sessions on one SQLite file, like two concurrent requests."""
+    # db_session has imported every model, so create_all builds the schema
+    engine = create_engine(f"sqlite:///{tmp_path / 'stocks.db'}")
+    StockModel.metadata.create_all(engine)
+    with Session(engine) as first, Session(engine) as second:
+        yield first, second
+    engine.dispose()
+
+
+def _rows(session) -> list[tuple]:
+    return session.execute(
+        select(
+            StockModel.product_id, StockModel.location_id, StockModel.quantity
+        ).order_by(StockModel.product_id)
+    ).all()
+
+
+def test_apply_delta_creates_missing_row(repo, session):
+    stock, created = repo.apply_delta(10, None, 5)
+
+    assert created is True
+    assert stock.id is not None
+    assert stock.quantity == 5
+    assert session.query(StockModel).count() == 1
+
+
+def test_apply_delta_updates_existing_row(repo):
+    repo.apply_delta(10, 3, 5)
+
+    stock, created = repo.apply_delta(10, 3, -2)
+
+    assert created is False
+    assert stock.quantity == 3
+    assert stock.location_id == 3
+
+
+def test_apply_delta_keeps_locations_apart(repo):
+    repo.apply_delta(10, None, 5)
+    stock, created = repo.apply_delta(10, 7, 4)
+
+    assert created is True
+    assert stock.quantity == 4
+
+
+def test_apply_delta_refreshes_loaded_rows(repo, session):
+    repo.apply_delta(10, None, 5)
+    loaded = session.query(StockModel).one()
+
+    repo.apply_delta(10, None, 3)
+
+    assert loaded.quantity == 8
+
+
+def test_apply_delta_rejects_negative_result(repo, session):
+    repo.apply_delta(10, None, 3)
+
+    with pytest.raises(InsufficientStockError):
+        repo.apply_delta(10, None, -5)
+
+    assert session.query(StockModel.quantity).scalar() == 3
+
+
+def test_apply_delta_rejects_negative_on_missing_row(repo, session):
+    with pytest.raises(InsufficientStockError):
+        repo.apply_delta(10, None, -1)
+
+    assert session.query(StockModel).count() == 0
+
+
+def test_apply_deltas_updates_and_creates_in_order(repo, session):
+    repo.apply_delta(10, None, 5)
+    repo.apply_delta(11, 3, 8)
+
+    results = repo.apply_deltas({(11, 3): -2, (12, None): 4, (10, None): 1})
+
+    assert [(s.product_id, s.quantity, created) for s, created in results] == [
+        (11, 6, False),
+        (12, 4, True),
+        (10, 6, False),
+    ]
+    assert session.query(StockModel).count() == 3
+
+
+def test_apply_deltas_rejects_negative_result(repo, session):
+    repo.apply_delta(10, None, 5)
+
+    with pytest.raises(InsufficientStockError):
+        repo.apply_deltas({(10, None): -6})
+
+
+def test_apply_deltas_rejects_negative_on_missing_row(repo):
+    with pytest.raises(InsufficientStockError):
+        repo.apply_deltas({(10, None): -1})
+
+
+def test_one_row_per_product_without_location(session):
+    session.execute(insert(StockModel), {"product_id": 10, "quantity": 1})
+
+    with pytest.raises(IntegrityError):
+        session.execute(insert(StockModel), {"product_id": 10, "quantity": 2})
+
+
+def test_concurrent_first_movements_without_location_share_a_row(sessions):
+    first, second = sessions
+    first_repo = SqlAlchemyStockRepository(first, StockMapper())
+    # The first request's guarded UPDATE ran before the second one committed
+    first_repo._increment = MagicMock(return_value=None)
+
+    SqlAlchemyStockRepository(second, StockMapper()).apply_delta(10, None, 3)
+    second.commit()
+    stock, _ = first_repo.apply_delta(10, None, 5)
+    first.commit()
+
+    assert stock.quantity == 8
+    assert _rows(second) == [(10, None, 8)]
+
+
+def test_concurrent_batches_without_location_share_rows(sessions):
+    first, second = sessions
+    first_repo = SqlAlchemyStockRepository(first, StockMapper())
+    first_repo._increment_many = MagicMock(return_value=[])
+
+    SqlAlchemyStockRepository(second, StockMapper()).apply_deltas({(10, None): 3})
+    second.commit()
+    results = first_repo.apply_deltas({(10, None): 5, (11, 4): 1, (12, None): 2})
+    first.commit()
+
+    assert [stock.quantity for stock, _ in results] == [8, 1, 2]
+    assert _rows(second) == [(10, None, 8), (11, 4, 1), (12, None, 2)]
@@ -0,0 +1,156 @@
+"""Unit tests for the daily stock snapshots"""
+
+from datetime import date, datetime
+
+from sqlalchemy import func, insert, select
+
+from src.catalog.product.infra.models import ProductModel
+from src.inventory.location.infra.models import LocationModel
+from src.inventory.movement.domain.constants import MovementType
+from src.inventory.movement.domain.entities import Movement
+from src.inventory.movement.infra.mappers import MovementMapper
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.movement.infra.repositories import SqlAlchemyMovementRepository
+from src.inventory.stock.infra.models import StockDailySnapshotModel
+from src.inventory.stock.infra.snapshots import (
+    append_snapshots,
+    build_snapshot,
+    build_snapshots,
+    stock_entries_as_of,
+)
+
+
+def _movement(product_id: int, location_id: int | None, quantity: int, when):
+    type = MovementType.IN if quantity > 0 else MovementType.OUT
+    return {
+        "product_id": product_id,
+        "location_id": location_id,
+        "quantity": quantity,
+        "type": type,
+        "date": when,
+    }
+
+
+def _seed(session) -> None:
+    session.execute(
+        insert(MovementModel),
+        [
+            _movement(1, 1, 10, datetime(2026, 3, 1, 8)),
+            _movement(1, 1, -10, datetime(2026, 3, 2, 23, 59)),
+            _movement(2, None, 5, datetime(2026, 3, 2, 9)),
+            _movement(2, None, -1, datetime(2026, 3, 4, 9)),
+        ],
+    )
+
+
+def _snapshot(session, day: date) -> dict:
+    rows = session.execute(
+        select(
+            StockDailySnapshotModel.product_id,
+            StockDailySnapshotModel.location_id,
+            StockDailySnapshotModel.quantity,
+        ).where(StockDailySnapshotModel.day == day)
+    )
+    return {(p, loc): q for p, loc, q in rows}
+
+
+def _as_of(session, day: date) -> dict:
+    entries = stock_entries_as_of(session, day)
+    rows = session.execute(
+        select(
+            entries.c.product_id, entries.c.location_id, func.sum(entries.c.quantity)
+        ).group_by(entries.c.product_id, entries.c.location_id)
+    )
+    return {(p, loc): q for p, loc, q in rows if q}
+
+
+def test_build_snapshot_omits_zero_balances(db_session):
+    _seed(db_session)
+
+    rows = build_snapshot(db_session, date(2026, 3, 2))
+
+    assert rows == 1
+    assert _snapshot(db_session, date(2026, 3, 2)) == {(2, None): 5}
+
+
+def test_rebuilding_a_day_replaces_its_rows(db_session):
+    _seed(db_session)
+    build_snapshot(db_session, date(2026, 3, 1))
+    db_session.execute(
+        insert(MovementModel), [_movement(3, 2, 4, datetime(2026, 3, 1, 12))]
+    )
+
+    build_snapshot(db_session, date(2026, 3, 1))
+
+    assert _snapshot(db_session, date(2026, 3, 1)) == {(1, 1): 10, (3, 2): 4}
+
+
+def test_as_of_is_the_same_with_and_without_snapshots(db_session):
+    _seed(db_session)
+    days = [date(2026, 3, d) for d in range(1, 6)]
+    expected = {day: _as_of(db_session, day) for day in days}
+
+    build_snapshots(db_session, date(2026, 3, 1), date(2026, 3, 3))
+
+    assert {day: _as_of(db_session, day) for day in days} == expected
+    assert expected[date(2026, 3, 4)] == {(2, None): 4}
+
+
+def test_append_builds_missing_days_up_to_yesterday(db_session):
+    _seed(db_session)
+
+    assert append_snapshots(db_session, today=date(2026, 3, 3)) == 2
+    assert append_snapshots(db_session, today=date(2026, 3, 3)) == 0
+    assert append_snapshots(db_session, today=date(2026, 3, 5)) == 2
+    days = db_session.execute(
+        select(StockDailySnapshotModel.day).distinct().order_by("day")
+    ).scalars()
+    assert list(days) == [date(2026, 3, d) for d in (1, 2, 3, 4)]
+
+
+def test_append_without_movements_builds_nothing(db_session):
+    assert append_snapshots(db_session, today=date(2026, 3, 3)) == 0
+
+
+def test_backdated_movements_reach_the_snapshots_after_their_day(db_session):
+    db_session.add_all(
+        [
+            ProductModel(id=1, name="Product A", sku="SKU-001"),
+            ProductModel(id=2, name="Product B", sku="SKU-002"),
+            ProductModel(id=3, name="Product C", sku="SKU-003"),
+            LocationModel(id=1, warehouse_id=7, name="Main", code="A-1"),
+        ]
+    )
+    db_session.flush()
+    _seed(db_session)
+    build_snapshots(db_session, date(2026, 3, 1), date(2026, 3, 4))
+    repo = SqlAlchemyMovementRepository(db_session, MovementMapper())
+
+    repo.create_many(
+        [
+            Movement(
+                product_id=product_id,
+                location_id=location_id,
+                quantity=quantity,
+                type=MovementType.IN if quantity > 0 else MovementType.OUT,
+                date=when,
+            )
+            for product_id, location_id, quantity, when in [
+                (1, 1, 4, datetime(2026, 3, 2, 10)),
+                (2, None, -4, datetime(2026, 3, 3, 10)),
+                (3, None, 2, datetime(2026, 3, 4, 10)),
+                (3, 1, 6, datetime(2026, 3, 5, 10)),
+            ]
+        ]
+    )
+
+    days = [date(2026, 3, d) for d in range(1, 6)]
+    snapshots = {day: _snapshot(db_session, day) for day in days}
+    as_of = {day: _as_of(db_session, day) for day in days}
+    assert snapshots[date(2026, 3, 3)] == {(1, 1): 4, (2, None): 1}
+    assert snapshots[date(2026, 3, 4)] == {(1, 1): 4, (3, None): 2}
+    assert as_of[date(2026, 3, 5)] == {(1, 1): 4, (3, None): 2, (3, 1): 6}
+    # Same result as rebuilding the days from the movements
+    build_snapshots(db_session, date(2026, 3, 1), date(2026, 3, 4))
+    assert {day: _snapshot(db_session, day) for day in days} == snapshots
+    assert {day: _as_of(db_session, day) for day in days} == as_of
@@ -329,10 +329,11 @@ def test_receive_transfer_creates_movements_and_releases_reservation():
     updated_stock = stock_repo.update.call_args[0][0]
     assert updated_stock.reserved_quantity == 0  # 10 - 10
 
-    # Two movements created: OUT from source, IN to destination
-    assert movement_handler.handle.call_count == 2
-    out_call = movement_handler.handle.call_args_list[0][0][0]
-    in_call = movement_handler.handle.call_args_list[1][0][0]
+    # Two movements created in one batch: OUT from source, IN to destination
+    movement_handler.handle.assert_called_once()
+    batch = movement_handler.handle.call_args[0][0]
+    assert batch.reference_type == "transfer"
+    out_call, in_call = batch.movements
     assert out_call.type == "OUT"
     assert out_call.location_id == 10  # source
     assert in_call.type == "IN"
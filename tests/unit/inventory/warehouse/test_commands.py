@@ -17,6 +17,7 @@ from src.inventory.warehouse.app.commands.update import (
     UpdateWarehouseCommandHandler,
 )
 from src.inventory.warehouse.domain.entities import Warehouse
+from src.inventory.warehouse.domain.events import WarehouseCreated, WarehouseDeleted
 from src.shared.domain.exceptions import NotFoundError
 
 # --- Helpers ---
@@ -55,7 +56,7 @@ def _mock_repo(warehouse=None):
 def test_create_warehouse_returns_dict_with_correct_fields():
     warehouse = _make_warehouse()
     repo = _mock_repo(warehouse=warehouse)
-    handler = CreateWarehouseCommandHandler(repo)
+    handler = CreateWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(
         CreateWarehouseCommand(
@@ -76,7 +77,7 @@ def test_create_warehouse_returns_dict_with_correct_fields():
 
 def test_create_warehouse_calls_repo_create():
     repo = _mock_repo(warehouse=_make_warehouse())
-    handler = CreateWarehouseCommandHandler(repo)
+    handler = CreateWarehouseCommandHandler(repo, Mock())
 
     handler.handle(CreateWarehouseCommand(name="Depot", code="DP-01"))
 
@@ -86,12 +87,25 @@ def test_create_warehouse_calls_repo_create():
     assert created.code == "DP-01"
 
 
+def test_create_warehouse_publishes_warehouse_created():
+    repo = _mock_repo(warehouse=_make_warehouse())
+    event_publisher = Mock()
+    handler = CreateWarehouseCommandHandler(repo, event_publisher)
+
+    handler.handle(CreateWarehouseCommand(name="Main Warehouse", code="WH-01"))
+
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, WarehouseCreated)
+    assert event.warehouse_id == 1
+    assert event.code == "WH-01"
+
+
 def test_create_warehouse_minimal_fields():
     warehouse = _make_warehouse(
         address=None, city=None, country=None, manager=None, phone=None, email=None
     )
     repo = _mock_repo(warehouse=warehouse)
-    handler = CreateWarehouseCommandHandler(repo)
+    handler = CreateWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(CreateWarehouseCommand(name="Simple", code="SP-01"))
 
@@ -103,7 +117,7 @@ def test_create_warehouse_minimal_fields():
 def test_create_warehouse_default_warehouse():
     warehouse = _make_warehouse(is_default=True)
     repo = _mock_repo(warehouse=warehouse)
-    handler = CreateWarehouseCommandHandler(repo)
+    handler = CreateWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(
         CreateWarehouseCommand(name="Default WH", code="DWH-01", is_default=True)
@@ -117,7 +131,7 @@ def test_create_warehouse_default_warehouse():
 def test_create_warehouse_inactive():
     warehouse = _make_warehouse(is_active=False)
     repo = _mock_repo(warehouse=warehouse)
-    handler = CreateWarehouseCommandHandler(repo)
+    handler = CreateWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(
         CreateWarehouseCommand(name="Closed WH", code="CWH-01", is_active=False)
@@ -135,7 +149,7 @@ def test_update_warehouse_returns_updated_dict():
     repo = Mock()
     repo.get_by_id.return_value = existing
     repo.update.return_value = updated
-    handler = UpdateWarehouseCommandHandler(repo)
+    handler = UpdateWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(
         UpdateWarehouseCommand(warehouse_id=1, name="New Name", code="NEW-01")
@@ -149,7 +163,7 @@ def test_update_warehouse_returns_updated_dict():
 def test_update_warehouse_not_found_raises():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = UpdateWarehouseCommandHandler(repo)
+    handler = UpdateWarehouseCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(UpdateWarehouseCommand(warehouse_id=999, name="X", code="X-01"))
@@ -158,7 +172,7 @@ def test_update_warehouse_not_found_raises():
 def test_update_warehouse_not_found_does_not_call_update():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = UpdateWarehouseCommandHandler(repo)
+    handler = UpdateWarehouseCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(UpdateWarehouseCommand(warehouse_id=999, name="X", code="X-01"))
@@ -172,7 +186,7 @@ def test_update_warehouse_deactivate():
     repo = Mock()
     repo.get_by_id.return_value = existing
     repo.update.return_value = deactivated
-    handler = UpdateWarehouseCommandHandler(repo)
+    handler = UpdateWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(
         UpdateWarehouseCommand(
@@ -191,7 +205,7 @@ def test_update_warehouse_change_manager():
     repo = Mock()
     repo.get_by_id.return_value = existing
     repo.update.return_value = updated
-    handler = UpdateWarehouseCommandHandler(repo)
+    handler = UpdateWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(
         UpdateWarehouseCommand(
@@ -207,7 +221,7 @@ def test_update_warehouse_change_manager():
 
 def test_delete_warehouse_calls_repo_delete():
     repo = _mock_repo(warehouse=_make_warehouse())
-    handler = DeleteWarehouseCommandHandler(repo)
+    handler = DeleteWarehouseCommandHandler(repo, Mock())
 
     result = handler.handle(DeleteWarehouseCommand(warehouse_id=1))
 
@@ -215,10 +229,22 @@ def test_delete_warehouse_calls_repo_delete():
     repo.delete.assert_called_once_with(1)
 
 
+def test_delete_warehouse_publishes_warehouse_deleted():
+    repo = _mock_repo(warehouse=_make_warehouse())
+    event_publisher = Mock()
+    handler = DeleteWarehouseCommandHandler(repo, event_publisher)
+
+    handler.handle(DeleteWarehouseCommand(warehouse_id=1))
+
+    event = event_publisher.publish.call_args[0][0]
+    assert isinstance(event, WarehouseDeleted)
+    assert event.warehouse_id == 1
+
+
 def test_delete_warehouse_not_found_raises():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = DeleteWarehouseCommandHandler(repo)
+    handler = DeleteWarehouseCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(DeleteWarehouseCommand(warehouse_id=999))
@@ -227,7 +253,7 @@ def test_delete_warehouse_not_found_raises():
 def test_delete_warehouse_not_found_does_not_delete():
     repo = Mock()
     repo.get_by_id.return_value = None
-    handler = DeleteWarehouseCommandHandler(repo)
+    handler = DeleteWarehouseCommandHandler(repo, Mock())
 
     with pytest.raises(NotFoundError):
         handler.handle(DeleteWarehouseCommand(warehouse_id=999))
@@ -259,9 +259,7 @@ class TestProcessRefund:
         refund_payment_repo.create.side_effect = lambda p: p
         movement_repo = MagicMock()
         stock_repo = MagicMock()
-        stock = MagicMock()
-        stock.update_quantity.return_value = stock
-        stock_repo.first.return_value = stock
+        stock_repo.first.return_value = MagicMock()
         event_publisher = MagicMock()
 
         handler = ProcessRefundCommandHandler(
@@ -293,7 +291,12 @@ class TestProcessRefund:
         assert "payments" in result
         movement_repo.create.assert_called_once()
         stock_repo.first.assert_called_once()
-        stock_repo.update.assert_called_once()
+        stock_repo.apply_delta.assert_called_once_with(
+            items[0].product_id,
+            stock_repo.first.return_value.location_id,
+            abs(items[0].quantity),
+        )
+        stock_repo.update.assert_not_called()
         event_publisher.publish.assert_called_once()
 
     def test_refund_not_found(self):
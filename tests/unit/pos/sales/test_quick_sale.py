@@ -43,6 +43,7 @@ def _mock_repo(entity=None, entities=None):
     repo = MagicMock()
     if entity is not None:
         repo.create.return_value = entity
+        repo.create_many.return_value = [entity]
         repo.update.return_value = entity
         repo.get_by_id.return_value = entity
         repo.first.return_value = entity
@@ -166,9 +167,9 @@ class TestQuickSaleHappyPath:
         assert "items" in result
         assert "payments" in result
         sale_repo.create.assert_called_once()
-        sale_item_repo.create.assert_called_once()
-        movement_repo.create.assert_called_once()
-        payment_repo.create.assert_called_once()
+        sale_item_repo.create_many.assert_called_once()
+        movement_repo.create_many.assert_called_once()
+        payment_repo.create_many.assert_called_once()
         event_publisher.publish.assert_called_once()
 
     def test_quick_sale_with_customer(self):
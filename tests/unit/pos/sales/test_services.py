@@ -105,7 +105,10 @@ class TestPOSConfirmSaleCommandHandler:
         assert result["status"] == SaleStatus.CONFIRMED
         handler.sale_repo.update.assert_called_once()
         handler.movement_repo.create.assert_called_once()
-        handler.stock_repo.update.assert_called_once()
+        handler.stock_repo.apply_delta.assert_called_once_with(
+            items[0].product_id, stock.location_id, -items[0].quantity
+        )
+        handler.stock_repo.update.assert_not_called()
 
     def test_confirm_insufficient_stock_raises_error(self):
         from src.pos.sales.app.commands import POSConfirmSaleCommand
@@ -197,7 +200,7 @@ class TestPOSConfirmSaleCommandHandler:
 
         assert result["status"] == SaleStatus.CONFIRMED
         assert handler.movement_repo.create.call_count == 2
-        assert handler.stock_repo.update.call_count == 2
+        assert handler.stock_repo.apply_delta.call_count == 2
 
 
 # === POSCancelSaleCommandHandler Tests ===
@@ -214,7 +217,7 @@ class TestPOSCancelSaleCommandHandler:
 
         assert result["status"] == SaleStatus.CANCELLED
         handler.movement_repo.create.assert_not_called()
-        handler.stock_repo.update.assert_not_called()
+        handler.stock_repo.apply_delta.assert_not_called()
 
     def test_cancel_confirmed_sale_reverses_inventory(self):
         from src.pos.sales.app.commands import POSCancelSaleCommand
@@ -228,7 +231,9 @@ class TestPOSCancelSaleCommandHandler:
 
         assert result["status"] == SaleStatus.CANCELLED
         handler.movement_repo.create.assert_called_once()
-        handler.stock_repo.update.assert_called_once()
+        handler.stock_repo.apply_delta.assert_called_once_with(
+            items[0].product_id, stock.location_id, items[0].quantity
+        )
 
     def test_cancel_sale_not_found(self):
         from src.pos.sales.app.commands import POSCancelSaleCommand
@@ -12,6 +12,7 @@ from src.pos.shift.app.queries.get_shifts import (
     GetShiftByIdQueryHandler,
 )
 from src.pos.shift.domain.entities import Shift, ShiftStatus
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -109,7 +110,9 @@ def test_get_all_shifts():
 
     result = handler.handle(GetAllShiftsQuery())
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None)
+    repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
     assert len(result["items"]) == 2
     assert result["total"] == 2
 
@@ -128,7 +131,13 @@ def test_get_all_shifts_with_status_filter():
 
     result = handler.handle(GetAllShiftsQuery(status="CLOSED"))
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, status="CLOSED")
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        status="CLOSED",
+    )
     assert len(result["items"]) == 1
 
 
@@ -146,7 +155,9 @@ def test_get_all_shifts_with_pagination():
 
     result = handler.handle(GetAllShiftsQuery(limit=5, offset=0))
 
-    repo.paginate.assert_called_once_with(limit=5, offset=0)
+    repo.paginate.assert_called_once_with(
+        limit=5, offset=0, cursor=None, include_total=TotalMode.EXACT
+    )
     assert len(result["items"]) == 5
     assert result["total"] == 10
 
@@ -1,3 +1,4 @@
+import datetime
 from decimal import Decimal
 from unittest.mock import MagicMock
 
@@ -85,13 +86,14 @@ def _make_receipt(**overrides) -> PurchaseReceipt:
 def test_create_purchase_order_generates_order_number():
     po = _make_po()
     repo = MagicMock()
-    repo.count_by_year.return_value = 0
+    sequence = MagicMock()
+    sequence.next_value.return_value = 1
     repo.create.return_value = po
-    handler = CreatePurchaseOrderCommandHandler(repo, MagicMock())
+    handler = CreatePurchaseOrderCommandHandler(repo, MagicMock(), sequence)
 
     result = handler.handle(CreatePurchaseOrderCommand(supplier_id=10))
 
-    repo.count_by_year.assert_called_once()
+    sequence.next_value.assert_called_once_with("PO", datetime.datetime.now().year)
     repo.create.assert_called_once()
     assert result["order_number"] == "PO-2026-0001"
 
@@ -104,13 +106,14 @@ def test_create_purchase_order_publishes_event():
     EventBus.clear()
     po = _make_po()
     repo = MagicMock()
-    repo.count_by_year.return_value = 2
     repo.create.return_value = po
 
     events_received = []
     EventBus.subscribe(PurchaseOrderCreated, lambda e: events_received.append(e))
 
-    handler = CreatePurchaseOrderCommandHandler(repo, EventBusPublisher())
+    sequence = MagicMock()
+    sequence.next_value.return_value = 3
+    handler = CreatePurchaseOrderCommandHandler(repo, EventBusPublisher(), sequence)
     handler.handle(CreatePurchaseOrderCommand(supplier_id=10))
 
     assert len(events_received) == 1
@@ -121,16 +124,14 @@ def test_create_purchase_order_publishes_event():
 def test_create_purchase_order_order_number_increments():
     po = _make_po(order_number="PO-2026-0005")
     repo = MagicMock()
-    repo.count_by_year.return_value = 4
+    sequence = MagicMock()
+    sequence.next_value.return_value = 5
     repo.create.return_value = po
-    handler = CreatePurchaseOrderCommandHandler(repo, MagicMock())
+    handler = CreatePurchaseOrderCommandHandler(repo, MagicMock(), sequence)
 
     handler.handle(CreatePurchaseOrderCommand(supplier_id=10))
 
-    # count=4 → 5th order
     called_po = repo.create.call_args[0][0]
-    import datetime
-
     year = datetime.datetime.now().year
     assert called_po.order_number == f"PO-{year}-0005"
 
@@ -428,8 +429,8 @@ def test_receive_complete():
     po_repo.get_by_id.return_value = po
     item_repo.filter_by.return_value = [item]
     receipt_repo.create.return_value = receipt
-    receipt_item_repo.create.return_value = MagicMock(id=1)
-    item_repo.update.return_value = item
+    receipt_item_repo.create_many.return_value = [MagicMock(id=1)]
+    item_repo.update_many.return_value = [item]
     po_repo.update.return_value = _make_po(status=PurchaseOrderStatus.RECEIVED)
 
     result = handler.handle(
@@ -440,6 +441,9 @@ def test_receive_complete():
     )
 
     assert result["purchase_order_id"] == 1
+    receipt_item_repo.create_many.assert_called_once()
+    (updated_item,) = item_repo.update_many.call_args[0][0]
+    assert updated_item.quantity_received == 10
     publisher.publish.assert_called_once()
     published_event = publisher.publish.call_args[0][0]
     assert published_event.is_complete is True
@@ -456,8 +460,10 @@ def test_receive_partial():
     po_repo.get_by_id.return_value = po
     item_repo.filter_by.return_value = [item]
     receipt_repo.create.return_value = receipt
-    receipt_item_repo.create.return_value = MagicMock(id=1)
-    item_repo.update.return_value = _make_item(quantity_ordered=10, quantity_received=5)
+    receipt_item_repo.create_many.return_value = [MagicMock(id=1)]
+    item_repo.update_many.return_value = [
+        _make_item(quantity_ordered=10, quantity_received=5)
+    ]
     po_repo.update.return_value = _make_po(status=PurchaseOrderStatus.PARTIAL)
 
     handler.handle(
@@ -7,7 +7,7 @@ from src.purchasing.domain.events import PurchaseOrderReceived
 def test_handle_purchase_order_received_creates_movements(mock_create_scope):
     """
     Verifies that handle_purchase_order_received creates one IN movement
-    per item in the event payload.
+    per item in the event payload, all in one batch.
     """
     from src.inventory.movement.app.commands.movement import CreateMovementCommand
     from src.inventory.movement.domain.constants import MovementType
@@ -35,9 +35,9 @@ def test_handle_purchase_order_received_creates_movements(mock_create_scope):
 
     handle_purchase_order_received(event)
 
-    assert mock_handler.handle.call_count == 2
+    mock_handler.handle.assert_called_once()
+    first_call, second_call = mock_handler.handle.call_args[0][0].movements
 
-    first_call = mock_handler.handle.call_args_list[0][0][0]
     assert isinstance(first_call, CreateMovementCommand)
     assert first_call.product_id == 5
     assert first_call.quantity == 10
@@ -45,7 +45,6 @@ def test_handle_purchase_order_received_creates_movements(mock_create_scope):
     assert first_call.reference_type == "purchase_order"
     assert first_call.reference_id == 1
 
-    second_call = mock_handler.handle.call_args_list[1][0][0]
     assert second_call.product_id == 6
     assert second_call.quantity == 3
     assert second_call.location_id == 2
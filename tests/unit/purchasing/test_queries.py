@@ -23,6 +23,7 @@ from src.purchasing.domain.entities import (
     PurchaseOrderStatus,
     PurchaseReceipt,
 )
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 # ---------------------------------------------------------------------------
@@ -85,7 +86,9 @@ def test_get_all_purchase_orders():
 
     result = handler.handle(GetAllPurchaseOrdersQuery())
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None)
+    repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
     assert len(result["items"]) == 2
     assert result["total"] == 2
 
@@ -103,7 +106,13 @@ def test_get_all_purchase_orders_filter_by_status():
 
     result = handler.handle(GetAllPurchaseOrdersQuery(status="sent"))
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, status="sent")
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        status="sent",
+    )
     assert len(result["items"]) == 1
     assert result["items"][0]["status"] == "sent"
     assert result["total"] == 1
@@ -122,7 +131,13 @@ def test_get_all_purchase_orders_filter_by_supplier():
 
     result = handler.handle(GetAllPurchaseOrdersQuery(supplier_id=5))
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, supplier_id=5)
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        supplier_id=5,
+    )
     assert len(result["items"]) == 1
     assert result["total"] == 1
 
@@ -141,7 +156,12 @@ def test_get_all_purchase_orders_filter_by_status_and_supplier():
     result = handler.handle(GetAllPurchaseOrdersQuery(status="sent", supplier_id=5))
 
     repo.paginate.assert_called_once_with(
-        limit=None, offset=None, status="sent", supplier_id=5
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        status="sent",
+        supplier_id=5,
     )
     assert len(result["items"]) == 1
     assert result["total"] == 1
@@ -0,0 +1,141 @@
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.catalog.product.domain.entities import Product
+from src.catalog.product.domain.events import ProductUpdated
+from src.inventory.alert.app.queries.alerts import (
+    GetExpiringLotsAlertsQuery,
+    GetExpiringLotsAlertsQueryHandler,
+)
+from src.inventory.alert.infra.routes import LOT_ALERT_DATA
+from src.inventory.location.domain.events import LocationUpdated
+from src.inventory.lot.app.commands.lot import UpdateLotCommand, UpdateLotCommandHandler
+from src.inventory.lot.domain.entities import Lot
+from src.inventory.movement.domain.events import MovementCreated
+from src.inventory.stock.domain.events import StockUpdated
+from src.inventory.transfer.domain.events import (
+    StockTransferCancelled,
+    StockTransferConfirmed,
+)
+from src.inventory.warehouse.domain.events import WarehouseCreated
+from src.reports.inventory.infra.event_handlers import (
+    invalidate_location_reports,
+    invalidate_lot_reports,
+    invalidate_movement_reports,
+    invalidate_product_reports,
+    invalidate_stock_reports,
+)
+from src.shared.infra.report_cache import ReportCache, ReportData
+
+
+@pytest.fixture
+def cache():
+    cache = ReportCache()
+    with patch("src.reports.inventory.infra.event_handlers.report_cache", cache):
+        yield cache
+
+
+def _generations(cache) -> dict:
+    return dict(
+        zip(ReportData, cache._current_generations(list(ReportData)), strict=True)
+    )
+
+
+def test_movements_invalidate_movement_and_stock_reports(cache):
+    invalidate_movement_reports(MovementCreated(product_id=1, quantity=5))
+
+    assert _generations(cache) == {
+        ReportData.STOCK: 1,
+        ReportData.MOVEMENTS: 1,
+        ReportData.PRICES: 0,
+        ReportData.PRODUCTS: 0,
+        ReportData.LOTS: 0,
+        ReportData.LOCATIONS: 0,
+    }
+
+
+def test_stock_updates_invalidate_stock_reports(cache):
+    invalidate_stock_reports(StockUpdated(product_id=1, new_quantity=3))
+
+    assert _generations(cache)[ReportData.STOCK] == 1
+    assert _generations(cache)[ReportData.MOVEMENTS] == 0
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        StockTransferConfirmed(aggregate_id=1, transfer_id=1, items_reserved=2),
+        StockTransferCancelled(aggregate_id=1, transfer_id=1, was_confirmed=True),
+    ],
+)
+def test_transfer_reservations_invalidate_stock_reports(cache, event):
+    invalidate_stock_reports(event)
+
+    assert _generations(cache)[ReportData.STOCK] == 1
+
+
+def test_price_change_only_invalidates_price_reports(cache):
+    invalidate_product_reports(
+        ProductUpdated(
+            aggregate_id=1,
+            product_id=1,
+            changes={"purchase_price": {"old": 1, "new": 2}},
+        )
+    )
+
+    assert _generations(cache)[ReportData.PRICES] == 1
+    assert _generations(cache)[ReportData.PRODUCTS] == 0
+
+
+def test_other_product_changes_invalidate_product_reports(cache):
+    invalidate_product_reports(
+        ProductUpdated(
+            aggregate_id=1, product_id=1, changes={"min_stock": {"old": 1, "new": 5}}
+        )
+    )
+
+    assert _generations(cache)[ReportData.PRICES] == 0
+    assert _generations(cache)[ReportData.PRODUCTS] == 1
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        WarehouseCreated(aggregate_id=2, warehouse_id=2, code="WH-02"),
+        LocationUpdated(
+            aggregate_id=1, location_id=1, warehouse_id=2, previous_warehouse_id=1
+        ),
+    ],
+)
+def test_warehouse_and_location_changes_invalidate_location_reports(cache, event):
+    invalidate_location_reports(event)
+
+    assert _generations(cache)[ReportData.LOCATIONS] == 1
+    assert _generations(cache)[ReportData.STOCK] == 0
+
+
+def test_lot_update_shows_in_cached_expiring_lots_alert(cache):
+    lots = {1: Lot(id=1, product_id=1, lot_number="LOT-001", current_quantity=5)}
+    lot_repo = MagicMock()
+    lot_repo.get_by_id.side_effect = lots.get
+    lot_repo.update.side_effect = lambda lot: lots.update({lot.id: lot}) or lot
+    lot_repo.filter_by_spec.side_effect = lambda spec: [
+        lot for lot in lots.values() if spec.is_satisfied_by(lot)
+    ]
+    product_repo = MagicMock()
+    product_repo.get_by_id.return_value = Product(id=1, sku="SKU-1", name="Milk")
+    alerts = GetExpiringLotsAlertsQueryHandler(lot_repo, product_repo)
+    query = GetExpiringLotsAlertsQuery(days=30)
+    # Without a transaction the bus would run the after-commit handler inline
+    event_publisher = MagicMock()
+    event_publisher.publish.side_effect = invalidate_lot_reports
+    assert cache.fetch(alerts, query, LOT_ALERT_DATA) == []
+
+    UpdateLotCommandHandler(lot_repo, event_publisher).handle(
+        UpdateLotCommand(id=1, expiration_date=date.today() + timedelta(days=10))
+    )
+
+    result = cache.fetch(alerts, query, LOT_ALERT_DATA)
+    assert [alert["lot_id"] for alert in result] == [1]
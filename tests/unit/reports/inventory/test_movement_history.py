@@ -1,10 +1,20 @@
 from datetime import date, datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
+from sqlalchemy import insert
+
+from src.catalog.product.infra.models import ProductModel
+from src.inventory.movement.domain.constants import MovementType
+from src.inventory.movement.infra.models import MovementModel
 from src.reports.inventory.app.queries.movement_history import (
+    ExportMovementHistoryQuery,
+    ExportMovementHistoryQueryHandler,
     GetMovementHistoryReportQuery,
     GetMovementHistoryReportQueryHandler,
 )
+from src.shared.app.pagination import TotalMode, encode_cursor
+from src.shared.domain.exceptions import ValidationError
 
 
 def _make_session(rows=None, count=None):
@@ -176,3 +186,114 @@ def test_movement_history_nullable_fields_preserved():
     assert item["location_id"] is None
     assert item["source_location_id"] is None
     assert item["reference_type"] is None
+
+
+def test_movement_history_returns_next_cursor_when_more_rows():
+    rows = [_make_row(id=3), _make_row(id=2), _make_row(id=1)]
+    session = _make_session(rows=rows)
+    handler = GetMovementHistoryReportQueryHandler(session)
+
+    result = handler.handle(GetMovementHistoryReportQuery(limit=2, offset=0))
+
+    assert len(result["items"]) == 2
+    assert result["next_cursor"] == encode_cursor(datetime(2026, 2, 1, 10, 0), 2)
+
+
+def test_movement_history_cursor_mode_skips_count():
+    session = _make_session(rows=[_make_row(id=1)])
+    handler = GetMovementHistoryReportQueryHandler(session)
+    cursor = encode_cursor(datetime(2026, 2, 1, 10, 0), 2)
+
+    result = handler.handle(GetMovementHistoryReportQuery(limit=2, cursor=cursor))
+
+    session.query.return_value.count.assert_not_called()
+    session.query.return_value.offset.assert_not_called()
+    assert result["total"] is None
+    assert result["offset"] is None
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_cursor("yesterday", 2),
+        encode_cursor(datetime(2026, 2, 1, 10, 0), "2"),
+    ],
+)
+def test_movement_history_rejects_malformed_cursor(cursor):
+    handler = GetMovementHistoryReportQueryHandler(_make_session())
+
+    with pytest.raises(ValidationError):
+        handler.handle(GetMovementHistoryReportQuery(cursor=cursor))
+
+
+@patch("src.reports.inventory.app.queries.movement_history.count_rows")
+def test_movement_history_estimated_total(mock_count_rows):
+    mock_count_rows.return_value = 900
+    session = _make_session(rows=[_make_row(id=1)])
+    handler = GetMovementHistoryReportQueryHandler(session)
+
+    result = handler.handle(
+        GetMovementHistoryReportQuery(include_total=TotalMode.ESTIMATED)
+    )
+
+    session.query.return_value.count.assert_not_called()
+    assert mock_count_rows.call_args[0][2] == TotalMode.ESTIMATED
+    assert result["total"] == 900
+    assert result["total_mode"] == TotalMode.ESTIMATED
+
+
+def _seed_movements(session):
+    session.add_all(
+        [
+            ProductModel(id=1, name="Product A", sku="SKU-001"),
+            ProductModel(id=2, name="Product B", sku="SKU-002"),
+        ]
+    )
+    session.flush()
+    session.execute(
+        insert(MovementModel),
+        [
+            {
+                "product_id": product_id,
+                "quantity": quantity,
+                "type": MovementType.IN if quantity > 0 else MovementType.OUT,
+                "date": when,
+            }
+            for product_id, quantity, when in [
+                (1, 10, datetime(2026, 3, 2)),
+                (2, 4, datetime(2026, 3, 1)),
+                (1, -3, datetime(2026, 3, 5)),
+                (1, 7, datetime(2026, 4, 1)),
+            ]
+        ],
+    )
+
+
+def test_export_streams_every_matching_row_oldest_first(db_session):
+    _seed_movements(db_session)
+    handler = ExportMovementHistoryQueryHandler(db_session)
+
+    rows = list(handler.handle(ExportMovementHistoryQuery()))
+
+    assert [(r["product_id"], r["quantity"]) for r in rows] == [
+        (2, 4),
+        (1, 10),
+        (1, -3),
+        (1, 7),
+    ]
+    assert rows[0]["sku"] == "SKU-002"
+    assert rows[0]["type"] == MovementType.IN
+
+
+def test_export_applies_the_history_filters(db_session):
+    _seed_movements(db_session)
+    handler = ExportMovementHistoryQueryHandler(db_session)
+
+    rows = handler.handle(
+        ExportMovementHistoryQuery(
+            product_id=1, from_date=date(2026, 3, 1), to_date=date(2026, 3, 31)
+        )
+    )
+
+    assert [r["quantity"] for r in rows] == [10, -3]
@@ -1,7 +1,14 @@
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from unittest.mock import MagicMock
 
+from sqlalchemy import insert, update
+
+from src.catalog.product.infra.models import ProductModel
+from src.inventory.movement.domain.constants import MovementType
+from src.inventory.movement.infra.models import MovementModel
+from src.inventory.stock.infra.models import StockDailySnapshotModel
+from src.inventory.stock.infra.snapshots import build_snapshots
 from src.reports.inventory.app.queries.valuation import (
     GetInventoryValuationQuery,
     GetInventoryValuationQueryHandler,
@@ -94,21 +101,9 @@ def test_valuation_uses_todays_date_when_no_as_of_date():
     assert result["as_of_date"] == date.today()
 
 
-def test_valuation_uses_provided_as_of_date_in_response():
+def test_valuation_uses_provided_as_of_date_in_response(db_session):
     as_of = date(2026, 1, 15)
-
-    # For _valuation_at_date, mock both query calls
-    row = _make_row(quantity=50, purchase_price=Decimal("10.00"))
-    session = MagicMock()
-    q = MagicMock()
-    q.join.return_value = q
-    q.filter.return_value = q
-    q.group_by.return_value = q
-    q.all.return_value = [row]
-    # Second query is for location_ids (returns empty list when warehouse_id is None)
-    session.query.return_value = q
-
-    handler = GetInventoryValuationQueryHandler(session)
+    handler = GetInventoryValuationQueryHandler(db_session)
 
     result = handler.handle(GetInventoryValuationQuery(as_of_date=as_of))
 
@@ -171,19 +166,80 @@ def test_valuation_with_warehouse_id_passes_to_query():
 # ---------------------------------------------------------------------------
 
 
-def test_valuation_at_date_excludes_negative_quantity():
-    row = _make_row(quantity=-5, purchase_price=Decimal("10.00"))
-    session = MagicMock()
-    q = MagicMock()
-    q.join.return_value = q
-    q.filter.return_value = q
-    q.group_by.return_value = q
-    q.all.return_value = [row]
-    session.query.return_value = q
+def _seed_history(session):
+    session.add(
+        ProductModel(
+            id=1, name="Product A", sku="SKU-001", purchase_price=Decimal("10")
+        )
+    )
+    session.add(
+        ProductModel(id=2, name="Product B", sku="SKU-002", purchase_price=Decimal("5"))
+    )
+    session.flush()
+    session.execute(
+        insert(MovementModel),
+        [
+            _movement(1, 10, datetime(2026, 1, 1, 9)),
+            _movement(1, -4, datetime(2026, 1, 2, 18)),
+            _movement(2, 3, datetime(2026, 1, 2, 10)),
+            _movement(2, -5, datetime(2026, 1, 3, 10)),
+            _movement(1, 6, datetime(2026, 1, 5, 12)),
+        ],
+    )
 
-    handler = GetInventoryValuationQueryHandler(session)
 
-    result = handler.handle(GetInventoryValuationQuery(as_of_date=date(2026, 1, 1)))
+def _movement(product_id, quantity, when):
+    return {
+        "product_id": product_id,
+        "quantity": quantity,
+        "type": MovementType.IN if quantity > 0 else MovementType.OUT,
+        "date": when,
+    }
 
-    assert result["items"] == []
-    assert result["total_value"] == 0
+
+def _quantities(result):
+    return {item["product_id"]: item["quantity"] for item in result["items"]}
+
+
+def test_valuation_at_date_sums_signed_movements(db_session):
+    _seed_history(db_session)
+    handler = GetInventoryValuationQueryHandler(db_session)
+
+    result = handler.handle(GetInventoryValuationQuery(as_of_date=date(2026, 1, 2)))
+
+    assert _quantities(result) == {1: 6, 2: 3}
+    assert result["total_value"] == Decimal("75")
+
+
+def test_valuation_at_date_excludes_negative_quantity(db_session):
+    _seed_history(db_session)
+    handler = GetInventoryValuationQueryHandler(db_session)
+
+    result = handler.handle(GetInventoryValuationQuery(as_of_date=date(2026, 1, 3)))
+
+    assert _quantities(result) == {1: 6}
+
+
+def test_valuation_at_date_reads_snapshots_plus_later_movements(db_session):
+    _seed_history(db_session)
+    handler = GetInventoryValuationQueryHandler(db_session)
+    expected = {
+        day: handler.handle(GetInventoryValuationQuery(as_of_date=day))
+        for day in (date(2026, 1, 2), date(2026, 1, 4), date(2026, 1, 6))
+    }
+
+    build_snapshots(db_session, date(2026, 1, 1), date(2026, 1, 3))
+    # Snapshot rows are authoritative for the days they cover
+    db_session.execute(
+        update(StockDailySnapshotModel)
+        .where(StockDailySnapshotModel.day == date(2026, 1, 3))
+        .values(quantity=StockDailySnapshotModel.quantity + 100)
+    )
+
+    assert (
+        handler.handle(GetInventoryValuationQuery(as_of_date=date(2026, 1, 2)))
+        == (expected[date(2026, 1, 2)])
+    )
+    assert _quantities(
+        handler.handle(GetInventoryValuationQuery(as_of_date=date(2026, 1, 6)))
+    ) == {1: 112, 2: 98}
@@ -0,0 +1,224 @@
+"""Unit tests for the background report jobs"""
+
+import gzip
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from src.catalog.product.infra.models import ProductModel
+from src.inventory.stock.infra.models import StockModel
+from src.reports.inventory.app.queries.valuation import (
+    GetInventoryValuationQueryHandler,
+)
+from src.reports.jobs.app.repositories import ReportJobRepository
+from src.reports.jobs.domain.entities import ReportJob, ReportJobStatus, ReportType
+from src.reports.jobs.domain.exceptions import (
+    ReportJobExpiredError,
+    ReportJobFailedError,
+    ReportJobNotReadyError,
+)
+from src.reports.jobs.infra import worker as worker_module
+from src.reports.jobs.infra.mappers import ReportJobMapper
+from src.reports.jobs.infra.models import ReportJobModel
+from src.reports.jobs.infra.repositories import SqlAlchemyReportJobRepository
+from src.reports.jobs.infra.results import write_result
+from src.reports.jobs.infra.worker import (
+    ReportJobWorker,
+    claim_jobs,
+    purge_jobs,
+    release_jobs,
+    run_report_job,
+)
+
+LIMITS = {"valuation": 1, "rotation": 1, "warehouse_summary": 2}
+
+
+def _add_jobs(session, *jobs: tuple[str, str]) -> list[int]:
+    ids = []
+    for report_type, status in jobs:
+        job = ReportJobModel(report_type=report_type, params={}, status=status)
+        if status == ReportJobStatus.RUNNING:
+            job.started_at = datetime.now()
+        session.add(job)
+        session.flush()
+        ids.append(job.id)
+    return ids
+
+
+def _statuses(session) -> dict[int, str]:
+    rows = session.execute(select(ReportJobModel.id, ReportJobModel.status))
+    return dict(rows.all())
+
+
+@pytest.fixture
+def job_scope(db_session):
+    handlers = {
+        Session: db_session,
+        ReportJobRepository: SqlAlchemyReportJobRepository(
+            db_session, ReportJobMapper()
+        ),
+        GetInventoryValuationQueryHandler: GetInventoryValuationQueryHandler(
+            db_session
+        ),
+    }
+
+    @contextmanager
+    def scope(session=None):
+        yield MagicMock(get=MagicMock(side_effect=handlers.__getitem__))
+
+    with patch.object(worker_module, "create_sync_scope", scope):
+        yield handlers
+
+
+def test_result_is_only_available_once_done_and_until_it_expires():
+    job = ReportJob(report_type=ReportType.VALUATION, id=1)
+    with pytest.raises(ReportJobNotReadyError):
+        job.ensure_result()
+
+    job.complete("/tmp/report-job-1.json.gz", 10, timedelta(hours=1))
+    assert job.ensure_result() == "/tmp/report-job-1.json.gz"
+    with pytest.raises(ReportJobExpiredError):
+        job.ensure_result(now=job.finished_at + timedelta(hours=2))
+
+    job.fail("boom")
+    with pytest.raises(ReportJobFailedError):
+        job.ensure_result()
+
+
+def test_claim_respects_slots_and_per_type_limits(db_session):
+    ids = _add_jobs(
+        db_session,
+        ("valuation", ReportJobStatus.RUNNING),
+        ("valuation", ReportJobStatus.PENDING),
+        ("rotation", ReportJobStatus.PENDING),
+        ("rotation", ReportJobStatus.PENDING),
+        ("warehouse_summary", ReportJobStatus.PENDING),
+    )
+
+    claimed = claim_jobs(db_session, slots=2, limits=LIMITS)
+
+    assert claimed == [ids[2], ids[4]]
+    assert claim_jobs(db_session, slots=5, limits=LIMITS) == []
+    assert _statuses(db_session)[ids[1]] == ReportJobStatus.PENDING
+
+
+def test_release_puts_claimed_jobs_back_in_the_queue(db_session):
+    ids = _add_jobs(db_session, ("rotation", ReportJobStatus.PENDING))
+    claim_jobs(db_session, slots=1, limits=LIMITS)
+
+    release_jobs(db_session, ids)
+
+    assert _statuses(db_session)[ids[0]] == ReportJobStatus.PENDING
+
+
+def test_purge_expires_results_and_fails_stuck_jobs(db_session, tmp_path):
+    done, stuck = _add_jobs(
+        db_session,
+        ("valuation", ReportJobStatus.DONE),
+        ("rotation", ReportJobStatus.RUNNING),
+    )
+    path, _ = write_result(tmp_path, done, b"[]")
+    db_session.get(ReportJobModel, done).result_path = str(path)
+    db_session.get(ReportJobModel, done).expires_at = datetime.now()
+
+    counts = purge_jobs(
+        db_session,
+        timeout=timedelta(minutes=30),
+        now=datetime.now() + timedelta(hours=1),
+    )
+
+    assert counts == (1, 1)
+    assert _statuses(db_session) == {
+        done: ReportJobStatus.EXPIRED,
+        stuck: ReportJobStatus.FAILED,
+    }
+    assert not path.exists()
+
+
+def test_run_stores_the_result_as_the_sync_endpoint_serializes_it(
+    db_session, job_scope, tmp_path
+):
+    db_session.add(
+        ProductModel(id=1, name="Product A", sku="SKU-001", purchase_price=2)
+    )
+    db_session.flush()
+    db_session.execute(insert(StockModel), [{"product_id": 1, "quantity": 5}])
+    (job_id,) = _add_jobs(db_session, ("valuation", ReportJobStatus.RUNNING))
+
+    status = run_report_job(job_id, str(tmp_path), result_ttl=3600)
+
+    job = db_session.get(ReportJobModel, job_id)
+    assert status == ReportJobStatus.DONE
+    assert job.expires_at == job.finished_at + timedelta(hours=1)
+    with gzip.open(job.result_path) as file:
+        result = json.load(file)
+    assert result["totalValue"] == 10.0
+    assert result["items"][0]["productName"] == "Product A"
+
+
+def test_failing_report_marks_the_job_failed(db_session, job_scope, tmp_path):
+    (job_id,) = _add_jobs(db_session, ("valuation", ReportJobStatus.RUNNING))
+    db_session.commit()  # The claim is committed before the job runs
+    failing = MagicMock()
+    failing.handle.side_effect = RuntimeError("statement timeout")
+    job_scope[GetInventoryValuationQueryHandler] = failing
+
+    status = run_report_job(job_id, str(tmp_path), result_ttl=3600)
+
+    job = db_session.get(ReportJobModel, job_id)
+    assert status == ReportJobStatus.FAILED
+    assert job.error == "RuntimeError: statement timeout"
+    assert not list(tmp_path.iterdir())
+
+
+def test_worker_only_claims_for_free_workers(db_session, job_scope, tmp_path):
+    _add_jobs(
+        db_session,
+        ("warehouse_summary", ReportJobStatus.PENDING),
+        ("warehouse_summary", ReportJobStatus.PENDING),
+        ("rotation", ReportJobStatus.PENDING),
+    )
+    executor = MagicMock()
+    executor.submit.side_effect = lambda *args: MagicMock(
+        done=MagicMock(return_value=False)
+    )
+    worker = ReportJobWorker(
+        executor,
+        workers=2,
+        limits=LIMITS,
+        result_dir=tmp_path,
+        result_ttl=timedelta(hours=1),
+        timeout=timedelta(minutes=30),
+    )
+
+    assert worker.dispatch_once() == 2
+    assert worker.dispatch_once() == 0
+    assert executor.submit.call_count == 2
+
+
+def test_job_timed_out_while_running_stays_failed(db_session, job_scope, tmp_path):
+    (job_id,) = _add_jobs(db_session, ("valuation", ReportJobStatus.RUNNING))
+    db_session.commit()
+    handler = job_scope[GetInventoryValuationQueryHandler]
+
+    def purged_while_running(query):
+        purge_jobs(db_session, timedelta(0), now=datetime.now() + timedelta(hours=1))
+        return handler.handle(query)
+
+    job_scope[GetInventoryValuationQueryHandler] = MagicMock(
+        handle=MagicMock(side_effect=purged_while_running)
+    )
+
+    status = run_report_job(job_id, str(tmp_path), result_ttl=3600)
+
+    job = db_session.get(ReportJobModel, job_id)
+    db_session.refresh(job)
+    assert status == ReportJobStatus.FAILED
+    assert job.status == ReportJobStatus.FAILED
+    assert job.result_path is None
+    assert not list(tmp_path.iterdir())
@@ -14,6 +14,7 @@ from src.sales.app.queries import (
     GetSalePaymentsQueryHandler,
 )
 from src.sales.domain.entities import Payment, PaymentMethod, Sale, SaleItem, SaleStatus
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 
 
@@ -85,7 +86,9 @@ def test_get_all_sales_query_handler():
     assert result["items"][0]["id"] == 1
     assert result["items"][1]["id"] == 2
     assert result["total"] == 2
-    repo.paginate.assert_called_once_with(limit=None, offset=None)
+    repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
 
 
 def test_get_all_sales_with_customer_filter():
@@ -103,7 +106,13 @@ def test_get_all_sales_with_customer_filter():
     query = GetAllSalesQuery(customer_id=10)
     result = handler.handle(query)
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, customer_id=10)
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        customer_id=10,
+    )
     assert len(result["items"]) == 1
     assert result["items"][0]["customer_id"] == 10
     assert result["total"] == 1
@@ -124,7 +133,13 @@ def test_get_all_sales_with_status_filter():
     query = GetAllSalesQuery(status="CONFIRMED")
     result = handler.handle(query)
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, status="CONFIRMED")
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        status="CONFIRMED",
+    )
     assert len(result["items"]) == 1
     assert result["total"] == 1
 
@@ -144,7 +159,9 @@ def test_get_all_sales_with_pagination():
     query = GetAllSalesQuery(limit=5, offset=0)
     result = handler.handle(query)
 
-    repo.paginate.assert_called_once_with(limit=5, offset=0)
+    repo.paginate.assert_called_once_with(
+        limit=5, offset=0, cursor=None, include_total=TotalMode.EXACT
+    )
     assert len(result["items"]) == 5
     assert result["total"] == 10
 
@@ -163,7 +180,9 @@ def test_get_all_sales_empty():
     query = GetAllSalesQuery()
     result = handler.handle(query)
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None)
+    repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
     assert len(result["items"]) == 0
     assert result["total"] == 0
 
@@ -0,0 +1,84 @@
+"""Unit tests for the bulk SqlAlchemyRepository methods against in-memory SQLite"""
+
+from dataclasses import replace
+
+import pytest
+
+from src.catalog.uom.domain.entities import UnitOfMeasure
+from src.catalog.uom.infra.mappers import UnitOfMeasureMapper
+from src.catalog.uom.infra.models import UnitOfMeasureModel
+from src.catalog.uom.infra.repositories import SqlAlchemyUnitOfMeasureRepository
+from src.shared.domain.exceptions import NotFoundError
+
+
+@pytest.fixture
+def repo(db_session):
+    return SqlAlchemyUnitOfMeasureRepository(db_session, UnitOfMeasureMapper())
+
+
+def test_create_many_returns_entities_in_order(repo, db_session):
+    created = repo.create_many(
+        [
+            UnitOfMeasure(name="Unit", symbol="u"),
+            UnitOfMeasure(name="Kilogram", symbol="kg"),
+            UnitOfMeasure(name="Liter", symbol="l"),
+        ]
+    )
+
+    assert [uom.symbol for uom in created] == ["u", "kg", "l"]
+    assert all(uom.id is not None for uom in created)
+    assert created[0].is_active is True
+    assert db_session.query(UnitOfMeasureModel).count() == 3
+
+
+def test_create_many_empty(repo):
+    assert repo.create_many([]) == []
+
+
+def test_update_many(repo):
+    first = repo.create(UnitOfMeasure(name="Unit", symbol="u"))
+    second = repo.create(UnitOfMeasure(name="Kilogram", symbol="kg"))
+
+    updated = repo.update_many(
+        [replace(second, name="Kilo"), replace(first, is_active=False)]
+    )
+
+    assert [uom.id for uom in updated] == [second.id, first.id]
+    assert updated[0].name == "Kilo"
+    assert updated[1].is_active is False
+    assert repo.get_by_id(first.id).is_active is False
+
+
+def test_update_many_raises_on_missing_id(repo):
+    uom = repo.create(UnitOfMeasure(name="Unit", symbol="u"))
+
+    with pytest.raises(NotFoundError):
+        repo.update_many([uom, replace(uom, id=999)])
+
+
+def test_upsert_many_inserts_and_updates(repo, db_session):
+    existing = repo.create(UnitOfMeasure(name="Unit", symbol="u"))
+
+    result = repo.upsert_many(
+        [
+            UnitOfMeasure(name="Kilogram", symbol="kg"),
+            UnitOfMeasure(name="Units", symbol="u"),
+        ],
+        conflict_fields=["symbol"],
+    )
+
+    assert result[0].symbol == "kg"
+    assert result[1].id == existing.id
+    assert result[1].name == "Units"
+    assert repo.get_by_id(existing.id).name == "Units"
+    assert db_session.query(UnitOfMeasureModel).count() == 2
+
+
+def test_get_many_fetches_known_ids(repo):
+    first = repo.create(UnitOfMeasure(name="Unit", symbol="u"))
+    second = repo.create(UnitOfMeasure(name="Kilogram", symbol="kg"))
+
+    found = repo.get_many([second.id, first.id, second.id, 999])
+
+    assert sorted(uom.id for uom in found) == [first.id, second.id]
+    assert repo.get_many([]) == []
@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+from src.shared.infra.cache import LRUCache
+
+
+def test_evicts_least_recently_used_entry():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_invalidate_removes_entry():
+    cache = LRUCache()
+    cache.set("a", 1)
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_entries_expire_after_ttl():
+    cache = LRUCache(ttl=10)
+    with patch("src.shared.infra.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("src.shared.infra.cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") == 1
+    with patch("src.shared.infra.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
@@ -0,0 +1,111 @@
+"""Unit tests for paginated totals: exact, estimated and skipped counts"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.catalog.uom.domain.entities import UnitOfMeasure
+from src.catalog.uom.infra.mappers import UnitOfMeasureMapper
+from src.catalog.uom.infra.models import UnitOfMeasureModel
+from src.catalog.uom.infra.repositories import SqlAlchemyUnitOfMeasureRepository
+from src.shared.app.pagination import TotalMode
+from src.shared.infra.counting import count_cache, count_rows
+
+
+@pytest.fixture(autouse=True)
+def _clear_count_cache():
+    count_cache.clear()
+    yield
+    count_cache.clear()
+
+
+@pytest.fixture
+def repo(db_session):
+    repo = SqlAlchemyUnitOfMeasureRepository(db_session, UnitOfMeasureMapper())
+    repo.create_many(
+        [UnitOfMeasure(name=f"Unit {i}", symbol=f"u{i}") for i in range(1, 6)]
+    )
+    return repo
+
+
+def test_exact_total(repo):
+    page = repo.paginate(limit=2)
+
+    assert page["total"] == 5
+    assert page["total_mode"] == TotalMode.EXACT
+
+
+def test_none_total_skips_count(repo):
+    page = repo.paginate(limit=2, include_total=TotalMode.NONE)
+
+    assert page["total"] is None
+    assert page["total_mode"] == TotalMode.NONE
+    assert page["next_cursor"] is not None
+
+
+def test_estimated_total_is_cached_per_filter(repo):
+    first = repo.paginate(limit=2, include_total=TotalMode.ESTIMATED)
+    repo.create(UnitOfMeasure(name="Unit 6", symbol="u6"))
+
+    cached = repo.paginate(limit=2, include_total=TotalMode.ESTIMATED)
+    filtered = repo.paginate(limit=2, include_total=TotalMode.ESTIMATED, symbol="u6")
+    exact = repo.paginate(limit=2)
+
+    assert first["total"] == 5
+    assert first["total_mode"] == TotalMode.ESTIMATED
+    assert cached["total"] == 5
+    assert filtered["total"] == 1
+    assert exact["total"] == 6
+
+
+def test_cursor_pages_report_no_total(repo):
+    first = repo.paginate(limit=2)
+
+    page = repo.paginate(
+        limit=2, cursor=first["next_cursor"], include_total=TotalMode.EXACT
+    )
+
+    assert page["total"] is None
+    assert page["total_mode"] == TotalMode.NONE
+
+
+def test_count_cache_is_bounded(repo, monkeypatch):
+    monkeypatch.setattr(count_cache, "maxsize", 3)
+
+    for i in range(1, 6):
+        repo.paginate(limit=2, include_total=TotalMode.ESTIMATED, symbol=f"u{i}")
+
+    assert len(count_cache) == 3
+
+
+def test_estimated_uses_planner_rows_on_postgresql():
+    session = MagicMock()
+    session.get_bind.return_value.dialect = postgresql.dialect()
+    session.execute.return_value.scalar.return_value = [{"Plan": {"Plan Rows": 1234}}]
+
+    total = count_rows(
+        session,
+        select(UnitOfMeasureModel.id).where(UnitOfMeasureModel.symbol == "a:b"),
+        TotalMode.ESTIMATED,
+    )
+
+    assert total == 1234
+    explain = session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+    assert str(explain).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "%(symbol_1)s" in str(explain)
+    assert explain.params == {"symbol_1": "a:b"}
+    session.scalar.assert_not_called()
+
+
+def test_estimated_falls_back_to_cached_count_when_planner_fails():
+    session = MagicMock()
+    session.get_bind.return_value.dialect = postgresql.dialect()
+    session.execute.return_value.scalar.return_value = None
+    session.scalar.return_value = 42
+    stmt = select(UnitOfMeasureModel.id)
+
+    assert count_rows(session, stmt, TotalMode.ESTIMATED) == 42
+    assert count_rows(session, stmt, TotalMode.ESTIMATED) == 42
+    session.scalar.assert_called_once()
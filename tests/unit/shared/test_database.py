@@ -0,0 +1,262 @@
+"""Unit tests for the scoped session factory and read-only query sessions"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+
+from config.base import DatabasePoolConfig
+from src.catalog.uom.infra.models import UnitOfMeasureModel
+from src.shared.infra import database
+from src.shared.infra.database import (
+    Base,
+    InstrumentedQueuePool,
+    ReplicaPool,
+    _create_engine,
+    _set_statement_timeout,
+    _set_transaction_read_only,
+    create_session_factory,
+    read_only_session_scope,
+    statement_timeout_scope,
+)
+from src.shared.infra.events.after_commit import current_after_commit_queue
+
+
+def _make_factory(tmp_path):
+    get_db_session = create_session_factory(f"sqlite:///{tmp_path / 'test.db'}")
+    gen = get_db_session()
+    session = next(gen)
+    Base.metadata.create_all(session.get_bind())
+    gen.close()
+    return get_db_session
+
+
+def _count(get_db_session) -> int:
+    gen = get_db_session()
+    session = next(gen)
+    count = session.query(UnitOfMeasureModel).count()
+    gen.close()
+    return count
+
+
+def _add_uom(session):
+    session.add(UnitOfMeasureModel(name="Unit", symbol="u"))
+    session.flush()
+
+
+def test_default_session_commits(tmp_path):
+    get_db_session = _make_factory(tmp_path)
+
+    gen = get_db_session()
+    _add_uom(next(gen))
+    next(gen, None)
+
+    assert _count(get_db_session) == 1
+
+
+def test_after_commit_queue_drains_only_after_commit(tmp_path):
+    get_db_session = _make_factory(tmp_path)
+    committed = []
+
+    gen = get_db_session()
+    _add_uom(next(gen))
+    queue = current_after_commit_queue()
+    queue.defer(lambda: committed.append(_count(get_db_session)))
+    assert committed == []
+    next(gen, None)
+
+    assert committed == [1]
+    assert current_after_commit_queue() is None
+
+
+def test_after_commit_queue_is_discarded_on_rollback(tmp_path):
+    get_db_session = _make_factory(tmp_path)
+    calls = []
+
+    gen = get_db_session()
+    _add_uom(next(gen))
+    current_after_commit_queue().defer(lambda: calls.append(1))
+    with pytest.raises(RuntimeError):
+        gen.throw(RuntimeError("handler failed"))
+
+    assert calls == []
+    assert _count(get_db_session) == 0
+
+
+def test_read_only_session_rolls_back(tmp_path):
+    get_db_session = _make_factory(tmp_path)
+
+    with read_only_session_scope():
+        gen = get_db_session()
+        session = next(gen)
+        _add_uom(session)
+        next(gen, None)
+
+    assert session.autoflush is False
+    assert _count(get_db_session) == 0
+
+
+def test_read_only_scope_is_reset(tmp_path):
+    get_db_session = _make_factory(tmp_path)
+    with read_only_session_scope():
+        pass
+
+    gen = get_db_session()
+    _add_uom(next(gen))
+    next(gen, None)
+
+    assert _count(get_db_session) == 1
+
+
+def test_postgresql_transactions_are_marked_read_only():
+    connection = MagicMock()
+    connection.dialect.name = "postgresql"
+
+    _set_transaction_read_only(MagicMock(), MagicMock(), connection)
+
+    connection.exec_driver_sql.assert_called_once_with("SET TRANSACTION READ ONLY")
+
+
+def test_other_dialects_are_left_untouched():
+    connection = MagicMock()
+    connection.dialect.name = "sqlite"
+
+    _set_transaction_read_only(MagicMock(), MagicMock(), connection)
+
+    connection.exec_driver_sql.assert_not_called()
+
+
+def _make_engine(name: str, fails: bool = False):
+    engine = create_engine(f"sqlite:///{name}.db")
+    if fails:
+        engine.connect = MagicMock(
+            side_effect=OperationalError("connect", {}, Exception("down"))
+        )
+    else:
+        engine.connect = MagicMock(return_value=MagicMock(name=name))
+    return engine
+
+
+def test_replica_pool_round_robin():
+    first, second = _make_engine("r1"), _make_engine("r2")
+    pool = ReplicaPool([first, second])
+
+    pool.connect()
+    pool.connect()
+    pool.connect()
+
+    assert first.connect.call_count == 2
+    assert second.connect.call_count == 1
+
+
+def test_replica_pool_skips_failed_replica_until_cooldown(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(database.time, "monotonic", lambda: now[0])
+    broken, healthy = _make_engine("r1", fails=True), _make_engine("r2")
+    pool = ReplicaPool([broken, healthy], cooldown=30)
+
+    assert pool.connect() is healthy.connect.return_value
+    pool.connect()
+    assert broken.connect.call_count == 1
+
+    now[0] += 31
+    pool.connect()
+    assert broken.connect.call_count == 2
+
+
+def test_replica_pool_returns_none_when_all_down():
+    pool = ReplicaPool([_make_engine("r1", fails=True)])
+
+    assert pool.connect() is None
+
+
+def _session_bind(get_db_session, use_primary=False):
+    with read_only_session_scope(use_primary=use_primary):
+        gen = get_db_session()
+        session = next(gen)
+        bind = session.get_bind()
+        gen.close()
+    return bind
+
+
+def test_read_only_sessions_use_replica(tmp_path):
+    primary = f"sqlite:///{tmp_path / 'primary.db'}"
+    replica = f"sqlite:///{tmp_path / 'replica.db'}"
+    get_db_session = create_session_factory(primary, replica_urls=[replica])
+
+    assert str(_session_bind(get_db_session).engine.url) == replica
+    assert str(_session_bind(get_db_session, use_primary=True).url) == primary
+
+    gen = get_db_session()
+    assert str(next(gen).get_bind().url) == primary
+    gen.close()
+
+
+def test_read_only_sessions_fall_back_to_primary(tmp_path, monkeypatch):
+    primary = f"sqlite:///{tmp_path / 'primary.db'}"
+    replica = f"sqlite:///{tmp_path / 'replica.db'}"
+    monkeypatch.setattr(ReplicaPool, "connect", lambda self: None)
+    get_db_session = create_session_factory(primary, replica_urls=[replica])
+
+    assert str(_session_bind(get_db_session).url) == primary
+
+
+def test_engine_uses_configured_pool(tmp_path):
+    pool = DatabasePoolConfig(pool_size=3, max_overflow=1, pool_timeout=2.5)
+
+    engine = _create_engine(f"sqlite:///{tmp_path / 'test.db'}", pool, "primary")
+
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 1
+    assert engine.pool._timeout == 2.5
+    assert engine.pool.role == "primary"
+
+
+def test_in_memory_engine_keeps_default_pool():
+    engine = _create_engine("sqlite://", DatabasePoolConfig(), "primary")
+
+    assert not isinstance(engine.pool, InstrumentedQueuePool)
+
+
+def test_pool_reports_checkout_wait_and_connections_in_use(tmp_path, monkeypatch):
+    wait, in_use = MagicMock(), MagicMock()
+    monkeypatch.setattr(database, "db_pool_checkout_wait", wait)
+    monkeypatch.setattr(database, "db_pool_connections_in_use", in_use)
+    engine = _create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", DatabasePoolConfig(), "replica-0"
+    )
+
+    with engine.connect():
+        in_use.add.assert_called_once_with(1, {"db.pool": "replica-0"})
+
+    in_use.add.assert_called_with(-1, {"db.pool": "replica-0"})
+    assert wait.record.call_args[0][1] == {"db.pool": "replica-0"}
+
+
+def test_pool_counts_checkout_timeouts(tmp_path, monkeypatch):
+    timeouts = MagicMock()
+    monkeypatch.setattr(database, "db_pool_timeouts", timeouts)
+    pool = DatabasePoolConfig(pool_size=1, max_overflow=0, pool_timeout=0.01)
+    engine = _create_engine(f"sqlite:///{tmp_path / 'test.db'}", pool, "primary")
+
+    with engine.connect(), pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    timeouts.add.assert_called_once_with(1, {"db.pool": "primary"})
+
+
+def test_statement_timeout_is_set_inside_scope():
+    connection = MagicMock()
+    connection.dialect.name = "postgresql"
+
+    _set_statement_timeout(MagicMock(), MagicMock(), connection)
+    connection.exec_driver_sql.assert_not_called()
+
+    with statement_timeout_scope(5000):
+        _set_statement_timeout(MagicMock(), MagicMock(), connection)
+
+    connection.exec_driver_sql.assert_called_once_with(
+        "SET LOCAL statement_timeout = 5000"
+    )
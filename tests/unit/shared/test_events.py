@@ -1,10 +1,13 @@
 from dataclasses import dataclass
 from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.shared.domain.events import DomainEvent
-from src.shared.infra.events.event_bus import EventBus
+from src.shared.infra.events import event_bus as event_bus_module
+from src.shared.infra.events.after_commit import after_commit_scope
+from src.shared.infra.events.event_bus import EventBus, EventPhase, SpanGranularity
 
 
 @dataclass
@@ -15,6 +18,11 @@ class OrderCreated(DomainEvent):
         return {"order_total": self.order_total}
 
 
+@dataclass
+class PriorityOrderCreated(OrderCreated):
+    pass
+
+
 @pytest.fixture(autouse=True)
 def clear_event_bus():
     EventBus.clear()
@@ -72,3 +80,140 @@ def test_event_to_dict():
     assert d["payload"] == {"order_total": 99.99}
     assert "event_id" in d
     assert "occurred_at" in d
+
+
+def test_handlers_of_base_events_receive_subclass_events():
+    results = []
+    EventBus.subscribe(OrderCreated, lambda event: results.append("base"))
+    EventBus.subscribe(PriorityOrderCreated, lambda event: results.append("exact"))
+
+    EventBus.freeze()
+    EventBus.publish(PriorityOrderCreated(aggregate_id=1))
+
+    assert results == ["exact", "base"]
+
+
+def test_handler_receives_session_only_when_it_accepts_one():
+    received = []
+    session = object()
+
+    def with_session(event: OrderCreated, session: Any = None):
+        received.append(session)
+
+    def without_session(event: OrderCreated):
+        received.append("no session")
+
+    EventBus.subscribe(OrderCreated, with_session)
+    EventBus.subscribe(OrderCreated, without_session)
+    EventBus.freeze()
+    EventBus.publish(OrderCreated(aggregate_id=1), session=session)
+
+    assert received == [session, "no session"]
+
+
+def test_frozen_bus_rejects_new_subscriptions():
+    EventBus.freeze()
+
+    with pytest.raises(RuntimeError, match="frozen"):
+        EventBus.subscribe(OrderCreated, lambda event: None)
+
+
+def test_frozen_bus_dispatches_events_defined_after_freeze():
+    results = []
+    EventBus.subscribe(OrderCreated, lambda event: results.append(event))
+    EventBus.freeze()
+
+    @dataclass
+    class LateOrderCreated(OrderCreated):
+        pass
+
+    EventBus.publish(LateOrderCreated(aggregate_id=1))
+
+    assert len(results) == 1
+
+
+def test_records_duration_per_handler():
+    def handler(event: OrderCreated):
+        pass
+
+    EventBus.subscribe(OrderCreated, handler)
+    with patch.object(event_bus_module, "event_handler_duration") as duration:
+        EventBus.publish(OrderCreated(aggregate_id=1))
+
+    [call] = duration.record.call_args_list
+    assert call.args[1] == {"event.type": "OrderCreated", "event.handler": "handler"}
+
+
+@pytest.mark.parametrize(
+    ("granularity", "spans"),
+    [(SpanGranularity.PUBLISH, 1), (SpanGranularity.HANDLER, 3)],
+)
+def test_span_granularity(granularity, spans):
+    EventBus.subscribe(OrderCreated, lambda event: None)
+    EventBus.subscribe(OrderCreated, lambda event: None)
+    EventBus.freeze(granularity)
+
+    with patch.object(event_bus_module, "tracer", MagicMock()) as tracer:
+        EventBus.publish(OrderCreated(aggregate_id=1))
+
+    assert tracer.start_as_current_span.call_count == spans
+
+
+def test_after_commit_handlers_wait_for_the_queue_to_drain():
+    calls = []
+    EventBus.subscribe(OrderCreated, lambda e: calls.append("in_transaction"))
+    EventBus.subscribe(
+        OrderCreated,
+        lambda e: calls.append("after_commit"),
+        phase=EventPhase.AFTER_COMMIT,
+    )
+
+    with after_commit_scope() as queue:
+        EventBus.publish(OrderCreated(aggregate_id=1))
+        assert calls == ["in_transaction"]
+    queue.drain()
+
+    assert calls == ["in_transaction", "after_commit"]
+
+
+def test_after_commit_handlers_run_inline_without_a_queue():
+    calls = []
+    EventBus.subscribe(
+        OrderCreated, lambda e: calls.append(e), phase=EventPhase.AFTER_COMMIT
+    )
+
+    EventBus.publish(OrderCreated(aggregate_id=1))
+
+    assert len(calls) == 1
+
+
+def test_failing_after_commit_handler_does_not_raise_or_stop_the_rest():
+    calls = []
+
+    def failing(event):
+        raise RuntimeError("side effect failed")
+
+    EventBus.subscribe(OrderCreated, failing, phase=EventPhase.AFTER_COMMIT)
+    EventBus.subscribe(
+        OrderCreated, lambda e: calls.append(e), phase=EventPhase.AFTER_COMMIT
+    )
+
+    with after_commit_scope() as queue:
+        EventBus.publish(OrderCreated(aggregate_id=1))
+    queue.drain()
+
+    assert len(calls) == 1
+
+
+def test_discarded_queue_never_runs_its_handlers():
+    calls = []
+    EventBus.subscribe(
+        OrderCreated, lambda e: calls.append(e), phase=EventPhase.AFTER_COMMIT
+    )
+
+    with after_commit_scope() as queue:
+        EventBus.publish(OrderCreated(aggregate_id=1))
+    queue.discard()
+    queue.drain()
+
+    assert calls == []
@@ -0,0 +1,83 @@
+"""Unit tests for the streamed export serializers"""
+
+import csv
+import gzip
+import io
+import json
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+
+from src.inventory.movement.domain.constants import MovementType
+from src.shared.infra.exports import CHUNK_SIZE, ExportFormat, export_chunks
+
+COLUMNS = ["id", "date", "type", "cost", "reason"]
+
+
+def _rows(count: int):
+    for i in range(count):
+        yield {
+            "id": i,
+            "date": datetime(2026, 3, 1, 12, 30),
+            "type": MovementType.OUT,
+            "cost": Decimal("1.50"),
+            "reason": None,
+        }
+
+
+def test_csv_writes_a_header_and_plain_values():
+    body = b"".join(export_chunks(_rows(2), ExportFormat.CSV, COLUMNS))
+
+    assert list(csv.reader(io.StringIO(body.decode()))) == [
+        COLUMNS,
+        ["0", "2026-03-01T12:30:00", "OUT", "1.50", ""],
+        ["1", "2026-03-01T12:30:00", "OUT", "1.50", ""],
+    ]
+
+
+def test_ndjson_writes_one_object_per_line():
+    body = b"".join(export_chunks(_rows(2), ExportFormat.NDJSON, COLUMNS))
+
+    lines = body.decode().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1]) == {
+        "id": 1,
+        "date": "2026-03-01T12:30:00",
+        "type": "OUT",
+        "cost": "1.50",
+        "reason": None,
+    }
+
+
+def test_gzip_round_trips():
+    plain = b"".join(export_chunks(_rows(5000), ExportFormat.CSV, COLUMNS))
+    compressed = b"".join(
+        export_chunks(_rows(5000), ExportFormat.CSV, COLUMNS, compress=True)
+    )
+
+    assert gzip.decompress(compressed) == plain
+    assert len(compressed) < len(plain)
+
+
+def test_chunks_stay_near_the_chunk_size():
+    chunks = list(export_chunks(_rows(20000), ExportFormat.NDJSON, COLUMNS))
+
+    assert len(chunks) > 1
+    assert max(len(chunk) for chunk in chunks) < CHUNK_SIZE + 1024
+
+
+def test_memory_does_not_grow_with_the_row_count():
+    tracemalloc.start()
+    try:
+        size = 0
+        for chunk in export_chunks(
+            _rows(50000), ExportFormat.CSV, COLUMNS, compress=True
+        ):
+            size += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert size > 0
+    # The uncompressed export is several MB; only a chunk or two is held
+    assert peak < 1024 * 1024
@@ -0,0 +1,352 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from aiokafka.errors import MessageSizeTooLargeError
+
+from src.shared.infra.kafka import producer as producer_module
+from src.shared.infra.kafka.breaker import CircuitBreaker, CircuitState
+from src.shared.infra.kafka.producer import (
+    Backpressure,
+    KafkaEventProducer,
+    OutgoingMessage,
+)
+from src.shared.infra.kafka.spool import DiskSpool
+
+
+class FakeAIOKafkaProducer:
+    instances: list["FakeAIOKafkaProducer"] = []
+    broker_down = False
+
+    def __init__(self, **options):
+        self.options = options
+        self.sent: list[tuple[str, dict, bytes | None]] = []
+        self.failing_topics: set[str] = set()
+        self.stalled_topics: set[str] = set()
+        FakeAIOKafkaProducer.instances.append(self)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def send(self, topic, value, key=None, headers=None):
+        if value.get("oversized"):
+            raise MessageSizeTooLargeError()
+        delivery = asyncio.get_running_loop().create_future()
+        if topic in self.stalled_topics:
+            return delivery  # Never acknowledged
+        if FakeAIOKafkaProducer.broker_down or topic in self.failing_topics:
+            delivery.set_exception(RuntimeError("broker unavailable"))
+        else:
+            self.sent.append((topic, value, key))
+            delivery.set_result(None)
+        return delivery
+
+
+@pytest.fixture
+def fake_kafka():
+    FakeAIOKafkaProducer.instances = []
+    FakeAIOKafkaProducer.broker_down = False
+    with patch.object(producer_module, "AIOKafkaProducer", FakeAIOKafkaProducer):
+        yield FakeAIOKafkaProducer.instances
+
+
+def _started(**kwargs) -> KafkaEventProducer:
+    producer = KafkaEventProducer("localhost:9092", send_timeout=2.0, **kwargs)
+    producer.start()
+    return producer
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_send_raw_returns_delivery_result(fake_kafka):
+    producer = _started()
+    try:
+        assert producer.send_raw("sales", {"id": 1}, key="1") is True
+        fake_kafka[0].failing_topics.add("broken")
+        assert producer.send_raw("broken", {"id": 2}) is False
+    finally:
+        producer.close()
+
+    assert fake_kafka[0].sent == [("sales", {"id": 1}, b"1")]
+
+
+def test_batching_options_reach_aiokafka(fake_kafka):
+    producer = _started(linger_ms=20, max_batch_size=1024, compression_type="lz4")
+    try:
+        _wait_for(lambda: fake_kafka)
+    finally:
+        producer.close()
+
+    options = fake_kafka[0].options
+    assert options["linger_ms"] == 20
+    assert options["max_batch_size"] == 1024
+    assert options["compression_type"] == "lz4"
+
+
+def test_publish_is_fire_and_forget(fake_kafka):
+    producer = _started()
+    try:
+        assert producer.publish("sales", {"id": 1}) is True
+        _wait_for(lambda: fake_kafka and fake_kafka[0].sent)
+    finally:
+        producer.close()
+
+
+def test_send_many_keeps_order_per_call(fake_kafka):
+    producer = _started()
+    messages = [OutgoingMessage("sales", {"id": i}, key="1") for i in range(5)]
+    try:
+        assert producer.send_many(messages) == [True] * 5
+    finally:
+        producer.close()
+
+    assert [value["id"] for _, value, _ in fake_kafka[0].sent] == [0, 1, 2, 3, 4]
+
+
+def test_send_many_waits_once_for_the_whole_batch(fake_kafka):
+    producer = KafkaEventProducer("localhost:9092", send_timeout=0.2)
+    producer.start()
+    try:
+        _wait_for(lambda: fake_kafka)
+        fake_kafka[0].stalled_topics.add("sales")
+        messages = [OutgoingMessage("sales", {"id": i}) for i in range(5)]
+
+        start = time.perf_counter()
+        assert producer.send_many(messages) == [False] * 5
+        # One timeout for the batch, not one per message (5 x 0.2s)
+        assert time.perf_counter() - start < 0.6
+    finally:
+        producer.close()
+
+
+def test_send_before_start_fails_fast():
+    producer = KafkaEventProducer("localhost:9092")
+
+    assert producer.send_raw("sales", {"id": 1}) is False
+    assert producer.publish("sales", {"id": 1}) is False
+
+
+def test_drop_oldest_keeps_newest_messages():
+    producer = KafkaEventProducer(
+        "localhost:9092", queue_size=2, backpressure=Backpressure.DROP_OLDEST
+    )
+
+    for i in range(3):
+        assert producer._enqueue(OutgoingMessage("sales", {"id": i})) is True
+
+    assert [m.value["id"] for m in producer._queue] == [1, 2]
+
+
+def test_block_gives_up_after_send_timeout():
+    producer = KafkaEventProducer(
+        "localhost:9092",
+        queue_size=1,
+        backpressure=Backpressure.BLOCK,
+        send_timeout=0.05,
+    )
+    producer._enqueue(OutgoingMessage("sales", {"id": 1}))
+
+    assert producer._enqueue(OutgoingMessage("sales", {"id": 2})) is False
+    assert len(producer._queue) == 1
+
+
+def test_spill_writes_overflow_to_spool(tmp_path):
+    producer = KafkaEventProducer(
+        "localhost:9092",
+        queue_size=1,
+        backpressure=Backpressure.SPILL,
+        spool_path=str(tmp_path / "spool.jsonl"),
+    )
+    producer._enqueue(OutgoingMessage("sales", {"id": 1}))
+
+    assert producer._enqueue(OutgoingMessage("sales", {"id": 2}, key="7")) is True
+    assert len(producer._spool) == 1
+
+    producer._take(1)
+    producer._refill_from_spool()
+    assert [(m.value["id"], m.key) for m in producer._queue] == [(2, "7")]
+
+
+def test_spill_requires_spool_path():
+    with pytest.raises(ValueError):
+        KafkaEventProducer("localhost:9092", backpressure=Backpressure.SPILL)
+
+
+def test_close_spools_messages_still_queued(fake_kafka, tmp_path):
+    spool_path = str(tmp_path / "spool.jsonl")
+    producer = KafkaEventProducer(
+        "localhost:9092", backpressure=Backpressure.SPILL, spool_path=spool_path
+    )
+    # Never started: queued messages can only go to the spool
+    producer._loop = asyncio.new_event_loop()
+    producer._enqueue(OutgoingMessage("sales", {"id": 1}))
+
+    producer.close()
+    producer._loop.close()
+
+    assert _spooled_values(spool_path) == [{"id": 1}]
+
+
+def _spooled_values(path: str) -> list[dict]:
+    return [record["value"] for _, record in DiskSpool(path).read(10)]
+
+
+def test_disk_spool_reads_records_in_write_order(tmp_path):
+    spool = DiskSpool(str(tmp_path / "spool.jsonl"))
+    spool.append([{"n": 1}, {"n": 2}])
+    spool.append([{"n": 3}])
+
+    assert [record for _, record in spool.read(2)] == [{"n": 1}, {"n": 2}]
+    assert len(spool) == 1
+    assert [record for _, record in spool.read(10)] == [{"n": 3}]
+    assert spool.read(10) == []
+
+
+def test_disk_spool_keeps_records_until_committed(tmp_path):
+    path = str(tmp_path / "spool.jsonl")
+    spool = DiskSpool(path)
+    spool.append([{"n": 1}, {"n": 2}, {"n": 3}])
+    (end1, _), (end2, _), (end3, _) = spool.read(10)
+
+    # Out of order: the offset only moves over the settled prefix
+    spool.commit(end2)
+    spool.sync()
+    assert [r for _, r in DiskSpool(path).read(10)] == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+    spool.commit(end1)
+    spool.sync()
+    # A crash now replays only the record that was read but not settled
+    assert [r for _, r in DiskSpool(path).read(10)] == [{"n": 3}]
+
+    spool.commit(end3)
+    assert not (tmp_path / "spool.jsonl").exists()
+    assert not (tmp_path / "spool.jsonl.offset").exists()
+
+
+def test_disk_spool_read_leaves_the_file_alone(tmp_path):
+    path = tmp_path / "spool.jsonl"
+    spool = DiskSpool(str(path))
+    spool.append([{"n": i} for i in range(100)])
+    size = path.stat().st_size
+
+    for _ in range(10):
+        spool.read(10)
+
+    assert path.stat().st_size == size
+    assert len(spool) == 0
+
+
+def test_replayed_messages_stay_spooled_until_sent(fake_kafka, tmp_path):
+    spool_path = str(tmp_path / "spool.jsonl")
+    DiskSpool(spool_path).append(
+        [OutgoingMessage("sales", {"id": i}).to_record() for i in range(3)]
+    )
+    producer = KafkaEventProducer("localhost:9092", spool_path=spool_path)
+    producer._refill_from_spool()
+
+    # Killed before the broker saw them: the next start replays them all
+    assert _spooled_values(spool_path) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    producer._on_delivery(producer._take(1)[0], None)
+    producer._spool.sync()
+    assert _spooled_values(spool_path) == [{"id": 1}, {"id": 2}]
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    assert breaker.allow_request() is True
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow_request() is False
+
+
+def test_breaker_lets_a_single_probe_through_when_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request() is True
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request() is False
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow_request() is True
+    assert breaker.record_success() is True
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_message_errors_do_not_open_the_circuit(fake_kafka):
+    producer = _started(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60))
+    try:
+        assert producer.send_raw("sales", {"oversized": True}) is False
+        assert producer.circuit_state == CircuitState.CLOSED
+        assert producer.send_raw("sales", {"id": 1}) is True
+    finally:
+        producer.close()
+
+
+def test_open_circuit_fails_sends_fast_and_spools_publishes(fake_kafka, tmp_path):
+    spool_path = str(tmp_path / "spool.jsonl")
+    producer = _started(
+        spool_path=spool_path,
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60),
+    )
+    FakeAIOKafkaProducer.broker_down = True
+    try:
+        assert producer.send_raw("sales", {"id": 0}) is False
+        assert producer.circuit_state == CircuitState.OPEN
+
+        start = time.perf_counter()
+        assert producer.send_raw("sales", {"id": 1}) is False
+        assert producer.publish("sales", {"id": 2}) is True
+        assert time.perf_counter() - start < 0.1
+    finally:
+        producer.close()
+
+    assert _spooled_values(spool_path) == [{"id": 2}]
+
+
+def test_spool_is_replayed_in_order_once_the_circuit_closes(fake_kafka, tmp_path):
+    producer = _started(
+        spool_path=str(tmp_path / "spool.jsonl"),
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.2),
+    )
+    FakeAIOKafkaProducer.broker_down = True
+    try:
+        assert producer.send_raw("sales", {"id": 0}) is False
+        for i in range(1, 4):
+            producer.publish("sales", {"id": i})
+
+        FakeAIOKafkaProducer.broker_down = False
+        _wait_for(lambda: len(fake_kafka[0].sent) == 3)
+        producer.publish("sales", {"id": 4})
+        _wait_for(lambda: len(fake_kafka[0].sent) == 4)
+    finally:
+        producer.close()
+
+    assert producer.circuit_state == CircuitState.CLOSED
+    assert [value["id"] for _, value, _ in fake_kafka[0].sent] == [1, 2, 3, 4]
+
+
+def test_disk_spool_batches_fsync(tmp_path):
+    spool = DiskSpool(str(tmp_path / "spool.jsonl"), fsync_interval=60)
+
+    with patch("src.shared.infra.kafka.spool.os.fsync") as fsync:
+        spool.append([{"n": 1}])
+        spool.append([{"n": 2}])
+        spool.append([{"n": 3}])
+        assert fsync.call_count == 1
+        spool.sync()
+        assert fsync.call_count == 2
@@ -4,7 +4,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 from sqlalchemy.exc import IntegrityError
 
-from src.shared.infra.middlewares import ErrorHandlingMiddleware
+from src.shared.infra.middlewares import (
+    READ_PRIMARY_COOKIE,
+    ErrorHandlingMiddleware,
+    ReadOnlySessionMiddleware,
+    StatementTimeoutMiddleware,
+)
 
 
 def _make_middleware():
@@ -43,3 +48,84 @@ def test_integrity_error_returns_409():
     assert "referenced by other records" in body["errors"][0]["message"]
     assert "requestId" in body["meta"]
     assert "timestamp" in body["meta"]
+
+
+def _dispatch_read_only(method: str, cookies=None, headers=None, status_code=200):
+    from src.shared.infra import database
+
+    seen = {}
+    response = MagicMock(status_code=status_code)
+
+    async def call_next(request):
+        seen["read_only"] = database._read_only.get()
+        seen["use_primary"] = database._use_primary.get()
+        return response
+
+    request = _make_request()
+    request.method = method
+    request.cookies = cookies or {}
+    request.headers = headers or {}
+    asyncio.get_event_loop().run_until_complete(
+        ReadOnlySessionMiddleware(MagicMock()).dispatch(request, call_next)
+    )
+    return seen, response
+
+
+def test_get_requests_use_read_only_sessions():
+    for method in ("GET", "HEAD"):
+        seen, _ = _dispatch_read_only(method)
+        assert seen == {"read_only": True, "use_primary": False}
+
+
+def test_write_requests_use_regular_sessions():
+    for method in ("POST", "PATCH"):
+        seen, _ = _dispatch_read_only(method, status_code=201)
+        assert seen["read_only"] is False
+
+
+def test_successful_write_pins_reads_to_primary():
+    _, response = _dispatch_read_only("POST", status_code=201)
+
+    response.set_cookie.assert_called_once()
+    assert response.set_cookie.call_args[0][0] == READ_PRIMARY_COOKIE
+    assert response.set_cookie.call_args.kwargs["max_age"] == 5
+
+
+def test_failed_write_does_not_pin_reads():
+    _, response = _dispatch_read_only("POST", status_code=400)
+
+    response.set_cookie.assert_not_called()
+
+
+def test_pinned_reads_use_primary():
+    seen, _ = _dispatch_read_only("GET", cookies={READ_PRIMARY_COOKIE: "1"})
+    assert seen == {"read_only": True, "use_primary": True}
+
+    seen, _ = _dispatch_read_only("GET", headers={"x-read-primary": "true"})
+    assert seen == {"read_only": True, "use_primary": True}
+
+
+def _statement_timeout_for(path: str):
+    from src.shared.infra import database
+
+    seen = {}
+
+    async def call_next(request):
+        seen["timeout_ms"] = database._statement_timeout_ms.get()
+        return MagicMock()
+
+    request = _make_request()
+    request.url.path = path
+    middleware = StatementTimeoutMiddleware(
+        MagicMock(),
+        timeouts={"/api/admin": 30000, "/api/admin/reports": 120000, "/api/pos": 5000},
+    )
+    asyncio.get_event_loop().run_until_complete(middleware.dispatch(request, call_next))
+    return seen["timeout_ms"]
+
+
+def test_statement_timeout_follows_api_surface():
+    assert _statement_timeout_for("/api/pos/sales") == 5000
+    assert _statement_timeout_for("/api/admin/products") == 30000
+    assert _statement_timeout_for("/api/admin/reports/inventory/valuation") == 120000
+    assert _statement_timeout_for("/docs") is None
@@ -0,0 +1,309 @@
+"""Unit tests for the transactional outbox and its relay"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.sales.domain.events import SaleConfirmed
+from src.shared.infra.kafka.breaker import CircuitState
+from src.shared.infra.models import OutboxMessageModel
+from src.shared.infra.outbox import (
+    OutboxRelay,
+    enqueue_message,
+    register_enricher,
+    relay as relay_module,
+)
+
+
+def _sale_confirmed(sale_id: int = 1) -> SaleConfirmed:
+    return SaleConfirmed(
+        aggregate_id=sale_id,
+        sale_id=sale_id,
+        items=[{"product_id": 5, "quantity": 2, "unit_price": Decimal("3.50")}],
+        total=Decimal("7.00"),
+    )
+
+
+@pytest.fixture
+def relay_scope(db_session):
+    @contextmanager
+    def scope(session=None):
+        yield MagicMock(get=MagicMock(return_value=db_session))
+
+    with patch.object(relay_module, "create_sync_scope", scope):
+        yield
+
+
+@pytest.fixture
+def clean_enrichers():
+    saved = dict(relay_module._enrichers)
+    relay_module._enrichers.clear()
+    yield
+    relay_module._enrichers.clear()
+    relay_module._enrichers.update(saved)
+
+
+def _producer(delivered=lambda message: True, state=CircuitState.CLOSED):
+    producer = MagicMock(circuit_state=state)
+    producer.send_many.side_effect = lambda messages: [delivered(m) for m in messages]
+    return producer
+
+
+def _sent(producer) -> list[tuple[str, str]]:
+    return [
+        (m.key, m.value["event_id"])
+        for call in producer.send_many.call_args_list
+        for m in call[0][0]
+    ]
+
+
+def _pending(db_session) -> list[OutboxMessageModel]:
+    return (
+        db_session.query(OutboxMessageModel)
+        .filter(
+            OutboxMessageModel.published_at.is_(None),
+            OutboxMessageModel.dead_lettered_at.is_(None),
+        )
+        .order_by(OutboxMessageModel.id)
+        .all()
+    )
+
+
+def test_enqueue_adds_one_row_with_json_payload(db_session):
+    event = _sale_confirmed()
+
+    enqueue_message(db_session, "sales.confirmed", event)
+    db_session.flush()
+
+    [message] = _pending(db_session)
+    assert message.topic == "sales.confirmed"
+    assert message.event_type == "SaleConfirmed"
+    assert message.aggregate_id == 1
+    assert message.payload["event_id"] == event.event_id
+    assert message.payload["payload"]["total"] == "7.00"
+
+
+def test_relay_publishes_in_order_and_marks_messages(
+    db_session, relay_scope, clean_enrichers
+):
+    events = [_sale_confirmed(sale_id) for sale_id in (1, 2, 1)]
+    for event in events:
+        enqueue_message(db_session, "sales.confirmed", event)
+    db_session.flush()
+    producer = _producer()
+
+    published = OutboxRelay(producer).drain_once()
+
+    assert published == 3
+    assert _pending(db_session) == []
+    # One wave per message of the busiest aggregate
+    assert [len(call[0][0]) for call in producer.send_many.call_args_list] == [2, 1]
+    assert _sent(producer) == [
+        ("1", events[0].event_id),
+        ("2", events[1].event_id),
+        ("1", events[2].event_id),
+    ]
+
+
+def test_relay_holds_back_aggregate_after_failed_send(
+    db_session, relay_scope, clean_enrichers
+):
+    events = [_sale_confirmed(sale_id) for sale_id in (1, 2, 1)]
+    for event in events:
+        enqueue_message(db_session, "sales.confirmed", event)
+    db_session.flush()
+    producer = _producer(delivered=lambda m: m.value["event_id"] != events[0].event_id)
+
+    published = OutboxRelay(producer).drain_once()
+
+    assert published == 1
+    # The later message of sale 1 is never sent ahead of the failed one
+    assert events[2].event_id not in [event_id for _, event_id in _sent(producer)]
+    pending = _pending(db_session)
+    assert [m.aggregate_id for m in pending] == [1, 1]
+    assert [m.attempts for m in pending] == [1, 0]
+
+
+def test_relay_dead_letters_a_message_after_max_attempts(
+    db_session, relay_scope, clean_enrichers
+):
+    events = [_sale_confirmed(1), _sale_confirmed(1)]
+    for event in events:
+        enqueue_message(db_session, "sales.confirmed", event)
+    db_session.flush()
+    producer = _producer(delivered=lambda m: m.value["event_id"] != events[0].event_id)
+    relay = OutboxRelay(producer, max_attempts=2)
+
+    assert relay.drain_once() == 0
+    assert relay.drain_once() == 0
+    assert relay.drain_once() == 1
+
+    poison = db_session.query(OutboxMessageModel).order_by(OutboxMessageModel.id)[0]
+    assert poison.attempts == 2
+    assert poison.dead_lettered_at is not None
+    assert poison.published_at is None
+    assert _pending(db_session) == []
+
+
+def test_relay_does_not_count_attempts_while_the_circuit_is_open(
+    db_session, relay_scope, clean_enrichers
+):
+    enqueue_message(db_session, "sales.confirmed", _sale_confirmed())
+    db_session.flush()
+    producer = _producer(delivered=lambda m: False, state=CircuitState.OPEN)
+
+    for _ in range(3):
+        OutboxRelay(producer, max_attempts=2).drain_once()
+
+    [message] = _pending(db_session)
+    assert message.attempts == 0
+
+
+def test_purge_deletes_only_old_published_messages(db_session, relay_scope):
+    now = datetime.now()
+    for published_at, dead_lettered_at in [
+        (now - timedelta(days=10), None),
+        (now - timedelta(hours=1), None),
+        (None, None),
+        (None, now - timedelta(days=10)),
+    ]:
+        db_session.add(
+            OutboxMessageModel(
+                topic="sales.confirmed",
+                event_type="SaleConfirmed",
+                aggregate_id=1,
+                payload={},
+                published_at=published_at,
+                dead_lettered_at=dead_lettered_at,
+            )
+        )
+    db_session.flush()
+
+    deleted = OutboxRelay(MagicMock(), retention=timedelta(days=3)).purge_once()
+
+    assert deleted == 1
+    assert db_session.query(OutboxMessageModel).count() == 3
+
+
+def test_relay_applies_registered_enricher(db_session, relay_scope, clean_enrichers):
+    register_enricher(
+        "SaleConfirmed", lambda messages, session: [{"enriched": True}] * len(messages)
+    )
+    enqueue_message(db_session, "sales.confirmed", _sale_confirmed())
+    db_session.flush()
+    producer = _producer()
+
+    OutboxRelay(producer).drain_once()
+
+    assert producer.send_many.call_args[0][0][0].value == {"enriched": True}
+
+
+def test_relay_sends_stored_event_when_enrichment_fails(
+    db_session, relay_scope, clean_enrichers
+):
+    def broken(messages, session):
+        raise RuntimeError("boom")
+
+    register_enricher("SaleConfirmed", broken)
+    event = _sale_confirmed()
+    enqueue_message(db_session, "sales.confirmed", event)
+    db_session.flush()
+    producer = _producer()
+
+    OutboxRelay(producer).drain_once()
+
+    assert producer.send_many.call_args[0][0][0].value["event_id"] == event.event_id
+
+
+def test_sale_confirmed_handler_only_enqueues(db_session):
+    from src.shared.infra.kafka import event_handlers
+
+    @contextmanager
+    def scope(session=None):
+        yield MagicMock(get=MagicMock(return_value=session))
+
+    with (
+        patch.object(event_handlers, "create_sync_scope", scope),
+        patch("config.config.KAFKA_ENABLED", True),
+        patch.object(event_handlers, "_get_producer") as get_producer,
+    ):
+        event_handlers.publish_sale_confirmed_to_kafka(
+            _sale_confirmed(), session=db_session
+        )
+        db_session.flush()
+
+    get_producer.assert_not_called()
+    assert len(_pending(db_session)) == 1
+
+
+@pytest.fixture
+def enrichment_scope():
+    from src.catalog.product.app.repositories import ProductRepository
+    from src.customers.app.repositories import CustomerRepository
+    from src.shared.infra.kafka import event_handlers
+
+    product_repo = MagicMock()
+    product_repo.get_many.side_effect = lambda ids: [
+        MagicMock(id=pid, sku=f"SKU-{pid}", name=f"Product {pid}") for pid in ids
+    ]
+    customer_repo = MagicMock()
+    customer_repo.get_many.return_value = []
+    repos = {ProductRepository: product_repo, CustomerRepository: customer_repo}
+
+    @contextmanager
+    def scope(session=None):
+        yield MagicMock(get=repos.get)
+
+    event_handlers._product_projections.clear()
+    with patch.object(event_handlers, "create_sync_scope", scope):
+        yield product_repo
+    event_handlers._product_projections.clear()
+
+
+def _stored(event: SaleConfirmed) -> dict:
+    from src.shared.infra.outbox.writer import _to_json
+
+    return _to_json(event.to_dict())
+
+
+def test_sale_confirmed_enricher_builds_kafka_message(enrichment_scope):
+    from src.shared.infra.kafka import event_handlers
+
+    event = _sale_confirmed()
+
+    [message] = event_handlers._build_enriched_payloads([_stored(event)], MagicMock())
+
+    assert message["event_id"] == event.event_id
+    assert message["occurred_at"].endswith("Z")
+    assert message["payload"]["total"] == "7.00"
+    assert message["payload"]["items"][0]["sku"] == "SKU-5"
+    assert message["payload"]["customer"] is None
+
+
+def test_sale_confirmed_enricher_fetches_products_once_per_batch(enrichment_scope):
+    from src.shared.infra.kafka import event_handlers
+
+    events = [_stored(_sale_confirmed(sale_id)) for sale_id in (1, 2, 3)]
+
+    messages = event_handlers._build_enriched_payloads(events, MagicMock())
+
+    assert [m["aggregate_id"] for m in messages] == [1, 2, 3]
+    enrichment_scope.get_many.assert_called_once_with([5])
+
+
+def test_sale_confirmed_enricher_caches_products_until_updated(enrichment_scope):
+    from src.catalog.product.domain.events import ProductUpdated
+    from src.shared.infra.kafka import event_handlers
+
+    event_handlers._build_enriched_payloads([_stored(_sale_confirmed())], None)
+    event_handlers._build_enriched_payloads([_stored(_sale_confirmed())], None)
+    assert enrichment_scope.get_many.call_count == 1
+
+    event_handlers.invalidate_product_projection(
+        ProductUpdated(aggregate_id=5, product_id=5)
+    )
+    event_handlers._build_enriched_payloads([_stored(_sale_confirmed())], None)
+    assert enrichment_scope.get_many.call_count == 2
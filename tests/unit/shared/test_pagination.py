@@ -0,0 +1,83 @@
+"""Unit tests for cursor pagination: codec and SqlAlchemyRepository keyset pages"""
+
+from datetime import datetime
+
+import pytest
+
+from src.catalog.uom.domain.entities import UnitOfMeasure
+from src.catalog.uom.infra.mappers import UnitOfMeasureMapper
+from src.catalog.uom.infra.repositories import SqlAlchemyUnitOfMeasureRepository
+from src.shared.app.pagination import decode_cursor, encode_cursor
+from src.shared.domain.exceptions import ValidationError
+
+
+@pytest.fixture
+def repo(db_session):
+    repo = SqlAlchemyUnitOfMeasureRepository(db_session, UnitOfMeasureMapper())
+    repo.create_many(
+        [
+            UnitOfMeasure(name=f"Unit {i}", symbol=f"u{i}", is_active=i % 2 == 0)
+            for i in range(1, 8)
+        ]
+    )
+    return repo
+
+
+def test_cursor_roundtrip():
+    cursor = encode_cursor(datetime(2026, 2, 1, 10, 30), 42)
+
+    assert decode_cursor(cursor, size=2) == ["2026-02-01T10:30:00", 42]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor!",
+        encode_cursor(1, 2),
+        "e30",
+        encode_cursor("1 OR 1=1"),
+        encode_cursor(1.5),
+        encode_cursor(True),
+    ],
+)
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, size=1)
+
+
+def test_offset_page_returns_total_and_next_cursor(repo):
+    page = repo.paginate(limit=3, offset=0)
+
+    assert page["total"] == 7
+    assert page["offset"] == 0
+    assert [item["symbol"] for item in page["items"]] == ["u1", "u2", "u3"]
+    assert page["next_cursor"] == encode_cursor(page["items"][-1]["id"])
+
+
+def test_cursor_pages_walk_the_whole_table(repo):
+    symbols = []
+    page = repo.paginate(limit=3)
+    symbols += [item["symbol"] for item in page["items"]]
+    while page["next_cursor"]:
+        page = repo.paginate(limit=3, offset=50, cursor=page["next_cursor"])
+        assert page["total"] is None
+        assert page["offset"] is None
+        symbols += [item["symbol"] for item in page["items"]]
+
+    assert symbols == [f"u{i}" for i in range(1, 8)]
+
+
+def test_last_page_has_no_next_cursor(repo):
+    page = repo.paginate(limit=7)
+
+    assert len(page["items"]) == 7
+    assert page["next_cursor"] is None
+
+
+def test_cursor_keeps_filters(repo):
+    first = repo.paginate(limit=2, is_active=True)
+    second = repo.paginate(limit=2, cursor=first["next_cursor"], is_active=True)
+
+    assert [item["symbol"] for item in first["items"]] == ["u2", "u4"]
+    assert [item["symbol"] for item in second["items"]] == ["u6"]
+    assert second["next_cursor"] is None
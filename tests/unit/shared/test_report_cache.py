@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+
+import pytest
+
+from src.shared.app.queries import Query, QueryHandler
+from src.shared.infra import report_cache
+from src.shared.infra.report_cache import (
+    InMemoryReportCacheBackend,
+    ReportCache,
+    ReportData,
+)
+
+
+@dataclass
+class CountQuery(Query):
+    warehouse_id: int | None = None
+
+
+class CountingHandler(QueryHandler[CountQuery, dict]):
+    def __init__(self, on_handle=None):
+        self.calls = 0
+        self.on_handle = on_handle
+
+    def _handle(self, query: CountQuery) -> dict:
+        self.calls += 1
+        if self.on_handle is not None:
+            self.on_handle()
+        return {"warehouse_id": query.warehouse_id, "call": self.calls}
+
+
+STOCK = (ReportData.STOCK,)
+
+
+def test_serves_repeated_queries_from_the_cache():
+    cache = ReportCache()
+    handler = CountingHandler()
+
+    first = cache.fetch(handler, CountQuery(warehouse_id=1), STOCK)
+    second = cache.fetch(handler, CountQuery(warehouse_id=1), STOCK)
+    other = cache.fetch(handler, CountQuery(warehouse_id=2), STOCK)
+
+    assert first == second == {"warehouse_id": 1, "call": 1}
+    assert other == {"warehouse_id": 2, "call": 2}
+    assert handler.calls == 2
+
+
+def test_invalidation_only_affects_reports_built_on_that_data():
+    cache = ReportCache()
+    stock_handler = CountingHandler()
+    price_handler = CountingHandler()
+    cache.fetch(stock_handler, CountQuery(), STOCK)
+    cache.fetch(price_handler, CountQuery(), (ReportData.PRICES,))
+
+    cache.invalidate(ReportData.STOCK)
+    cache.fetch(stock_handler, CountQuery(), STOCK)
+    cache.fetch(price_handler, CountQuery(), (ReportData.PRICES,))
+
+    assert stock_handler.calls == 2
+    assert price_handler.calls == 1
+
+
+def test_result_computed_during_an_invalidation_is_stored_stale():
+    cache = ReportCache()
+    handler = CountingHandler(on_handle=lambda: cache.invalidate(ReportData.STOCK))
+
+    cache.fetch(handler, CountQuery(), STOCK)
+    handler.on_handle = None
+    cache.fetch(handler, CountQuery(), STOCK)
+
+    assert handler.calls == 2
+
+
+def test_shared_backend_serves_and_invalidates_across_processes():
+    shared = InMemoryReportCacheBackend()
+    first, second = ReportCache(shared=shared), ReportCache(shared=shared)
+    handler = CountingHandler()
+
+    first.fetch(handler, CountQuery(), STOCK)
+    assert second.fetch(handler, CountQuery(), STOCK) == {
+        "warehouse_id": None,
+        "call": 1,
+    }
+
+    second.invalidate(ReportData.STOCK)
+    first.fetch(handler, CountQuery(), STOCK)
+
+    assert handler.calls == 2
+
+
+def test_disabled_cache_always_computes():
+    cache = ReportCache(enabled=False)
+    handler = CountingHandler()
+
+    cache.fetch(handler, CountQuery(), STOCK)
+    cache.fetch(handler, CountQuery(), STOCK)
+
+    assert handler.calls == 2
+
+
+@pytest.mark.parametrize("shared", [None, InMemoryReportCacheBackend()])
+def test_results_computed_right_after_an_invalidation_are_not_stored(
+    monkeypatch, shared
+):
+    now = [1000.0]
+    monkeypatch.setattr(report_cache.time, "time", lambda: now[0])
+    cache = ReportCache(shared=shared, replica_lag=5.0)
+    handler = CountingHandler()
+    cache.invalidate(ReportData.STOCK)
+
+    # A replica may not have the invalidating commit yet
+    now[0] += 1
+    cache.fetch(handler, CountQuery(), STOCK)
+    cache.fetch(handler, CountQuery(), STOCK)
+    assert handler.calls == 2
+
+    now[0] += 5
+    cache.fetch(handler, CountQuery(), STOCK)
+    cache.fetch(handler, CountQuery(), STOCK)
+    # Other data was not invalidated, so its results are stored at once
+    cache.fetch(handler, CountQuery(), (ReportData.PRICES,))
+    cache.fetch(handler, CountQuery(), (ReportData.PRICES,))
+    assert handler.calls == 4
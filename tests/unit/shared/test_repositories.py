@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 from unittest.mock import MagicMock
 
+import pytest
+
 from src.shared.domain.entities import Entity
 from src.shared.infra.repositories import SqlAlchemyRepository
+from src.shared.infra.unit_of_work import current_unit_of_work, unit_of_work
 
 
 @dataclass
@@ -13,6 +16,7 @@ class FakeEntity(Entity):
 
 class FakeRepo(SqlAlchemyRepository[FakeEntity]):
     __model__ = MagicMock
+    _onupdate_columns = False  # The fake model has no table to inspect
 
 
 def _make_repo():
@@ -56,3 +60,53 @@ def test_delete_flushes():
     repo.delete(1)
     session.flush.assert_called_once()
     session.commit.assert_not_called()
+
+
+def test_update_and_delete_defer_flush_to_unit_of_work():
+    repo, session, _ = _make_repo()
+    session.autoflush = False
+    session.query.return_value.get.return_value = MagicMock()
+
+    with unit_of_work():
+        repo.update(FakeEntity(id=1, name="updated"))
+        repo.delete(1)
+        session.flush.assert_not_called()
+        # Later queries still see the pending changes
+        assert session.autoflush is True
+
+    session.flush.assert_called_once()
+    assert session.autoflush is False
+
+
+def test_create_flushes_inside_unit_of_work():
+    repo, session, _ = _make_repo()
+
+    with unit_of_work():
+        repo.create(FakeEntity(name="test"))
+        session.flush.assert_called_once()
+
+
+def test_nested_unit_of_work_flushes_once_at_the_outer_end():
+    repo, session, _ = _make_repo()
+    session.query.return_value.get.return_value = MagicMock()
+
+    with unit_of_work() as outer:
+        with unit_of_work() as inner:
+            assert inner is outer
+            repo.update(FakeEntity(id=1, name="updated"))
+        session.flush.assert_not_called()
+
+    session.flush.assert_called_once()
+    assert current_unit_of_work() is None
+
+
+def test_failed_unit_of_work_does_not_flush():
+    repo, session, _ = _make_repo()
+    session.query.return_value.get.return_value = MagicMock()
+
+    with pytest.raises(RuntimeError), unit_of_work():
+        repo.update(FakeEntity(id=1, name="updated"))
+        raise RuntimeError("boom")
+
+    session.flush.assert_not_called()
+    assert current_unit_of_work() is None
@@ -0,0 +1,47 @@
+"""Unit tests for the counter-table document sequence"""
+
+from src.shared.infra.models import DocumentSequenceModel
+from src.shared.infra.sequences import SqlAlchemyDocumentSequence
+
+
+def test_sequence_starts_at_one_and_increments(db_session):
+    sequence = SqlAlchemyDocumentSequence(db_session)
+
+    assert [sequence.next_value("PO", 2026) for _ in range(3)] == [1, 2, 3]
+
+
+def test_sequence_is_scoped_by_name_and_year(db_session):
+    sequence = SqlAlchemyDocumentSequence(db_session)
+    sequence.next_value("PO", 2026)
+    sequence.next_value("PO", 2026)
+
+    assert sequence.next_value("PO", 2027) == 1
+    assert sequence.next_value("RC", 2026) == 1
+    assert sequence.next_value("PO", 2026) == 3
+
+
+def test_sequence_continues_from_stored_value(db_session):
+    db_session.add(DocumentSequenceModel(name="PO", year=2026, last_value=41))
+    db_session.flush()
+
+    assert SqlAlchemyDocumentSequence(db_session).next_value("PO", 2026) == 42
+
+
+def test_sequence_retries_when_year_is_opened_concurrently(db_session):
+    sequence = SqlAlchemyDocumentSequence(db_session)
+    increment = sequence._increment
+    calls = []
+
+    def racing_increment(name, year):
+        calls.append(name)
+        if len(calls) == 1:
+            # Another transaction creates the row between our UPDATE and INSERT
+            db_session.add(DocumentSequenceModel(name=name, year=year, last_value=1))
+            db_session.flush()
+            return None
+        return increment(name, year)
+
+    sequence._increment = racing_increment
+
+    assert sequence.next_value("PO", 2026) == 2
+    assert len(calls) == 2
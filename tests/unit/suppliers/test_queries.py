@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.customers.domain.entities import TaxType
+from src.shared.app.pagination import TotalMode
 from src.shared.domain.exceptions import NotFoundError
 from src.suppliers.app.queries.supplier import (
     GetAllSuppliersQuery,
@@ -83,7 +84,9 @@ def test_get_all_suppliers_no_filter():
 
     result = handler.handle(GetAllSuppliersQuery())
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None)
+    repo.paginate.assert_called_once_with(
+        limit=None, offset=None, cursor=None, include_total=TotalMode.EXACT
+    )
     assert len(result["items"]) == 2
     assert result["items"][0]["name"] == "ACME Corp"
     assert result["items"][1]["name"] == "Beta Supplies"
@@ -103,7 +106,13 @@ def test_get_all_suppliers_with_active_filter():
 
     result = handler.handle(GetAllSuppliersQuery(is_active=True))
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, is_active=True)
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        is_active=True,
+    )
     assert len(result["items"]) == 1
     assert result["items"][0]["is_active"] is True
     assert result["total"] == 1
@@ -122,7 +131,13 @@ def test_get_all_suppliers_with_inactive_filter():
 
     result = handler.handle(GetAllSuppliersQuery(is_active=False))
 
-    repo.paginate.assert_called_once_with(limit=None, offset=None, is_active=False)
+    repo.paginate.assert_called_once_with(
+        limit=None,
+        offset=None,
+        cursor=None,
+        include_total=TotalMode.EXACT,
+        is_active=False,
+    )
     assert len(result["items"]) == 1
     assert result["items"][0]["is_active"] is False
     assert result["total"] == 1